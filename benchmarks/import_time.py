@@ -0,0 +1,70 @@
+"""Import-time benchmark: `import celeste`, then the first use of each provider.
+
+Every measurement runs in a fresh interpreter so module caches never carry over.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 10 --provider openai
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_IMPORT = """
+import time
+started = time.perf_counter()
+import celeste
+print(time.perf_counter() - started)
+"""
+
+_FIRST_USE = """
+import sys, time
+import celeste
+from celeste.models import list_models
+started = time.perf_counter()
+for modality, provider in celeste._CLIENT_MAP:
+    if str(provider) == sys.argv[1]:
+        celeste._CLIENT_MAP[(modality, provider)]
+        list_models(provider=provider)
+print(time.perf_counter() - started)
+"""
+
+_TARGETS = """
+import json
+import celeste
+print(json.dumps(sorted({str(target) for _, target in celeste._CLIENT_MAP})))
+"""
+
+
+def _run(code: str, *args: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _median_ms(code: str, runs: int, *args: str) -> float:
+    return statistics.median(float(_run(code, *args)) for _ in range(runs)) * 1000
+
+
+def main() -> None:
+    """Print median timings in milliseconds."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    parser.add_argument("--provider", action="append", help="limit to a provider")
+    args = parser.parse_args()
+
+    print(f"import celeste: {_median_ms(_IMPORT, args.runs):8.1f} ms")
+    targets = args.provider or json.loads(_run(_TARGETS))
+    print("first use (clients + model catalog), on top of import:")
+    for target in targets:
+        print(f"  {target:<16}{_median_ms(_FIRST_USE, args.runs, target):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
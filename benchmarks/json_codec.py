@@ -0,0 +1,144 @@
+"""JSON codec benchmark: request encoding and response/event decoding per backend.
+
+Times `celeste.codec` with each installed backend (stdlib ``json``, orjson,
+msgspec) on a synthetic chat request body, a unary response and a run of
+streaming events, next to the previous stdlib defaults (``json.dumps`` with
+httpx's separators for requests, ``json.loads`` for responses and events).
+
+Usage:
+    python benchmarks/json_codec.py
+    python benchmarks/json_codec.py --messages 200 --events 20000 --runs 7
+"""
+
+import argparse
+import importlib.util
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from celeste import codec
+
+
+def _request(messages: int) -> dict[str, Any]:
+    return {
+        "model": "bench",
+        "max_tokens": 1024,
+        "messages": [
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": [{"type": "text", "text": f"message {i} " * 40}],
+            }
+            for i in range(messages)
+        ],
+        "tools": [
+            {
+                "name": f"tool_{i}",
+                "description": "Look something up.",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {"query": {"type": "string"}},
+                },
+            }
+            for i in range(8)
+        ],
+    }
+
+
+def _response(messages: int) -> bytes:
+    body = {
+        "id": "msg_bench",
+        "content": [{"type": "text", "text": "token " * (messages * 40)}],
+        "usage": {"input_tokens": messages * 40, "output_tokens": messages * 40},
+    }
+    return json.dumps(body).encode()
+
+
+def _events(count: int) -> list[bytes]:
+    return [
+        json.dumps(
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": f"token{i} "},
+            }
+        ).encode()
+        for i in range(count)
+    ]
+
+
+def _time(run: Callable[[], object], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+_BACKENDS: dict[str, type[codec.JSONCodec]] = {
+    "json": codec.JSONCodec,
+    "msgspec": codec.MsgspecCodec,
+    "orjson": codec.OrjsonCodec,
+}
+
+
+def _installed() -> list[str]:
+    return [
+        name
+        for name in _BACKENDS
+        if name == "json" or importlib.util.find_spec(name) is not None
+    ]
+
+
+def main() -> None:
+    """Print median encode/decode times for each backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=100, help="request turns")
+    parser.add_argument("--events", type=int, default=10000, help="stream events")
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    request = _request(args.messages)
+    response = _response(args.messages)
+    events = _events(args.events)
+    repeat = 100
+
+    cases: list[tuple[str, Callable[[], object]]] = [
+        (
+            "stdlib (before)",
+            lambda: (
+                [
+                    json.dumps(request, ensure_ascii=False, separators=(",", ":"))
+                    for _ in range(repeat)
+                ],
+                [json.loads(response) for _ in range(repeat)],
+                [json.loads(event) for event in events],
+            ),
+        )
+    ]
+    for name in _installed():
+        backend = _BACKENDS[name]()
+        cases.append(
+            (
+                f"codec {name}",
+                lambda backend=backend: (
+                    [backend.dumps(request) for _ in range(repeat)],
+                    [backend.loads(response) for _ in range(repeat)],
+                    [backend.loads(event) for event in events],
+                ),
+            )
+        )
+
+    size = len(codec.dumps(request))
+    print(
+        f"{repeat}x {size:,}-byte request + {repeat}x {len(response):,}-byte "
+        f"response + {args.events} events"
+    )
+    for name, run in cases:
+        print(f"  {name:<18}{_time(run, args.runs) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""SSE/NDJSON parsing benchmark: built-in byte framing vs line-by-line iteration.
+
+Serves a synthetic token stream from an in-memory transport and times decoding
+every event to JSON through `celeste.sse` against the previous line-based paths
+(``httpx_sse.aiter_sse`` for SSE, ``Response.aiter_lines`` for NDJSON). The
+httpx-sse comparison is skipped when that package is not installed.
+
+Usage:
+    python benchmarks/sse_parsing.py
+    python benchmarks/sse_parsing.py --events 50000 --chunk-size 16384 --runs 7
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import Any
+
+import httpx
+
+from celeste.sse import aiter_ndjson, aiter_sse, decode_json
+
+type Parse = Callable[[httpx.Response], Coroutine[Any, Any, int]]
+
+
+def _event(index: int) -> dict[str, Any]:
+    return {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion.chunk",
+        "choices": [{"index": 0, "delta": {"content": f"token{index} "}}],
+    }
+
+
+def _sse_body(events: int) -> bytes:
+    return b"".join(
+        b"data: " + json.dumps(_event(i)).encode() + b"\n\n" for i in range(events)
+    )
+
+
+def _ndjson_body(events: int) -> bytes:
+    return b"".join(json.dumps(_event(i)).encode() + b"\n" for i in range(events))
+
+
+class _Chunked(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, size: int) -> None:
+        self._body = body
+        self._size = size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._body), self._size):
+            yield self._body[start : start + self._size]
+
+
+async def _builtin_sse(response: httpx.Response) -> int:
+    count = 0
+    async for event in aiter_sse(response.aiter_bytes()):
+        decode_json(event.data)
+        count += 1
+    return count
+
+
+async def _httpx_sse(response: httpx.Response) -> int:
+    from httpx_sse import EventSource
+
+    count = 0
+    async for sse in EventSource(response).aiter_sse():
+        json.loads(sse.data)
+        count += 1
+    return count
+
+
+async def _builtin_ndjson(response: httpx.Response) -> int:
+    count = 0
+    async for _ in aiter_ndjson(response.aiter_bytes()):
+        count += 1
+    return count
+
+
+async def _lines_ndjson(response: httpx.Response) -> int:
+    count = 0
+    async for line in response.aiter_lines():
+        if line:
+            json.loads(line)
+            count += 1
+    return count
+
+
+async def _time(parse: Parse, body: bytes, chunk_size: int, events: int) -> float:
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            stream=_Chunked(body, chunk_size),
+        )
+    )
+    async with (
+        httpx.AsyncClient(transport=transport) as client,
+        client.stream("POST", "https://bench.local/stream") as response,
+    ):
+        started = time.perf_counter()
+        count = await parse(response)
+        elapsed = time.perf_counter() - started
+    assert count == events, (count, events)
+    return elapsed
+
+
+def _has_httpx_sse() -> bool:
+    try:
+        import httpx_sse  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def main() -> None:
+    """Print median parse time and events per second for each path."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000, help="events per run")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="bytes/chunk")
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    cases: list[tuple[str, Parse, bytes]] = [
+        ("sse  celeste.sse", _builtin_sse, _sse_body(args.events)),
+    ]
+    if _has_httpx_sse():
+        cases.append(("sse  httpx-sse", _httpx_sse, cases[0][2]))
+    ndjson = _ndjson_body(args.events)
+    cases += [
+        ("ndjson celeste.sse", _builtin_ndjson, ndjson),
+        ("ndjson aiter_lines", _lines_ndjson, ndjson),
+    ]
+
+    print(f"{args.events} events, {args.chunk_size}-byte chunks")
+    for name, parse, body in cases:
+        seconds = statistics.median(
+            asyncio.run(_time(parse, body, args.chunk_size, args.events))
+            for _ in range(args.runs)
+        )
+        rate = args.events / seconds
+        print(f"  {name:<20}{seconds * 1000:9.1f} ms {rate:12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
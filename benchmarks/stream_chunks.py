@@ -0,0 +1,182 @@
+"""Stream chunk benchmark: chunks per second per provider stream, validated vs constructed.
+
+Replays a synthetic stream of ``--tokens`` content deltas through each
+provider's stream class and reports chunks per second with the built-in chunk
+construction (`celeste.io.trusted_constructor` over provider-parsed fields)
+and with the previous path that validated every chunk. The two paths
+alternate run by run and the best run of each is reported.
+
+Usage:
+    python benchmarks/stream_chunks.py
+    python benchmarks/stream_chunks.py --tokens 20000 --runs 7
+"""
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
+
+from celeste.modalities.audio.providers.gradium.client import GradiumAudioStream
+from celeste.modalities.text.protocols.chatcompletions import ChatCompletionsTextStream
+from celeste.modalities.text.providers.anthropic.client import AnthropicTextStream
+from celeste.modalities.text.providers.google.vertex import GoogleVertexTextStream
+from celeste.modalities.text.providers.openai.client import OpenAITextStream
+from celeste.streaming import Stream
+
+
+def _anthropic(tokens: int) -> list[dict[str, Any]]:
+    return [
+        {"type": "message_start", "message": {"usage": {"input_tokens": 10}}},
+        *(
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": f"token{i} "},
+            }
+            for i in range(tokens)
+        ),
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"output_tokens": tokens},
+        },
+    ]
+
+
+def _chatcompletions(tokens: int) -> list[dict[str, Any]]:
+    return [
+        *(
+            {
+                "object": "chat.completion.chunk",
+                "choices": [{"index": 0, "delta": {"content": f"token{i} "}}],
+            }
+            for i in range(tokens)
+        ),
+        {
+            "object": "chat.completion.chunk",
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": tokens},
+        },
+    ]
+
+
+def _openresponses(tokens: int) -> list[dict[str, Any]]:
+    return [
+        *(
+            {"type": "response.output_text.delta", "delta": f"token{i} "}
+            for i in range(tokens)
+        ),
+        {
+            "type": "response.completed",
+            "response": {
+                "status": "completed",
+                "output": [],
+                "usage": {"input_tokens": 10, "output_tokens": tokens},
+            },
+        },
+    ]
+
+
+def _google(tokens: int) -> list[dict[str, Any]]:
+    # Gemini repeats cumulative usageMetadata on every chunk.
+    return [
+        {
+            "candidates": [
+                {
+                    "content": {"parts": [{"text": f"token{i} "}]},
+                    **({"finishReason": "STOP"} if i == tokens - 1 else {}),
+                }
+            ],
+            "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": i},
+        }
+        for i in range(tokens)
+    ]
+
+
+def _gradium(tokens: int) -> list[dict[str, Any]]:
+    return [
+        *({"data": b"\x00\x01" * 256} for _ in range(tokens)),
+        {"finish_reason": "stop"},
+    ]
+
+
+_PROVIDERS: dict[
+    str, tuple[type[Stream[Any, Any, Any]], Callable[[int], list[dict[str, Any]]]]
+] = {
+    "anthropic": (AnthropicTextStream, _anthropic),
+    "chatcompletions": (ChatCompletionsTextStream, _chatcompletions),
+    "google": (GoogleVertexTextStream, _google),
+    "openai": (OpenAITextStream, _openresponses),
+    "gradium (audio)": (GradiumAudioStream, _gradium),
+}
+
+
+@contextlib.contextmanager
+def _validated() -> Iterator[None]:
+    """Swap in the previous validating chunk constructor."""
+
+    def build_chunk(self: Stream[Any, Any, Any], fields: dict[str, Any]) -> Any:  # noqa: ANN401
+        return self._chunk_class(**fields)
+
+    original = Stream._build_chunk
+    Stream._build_chunk = build_chunk  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        Stream._build_chunk = original  # type: ignore[method-assign]
+
+
+async def _events(events: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for event in events:
+        yield event
+
+
+async def _drain(
+    stream_class: type[Stream[Any, Any, Any]], events: list[dict[str, Any]]
+) -> tuple[int, float]:
+    stream = stream_class(_events(events))
+    count = 0
+    started = time.perf_counter()
+    async for _ in stream:
+        count += 1
+    return count, time.perf_counter() - started
+
+
+def _rates(
+    stream_class: type[Stream[Any, Any, Any]], events: list[dict[str, Any]], runs: int
+) -> tuple[float, float]:
+    """Best-of-``runs`` chunks/s (validated, constructed), alternating the two."""
+    best = [float("inf"), float("inf")]
+    count = 0
+    gc.disable()
+    try:
+        for _ in range(runs):
+            for index, mode in enumerate((_validated, contextlib.nullcontext)):
+                with mode():
+                    count, seconds = asyncio.run(_drain(stream_class, events))
+                best[index] = min(best[index], seconds)
+                gc.collect()
+    finally:
+        gc.enable()
+    return count / best[0], count / best[1]
+
+
+def main() -> None:
+    """Print chunks per second per provider for both construction paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=10000, help="deltas per run")
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{args.tokens} deltas per stream, chunks/s (best of {args.runs})")
+    print(f"  {'provider':<18}{'validated':>12}{'constructed':>14}{'speedup':>9}")
+    for name, (stream_class, make_events) in _PROVIDERS.items():
+        before, after = _rates(stream_class, make_events(args.tokens), args.runs)
+        print(f"  {name:<18}{before:12,.0f}{after:14,.0f}{after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
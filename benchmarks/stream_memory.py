@@ -0,0 +1,139 @@
+"""Stream memory benchmark: memory held by a finished text stream under each retention policy.
+
+Replays recorded SSE events (one JSON event per line) through a provider's text
+stream and reports, per `Retention` policy, the traced memory still held by the
+stream and its output once it is exhausted, and the peak while streaming. Without
+``--recording``, a synthetic Anthropic or Chat Completions stream of ``--tokens``
+text deltas is replayed.
+
+Usage:
+    python benchmarks/stream_memory.py
+    python benchmarks/stream_memory.py --stream chatcompletions --tokens 20000
+    python benchmarks/stream_memory.py --stream anthropic --recording events.jsonl
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import tracemalloc
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+from celeste.modalities.text.protocols.chatcompletions import ChatCompletionsTextStream
+from celeste.modalities.text.providers.anthropic.client import AnthropicTextStream
+from celeste.retention import Retention
+from celeste.streaming import Stream
+
+_STREAMS: dict[str, type[Stream[Any, Any, Any]]] = {
+    "anthropic": AnthropicTextStream,
+    "chatcompletions": ChatCompletionsTextStream,
+}
+
+
+def _anthropic_events(tokens: int) -> list[dict[str, Any]]:
+    start = {"id": "msg_bench", "model": "bench", "usage": {"input_tokens": 10}}
+    return [
+        {"type": "message_start", "message": start},
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        },
+        *(
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": f"token{i} "},
+            }
+            for i in range(tokens)
+        ),
+        {"type": "content_block_stop", "index": 0},
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"output_tokens": tokens},
+        },
+        {"type": "message_stop"},
+    ]
+
+
+def _chatcompletions_events(tokens: int) -> list[dict[str, Any]]:
+    def chunk(delta: dict[str, Any], **extra: Any) -> dict[str, Any]:  # noqa: ANN401
+        return {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "model": "bench",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": None, **extra}],
+        }
+
+    return [
+        *(chunk({"content": f"token{i} "}) for i in range(tokens)),
+        chunk({}, finish_reason="stop"),
+        {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "choices": [],
+            "usage": {"prompt_tokens": 10, "completion_tokens": tokens},
+        },
+    ]
+
+
+_SYNTHETIC = {
+    "anthropic": _anthropic_events,
+    "chatcompletions": _chatcompletions_events,
+}
+
+
+def _load(path: Path) -> list[dict[str, Any]]:
+    with path.open() as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+async def _replay(events: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for event in events:
+        # Each event is decoded fresh, as it would be off the wire.
+        yield json.loads(json.dumps(event))
+
+
+async def _measure(
+    stream_class: type[Stream[Any, Any, Any]],
+    events: list[dict[str, Any]],
+    retention: Retention,
+) -> tuple[int, int]:
+    """Return (bytes held after exhaustion, peak bytes while streaming)."""
+    gc.collect()
+    tracemalloc.start()
+    stream = stream_class(_replay(events), retention=retention)
+    async for _ in stream:
+        pass
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stream
+    return held, peak
+
+
+def main() -> None:
+    """Print retained and peak memory per retention policy in KiB."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stream", choices=sorted(_STREAMS), default="anthropic")
+    parser.add_argument("--recording", type=Path, help="JSONL file of SSE events")
+    parser.add_argument("--tokens", type=int, default=5000, help="synthetic deltas")
+    args = parser.parse_args()
+
+    events = (
+        _load(args.recording)
+        if args.recording
+        else _SYNTHETIC[args.stream](args.tokens)
+    )
+    print(f"{args.stream}: {len(events)} events")
+    print(f"  {'retention':<12}{'held KiB':>12}{'peak KiB':>12}")
+    for retention in Retention:
+        held, peak = asyncio.run(_measure(_STREAMS[args.stream], events, retention))
+        print(f"  {retention:<12}{held / 1024:12.1f}{peak / 1024:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
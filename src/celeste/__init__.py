@@ -6,6 +6,7 @@ from pydantic import SecretStr
 
 from celeste import providers as _providers  # noqa: F401
 from celeste.auth import Authentication, AuthHeader, NoAuth
+from celeste.cache import DiskCache, MemoryCache, ResponseCache, SQLiteCache
 from celeste.client import ModalityClient
 from celeste.core import Modality, Operation, Protocol, Provider
 from celeste.credentials import credentials
@@ -14,24 +15,34 @@ from celeste.exceptions import (
     Error,
     ModelNotFoundError,
 )
+from celeste.http import HTTPConfig
 from celeste.io import Input, Output, Usage
-from celeste.modalities.audio.models import MODELS as _audio_models
+from celeste.jobs import DirectoryJobStore, JobHandle, JobStore, MemoryJobStore
+from celeste.lazy import LazyMapping
+from celeste.modalities.audio.models import MODEL_MODULES as _audio_models
 from celeste.modalities.audio.providers import PROVIDERS as _audio_providers
-from celeste.modalities.embeddings.models import MODELS as _embeddings_models
+from celeste.modalities.embeddings.models import MODEL_MODULES as _embeddings_models
 from celeste.modalities.embeddings.providers import PROVIDERS as _embeddings_providers
-from celeste.modalities.images.models import MODELS as _images_models
+from celeste.modalities.images.models import MODEL_MODULES as _images_models
 from celeste.modalities.images.providers import PROVIDERS as _images_providers
-from celeste.modalities.segmentation.models import MODELS as _segmentation_models
+from celeste.modalities.segmentation.models import (
+    MODEL_MODULES as _segmentation_models,
+)
 from celeste.modalities.segmentation.providers import (
     PROVIDERS as _segmentation_providers,
 )
-from celeste.modalities.text.models import MODELS as _text_models
-from celeste.modalities.text.protocols.chatcompletions import ChatCompletionsTextClient
-from celeste.modalities.text.protocols.openresponses import OpenResponsesTextClient
+from celeste.modalities.text.models import MODEL_MODULES as _text_models
 from celeste.modalities.text.providers import PROVIDERS as _text_providers
-from celeste.modalities.videos.models import MODELS as _videos_models
+from celeste.modalities.videos.models import MODEL_MODULES as _videos_models
 from celeste.modalities.videos.providers import PROVIDERS as _videos_providers
-from celeste.models import Model, _models, get_model, list_models, register_models
+from celeste.models import (
+    Model,
+    get_model,
+    list_models,
+    register_catalog,
+    register_models,
+)
+from celeste.retention import Retention, retention_scope
 from celeste.tools import (
     CodeExecution,
     Tool,
@@ -56,28 +67,45 @@ from celeste.types import (
     VideoPart,
 )
 
-_CLIENT_MAP: dict[tuple[Modality, Provider | Protocol], type[ModalityClient]] = {
-    **{(Modality.TEXT, p): c for p, c in _text_providers.items()},
-    **{(Modality.IMAGES, p): c for p, c in _images_providers.items()},
-    **{(Modality.VIDEOS, p): c for p, c in _videos_providers.items()},
-    **{(Modality.AUDIO, p): c for p, c in _audio_providers.items()},
-    **{(Modality.EMBEDDINGS, p): c for p, c in _embeddings_providers.items()},
-    **{(Modality.SEGMENTATION, p): c for p, c in _segmentation_providers.items()},
-    # Protocol entries (for compatible APIs via protocol= + base_url=)
-    (Modality.TEXT, Protocol.OPENRESPONSES): OpenResponsesTextClient,
-    (Modality.TEXT, Protocol.CHATCOMPLETIONS): ChatCompletionsTextClient,
-}
+# Provider clients are imported on first lookup, so `import celeste` only pays
+# for the providers a program actually uses.
+_CLIENT_MAP: LazyMapping[tuple[Modality, Provider | Protocol], type[ModalityClient]] = (
+    LazyMapping(
+        {
+            **{(Modality.TEXT, p): c for p, c in _text_providers.raw_items()},
+            **{(Modality.IMAGES, p): c for p, c in _images_providers.raw_items()},
+            **{(Modality.VIDEOS, p): c for p, c in _videos_providers.raw_items()},
+            **{(Modality.AUDIO, p): c for p, c in _audio_providers.raw_items()},
+            **{
+                (Modality.EMBEDDINGS, p): c
+                for p, c in _embeddings_providers.raw_items()
+            },
+            **{
+                (Modality.SEGMENTATION, p): c
+                for p, c in _segmentation_providers.raw_items()
+            },
+        }
+    )
+)
+# Protocol entries (for compatible APIs via protocol= + base_url=)
+_CLIENT_MAP[(Modality.TEXT, Protocol.OPENRESPONSES)] = (
+    "celeste.modalities.text.protocols.openresponses:OpenResponsesTextClient"
+)
+_CLIENT_MAP[(Modality.TEXT, Protocol.CHATCOMPLETIONS)] = (
+    "celeste.modalities.text.protocols.chatcompletions:ChatCompletionsTextClient"
+)
 
-for _model in [
-    *_text_models,
-    *_images_models,
-    *_videos_models,
-    *_audio_models,
-    *_embeddings_models,
-    *_segmentation_models,
+# Model catalogs load per provider on first lookup (see celeste.models).
+for _catalogs in [
+    _text_models,
+    _images_models,
+    _videos_models,
+    _audio_models,
+    _embeddings_models,
+    _segmentation_models,
 ]:
-    assert _model.provider is not None
-    _models[(_model.id, _model.provider)] = _model
+    for _provider, _module in _catalogs.items():
+        register_catalog(_provider, _module)
 
 
 def _resolve_model(
@@ -140,6 +168,9 @@ def create_client(
     auth: Authentication | None = None,
     protocol: Protocol | None = None,
     base_url: str | None = None,
+    http_config: HTTPConfig | None = None,
+    cache: ResponseCache | None = None,
+    retention: Retention | str = Retention.FULL,
 ) -> ModalityClient:
     """Create an async client for the specified modality.
 
@@ -154,6 +185,13 @@ def create_client(
                   "chatcompletions"). Use with base_url for third-party compatible APIs.
         base_url: Custom base URL override. Use with protocol for compatible APIs,
                   or with provider to proxy through a custom endpoint.
+        http_config: Transport settings (HTTP/2, pool limits, keepalive, per-phase
+                     timeouts). Clients sharing a config share a connection pool.
+        cache: Opt-in exact-match response cache (MemoryCache, SQLiteCache or
+               DiskCache). Identical unary requests are served from it.
+        retention: How much raw provider payload chunks and outputs keep
+                   ("full", "last_event" or "none"). Override per call with
+                   ``retention_scope``.
 
     Returns:
         Configured client instance ready for generation operations.
@@ -214,6 +252,9 @@ def create_client(
         protocol=protocol,
         auth=resolved_auth,
         base_url=base_url,
+        http_config=http_config,
+        cache=cache,
+        retention=Retention(retention),
     )
 
 
@@ -221,10 +262,17 @@ __all__ = [
     "AudioPart",
     "Authentication",
     "CodeExecution",
+    "DirectoryJobStore",
+    "DiskCache",
     "DocumentPart",
     "Error",
+    "HTTPConfig",
     "ImagePart",
     "Input",
+    "JobHandle",
+    "JobStore",
+    "MemoryCache",
+    "MemoryJobStore",
     "Message",
     "MessageContent",
     "MessagePart",
@@ -234,7 +282,10 @@ __all__ = [
     "Output",
     "Protocol",
     "Provider",
+    "ResponseCache",
+    "Retention",
     "Role",
+    "SQLiteCache",
     "TextPart",
     "Tool",
     "ToolCall",
@@ -254,6 +305,7 @@ __all__ = [
     "images",
     "list_models",
     "register_models",
+    "retention_scope",
     "text",
     "videos",
 ]
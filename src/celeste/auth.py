@@ -13,6 +13,13 @@ class Authentication(ABC, BaseModel):
         """Return authentication headers for HTTP requests."""
         ...
 
+    async def ensure_valid(self) -> None:
+        """Prepare credentials so get_headers() does not block the event loop.
+
+        Awaited before each request. Static credentials need nothing; token
+        based methods load or refresh their token here.
+        """
+
 
 class AuthHeader(Authentication):
     """Authentication via HTTP header with configurable header name and prefix.
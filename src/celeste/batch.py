@@ -0,0 +1,153 @@
+"""Bounded-concurrency fan-out and provider batch jobs over many inputs."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_BATCH_POLL_INTERVAL = 30.0  # seconds
+
+
+class BatchResult[Out](BaseModel):
+    """Outcome of one batch item, tagged with its position in the input."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    index: int
+    output: Out | None = None
+    error: Exception | None = Field(default=None, exclude=True)
+
+    @property
+    def ok(self) -> bool:
+        """True if the item completed without an error."""
+        return self.error is None
+
+    def unwrap(self) -> Out:
+        """Return the output, re-raising the item's error if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.output  # type: ignore[return-value]  # set whenever error is None
+
+
+async def run_batch[Item, Out](
+    items: Iterable[Item],
+    call: Callable[[Item], Awaitable[Out]],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[BatchResult[Out]]:
+    """Run ``call`` over ``items`` with at most ``concurrency`` calls in flight.
+
+    Items are pulled lazily, so ``items`` may be a generator over a large
+    dataset. Results are yielded in completion order. An exception from one
+    item is reported on its result instead of aborting the batch. Closing the
+    iterator early cancels the calls still in flight.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1.
+    """
+    if concurrency < 1:
+        msg = "concurrency must be at least 1"
+        raise ValueError(msg)
+
+    async def settle(index: int, item: Item) -> BatchResult[Out]:
+        try:
+            return BatchResult(index=index, output=await call(item))
+        except Exception as exc:
+            return BatchResult(index=index, error=exc)
+
+    source = enumerate(items)
+    pending: set[asyncio.Task[BatchResult[Out]]] = set()
+
+    def fill() -> None:
+        while len(pending) < concurrency:
+            entry = next(source, None)
+            if entry is None:
+                return
+            pending.add(asyncio.create_task(settle(*entry)))
+
+    try:
+        fill()
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            fill()
+            for task in sorted(done, key=lambda task: task.result().index):
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+class BatchJobStatus(StrEnum):
+    """Provider-neutral state of a batch job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
+
+    @property
+    def done(self) -> bool:
+        """True once the provider will no longer change the job."""
+        return self not in {BatchJobStatus.PENDING, BatchJobStatus.RUNNING}
+
+
+class BatchJob(BaseModel):
+    """Handle to a job submitted to a provider's native batch API.
+
+    Serializable, so a job submitted by one process can be collected by another.
+    ``data`` holds the provider's last job object (file ids, result URLs, ...).
+    """
+
+    id: str
+    status: BatchJobStatus
+    size: int
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
+def batch_custom_id(index: int) -> str:
+    """Request id under which batch item ``index`` is submitted."""
+    return f"item-{index}"
+
+
+async def wait_for_batch(
+    job: BatchJob,
+    refresh: Callable[[BatchJob], Awaitable[BatchJob]],
+    *,
+    poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+    timeout: float | None = None,
+) -> BatchJob:
+    """Refresh ``job`` every ``poll_interval`` seconds until it is done.
+
+    Raises:
+        TimeoutError: If the job is still running after ``timeout`` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    while not job.status.done:
+        if deadline is not None and loop.time() + poll_interval > deadline:
+            msg = f"Batch job {job.id} still {job.status} after {timeout} seconds"
+            raise TimeoutError(msg)
+        await asyncio.sleep(poll_interval)
+        job = await refresh(job)
+    return job
+
+
+__all__ = [
+    "DEFAULT_BATCH_POLL_INTERVAL",
+    "DEFAULT_CONCURRENCY",
+    "BatchJob",
+    "BatchJobStatus",
+    "BatchResult",
+    "batch_custom_id",
+    "run_batch",
+    "wait_for_batch",
+]
@@ -0,0 +1,379 @@
+"""Exact-match response caching for unary provider requests."""
+
+import asyncio
+import base64
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from celeste import codec
+from celeste.core import Protocol, Provider
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Marker keys for bytes values in stored JSON: inline base64, or a blob digest.
+_BYTES_KEY = "__bytes__"
+_BLOB_KEY = "__blob__"
+
+
+def _canonical_default(value: object) -> object:
+    """JSON fallback for canonical key hashing."""
+    if isinstance(value, bytes | bytearray | memoryview):
+        return {"__sha256__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def response_cache_key(
+    *,
+    target: Provider | Protocol | None,
+    model_id: str,
+    request_body: Mapping[str, Any],
+    endpoint: str | None = None,
+    base_url: str | None = None,
+    extra_headers: Mapping[str, str] | None = None,
+    parameters: Mapping[str, Any] | None = None,
+) -> str:
+    """Hash a request into a stable cache key.
+
+    The request body is the final one from ``_build_request()``. ``parameters``
+    are included because some providers read them when building the URL.
+    Bytes are hashed rather than embedded, so large uploads keep keys cheap.
+    """
+    payload = {
+        "target": target,
+        "model": model_id,
+        "endpoint": endpoint,
+        "base_url": base_url,
+        "headers": dict(extra_headers or {}),
+        "body": request_body,
+        "parameters": dict(parameters or {}),
+    }
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_canonical_default,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _encode(value: Any, store_blob: Callable[[bytes], str] | None = None) -> Any:  # noqa: ANN401
+    """Make response data JSON-safe, writing bytes inline or to ``store_blob``."""
+    if isinstance(value, bytes | bytearray):
+        if store_blob is not None:
+            return {_BLOB_KEY: store_blob(bytes(value))}
+        return {_BYTES_KEY: base64.b64encode(value).decode("ascii")}
+    if isinstance(value, dict):
+        return {key: _encode(item, store_blob) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_encode(item, store_blob) for item in value]
+    return value
+
+
+def _decode(value: Any, load_blob: Callable[[str], bytes] | None = None) -> Any:  # noqa: ANN401
+    """Reverse :func:`_encode`."""
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if _BYTES_KEY in value:
+                return base64.b64decode(value[_BYTES_KEY])
+            if _BLOB_KEY in value and load_blob is not None:
+                return load_blob(value[_BLOB_KEY])
+        return {key: _decode(item, load_blob) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item, load_blob) for item in value]
+    return value
+
+
+def _expires_at(ttl: float | None) -> float | None:
+    return None if ttl is None else time.time() + ttl
+
+
+def _validate_ttl(ttl: float | None) -> None:
+    if ttl is not None and ttl <= 0:
+        msg = "ttl must be positive"
+        raise ValueError(msg)
+
+
+class ResponseCache(ABC):
+    """Backend storing raw provider response data by request key.
+
+    Hits are parsed by the client's normal ``_parse_*`` hooks, so a cache
+    holds provider JSON rather than Output objects and survives parser changes.
+
+    Usage:
+        client = create_client(..., cache=MemoryCache(ttl=3600))
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored response data, or None on a miss or expiry."""
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, response_data: dict[str, Any]) -> None:
+        """Store response data under ``key``."""
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU cache with optional TTL.
+
+    Stores copies, so callers mutating a parsed response cannot poison
+    later hits.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float | None = None
+    ) -> None:
+        """Initialize an empty cache.
+
+        Raises:
+            ValueError: If ``max_entries`` is less than 1 or ``ttl`` is not positive.
+        """
+        if max_entries < 1:
+            msg = "max_entries must be at least 1"
+            raise ValueError(msg)
+        _validate_ttl(ttl)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float | None, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of the entry and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response_data = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(response_data)
+
+    async def set(self, key: str, response_data: dict[str, Any]) -> None:
+        """Store a copy, evicting the least recently used entry when full."""
+        entry = (_expires_at(self.ttl), copy.deepcopy(response_data))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """SQLite-backed cache shared by every process using the same file.
+
+    Runs in WAL mode so concurrent readers do not block a writer. Queries run
+    in a worker thread to keep the event loop free.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], ttl: float | None = None) -> None:
+        """Open (or create) the cache database at ``path``.
+
+        Raises:
+            ValueError: If ``ttl`` is not positive.
+        """
+        _validate_ttl(ttl)
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success, and always close it."""
+        connection = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _get(self, key: str) -> dict[str, Any] | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        result: dict[str, Any] = _decode(codec.loads(value))
+        return result
+
+    def _set(self, key: str, response_data: dict[str, Any]) -> None:
+        value = codec.dumps_str(_encode(response_data))
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, _expires_at(self.ttl)),
+            )
+
+    def _clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM responses")
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the entry, deleting it if expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response_data: dict[str, Any]) -> None:
+        """Insert or replace the entry."""
+        await asyncio.to_thread(self._set, key, response_data)
+
+    async def clear(self) -> None:
+        """Remove every entry."""
+        await asyncio.to_thread(self._clear)
+
+
+class DiskCache(ResponseCache):
+    """Content-addressed file cache for responses carrying large artifacts.
+
+    Response JSON lives under ``entries/``; binary payloads (audio, video,
+    image bytes) are written once under ``blobs/`` named by their SHA-256, so
+    identical artifacts are stored once however many requests produced them.
+    Writes go through a temporary file and an atomic rename, so concurrent
+    processes never see a partial entry. Blobs are only removed by clear().
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], ttl: float | None = None
+    ) -> None:
+        """Use ``directory`` as the cache root, creating it if needed.
+
+        Raises:
+            ValueError: If ``ttl`` is not positive.
+        """
+        _validate_ttl(ttl)
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / "entries" / key[:2] / f"{key}.json"
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.directory / "blobs" / digest[:2] / digest
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _store_blob(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            self._write_atomic(path, data)
+        return digest
+
+    def _load_blob(self, digest: str) -> bytes:
+        return self._blob_path(digest).read_bytes()
+
+    def _get(self, key: str) -> dict[str, Any] | None:
+        path = self._entry_path(key)
+        try:
+            entry = codec.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            result: dict[str, Any] = _decode(entry["value"], self._load_blob)
+        except FileNotFoundError:
+            return None
+        return result
+
+    def _set(self, key: str, response_data: dict[str, Any]) -> None:
+        entry = {
+            "expires_at": _expires_at(self.ttl),
+            "value": _encode(response_data, self._store_blob),
+        }
+        self._write_atomic(self._entry_path(key), codec.dumps(entry))
+
+    def _clear(self) -> None:
+        for sub in ("entries", "blobs"):
+            root = self.directory / sub
+            if not root.exists():
+                continue
+            for path in sorted(root.rglob("*"), reverse=True):
+                if path.is_dir():
+                    path.rmdir()
+                else:
+                    path.unlink(missing_ok=True)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the entry, deleting it if expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response_data: dict[str, Any]) -> None:
+        """Write the entry, storing bytes values as blobs."""
+        await asyncio.to_thread(self._set, key, response_data)
+
+    async def clear(self) -> None:
+        """Remove every entry and blob."""
+        await asyncio.to_thread(self._clear)
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "DiskCache",
+    "MemoryCache",
+    "ResponseCache",
+    "SQLiteCache",
+    "response_cache_key",
+]
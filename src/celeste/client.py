@@ -9,21 +9,36 @@ from typing import Any, ClassVar, Unpack
 import httpx
 from pydantic import BaseModel, ConfigDict, Field
 
-from celeste import telemetry
+from celeste import codec, telemetry
 from celeste.auth import Authentication
+from celeste.batch import BatchJob, BatchResult, batch_custom_id
+from celeste.cache import ResponseCache, response_cache_key
 from celeste.core import Modality, Protocol, Provider
 from celeste.exceptions import (
+    BatchItemError,
+    BatchNotSupportedError,
     ClientNotFoundError,
+    JobNotSupportedError,
     StreamingNotSupportedError,
     UnsupportedParameterWarning,
 )
 from celeste.grounding import Grounding
-from celeste.http import HTTPClient, get_http_client
+from celeste.http import HTTPClient, HTTPConfig, get_http_client
 from celeste.io import Chunk as ChunkBase
 from celeste.io import FinishReason, Input, Output, Usage
+from celeste.jobs import JobHandle, json_parameters
 from celeste.mime_types import ApplicationMimeType
 from celeste.models import Model
 from celeste.parameters import ParameterMapper, Parameters
+from celeste.ratelimit import (
+    RateLimitKey,
+    credential_fingerprint,
+    rate_limit_scope,
+    rate_limiter,
+    throttle_stream,
+)
+from celeste.retention import Retention, active_retention
+from celeste.sinks import BinarySink, Sink, active_sink
 from celeste.streaming import Stream, enrich_stream_errors
 from celeste.tools import ToolCall, validate_tool_calls
 from celeste.types import RawUsage
@@ -51,6 +66,7 @@ class APIMixin(ABC):
             pass
     """
 
+    modality: Modality
     model: Model
     auth: Authentication
     provider: Provider | None
@@ -140,6 +156,33 @@ class APIMixin(ABC):
         """
         super()._handle_error_response(response)  # type: ignore[misc]
 
+    def _job_handle(self, job_id: str, poll_url: str, **data: Any) -> JobHandle:
+        """Build the handle of a job this client submitted."""
+        return JobHandle(
+            id=job_id,
+            provider=self.provider,
+            protocol=self.protocol,
+            model=self.model.id,
+            modality=self.modality,
+            poll_url=poll_url,
+            data=data,
+        )
+
+    async def _run_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Submit a long-running job and wait for its response data.
+
+        Stub that calls through to ModalityClient._run_job via MRO.
+        """
+        return await super()._run_job(  # type: ignore[misc,no-any-return]
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+
 
 class ModalityClient[
     In: Input,
@@ -164,7 +207,12 @@ class ModalityClient[
     - unary: parameter_mappers, _validate_artifacts, _init_request,
       _build_request, _make_request, _parse_content, _transform_output,
       _parse_tool_calls, _parse_reasoning, _parse_grounding, _parse_container,
-      _parse_usage, _parse_finish_reason, _build_metadata
+      _parse_usage, _parse_finish_reason, _build_metadata (the parse hooks
+      run through _build_output)
+    - batch jobs: the unary request hooks up to _build_request, then
+      _create_batch, _retrieve_batch, _fetch_batch_results, and _build_output
+    - detached jobs: the unary request hooks up to _build_request, then
+      _start_job, _wait_job, _finish_job, and _build_output
     - streaming: parameter_mappers, _validate_artifacts, _init_request,
       _build_request, _make_stream_request, _handle_error_response,
       _transform_output, and _stream_class via the modality stream namespaces
@@ -189,16 +237,31 @@ class ModalityClient[
     protocol: Protocol | None = None
     auth: Authentication = Field(exclude=True)
     base_url: str | None = Field(None, exclude=True)
+    http_config: HTTPConfig | None = Field(None, exclude=True)
+    cache: ResponseCache | None = Field(None, exclude=True)
+    retention: Retention = Field(Retention.FULL, exclude=True)
 
     @property
     def http_client(self) -> HTTPClient:
         """Shared HTTP client with connection pooling."""
         if self.provider is not None:
-            return get_http_client(self.provider, self.modality)
+            return get_http_client(
+                self.provider, self.modality, config=self.http_config
+            )
         if self.protocol is not None:
-            return get_http_client(self.protocol, self.modality)
+            return get_http_client(
+                self.protocol, self.modality, config=self.http_config
+            )
         raise ClientNotFoundError(modality=self.modality)
 
+    def _rate_limit_key(self) -> RateLimitKey:
+        """Key under which the process rate limiter throttles this client."""
+        return (
+            self.provider or self.protocol,
+            self.model.id,
+            credential_fingerprint(self.auth),
+        )
+
     # Namespace properties - implemented by modality clients
     @property
     def sync(self) -> Any:
@@ -221,6 +284,10 @@ class ModalityClient[
     ) -> Out:
         """Generic prediction - called by operation methods.
 
+        When ``cache`` is set, a request identical to a cached one skips the
+        network and its stored response is parsed through the same hooks.
+        Requests writing their body to a sink (see celeste.sinks) bypass it.
+
         Args:
             inputs: Operation-specific input object.
             endpoint: Optional endpoint path (e.g., "/generations").
@@ -242,40 +309,214 @@ class ModalityClient[
             request_body = self._build_request(
                 inputs, extra_body=extra_body, **parameters
             )
-            response_data = await self._make_request(
-                request_body,
-                endpoint=endpoint,
-                extra_headers=extra_headers,
-                **parameters,
+            cache_key: str | None = None
+            response_data: dict[str, Any] | None = None
+            if self.cache is not None and active_sink() is None:
+                # Keyed before _make_request, which may mutate the body.
+                cache_key = response_cache_key(
+                    target=self.provider or self.protocol,
+                    model_id=self.model.id,
+                    request_body=request_body,
+                    endpoint=endpoint,
+                    base_url=self.base_url,
+                    extra_headers=extra_headers,
+                    parameters=parameters,
+                )
+                response_data = await self.cache.get(cache_key)
+                telemetry.record_cache_lookup(
+                    span, response_data is not None, request_attrs
+                )
+            cache_hit = response_data is not None
+            if response_data is None:
+                await self.auth.ensure_valid()
+                rate_limit_key = self._rate_limit_key()
+                await rate_limiter.acquire(
+                    rate_limit_key, request_body, parameters.get("max_tokens")
+                )
+                with rate_limit_scope(rate_limit_key):
+                    response_data = await self._make_request(
+                        request_body,
+                        endpoint=endpoint,
+                        extra_headers=extra_headers,
+                        **parameters,
+                    )
+                if self.cache is not None and cache_key is not None:
+                    await self.cache.set(cache_key, response_data)
+            output = self._build_output(response_data, **parameters)
+            if self.cache is not None:
+                output.metadata["cache_hit"] = cache_hit
+            telemetry.record_output(span, output, request_attrs)
+            return output
+
+    def _build_output(
+        self,
+        response_data: dict[str, Any],
+        **parameters: Unpack[Params],  # type: ignore[misc]
+    ) -> Out:
+        """Parse one provider response into the modality's Output."""
+        content = self._parse_content(response_data)
+        content = self._transform_output(content, **parameters)
+        tool_calls = validate_tool_calls(
+            self._parse_tool_calls(response_data),
+            parameters.get("tools"),
+        )
+        reasoning, signature = self._parse_reasoning(response_data)
+        kwargs: dict[str, Any] = {}
+        if reasoning is not None:
+            kwargs["reasoning"] = reasoning
+        if signature:
+            kwargs["signature"] = signature
+        grounding = self._parse_grounding(response_data)
+        if grounding is not None:
+            kwargs["grounding"] = grounding
+        container = self._parse_container(response_data)
+        if container is not None:
+            kwargs["container"] = container
+        return self._output_class()(
+            content=content,
+            usage=self._get_usage(response_data),
+            finish_reason=self._get_finish_reason(response_data),
+            metadata=self._build_metadata(response_data),
+            tool_calls=tool_calls,
+            **kwargs,
+        )
+
+    async def _submit_batch(
+        self,
+        inputs: list[In],
+        *,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[Params],  # type: ignore[misc]
+    ) -> BatchJob:
+        """Submit many inputs as one job to the provider's native batch API.
+
+        Request bodies are built exactly as _predict() builds them, so every
+        parameter mapper applies; only the transport differs.
+        """
+        requests: dict[str, dict[str, Any]] = {}
+        for index, item in enumerate(inputs):
+            item, item_parameters = self._validate_artifacts(item, **parameters)
+            requests[batch_custom_id(index)] = self._build_request(
+                item, extra_body=extra_body, **item_parameters
             )
-            content = self._parse_content(response_data)
-            content = self._transform_output(content, **parameters)
-            tool_calls = validate_tool_calls(
-                self._parse_tool_calls(response_data),
-                parameters.get("tools"),
+        await self.auth.ensure_valid()
+        return await self._create_batch(requests, extra_headers=extra_headers)
+
+    async def _submit_job(
+        self,
+        inputs: In,
+        *,
+        endpoint: str | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[Params],  # type: ignore[misc]
+    ) -> JobHandle:
+        """Submit a long-running job and return its handle without waiting.
+
+        The request body is built exactly as _predict() builds it; waiting for
+        the result is left to _collect_job(), possibly in another process.
+        The JSON-safe parameters are kept on the handle for that collect.
+        """
+        submitted = json_parameters(parameters)
+        inputs, parameters = self._validate_artifacts(inputs, **parameters)
+        request_body = self._build_request(inputs, extra_body=extra_body, **parameters)
+        await self.auth.ensure_valid()
+        rate_limit_key = self._rate_limit_key()
+        await rate_limiter.acquire(rate_limit_key, request_body)
+        with rate_limit_scope(rate_limit_key):
+            handle = await self._start_job(
+                request_body, endpoint=endpoint, extra_headers=extra_headers
             )
-            reasoning, signature = self._parse_reasoning(response_data)
-            kwargs: dict[str, Any] = {}
-            if reasoning is not None:
-                kwargs["reasoning"] = reasoning
-            if signature:
-                kwargs["signature"] = signature
-            grounding = self._parse_grounding(response_data)
-            if grounding is not None:
-                kwargs["grounding"] = grounding
-            container = self._parse_container(response_data)
-            if container is not None:
-                kwargs["container"] = container
-            output = self._output_class()(
-                content=content,
-                usage=self._get_usage(response_data),
-                finish_reason=self._get_finish_reason(response_data),
-                metadata=self._build_metadata(response_data),
-                tool_calls=tool_calls,
-                **kwargs,
+        return handle.model_copy(update={"parameters": submitted})
+
+    async def _collect_job(
+        self,
+        handle: JobHandle,
+        *,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[Params],  # type: ignore[misc]
+    ) -> Out:
+        """Wait for a submitted job and parse its result into an Output.
+
+        Output transforms use the parameters stored on the handle at submit;
+        explicit parameters override them, and supply values that could not
+        be stored, such as output schema classes.
+
+        Raises:
+            ValueError: If the job was submitted to another model or modality.
+        """
+        submitted = (handle.provider, handle.protocol, handle.model, handle.modality)
+        if submitted != (self.provider, self.protocol, self.model.id, self.modality):
+            msg = (
+                f"Job {handle.id} belongs to {handle.modality} model {handle.model} "
+                f"on {handle.provider or handle.protocol}, not this client"
             )
-            telemetry.record_output(span, output, request_attrs)
-            return output
+            raise ValueError(msg)
+        await self.auth.ensure_valid()
+        status = await self._wait_job(handle, extra_headers=extra_headers)
+        response_data = await self._finish_job(
+            handle, status, extra_headers=extra_headers
+        )
+        return self._build_output(response_data, **{**handle.parameters, **parameters})
+
+    async def _run_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Submit a long-running job and wait for its response data.
+
+        The _make_request() of providers whose API is a job, so inline calls
+        and detached jobs share the submit, poll and result hooks.
+        """
+        handle = await self._start_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+        status = await self._wait_job(handle, extra_headers=extra_headers)
+        return await self._finish_job(handle, status, extra_headers=extra_headers)
+
+    async def _refresh_batch(self, job: BatchJob) -> BatchJob:
+        """Fetch the current state of a batch job."""
+        await self.auth.ensure_valid()
+        return await self._retrieve_batch(job)
+
+    async def _batch_results(
+        self,
+        job: BatchJob,
+        **parameters: Unpack[Params],  # type: ignore[misc]
+    ) -> list[BatchResult[Out]]:
+        """Parse a finished batch job's results into Outputs, in submission order.
+
+        Pass the parameters the job was submitted with; they drive output
+        transforms such as structured-output parsing.
+
+        Raises:
+            ValueError: If the job has not finished yet.
+        """
+        if not job.status.done:
+            msg = f"Batch job {job.id} is still {job.status}"
+            raise ValueError(msg)
+        await self.auth.ensure_valid()
+        responses = await self._fetch_batch_results(job)
+        results: list[BatchResult[Out]] = []
+        for index in range(job.size):
+            custom_id = batch_custom_id(index)
+            response = responses.get(custom_id)
+            if response is None:
+                response = BatchItemError(custom_id, f"no result (job {job.status})")
+            if isinstance(response, BatchItemError):
+                results.append(BatchResult(index=index, error=response))
+                continue
+            try:
+                output = self._build_output(response, **parameters)
+            except Exception as exc:
+                results.append(BatchResult(index=index, error=exc))
+            else:
+                results.append(BatchResult(index=index, output=output))
+        return results
 
     def _parse_tool_calls(self, response_data: dict[str, Any]) -> list[ToolCall]:
         """Parse tool calls from response. Override in providers that support tools."""
@@ -303,6 +544,7 @@ class ModalityClient[
         endpoint: str | None = None,
         extra_body: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
+        sink: Sink | None = None,
         **parameters: Unpack[Params],  # type: ignore[misc]
     ) -> Stream[Out, Params, Chunk]:
         """Generic streaming - called by operation methods.
@@ -315,6 +557,8 @@ class ModalityClient[
             stream_class: The Stream class to instantiate.
             extra_body: Additional parameters to merge into the request body.
             extra_headers: Additional headers to merge into the request headers.
+            sink: Path or binary file that binary chunk content is written to
+                  as it arrives, instead of being kept in memory.
             **parameters: Operation-specific keyword arguments.
 
         Returns:
@@ -341,12 +585,18 @@ class ModalityClient[
             attributes={**request_attrs, "gen_ai.request.stream": True},
         )
         telemetry.add_input_event(span, inputs)
-        sse_iterator = self._make_stream_request(
+        sse_iterator = self._open_stream(
             request_body,
             endpoint=endpoint,
             extra_headers=extra_headers,
             **parameters,
         )
+        sse_iterator = throttle_stream(
+            sse_iterator,
+            self._rate_limit_key(),
+            request_body,
+            parameters.get("max_tokens"),
+        )
         sse_iterator = enrich_stream_errors(sse_iterator, self._handle_error_response)
         sse_iterator = telemetry.bind_first_pull_to_span(sse_iterator, span)
         stream = stream_class(
@@ -357,6 +607,8 @@ class ModalityClient[
                 "provider": self.provider or self.protocol,
                 "modality": self.modality,
             },
+            sink=BinarySink(sink) if sink is not None else None,
+            retention=active_retention(self.retention),
             **parameters,
         )
         return telemetry.trace_stream(stream, span, metric_attributes=request_attrs)  # type: ignore[return-value]
@@ -429,10 +681,65 @@ class ModalityClient[
         """Make HTTP streaming request and return async iterator of events."""
         raise StreamingNotSupportedError(model_id=self.model.id)
 
+    async def _open_stream(
+        self,
+        request_body: dict[str, Any],
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Ready the credentials, then open the provider stream on first pull."""
+        await self.auth.ensure_valid()
+        async for event in self._make_stream_request(request_body, **kwargs):
+            yield event
+
     def _stream_class(self) -> type[Stream[Out, Params, Chunk]]:
         """Return the Stream class for this client."""
         raise StreamingNotSupportedError(model_id=self.model.id)
 
+    async def _create_batch(
+        self,
+        requests: dict[str, dict[str, Any]],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> BatchJob:
+        """Create a native batch job from request bodies keyed by custom id."""
+        raise BatchNotSupportedError(model_id=self.model.id)
+
+    async def _retrieve_batch(self, job: BatchJob) -> BatchJob:
+        """Return ``job`` updated with the provider's current job state."""
+        raise BatchNotSupportedError(model_id=self.model.id)
+
+    async def _fetch_batch_results(
+        self, job: BatchJob
+    ) -> dict[str, dict[str, Any] | BatchItemError]:
+        """Download a finished job's per-item response data keyed by custom id."""
+        raise BatchNotSupportedError(model_id=self.model.id)
+
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        """Submit a long-running job and return its handle."""
+        raise JobNotSupportedError(model_id=self.model.id)
+
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll a job on the shared scheduler and return its final status."""
+        raise JobNotSupportedError(model_id=self.model.id)
+
+    async def _finish_job(
+        self,
+        handle: JobHandle,
+        status: dict[str, Any],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Return a finished job's response data, fetching its result if needed."""
+        return status
+
     def _validate_artifacts(
         self,
         inputs: In,
@@ -450,8 +757,9 @@ class ModalityClient[
         metadata: dict[str, Any] = {
             "model": self.model.id,
             "modality": self.modality,
-            "raw_response": response_data,
         }
+        if active_retention(self.retention) is not Retention.NONE:
+            metadata["raw_response"] = response_data
         if (
             isinstance(response_model := response_data.get("model"), str)
             and response_model
@@ -467,7 +775,7 @@ class ModalityClient[
         """Handle error responses from provider APIs."""
         if not response.is_success:
             try:
-                error_msg = response.json()["error"]["message"]
+                error_msg = codec.loads(response.content)["error"]["message"]
             except (
                 JSONDecodeError,
                 KeyError,
@@ -0,0 +1,171 @@
+"""Pluggable JSON codec for request bodies, responses, streams and telemetry.
+
+The fastest installed backend is picked at import: orjson, then msgspec, then
+the stdlib ``json`` module. ``set_codec`` overrides the choice process-wide.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from celeste.exceptions import MissingDependencyError
+
+type Default = Callable[[Any], Any]
+"""Fallback for objects the codec cannot serialize natively (e.g. ``str``)."""
+
+
+class JSONCodec:
+    """Stdlib ``json`` backend; subclasses swap in a faster library.
+
+    ``dumps`` returns compact UTF-8 bytes, ready to send as a request body;
+    ``loads`` accepts bytes or str. Invalid documents raise ``ValueError``
+    (``json.JSONDecodeError``) whichever backend is active.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, default: Default | None = None) -> bytes:  # noqa: ANN401
+        """Encode ``obj`` to compact UTF-8 JSON bytes."""
+        return json.dumps(
+            obj, default=default, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        """Decode one JSON document."""
+        # Decoding to str first skips the encoding sniffing json.loads does in
+        # Python for bytes input; JSON on the wire is UTF-8.
+        return json.loads(data if isinstance(data, str) else data.decode())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson backend (the ``orjson`` extra)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Bind orjson; raises ImportError when it is not installed."""
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        # Non-str keys (e.g. token ids in logit_bias) are stringified like json.
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, default: Default | None = None) -> bytes:  # noqa: ANN401
+        """Encode ``obj`` to compact UTF-8 JSON bytes."""
+        result: bytes = self._dumps(obj, default=default, option=self._option)
+        return result
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        """Decode one JSON document."""
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """msgspec backend (the ``msgspec`` extra)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Bind msgspec; raises ImportError when it is not installed."""
+        import msgspec
+
+        self._encode = msgspec.json.encode
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any, default: Default | None = None) -> bytes:  # noqa: ANN401
+        """Encode ``obj`` to compact UTF-8 JSON bytes."""
+        if default is None:
+            encoded: bytes = self._encoder.encode(obj)
+        else:
+            encoded = self._encode(obj, enc_hook=default)
+        return encoded
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        """Decode one JSON document."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            # msgspec errors are not ValueErrors; keep the stdlib contract.
+            doc = data if isinstance(data, str) else data.decode(errors="replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "json": JSONCodec,
+    "msgspec": MsgspecCodec,
+    "orjson": OrjsonCodec,
+}
+
+
+def _detect() -> JSONCodec:
+    for codec_type in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_type()
+        except ImportError:
+            continue
+    return JSONCodec()
+
+
+_codec: JSONCodec = _detect()
+
+
+def get_codec() -> JSONCodec:
+    """Return the active JSON codec."""
+    return _codec
+
+
+def set_codec(codec: JSONCodec | str) -> JSONCodec:
+    """Make ``codec`` (an instance or ``"orjson"``/``"msgspec"``/``"json"``) active.
+
+    Returns the previously active codec so callers can restore it.
+
+    Raises:
+        ValueError: If ``codec`` names an unknown backend.
+        MissingDependencyError: If the named backend is not installed.
+    """
+    global _codec
+    if isinstance(codec, str):
+        name = codec
+        if name not in _CODECS:
+            msg = f"Unknown JSON codec {name!r}; expected one of {sorted(_CODECS)}"
+            raise ValueError(msg)
+        try:
+            codec = _CODECS[name]()
+        except ImportError as e:
+            raise MissingDependencyError(library=name, extra=name) from e
+    previous, _codec = _codec, codec
+    return previous
+
+
+def dumps(obj: Any, default: Default | None = None) -> bytes:  # noqa: ANN401
+    """Encode ``obj`` to compact UTF-8 JSON bytes with the active codec."""
+    return _codec.dumps(obj, default)
+
+
+def dumps_str(obj: Any, default: Default | None = None) -> str:  # noqa: ANN401
+    """Encode ``obj`` to a JSON string with the active codec."""
+    return _codec.dumps(obj, default).decode()
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Decode one JSON document with the active codec."""
+    return _codec.loads(data)
+
+
+__all__ = [
+    "Default",
+    "JSONCodec",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "dumps",
+    "dumps_str",
+    "get_codec",
+    "loads",
+    "set_codec",
+]
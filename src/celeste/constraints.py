@@ -5,7 +5,13 @@ import re
 from abc import ABC, abstractmethod
 from typing import Any, ClassVar, get_args, get_origin
 
-from pydantic import BaseModel, Field, computed_field, field_serializer
+from pydantic import (
+    BaseModel,
+    Field,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
 
 from celeste.artifacts import (
     AudioArtifact,
@@ -411,6 +417,20 @@ class ToolSupport(Constraint):
     def _serialize_tools(cls, v: list[type[Tool]]) -> list[str]:
         return [t.__name__ for t in v]
 
+    @field_validator("tools", mode="before")
+    @classmethod
+    def _resolve_tools(cls, v: list[Any]) -> list[Any]:
+        """Accept the serialized form: Tool subclass names."""
+        if not any(isinstance(t, str) for t in v):
+            return v
+        known = {}
+        pending = [Tool]
+        while pending:
+            tool = pending.pop()
+            known[tool.__name__] = tool
+            pending.extend(tool.__subclasses__())
+        return [known.get(t, t) if isinstance(t, str) else t for t in v]
+
     def __call__(self, value: list) -> list:
         """Validate tools list against supported tools."""
         for item in value:
@@ -164,6 +164,45 @@ class StreamEventError(StreamingError):
         super().__init__(f"{prefix}{suffix}: {message}")
 
 
+class BatchError(Error):
+    """Errors related to provider batch jobs."""
+
+    pass
+
+
+class BatchNotSupportedError(BatchError):
+    """Raised when a batch job is requested for a client without a batch API."""
+
+    def __init__(self, model_id: str) -> None:
+        """Initialize with model ID."""
+        self.model_id = model_id
+        super().__init__(f"Batch jobs not supported for model '{model_id}'")
+
+
+class BatchItemError(BatchError):
+    """Raised for a batch item the provider did not complete successfully."""
+
+    def __init__(self, custom_id: str, message: str) -> None:
+        """Initialize with the item's request id and the provider's message."""
+        self.custom_id = custom_id
+        super().__init__(f"Batch item '{custom_id}' failed: {message}")
+
+
+class JobError(Error):
+    """Errors related to detached long-running jobs."""
+
+    pass
+
+
+class JobNotSupportedError(JobError):
+    """Raised when a detached job is requested for a client that answers inline."""
+
+    def __init__(self, model_id: str) -> None:
+        """Initialize with model ID."""
+        self.model_id = model_id
+        super().__init__(f"Detached jobs not supported for model '{model_id}'")
+
+
 class MissingDependencyError(Error):
     """Raised when a required optional dependency is not installed."""
 
@@ -230,10 +269,15 @@ class UnsupportedParameterWarning(UserWarning):
 
 
 __all__ = [
+    "BatchError",
+    "BatchItemError",
+    "BatchNotSupportedError",
     "ClientNotFoundError",
     "ConstraintViolationError",
     "Error",
     "InvalidToolError",
+    "JobError",
+    "JobNotSupportedError",
     "MissingCredentialsError",
     "MissingDependencyError",
     "ModalityNotFoundError",
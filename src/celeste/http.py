@@ -1,40 +1,270 @@
 """HTTP client with persistent connection pooling for AI provider APIs."""
 
 import asyncio
-import json
+import contextlib
+import io
+import itertools
 import logging
-from collections.abc import AsyncIterator, Awaitable, Callable
+import weakref
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
 from typing import Any
 
 import httpx
-from httpx_sse import aconnect_sse
+from pydantic import BaseModel, ConfigDict, Field
 
+from celeste import codec, telemetry
 from celeste.core import Modality, Protocol, Provider
+from celeste.exceptions import MissingDependencyError
+from celeste.ratelimit import observe_response_headers
+from celeste.retry import DEFAULT_RETRY_POLICY, MAX_RETRIES, RetryPolicy
+from celeste.sinks import BinarySink
+from celeste.sse import JSONDecoder, SSEEvent, aiter_ndjson, aiter_sse, decode_json
 
 logger = logging.getLogger(__name__)
 
 MAX_CONNECTIONS = 20
 MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 5.0
 DEFAULT_TIMEOUT = 180.0
-MAX_RETRIES = 2
-RETRY_BASE_DELAY = 0.5
-RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+MIN_DOWNLOAD_SEGMENT_BYTES = 8 * 1024 * 1024
+_DOWNLOAD_ERRORS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+class HTTPConfig(BaseModel):
+    """Transport settings for a shared connection pool.
+
+    Per-phase timeouts left as None fall back to the per-request ``timeout``.
+    ``http2`` multiplexes concurrent requests over one connection per host and
+    requires the ``http2`` extra.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    http2: bool = False
+    max_connections: int | None = Field(default=MAX_CONNECTIONS, ge=1)
+    max_keepalive_connections: int | None = Field(
+        default=MAX_KEEPALIVE_CONNECTIONS, ge=0
+    )
+    keepalive_expiry: float | None = Field(default=KEEPALIVE_EXPIRY, ge=0)
+    connect_timeout: float | None = Field(default=None, gt=0)
+    read_timeout: float | None = Field(default=None, gt=0)
+    write_timeout: float | None = Field(default=None, gt=0)
+    pool_timeout: float | None = Field(default=None, gt=0)
+
+    def limits(self) -> httpx.Limits:
+        """Connection pool limits for httpx."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self, timeout: float) -> float | httpx.Timeout:
+        """Per-request timeout, with configured per-phase overrides applied."""
+        phases = (
+            self.connect_timeout,
+            self.read_timeout,
+            self.write_timeout,
+            self.pool_timeout,
+        )
+        if all(phase is None for phase in phases):
+            return timeout
+        connect, read, write, pool = (
+            timeout if phase is None else phase for phase in phases
+        )
+        return httpx.Timeout(
+            timeout, connect=connect, read=read, write=write, pool=pool
+        )
+
+
+DEFAULT_HTTP_CONFIG = HTTPConfig()
 
 
 async def _retry_request(
     send: Callable[[], Awaitable[httpx.Response]],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    url: str = "",
 ) -> httpx.Response:
-    """Retry `send` on transient failures (network errors + retryable status) with backoff, then fail hard."""
-    for attempt in range(MAX_RETRIES):
+    """Retry `send` on transient failures (network errors + retryable status) per `policy`.
+
+    Returns the last response once retries are exhausted, the budget is spent, or
+    the server asks to wait longer than the policy allows; re-raises the last
+    transport error in the same cases.
+    """
+    delay = policy.base_delay
+    attempt = 0
+    while True:
+        response: httpx.Response | None = None
         try:
             response = await send()
-        except (httpx.TimeoutException, httpx.NetworkError):
-            pass  # transient — retry after backoff
+        except (httpx.TimeoutException, httpx.NetworkError) as exc:
+            error: Exception = exc
+            reason = type(exc).__name__
         else:
-            if response.status_code not in RETRYABLE_STATUS:
+            observe_response_headers(response.headers)
+            if not policy.is_retryable(response):
+                if policy.budget is not None:
+                    policy.budget.record_success()
                 return response
-        await asyncio.sleep(RETRY_BASE_DELAY * 2**attempt)
-    return await send()
+            reason = str(response.status_code)
+
+        if policy.budget is not None:
+            policy.budget.record_failure()
+        next_delay = policy.next_delay(attempt, delay, response)
+        throttled = policy.budget is not None and not policy.budget.allows_retry()
+        if next_delay is not None and throttled:
+            telemetry.record_retry(url, reason, throttled=True)
+        if next_delay is None or throttled:
+            if response is None:
+                raise error
+            return response
+
+        telemetry.record_retry(url, reason)
+        await asyncio.sleep(next_delay)
+        delay = next_delay
+        attempt += 1
+
+
+def _json_request(
+    headers: dict[str, str], json_body: dict[str, Any] | None
+) -> dict[str, Any]:
+    """httpx request kwargs sending ``json_body`` pre-encoded by the active codec.
+
+    The body is encoded once per call, so retries resend the same bytes.
+    """
+    if json_body is None:
+        return {"headers": headers}
+    if not any(name.lower() == "content-type" for name in headers):
+        headers = {**headers, "Content-Type": "application/json"}
+    return {"headers": headers, "content": codec.dumps(json_body)}
+
+
+Origin = tuple[str, str, int]
+"""(scheme, host, port) identifying a connection pool destination."""
+
+
+def request_origin(url: str) -> Origin:
+    """Return the (scheme, host, port) origin of ``url``."""
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return (parsed.scheme, parsed.host, port)
+
+
+PoolKey = tuple[Origin, HTTPConfig]
+
+
+class _LoopPools:
+    """Pools opened on one event loop.
+
+    A sentinel async generator is started on the loop so that
+    ``loop.shutdown_asyncgens()`` — run by `asyncio.run()`, `asyncio.Runner`
+    and the sync runner — closes the pools before the loop goes away.
+    """
+
+    def __init__(self) -> None:
+        self.clients: dict[PoolKey, httpx.AsyncClient] = {}
+        self.closed = False
+        self._sentinel: AsyncIterator[None] | None = self._close_on_shutdown()
+
+    async def start(self) -> None:
+        """Register the sentinel with the running loop."""
+        if self._sentinel is not None:
+            await anext(self._sentinel)
+
+    async def _close_on_shutdown(self) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            self.closed = True
+            # The sentinel's finalizer references the loop; drop it so the
+            # registry's weak key can expire once the loop is gone.
+            self._sentinel = None
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close every pool, logging failures instead of raising."""
+        clients, self.clients = self.clients, {}
+        for (origin, _), client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP pool for {origin}: {e}")
+
+
+class ConnectionPools:
+    """httpx connection pools keyed by event loop, origin and transport config.
+
+    Every origin gets its own pool, so requests to the same host share TCP/TLS
+    connections whichever provider, modality or base URL they come from, and
+    pool limits apply per host. Limits set with `configure()` override the
+    caller's config for that origin.
+
+    httpx connections are bound to the loop that opened them, so each event
+    loop keeps its own warm set of pools (weakly keyed on the loop). A loop's
+    pools are closed when the loop shuts down its async generators.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set of pools."""
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopPools
+        ] = weakref.WeakKeyDictionary()
+        self._origin_configs: dict[Origin, HTTPConfig] = {}
+
+    def configure(self, url: str, config: HTTPConfig) -> None:
+        """Use ``config`` for every pool opened to the origin of ``url``."""
+        self._origin_configs[request_origin(url)] = config
+
+    def config_for(self, url: str, default: HTTPConfig) -> HTTPConfig:
+        """Transport config in effect for ``url``."""
+        return self._origin_configs.get(request_origin(url), default)
+
+    async def _loop_pools(self) -> _LoopPools:
+        loop = asyncio.get_running_loop()
+        pools = self._loops.get(loop)
+        if pools is None or pools.closed:
+            # Forget loops that closed without shutting down async generators
+            for stale in [other for other in self._loops if other.is_closed()]:
+                del self._loops[stale]
+            pools = self._loops[loop] = _LoopPools()
+            await pools.start()
+        return pools
+
+    async def get(self, url: str, config: HTTPConfig) -> httpx.AsyncClient:
+        """Get or create the running loop's pool serving ``url``."""
+        pools = await self._loop_pools()
+        origin = request_origin(url)
+        config = self._origin_configs.get(origin, config)
+        key = (origin, config)
+        client = pools.clients.get(key)
+        if client is None:
+            kwargs: dict[str, Any] = {"limits": config.limits()}
+            if config.http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError as e:
+                    raise MissingDependencyError(library="h2", extra="http2") from e
+                kwargs["http2"] = True
+            client = pools.clients[key] = httpx.AsyncClient(**kwargs)  # nosec B113
+        return client
+
+    def open_pools(self) -> int:
+        """Number of pools currently open on the running loop."""
+        pools = self._loops.get(asyncio.get_running_loop())
+        return len(pools.clients) if pools is not None else 0
+
+    async def aclose(self) -> None:
+        """Close the running loop's pools, logging failures instead of raising.
+
+        Pools belonging to other loops are closed when those loops shut down.
+        """
+        pools = self._loops.get(asyncio.get_running_loop())
+        if pools is not None:
+            await pools.aclose()
 
 
 class HTTPClient:
@@ -44,35 +274,36 @@ class HTTPClient:
         self,
         max_connections: int = MAX_CONNECTIONS,
         max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        retry_policy: RetryPolicy | None = None,
+        config: HTTPConfig | None = None,
+        pools: ConnectionPools | None = None,
     ) -> None:
         """Initialize HTTP client with connection pool limits.
 
         Args:
-            max_connections: Maximum total connections in pool.
-            max_keepalive_connections: Maximum idle keepalive connections.
+            max_connections: Maximum total connections per origin.
+            max_keepalive_connections: Maximum idle keepalive connections per origin.
+            retry_policy: Retry behaviour for transient failures
+                (default: DEFAULT_RETRY_POLICY).
+            config: Transport settings; takes precedence over the pool limit
+                arguments when given.
+            pools: Connection pools to share with other clients. When omitted the
+                client owns private pools and closes them in `aclose()`.
         """
-        self._client: httpx.AsyncClient | None = None
-        self._client_loop: int | None = None
-        self._max_connections = max_connections
-        self._max_keepalive_connections = max_keepalive_connections
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create httpx.AsyncClient with connection pooling."""
-        current_loop = asyncio.get_running_loop()
-
-        # Recreate client if event loop changed (prevents "Event loop is closed" errors)
-        if self._client is not None and self._client_loop != id(current_loop):
-            self._client = None
-
-        if self._client is None:
-            limits = httpx.Limits(
-                max_connections=self._max_connections,
-                max_keepalive_connections=self._max_keepalive_connections,
-            )
-            self._client = httpx.AsyncClient(limits=limits)  # nosec B113
-            self._client_loop = id(current_loop)
+        self.config = config or HTTPConfig(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self._owns_pools = pools is None
+        self._pools = pools if pools is not None else ConnectionPools()
 
-        return self._client
+    async def _get_client(self, url: str) -> httpx.AsyncClient:
+        """Get or create the pooled httpx.AsyncClient for the origin of ``url``."""
+        return await self._pools.get(url, self.config)
+
+    def _timeout(self, url: str, timeout: float) -> float | httpx.Timeout:
+        return self._pools.config_for(url, self.config).timeout(timeout)
 
     async def post(
         self,
@@ -101,14 +332,12 @@ class HTTPClient:
         if not url or not url.strip():
             raise ValueError("URL cannot be empty")
 
-        client = await self._get_client()
+        client = await self._get_client(url)
+        request = _json_request(headers, json_body)
         return await _retry_request(
-            lambda: client.post(
-                url,
-                headers=headers,
-                json=json_body,
-                timeout=timeout,
-            )
+            lambda: client.post(url, **request, timeout=self._timeout(url, timeout)),
+            self.retry_policy,
+            url,
         )
 
     async def post_multipart(
@@ -138,15 +367,17 @@ class HTTPClient:
         if not url or not url.strip():
             raise ValueError("URL cannot be empty")
 
-        client = await self._get_client()
+        client = await self._get_client(url)
         return await _retry_request(
             lambda: client.post(
                 url,
                 headers=headers,
                 files=files,
                 data=data,
-                timeout=timeout,
-            )
+                timeout=self._timeout(url, timeout),
+            ),
+            self.retry_policy,
+            url,
         )
 
     async def get(
@@ -174,22 +405,69 @@ class HTTPClient:
         if not url or not url.strip():
             raise ValueError("URL cannot be empty")
 
-        client = await self._get_client()
+        client = await self._get_client(url)
         return await _retry_request(
             lambda: client.get(
                 url,
                 headers=headers or {},
-                timeout=timeout,
+                timeout=self._timeout(url, timeout),
                 follow_redirects=follow_redirects,
-            )
+            ),
+            self.retry_policy,
+            url,
         )
 
+    async def stream_events(
+        self,
+        url: str,
+        headers: dict[str, str],
+        json_body: dict[str, Any],
+        timeout: float = DEFAULT_TIMEOUT,
+        last_event_id: str | None = None,
+    ) -> AsyncGenerator[SSEEvent]:
+        """Stream POST request and yield raw Server-Sent Events.
+
+        Events keep their ``event`` name and ``id``; pass the last seen id as
+        ``last_event_id`` to resume a stream on providers that support it.
+
+        Args:
+            url: API endpoint URL.
+            headers: HTTP headers (including authentication).
+            json_body: JSON request body.
+            timeout: Timeout in seconds (default: DEFAULT_TIMEOUT).
+            last_event_id: Sent as the ``Last-Event-ID`` header when given.
+
+        Yields:
+            SSE events, framed incrementally from the response bytes.
+        """
+        client = await self._get_client(url)
+        sse_headers = {
+            "Accept": "text/event-stream",
+            "Cache-Control": "no-store",
+            **headers,
+        }
+        if last_event_id is not None:
+            sse_headers["Last-Event-ID"] = last_event_id
+        async with client.stream(
+            "POST",
+            url,
+            **_json_request(sse_headers, json_body),
+            timeout=self._timeout(url, timeout),
+        ) as response:
+            observe_response_headers(response.headers)
+            if not response.is_success:
+                await response.aread()
+                response.raise_for_status()
+            async for event in aiter_sse(response.aiter_bytes()):
+                yield event
+
     async def stream_post(
         self,
         url: str,
         headers: dict[str, str],
         json_body: dict[str, Any],
         timeout: float = DEFAULT_TIMEOUT,
+        decode: JSONDecoder = decode_json,
     ) -> AsyncIterator[dict[str, Any]]:
         """Stream POST request using Server-Sent Events.
 
@@ -198,27 +476,20 @@ class HTTPClient:
             headers: HTTP headers (including authentication).
             json_body: JSON request body.
             timeout: Timeout in seconds (default: DEFAULT_TIMEOUT).
+            decode: JSON decoder applied to each event's data.
 
         Yields:
             Parsed JSON events from SSE stream.
         """
-        client = await self._get_client()
-
-        async with aconnect_sse(
-            client,
-            "POST",
-            url,
-            json=json_body,
-            headers=headers,
-            timeout=timeout,
-        ) as event_source:
-            if not event_source.response.is_success:
-                await event_source.response.aread()
-                event_source.response.raise_for_status()
-            async for sse in event_source.aiter_sse():
+        # aclosing releases the response as soon as this generator is closed,
+        # instead of leaving the inner generator to the loop's finalizer.
+        async with contextlib.aclosing(
+            self.stream_events(url, headers, json_body, timeout)
+        ) as events:
+            async for event in events:
                 try:
-                    yield json.loads(sse.data)
-                except json.JSONDecodeError:
+                    yield decode(event.data)
+                except ValueError:
                     continue  # Skip non-JSON control messages (provider-agnostic)
 
     async def stream_post_ndjson(
@@ -227,6 +498,7 @@ class HTTPClient:
         headers: dict[str, str],
         json_body: dict[str, Any],
         timeout: float = DEFAULT_TIMEOUT,
+        decode: JSONDecoder = decode_json,
     ) -> AsyncIterator[dict[str, Any]]:
         """Stream POST request using NDJSON (newline-delimited JSON).
 
@@ -238,30 +510,309 @@ class HTTPClient:
             headers: HTTP headers (including authentication).
             json_body: JSON request body.
             timeout: Timeout in seconds (default: DEFAULT_TIMEOUT).
+            decode: JSON decoder applied to each line.
 
         Yields:
             Parsed JSON objects from NDJSON stream.
         """
-        client = await self._get_client()
+        client = await self._get_client(url)
+        async with client.stream(
+            "POST",
+            url,
+            **_json_request(headers, json_body),
+            timeout=self._timeout(url, timeout),
+        ) as response:
+            observe_response_headers(response.headers)
+            if not response.is_success:
+                await response.aread()
+                response.raise_for_status()
+            async for document in aiter_ndjson(response.aiter_bytes(), decode):
+                yield document
+
+    async def stream_bytes(
+        self,
+        url: str,
+        headers: dict[str, str],
+        json_body: dict[str, Any],
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> AsyncGenerator[bytes]:
+        """Stream POST request and yield the raw response body chunks.
+
+        Used by providers that stream binary payloads, such as audio.
+
+        Args:
+            url: API endpoint URL.
+            headers: HTTP headers (including authentication).
+            json_body: JSON request body.
+            timeout: Timeout in seconds (default: DEFAULT_TIMEOUT).
+
+        Yields:
+            Non-empty chunks of the response body as they arrive.
+        """
+        client = await self._get_client(url)
         async with client.stream(
             "POST",
             url,
-            json=json_body,
-            headers=headers,
-            timeout=timeout,
+            **_json_request(headers, json_body),
+            timeout=self._timeout(url, timeout),
         ) as response:
+            observe_response_headers(response.headers)
             if not response.is_success:
                 await response.aread()
                 response.raise_for_status()
-            async for line in response.aiter_lines():
-                if line:
-                    yield json.loads(line)
+            async for chunk in response.aiter_bytes():
+                if chunk:
+                    yield chunk
+
+    async def stream_to_sink(
+        self,
+        url: str,
+        sink: BinarySink,
+        headers: dict[str, str] | None = None,
+        json_body: dict[str, Any] | None = None,
+        method: str = "POST",
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> httpx.Response:
+        """Send a request and write the response body to ``sink`` as it arrives.
+
+        The body is never held in memory whole. Error responses are read and
+        returned without touching the sink, so callers handle them as usual.
+        Transient failures are retried per the retry policy, like `post`,
+        until the first byte of the body is written.
+
+        Args:
+            url: Full URL.
+            sink: Destination for the response body.
+            headers: HTTP headers including authentication (optional).
+            json_body: JSON request body (optional).
+            method: HTTP method (default: POST).
+            timeout: Timeout in seconds (default: DEFAULT_TIMEOUT).
+
+        Returns:
+            The response, with its body already consumed on success.
+        """
+        client = await self._get_client(url)
+        request = client.build_request(
+            method,
+            url,
+            **_json_request(headers or {}, json_body),
+            timeout=self._timeout(url, timeout),
+        )
+        body: tuple[bytes, AsyncIterator[bytes]] | None = None
+
+        async def send() -> httpx.Response:
+            nonlocal body
+            response = await client.send(request, stream=True)
+            try:
+                if not response.is_success:
+                    await response.aread()
+                    return response
+                # Pull the first chunk here so a failure before it is retried.
+                chunks = response.aiter_bytes()
+                body = (await anext(chunks, b""), chunks)
+            except BaseException:
+                await response.aclose()
+                raise
+            return response
+
+        response = await _retry_request(send, self.retry_policy, url)
+        if body is None:
+            return response
+        first, chunks = body
+        try:
+            if first:
+                sink.write(first)
+            async for chunk in chunks:
+                sink.write(chunk)
+        finally:
+            await response.aclose()
+        return response
+
+    async def download(
+        self,
+        url: str,
+        sink: BinarySink,
+        headers: dict[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        segments: int = 1,
+        follow_redirects: bool = True,
+    ) -> httpx.Response:
+        """Download ``url`` into ``sink`` in chunks, resuming dropped connections.
+
+        A body cut off mid-transfer is resumed with an HTTP ``Range`` request
+        for the remaining bytes; a server that ignores the range resends the
+        whole body, which is written again from the start (seekable sinks
+        only). Resumes that extended the body do not count against the retry
+        policy; restarts from the start do.
+
+        With ``segments`` > 1, a server that advertises byte ranges and a body
+        length, and a seekable sink, the body is fetched as up to ``segments``
+        parallel ranged requests of at least ``MIN_DOWNLOAD_SEGMENT_BYTES``,
+        each written at its own offset.
+
+        Args:
+            url: Full URL to GET.
+            sink: Destination for the response body.
+            headers: HTTP headers including authentication (optional).
+            timeout: Timeout in seconds per request (default: DEFAULT_TIMEOUT).
+            segments: Maximum number of parallel ranged requests (default: 1).
+            follow_redirects: Whether to follow HTTP redirects (default: True).
+
+        Returns:
+            The last response, with its body already consumed. Error responses
+            are read and returned without touching the sink.
+
+        Raises:
+            httpx.HTTPError: On network or timeout errors once retries are spent.
+            ValueError: If URL is empty or ``segments`` is below 1.
+            io.UnsupportedOperation: If the server ignores a resume ``Range``
+                request and ``sink`` is not seekable.
+        """
+        if not url or not url.strip():
+            raise ValueError("URL cannot be empty")
+        if segments < 1:
+            raise ValueError("segments must be at least 1")
+
+        client = await self._get_client(url)
+        # Byte offsets must match the stored representation.
+        request_headers = {**(headers or {}), "Accept-Encoding": "identity"}
+        request_timeout = self._timeout(url, timeout)
+
+        async def fetch(start: int, end: int | None) -> httpx.Response:
+            return await self._download_range(
+                client,
+                url,
+                sink,
+                request_headers,
+                request_timeout,
+                follow_redirects,
+                start,
+                end,
+            )
+
+        size = None
+        if segments > 1 and sink.seekable():
+            head = await _retry_request(
+                lambda: client.head(
+                    url,
+                    headers=request_headers,
+                    timeout=request_timeout,
+                    follow_redirects=follow_redirects,
+                ),
+                self.retry_policy,
+                url,
+            )
+            if head.is_success and head.headers.get("accept-ranges") == "bytes":
+                with contextlib.suppress(KeyError, ValueError):
+                    size = int(head.headers["content-length"])
+        count = min(segments, (size or 0) // MIN_DOWNLOAD_SEGMENT_BYTES)
+        if size is None or count < 2:
+            return await fetch(0, None)
+
+        bounds = [size * index // count for index in range(count + 1)]
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(fetch(start, end - 1))
+                for start, end in itertools.pairwise(bounds)
+            ]
+        responses = [task.result() for task in tasks]
+        return next((r for r in responses if not r.is_success), responses[-1])
+
+    async def _download_range(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        sink: BinarySink,
+        headers: dict[str, str],
+        timeout: float | httpx.Timeout,
+        follow_redirects: bool,
+        start: int,
+        end: int | None,
+    ) -> httpx.Response:
+        """Write bytes ``start``..``end`` (inclusive; None = to the end) of ``url``."""
+        policy = self.retry_policy
+        offset = start
+        written = start  # high-water mark: bytes up to here are in the sink
+        delay = policy.base_delay
+        attempt = 0
+        while True:
+            range_headers = dict(headers)
+            if offset or end is not None:
+                range_headers["Range"] = f"bytes={offset}-{'' if end is None else end}"
+            response: httpx.Response | None = None
+            # Only an answer to what was asked (206 to a range, or any success
+            # to a plain GET) that extends the high-water mark is progress; a
+            # server ignoring ranges must not resend the start forever.
+            resumable = False
+            try:
+                async with client.stream(
+                    "GET",
+                    url,
+                    headers=range_headers,
+                    timeout=timeout,
+                    follow_redirects=follow_redirects,
+                ) as response:
+                    observe_response_headers(response.headers)
+                    if not response.is_success:
+                        await response.aread()
+                        if not policy.is_retryable(response):
+                            return response
+                        reason = str(response.status_code)
+                    else:
+                        partial = response.status_code == 206
+                        resumable = partial or "Range" not in range_headers
+                        if not partial:
+                            if written > 0 and not sink.seekable():
+                                msg = (
+                                    "Server ignored the Range request; cannot "
+                                    "rewrite a non-seekable sink from the start"
+                                )
+                                raise io.UnsupportedOperation(msg)
+                            offset = 0  # Range ignored: the whole body follows
+                        async for chunk in response.aiter_bytes():
+                            sink.write_at(offset, chunk)
+                            offset += len(chunk)
+                        if not partial or end is None or offset > end:
+                            if policy.budget is not None:
+                                policy.budget.record_success()
+                            return response
+                        reason = "truncated"
+            except _DOWNLOAD_ERRORS as exc:
+                error: Exception = exc
+                reason = type(exc).__name__
+                response = None
+
+            progressed = resumable and offset > written
+            written = max(written, offset)
+            if progressed:
+                # Progress was made; resume without spending a retry.
+                telemetry.record_retry(url, reason)
+                attempt = 0
+                delay = policy.base_delay
+                continue
+            if policy.budget is not None:
+                policy.budget.record_failure()
+            next_delay = policy.next_delay(attempt, delay, response)
+            throttled = policy.budget is not None and not policy.budget.allows_retry()
+            if next_delay is not None and throttled:
+                telemetry.record_retry(url, reason, throttled=True)
+            if next_delay is None or throttled:
+                if response is None:
+                    raise error
+                return response
+            telemetry.record_retry(url, reason)
+            await asyncio.sleep(next_delay)
+            delay = next_delay
+            attempt += 1
 
     async def aclose(self) -> None:
-        """Close HTTP client and cleanup all connections."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Close HTTP client and cleanup connections it owns.
+
+        Clients sharing process-wide pools leave them open; use
+        `close_all_http_clients()` to close those.
+        """
+        if self._owns_pools:
+            await self._pools.aclose()
 
     async def __aenter__(self) -> "HTTPClient":
         """Enter async context manager."""
@@ -272,49 +823,85 @@ class HTTPClient:
         await self.aclose()
 
 
+# Process-wide connection pools shared by every registry client
+_shared_pools = ConnectionPools()
+
 # Module-level registry of shared HTTPClient instances
-_http_clients: dict[tuple[Provider | Protocol, Modality], HTTPClient] = {}
+_http_clients: dict[tuple[Provider | Protocol, Modality, HTTPConfig], HTTPClient] = {}
 
 
-def get_http_client(provider: Provider | Protocol, modality: Modality) -> HTTPClient:
+def get_http_client(
+    provider: Provider | Protocol,
+    modality: Modality,
+    *,
+    retry_policy: RetryPolicy | None = None,
+    config: HTTPConfig | None = None,
+) -> HTTPClient:
     """Get or create shared HTTP client for provider and modality combination.
 
+    Clients returned here share process-wide connection pools keyed by origin,
+    so every provider and modality calling the same host reuses its connections.
+
     Args:
         provider: The AI provider.
         modality: The modality being used.
+        retry_policy: Optional retry policy to install on the shared client.
+            Applies to every later request for this provider and modality.
+        config: Transport settings (default: DEFAULT_HTTP_CONFIG). Each
+            distinct config gets its own pool per origin.
 
     Returns:
-        Shared HTTPClient instance for this provider and modality.
+        Shared HTTPClient instance for this provider, modality and config.
     """
-    key = (provider, modality)
+    config = config or DEFAULT_HTTP_CONFIG
+    key = (provider, modality, config)
     if key not in _http_clients:
-        _http_clients[key] = HTTPClient()
+        _http_clients[key] = HTTPClient(config=config, pools=_shared_pools)
+    if retry_policy is not None:
+        _http_clients[key].retry_policy = retry_policy
     return _http_clients[key]
 
 
+def configure_origin(url: str, config: HTTPConfig) -> None:
+    """Set transport settings for every shared pool opened to the origin of ``url``.
+
+    Overrides the client's config for that host, e.g. to raise the connection
+    limit for one provider or a custom ``base_url``.
+    """
+    _shared_pools.configure(url, config)
+
+
 async def close_all_http_clients() -> None:
-    """Close all HTTP clients gracefully and clear registry."""
-    for key, client in list(_http_clients.items()):
-        try:
-            await client.aclose()
-        except Exception as e:
-            logger.warning(f"Failed to close HTTP client for {key}: {e}")
+    """Close the running loop's shared connection pools and clear registry.
 
+    Pools opened on other event loops close when those loops shut down.
+    """
+    await _shared_pools.aclose()
     _http_clients.clear()
 
 
 def clear_http_clients() -> None:
     """Clear HTTP client registry without closing connections."""
+    global _shared_pools
+    _shared_pools = ConnectionPools()
     _http_clients.clear()
 
 
 __all__ = [
+    "DEFAULT_HTTP_CONFIG",
     "DEFAULT_TIMEOUT",
+    "KEEPALIVE_EXPIRY",
     "MAX_CONNECTIONS",
     "MAX_KEEPALIVE_CONNECTIONS",
     "MAX_RETRIES",
+    "ConnectionPools",
     "HTTPClient",
+    "HTTPConfig",
+    "Origin",
+    "RetryPolicy",
     "clear_http_clients",
     "close_all_http_clients",
+    "configure_origin",
     "get_http_client",
+    "request_origin",
 ]
@@ -2,6 +2,7 @@
 
 import inspect
 import types
+from collections.abc import Callable
 from typing import Any, get_args, get_origin
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -60,6 +61,61 @@ class Chunk[Content](BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_private = BaseModel.__dict__["__pydantic_private__"].__set__
+_constructors: dict[type[BaseModel], Callable[[dict[str, Any]], Any]] = {}
+
+
+def trusted_constructor[M: BaseModel](
+    model_class: type[M],
+) -> Callable[[dict[str, Any]], M]:
+    """Return a function building ``model_class`` from already-typed fields.
+
+    Streams build a chunk per event from values their own parsers produced,
+    so validation there is pure overhead. The returned function fills in the
+    defaults resolved once for the class and sets the instance state directly,
+    which is cheaper than both validation and ``model_construct``. Models with
+    private attributes, ``extra="allow"`` or a post-init hook, and calls that
+    pass unknown fields or omit one without a static default, fall back to
+    ``model_construct``.
+    """
+    try:
+        return _constructors[model_class]
+    except KeyError:
+        pass
+    direct = not (
+        model_class.__private_attributes__
+        or model_class.model_config.get("extra") == "allow"
+        or model_class.__pydantic_post_init__
+    )
+    defaults: dict[str, Any] = {}
+    required: set[str] = set()
+    for name, info in model_class.model_fields.items():
+        if info.is_required() or info.default_factory is not None:
+            required.add(name)
+            defaults[name] = None  # Always overwritten by the caller's value.
+        else:
+            defaults[name] = info.default
+    names = frozenset(defaults)
+    new = object.__new__
+    set_dict = object.__setattr__
+
+    def construct(fields: dict[str, Any]) -> M:
+        keys = fields.keys()
+        if not (direct and keys <= names and required <= keys):
+            return model_class.model_construct(**fields)
+        model = new(model_class)
+        set_dict(model, "__dict__", {**defaults, **fields})
+        _fields_set(model, set(keys))
+        _extra(model, None)
+        _private(model, None)
+        return model
+
+    _constructors[model_class] = construct
+    return construct
+
+
 # Centralized mapping: field type → InputType
 INPUT_TYPE_MAPPING: dict[type, InputType] = {
     str: InputType.TEXT,
@@ -125,4 +181,5 @@ __all__ = [
     "Output",
     "Usage",
     "get_constraint_input_type",
+    "trusted_constructor",
 ]
@@ -0,0 +1,185 @@
+"""Durable handles for long-running provider jobs, and stores to keep them in."""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from celeste.core import Modality, Protocol, Provider
+from celeste.types import JsonValue
+
+
+class JobHandle(BaseModel):
+    """Handle to a long-running job submitted without waiting for it.
+
+    Serializable, so a job submitted by one process can be collected by
+    another holding a client for the same provider, model and credentials.
+    ``poll_url`` is where the job's status is read; ``data`` holds whatever
+    else the provider needs to fetch the result (result URLs, submit
+    metadata used for usage). ``parameters`` keeps the JSON-safe submit
+    parameters, so the collector parses the output as generate() would.
+    Credentials are never stored on the handle.
+    """
+
+    id: str
+    provider: Provider | None = None
+    protocol: Protocol | None = None
+    model: str
+    modality: Modality
+    poll_url: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    data: dict[str, Any] = Field(default_factory=dict)
+    parameters: dict[str, JsonValue] = Field(default_factory=dict)
+
+
+def _is_json_value(value: object) -> bool:
+    if value is None or isinstance(value, str | int | float | bool):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_value(item) for key, item in value.items()
+        )
+    return False
+
+
+def json_parameters(parameters: dict[str, Any]) -> dict[str, JsonValue]:
+    """Return the parameters a JobHandle can carry: those with plain JSON values.
+
+    Values such as artifacts or output schema classes are left out; pass them
+    to collect() again if its output transforms need them.
+    """
+    return {key: value for key, value in parameters.items() if _is_json_value(value)}
+
+
+class JobStore(ABC):
+    """Persists job handles between the process that submits and the one that collects.
+
+    Handles are keyed by ``JobHandle.id``.
+    """
+
+    @abstractmethod
+    async def save(self, handle: JobHandle) -> None:
+        """Store ``handle``, replacing any handle with the same id."""
+        ...
+
+    @abstractmethod
+    async def get(self, job_id: str) -> JobHandle | None:
+        """Return the stored handle for ``job_id``, or None."""
+        ...
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> None:
+        """Remove the handle for ``job_id``; a no-op if there is none."""
+        ...
+
+    @abstractmethod
+    async def pending(self) -> list[JobHandle]:
+        """Return every stored handle, oldest first.
+
+        Collecting through a store deletes the handle, so these are the jobs
+        not yet collected.
+        """
+        ...
+
+
+class MemoryJobStore(JobStore):
+    """In-process job store, for tests and single-process deployments."""
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._handles: dict[str, JobHandle] = {}
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    async def save(self, handle: JobHandle) -> None:
+        """Store ``handle``."""
+        self._handles[handle.id] = handle
+
+    async def get(self, job_id: str) -> JobHandle | None:
+        """Return the handle for ``job_id``, or None."""
+        return self._handles.get(job_id)
+
+    async def delete(self, job_id: str) -> None:
+        """Remove the handle for ``job_id``."""
+        self._handles.pop(job_id, None)
+
+    async def pending(self) -> list[JobHandle]:
+        """Return every handle, oldest first."""
+        return sorted(self._handles.values(), key=lambda handle: handle.created_at)
+
+
+class DirectoryJobStore(JobStore):
+    """Job store keeping one JSON file per handle in a directory.
+
+    The directory can be shared by processes on one host or mounted across
+    hosts. Writes go through a temporary file and an atomic rename, so a
+    reader never sees a partial handle.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """Use ``directory`` as the store root, creating it if needed."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, job_id: str) -> Path:
+        # Provider ids may contain slashes (e.g. Veo operation names).
+        return self.directory / f"{hashlib.sha256(job_id.encode()).hexdigest()}.json"
+
+    def _save(self, handle: JobHandle) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(handle.model_dump_json().encode())
+            os.replace(tmp, self._path(handle.id))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _get(self, job_id: str) -> JobHandle | None:
+        try:
+            return JobHandle.model_validate_json(self._path(job_id).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def _pending(self) -> list[JobHandle]:
+        handles: list[JobHandle] = []
+        for path in self.directory.glob("*.json"):
+            try:
+                handles.append(JobHandle.model_validate_json(path.read_bytes()))
+            except FileNotFoundError:
+                continue  # Collected by another process meanwhile
+        return sorted(handles, key=lambda handle: handle.created_at)
+
+    async def save(self, handle: JobHandle) -> None:
+        """Write ``handle`` to its file."""
+        await asyncio.to_thread(self._save, handle)
+
+    async def get(self, job_id: str) -> JobHandle | None:
+        """Read the handle for ``job_id``, or None."""
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def delete(self, job_id: str) -> None:
+        """Delete the handle file for ``job_id``."""
+        await asyncio.to_thread(self._path(job_id).unlink, missing_ok=True)
+
+    async def pending(self) -> list[JobHandle]:
+        """Read every handle in the directory, oldest first."""
+        return await asyncio.to_thread(self._pending)
+
+
+__all__ = [
+    "DirectoryJobStore",
+    "JobHandle",
+    "JobStore",
+    "MemoryJobStore",
+    "json_parameters",
+]
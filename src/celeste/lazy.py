@@ -0,0 +1,99 @@
+"""Deferred imports, so provider clients load only when first used."""
+
+import importlib
+import importlib.util
+import sys
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+
+def resolve_spec(spec: str, package: str | None = None) -> str:
+    """Make a ``"module:attribute"`` spec absolute relative to ``package``."""
+    module, _, attribute = spec.partition(":")
+    return f"{importlib.util.resolve_name(module, package)}:{attribute}"
+
+
+def import_spec(spec: str) -> Any:  # noqa: ANN401
+    """Import the object named by an absolute ``"module:attribute"`` spec."""
+    module, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module), attribute)
+
+
+def lazy_attributes(package: str, specs: Mapping[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports ``specs`` on first access.
+
+    Usage:
+        __getattr__ = lazy_attributes(__name__, {"AnthropicTextClient": ".client:AnthropicTextClient"})
+    """
+    absolute = {name: resolve_spec(spec, package) for name, spec in specs.items()}
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        spec = absolute.get(name)
+        if spec is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = import_spec(spec)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
+
+
+class LazyMapping[K, V](MutableMapping[K, V]):
+    """Mapping whose values are import specs, imported on first lookup.
+
+    Membership and iteration never import; reading a value imports only that
+    value's module. Values may also be set directly.
+    """
+
+    def __init__(
+        self, specs: Mapping[K, V | str] | None = None, package: str | None = None
+    ) -> None:
+        """Initialize from values or ``"module:attribute"`` specs.
+
+        Relative specs are resolved against ``package``.
+        """
+        self._entries: dict[K, V | str] = {}
+        for key, value in (specs or {}).items():
+            self._entries[key] = (
+                resolve_spec(value, package) if isinstance(value, str) else value
+            )
+
+    def __getitem__(self, key: K) -> V:
+        value = self._entries[key]
+        if isinstance(value, str):
+            value = self._entries[key] = import_spec(value)
+        return value
+
+    def __setitem__(self, key: K, value: V | str) -> None:
+        self._entries[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        del self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._entries!r})"
+
+    def copy(self) -> "LazyMapping[K, V]":
+        """Shallow copy that keeps unimported entries unimported."""
+        return LazyMapping(self._entries)
+
+    def raw_items(self) -> Iterator[tuple[K, V | str]]:
+        """Items with unimported values still as specs."""
+        return iter(self._entries.items())
+
+    def is_loaded(self, key: K) -> bool:
+        """Whether the value for ``key`` has been imported."""
+        return not isinstance(self._entries[key], str)
+
+
+__all__ = ["LazyMapping", "import_spec", "lazy_attributes", "resolve_spec"]
@@ -1,13 +1,16 @@
 """Audio modality client."""
 
+from collections.abc import AsyncIterator, Iterable
 from typing import Any, ClassVar, Unpack
 
-from asgiref.sync import async_to_sync
-
 from celeste import telemetry
+from celeste.artifacts import AudioArtifact
+from celeste.batch import DEFAULT_CONCURRENCY, BatchResult, run_batch
 from celeste.client import ModalityClient
 from celeste.core import Modality
 from celeste.modalities.text.io import TextFinishReason, TextOutput, TextUsage
+from celeste.runner import run_sync
+from celeste.sinks import BinarySink, Sink, sink_scope
 from celeste.types import AudioContent
 
 from .io import AudioChunk, AudioFinishReason, AudioInput, AudioOutput, AudioUsage
@@ -23,7 +26,7 @@ class AudioClient(
     modality: Modality = Modality.AUDIO
     _usage_class = AudioUsage
     _finish_reason_class = AudioFinishReason
-    _content_fields: ClassVar[set[str]] = {"audio_bytes"}
+    _content_fields: ClassVar[set[str]] = {"audio_bytes", "audio_sink"}
 
     _speak_endpoint: ClassVar[str | None] = None
     _generate_endpoint: ClassVar[str | None] = None
@@ -37,11 +40,72 @@ class AudioClient(
     async def speak(
         self,
         text: str,
+        *,
+        sink: Sink | None = None,
         **parameters: Unpack[AudioParameters],
     ) -> AudioOutput:
-        """Convert text to speech audio."""
-        inputs = AudioInput(text=text)
-        return await self._predict(inputs, endpoint=self._speak_endpoint, **parameters)
+        """Convert text to speech audio.
+
+        With ``sink`` (a path or binary file), audio is written there as it
+        arrives and the returned artifact is backed by that path.
+        """
+        return await self._speak(AudioInput(text=text), sink=sink, **parameters)
+
+    async def _speak(
+        self,
+        inputs: AudioInput,
+        *,
+        sink: Sink | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[AudioParameters],
+    ) -> AudioOutput:
+        if sink is None:
+            return await self._predict(
+                inputs,
+                endpoint=self._speak_endpoint,
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                **parameters,
+            )
+        if self.model.streaming:
+            # Streamed, so memory stays constant however long the audio is.
+            stream = self._stream(
+                inputs,
+                stream_class=self._stream_class(),
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                sink=sink,
+                **parameters,
+            )
+            async with stream:
+                async for _ in stream:
+                    pass
+            return stream.output
+        binary_sink = BinarySink(sink)
+        try:
+            # Providers that can stream the response body write it to the
+            # sink; the rest return the audio whole and it is written here.
+            with sink_scope(binary_sink):
+                output = await self._predict(
+                    inputs,
+                    endpoint=self._speak_endpoint,
+                    extra_body=extra_body,
+                    extra_headers=extra_headers,
+                    **parameters,
+                )
+            if not isinstance(output.content, AudioArtifact):
+                binary_sink.abort()
+                return output
+            if not binary_sink.bytes_written:
+                binary_sink.write(output.content.get_bytes())
+            binary_sink.commit()
+        except BaseException:
+            binary_sink.abort()
+            raise
+        return output.model_copy(
+            update={"content": binary_sink.artifact(output.content)}
+        )
 
     async def generate(
         self,
@@ -115,6 +179,11 @@ class AudioClient(
         """Sync namespace for audio operations."""
         return AudioSyncNamespace(self)
 
+    @property
+    def batch(self) -> "AudioBatchNamespace":
+        """Batch namespace for fan-out over many inputs."""
+        return AudioBatchNamespace(self)
+
 
 class AudioStreamNamespace:
     """Streaming namespace for audio operations."""
@@ -128,15 +197,21 @@ class AudioStreamNamespace:
         *,
         extra_body: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
+        sink: Sink | None = None,
         **parameters: Unpack[AudioParameters],
     ) -> AudioStream:
-        """Stream speech generation."""
+        """Stream speech generation.
+
+        With ``sink``, chunk audio is also written there and not retained;
+        ``stream.output.content`` is then backed by the sink's path.
+        """
         inputs = AudioInput(text=text)
         return self._client._stream(
             inputs,
             stream_class=self._client._stream_class(),
             extra_body=extra_body,
             extra_headers=extra_headers,
+            sink=sink,
             **parameters,
         )
 
@@ -153,12 +228,18 @@ class AudioSyncNamespace:
         *,
         extra_body: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
+        sink: Sink | None = None,
         **parameters: Unpack[AudioParameters],
     ) -> AudioOutput:
         """Blocking speech generation."""
         inputs = AudioInput(text=text)
-        return async_to_sync(self._client._predict)(
-            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        return run_sync(
+            self._client._speak,
+            inputs,
+            sink=sink,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
         )
 
     def generate(
@@ -174,7 +255,8 @@ class AudioSyncNamespace:
             msg = f"Model {self._client.model.id} does not support audio generation"
             raise NotImplementedError(msg)
         inputs = AudioInput(text=prompt)
-        return async_to_sync(self._client._predict)(
+        return run_sync(
+            self._client._predict,
             inputs,
             endpoint=self._client._generate_endpoint,
             extra_body=extra_body,
@@ -192,7 +274,8 @@ class AudioSyncNamespace:
         **parameters: Unpack[AudioParameters],
     ) -> TextOutput:
         """Blocking speech transcription."""
-        return async_to_sync(self._client.transcribe)(
+        return run_sync(
+            self._client.transcribe,
             audio,
             prompt=prompt,
             extra_body=extra_body,
@@ -218,6 +301,7 @@ class AudioSyncStreamNamespace:
         *,
         extra_body: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
+        sink: Sink | None = None,
         **parameters: Unpack[AudioParameters],
     ) -> AudioStream:
         """Sync streaming speech generation.
@@ -232,11 +316,45 @@ class AudioSyncStreamNamespace:
         """
         # Return same stream as async version - __iter__/__next__ handle sync iteration
         return self._client.stream.speak(
-            text, extra_body=extra_body, extra_headers=extra_headers, **parameters
+            text,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            sink=sink,
+            **parameters,
         )
 
 
+class AudioBatchNamespace:
+    """Batch namespace for audio operations."""
+
+    def __init__(self, client: AudioClient) -> None:
+        self._client = client
+
+    def speak(
+        self,
+        texts: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[AudioParameters],
+    ) -> AsyncIterator[BatchResult[AudioOutput]]:
+        """Convert many texts to speech with bounded concurrency."""
+
+        async def speak(text: str) -> AudioOutput:
+            return await self._client._predict(
+                AudioInput(text=text),
+                endpoint=self._client._speak_endpoint,
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                **parameters,
+            )
+
+        return run_batch(texts, speak, concurrency=concurrency)
+
+
 __all__ = [
+    "AudioBatchNamespace",
     "AudioClient",
     "AudioStreamNamespace",
     "AudioSyncNamespace",
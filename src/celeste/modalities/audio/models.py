@@ -1,19 +1,27 @@
 """Aggregated models for audio modality."""
 
+from celeste.core import Provider
+from celeste.lazy import import_spec
 from celeste.models import Model
 
-from .providers.elevenlabs.models import MODELS as ELEVENLABS_MODELS
-from .providers.google.models import MODELS as GOOGLE_MODELS
-from .providers.gradium.models import MODELS as GRADIUM_MODELS
-from .providers.groq.models import MODELS as GROQ_MODELS
-from .providers.mistral.models import MODELS as MISTRAL_MODELS
-from .providers.openai.models import MODELS as OPENAI_MODELS
+# Catalog module per provider, imported on first lookup (see celeste.models).
+MODEL_MODULES: dict[Provider, str] = {
+    Provider.ELEVENLABS: f"{__package__}.providers.elevenlabs.models",
+    Provider.GOOGLE: f"{__package__}.providers.google.models",
+    Provider.GRADIUM: f"{__package__}.providers.gradium.models",
+    Provider.GROQ: f"{__package__}.providers.groq.models",
+    Provider.MISTRAL: f"{__package__}.providers.mistral.models",
+    Provider.OPENAI: f"{__package__}.providers.openai.models",
+}
 
-MODELS: list[Model] = [
-    *ELEVENLABS_MODELS,
-    *GOOGLE_MODELS,
-    *GRADIUM_MODELS,
-    *GROQ_MODELS,
-    *MISTRAL_MODELS,
-    *OPENAI_MODELS,
-]
+
+def __getattr__(name: str) -> list[Model]:
+    """Import every provider catalog on first access to ``MODELS``."""
+    if name != "MODELS":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return [
+        model
+        for module in MODEL_MODULES.values()
+        for model in import_spec(f"{module}:MODELS")
+    ]
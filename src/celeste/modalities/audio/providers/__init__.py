@@ -1,20 +1,19 @@
 """Audio providers."""
 
 from celeste.core import Provider
+from celeste.lazy import LazyMapping
 
 from ..client import AudioClient
-from .elevenlabs import ElevenLabsAudioClient
-from .google import GoogleAudioClient
-from .gradium import GradiumAudioClient
-from .groq import GroqAudioClient
-from .mistral import MistralAudioClient
-from .openai import OpenAIAudioClient
 
-PROVIDERS: dict[Provider, type[AudioClient]] = {
-    Provider.ELEVENLABS: ElevenLabsAudioClient,
-    Provider.GOOGLE: GoogleAudioClient,
-    Provider.GRADIUM: GradiumAudioClient,
-    Provider.GROQ: GroqAudioClient,
-    Provider.MISTRAL: MistralAudioClient,
-    Provider.OPENAI: OpenAIAudioClient,
-}
+# Each client is imported on first lookup.
+PROVIDERS: LazyMapping[Provider, type[AudioClient]] = LazyMapping(
+    {
+        Provider.ELEVENLABS: ".elevenlabs.client:ElevenLabsAudioClient",
+        Provider.GOOGLE: ".google.client:GoogleAudioClient",
+        Provider.GRADIUM: ".gradium.client:GradiumAudioClient",
+        Provider.GROQ: ".groq.client:GroqAudioClient",
+        Provider.MISTRAL: ".mistral.client:MistralAudioClient",
+        Provider.OPENAI: ".openai.client:OpenAIAudioClient",
+    },
+    package=__name__,
+)
@@ -1,6 +1,17 @@
 """ElevenLabs provider for audio modality."""
 
-from .client import ElevenLabsAudioClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import ElevenLabsAudioClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"ElevenLabsAudioClient": ".client:ElevenLabsAudioClient"}
+)
+
 __all__ = ["MODELS", "ElevenLabsAudioClient"]
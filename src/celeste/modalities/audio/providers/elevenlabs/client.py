@@ -47,6 +47,9 @@ class ElevenLabsAudioClient(AudioClient):
             provider=self.provider,
             auth=self.auth,
             base_url=self.base_url,
+            http_config=self.http_config,
+            cache=self.cache,
+            retention=self.retention,
         )
         object.__setattr__(self, "_strategy", strategy)
 
@@ -53,6 +53,8 @@ class ElevenLabsTextToSpeechAudioClient(ElevenLabsTextToSpeechMixin, AudioClient
         response_data: dict[str, Any],
     ) -> AudioArtifact:
         """Extract audio bytes from response."""
+        if response_data.get("audio_sink"):
+            return AudioArtifact()  # written to the active sink
         audio_bytes = response_data.get("audio_bytes")
         if not audio_bytes:
             msg = "No audio data in response"
@@ -1,5 +1,15 @@
 """Google provider for audio modality."""
 
-from .client import GoogleAudioClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .client import GoogleAudioClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"GoogleAudioClient": ".client:GoogleAudioClient"}
+)
 
 __all__ = ["GoogleAudioClient"]
@@ -1,6 +1,17 @@
 """Gradium provider for audio modality."""
 
-from .client import GradiumAudioClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import GradiumAudioClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"GradiumAudioClient": ".client:GradiumAudioClient"}
+)
+
 __all__ = ["MODELS", "GradiumAudioClient"]
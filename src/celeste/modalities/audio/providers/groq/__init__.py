@@ -1,6 +1,15 @@
 """Groq provider for audio modality."""
 
-from .client import GroqAudioClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import GroqAudioClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(__name__, {"GroqAudioClient": ".client:GroqAudioClient"})
+
 __all__ = ["MODELS", "GroqAudioClient"]
@@ -1,6 +1,17 @@
 """Mistral provider for audio modality."""
 
-from .client import MistralAudioClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import MistralAudioClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"MistralAudioClient": ".client:MistralAudioClient"}
+)
+
 __all__ = ["MODELS", "MistralAudioClient"]
@@ -1,6 +1,17 @@
 """OpenAI provider for audio modality."""
 
-from .client import OpenAIAudioClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import OpenAIAudioClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"OpenAIAudioClient": ".client:OpenAIAudioClient"}
+)
+
 __all__ = ["MODELS", "OpenAIAudioClient"]
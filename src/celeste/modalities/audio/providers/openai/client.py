@@ -45,6 +45,8 @@ class OpenAIAudioClient(OpenAIAudioMixin, AudioClient):
         response_data: dict[str, Any],
     ) -> AudioArtifact | str:
         """Extract audio bytes for TTS or transcript text for STT."""
+        if response_data.get("audio_sink"):
+            return AudioArtifact()  # written to the active sink
         if "audio_bytes" in response_data:
             audio_bytes = response_data.get("audio_bytes")
             if not audio_bytes:
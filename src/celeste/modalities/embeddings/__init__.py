@@ -1,6 +1,7 @@
 """Celeste Embeddings modality."""
 
 from .client import EmbeddingsClient
+from .coalesce import EmbeddingsCoalescer
 from .io import (
     EmbeddingsChunk,
     EmbeddingsFinishReason,
@@ -13,6 +14,7 @@ from .parameters import EmbeddingsParameter, EmbeddingsParameters
 __all__ = [
     "EmbeddingsChunk",
     "EmbeddingsClient",
+    "EmbeddingsCoalescer",
     "EmbeddingsFinishReason",
     "EmbeddingsInput",
     "EmbeddingsOutput",
@@ -1,13 +1,28 @@
 """Embeddings modality client."""
 
-from typing import Any, Unpack
-
-from asgiref.sync import async_to_sync
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, ClassVar, Unpack
 
+from celeste.batch import (
+    DEFAULT_BATCH_POLL_INTERVAL,
+    DEFAULT_CONCURRENCY,
+    BatchJob,
+    BatchResult,
+    run_batch,
+    wait_for_batch,
+)
 from celeste.client import ModalityClient
 from celeste.core import Modality
-from celeste.types import AudioContent, EmbeddingsContent, ImageContent, VideoContent
+from celeste.runner import run_sync
+from celeste.types import (
+    AudioContent,
+    EmbeddingsContent,
+    Float32Embeddings,
+    ImageContent,
+    VideoContent,
+)
 
+from .coalesce import DEFAULT_MAX_DELAY, EmbeddingsCoalescer
 from .io import (
     EmbeddingsChunk,
     EmbeddingsFinishReason,
@@ -18,6 +33,15 @@ from .io import (
 from .parameters import EmbeddingsParameters
 
 
+def _unwrap_single(output: EmbeddingsOutput) -> None:
+    """Unwrap a single-input result from the provider's batch format."""
+    content = output.content
+    if (isinstance(content, Float32Embeddings) and len(content.shape) == 2) or (
+        isinstance(content, list) and content and isinstance(content[0], list)
+    ):
+        output.content = content[0]
+
+
 class EmbeddingsClient(
     ModalityClient[
         EmbeddingsInput,
@@ -32,6 +56,9 @@ class EmbeddingsClient(
     modality: Modality = Modality.EMBEDDINGS
     _usage_class = EmbeddingsUsage
     _finish_reason_class = EmbeddingsFinishReason
+    # Provider limit on texts per request; None = unknown (coalescing caps
+    # batches at DEFAULT_MAX_BATCH_SIZE).
+    _max_batch_size: ClassVar[int | None] = None
 
     @classmethod
     def _output_class(cls) -> type[EmbeddingsOutput]:
@@ -58,40 +85,92 @@ class EmbeddingsClient(
             audio: Audio file(s) to embed. Single AudioArtifact or list.
             extra_body: Additional provider-specific fields to merge into request.
             extra_headers: Additional HTTP headers to include in the request.
-            **parameters: Embedding parameters (e.g., dimensions).
+            **parameters: Embedding parameters (e.g., dimensions, float32).
 
         Returns:
             EmbeddingsOutput with content as EmbeddingsContent:
             - Single vector for single inputs (str, ImageArtifact, etc.)
             - List of vectors for batch inputs (list[str], list[ImageArtifact], etc.)
+            - Float32Embeddings of either shape when float32=True
         """
         inputs = EmbeddingsInput(text=text, images=images, videos=videos, audio=audio)
         output = await self._predict(
             inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
         )
 
-        # Unwrap single-item results from batch format
         is_batch = (
             isinstance(text, list)
             or isinstance(images, list)
             or isinstance(videos, list)
             or isinstance(audio, list)
         )
-        if (
-            not is_batch
-            and isinstance(output.content, list)
-            and output.content
-            and isinstance(output.content[0], list)
-        ):
-            output.content = output.content[0]
+        if not is_batch:
+            _unwrap_single(output)
 
         return output
 
+    async def _batch_results(
+        self,
+        job: BatchJob,
+        **parameters: Unpack[EmbeddingsParameters],
+    ) -> list[BatchResult[EmbeddingsOutput]]:
+        """Parse batch results; every job item is a single text, as in embed()."""
+        results = await super()._batch_results(job, **parameters)
+        for result in results:
+            if result.output is not None:
+                _unwrap_single(result.output)
+        return results
+
+    def _build_request(
+        self,
+        inputs: EmbeddingsInput,
+        extra_body: dict[str, Any] | None = None,
+        streaming: bool = False,
+        **parameters: Unpack[EmbeddingsParameters],
+    ) -> dict[str, Any]:
+        """Build request; float32 is client-side only and never sent."""
+        parameters.pop("float32", None)
+        return super()._build_request(
+            inputs, extra_body=extra_body, streaming=streaming, **parameters
+        )
+
+    def _transform_output(
+        self,
+        content: EmbeddingsContent,
+        **parameters: Unpack[EmbeddingsParameters],
+    ) -> EmbeddingsContent:
+        """Apply mapper transforms, then pack vectors when float32 is set."""
+        content = super()._transform_output(content, **parameters)
+        if parameters.get("float32") and not isinstance(content, Float32Embeddings):
+            return Float32Embeddings.from_vectors(content)
+        return content
+
+    def coalesce(
+        self,
+        *,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_batch_size: int | None = None,
+    ) -> EmbeddingsCoalescer:
+        """Embedder that merges concurrent single-text calls into batch requests.
+
+        Usage:
+            embedder = client.coalesce()
+            output = await embedder.embed("one of many concurrent texts")
+        """
+        return EmbeddingsCoalescer(
+            self, max_delay=max_delay, max_batch_size=max_batch_size
+        )
+
     @property
     def sync(self) -> "EmbeddingsSyncNamespace":
         """Sync namespace for embeddings operations."""
         return EmbeddingsSyncNamespace(self)
 
+    @property
+    def batch(self) -> "EmbeddingsBatchNamespace":
+        """Batch namespace for fan-out over many inputs."""
+        return EmbeddingsBatchNamespace(self)
+
 
 class EmbeddingsSyncNamespace:
     """Sync namespace for embeddings operations."""
@@ -111,7 +190,8 @@ class EmbeddingsSyncNamespace:
         **parameters: Unpack[EmbeddingsParameters],
     ) -> EmbeddingsOutput:
         """Blocking embeddings generation."""
-        return async_to_sync(self._client.embed)(
+        return run_sync(
+            self._client.embed,
             text,
             images=images,
             videos=videos,
@@ -122,7 +202,91 @@ class EmbeddingsSyncNamespace:
         )
 
 
+class EmbeddingsBatchNamespace:
+    """Batch namespace for embeddings operations.
+
+    Provides `client.batch.embed()` for concurrent fan-out, and
+    `client.batch.submit()` / `wait()` / `results()` for provider batch jobs.
+    """
+
+    def __init__(self, client: EmbeddingsClient) -> None:
+        self._client = client
+
+    def embed(
+        self,
+        texts: Iterable[str | list[str]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[EmbeddingsParameters],
+    ) -> AsyncIterator[BatchResult[EmbeddingsOutput]]:
+        """Embed many texts (or text lists) with bounded concurrency."""
+
+        async def embed(text: str | list[str]) -> EmbeddingsOutput:
+            return await self._client.embed(
+                text,
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                **parameters,
+            )
+
+        return run_batch(texts, embed, concurrency=concurrency)
+
+    async def submit(
+        self,
+        texts: Iterable[str],
+        *,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[EmbeddingsParameters],
+    ) -> BatchJob:
+        """Submit many texts as one job to the provider's native batch API.
+
+        Batch APIs trade latency (up to 24h) for lower prices and higher limits.
+
+        Usage:
+            job = await client.batch.submit(texts)
+            job = await client.batch.wait(job)
+            for result in await client.batch.results(job):
+                print(result.index, result.output.content if result.ok else result.error)
+        """
+        inputs = [EmbeddingsInput(text=item) for item in texts]
+        return await self._client._submit_batch(
+            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        )
+
+    async def refresh(self, job: BatchJob) -> BatchJob:
+        """Fetch the current state of a batch job."""
+        return await self._client._refresh_batch(job)
+
+    async def wait(
+        self,
+        job: BatchJob,
+        *,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> BatchJob:
+        """Poll a batch job until it is done."""
+        return await wait_for_batch(
+            job,
+            self._client._refresh_batch,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
+    async def results(
+        self, job: BatchJob, **parameters: Unpack[EmbeddingsParameters]
+    ) -> list[BatchResult[EmbeddingsOutput]]:
+        """Parse a finished job's results in submission order.
+
+        Pass the parameters the job was submitted with.
+        """
+        return await self._client._batch_results(job, **parameters)
+
+
 __all__ = [
+    "EmbeddingsBatchNamespace",
     "EmbeddingsClient",
     "EmbeddingsSyncNamespace",
 ]
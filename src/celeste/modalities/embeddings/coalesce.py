@@ -0,0 +1,158 @@
+"""Coalescing of concurrent single-text embed() calls into batch requests."""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Unpack
+
+from .io import EmbeddingsOutput
+from .parameters import EmbeddingsParameters
+
+if TYPE_CHECKING:
+    from .client import EmbeddingsClient
+
+DEFAULT_MAX_DELAY = 0.005  # seconds
+DEFAULT_MAX_BATCH_SIZE = 100
+
+type _BatchKey = tuple[asyncio.AbstractEventLoop, str]
+
+
+class _PendingBatch:
+    """Texts waiting to be sent together, with the futures of their callers."""
+
+    def __init__(
+        self,
+        extra_body: dict[str, Any] | None,
+        extra_headers: dict[str, str] | None,
+        parameters: EmbeddingsParameters,
+    ) -> None:
+        self.extra_body = extra_body
+        self.extra_headers = extra_headers
+        self.parameters = parameters
+        self.texts: list[str] = []
+        self.futures: list[asyncio.Future[EmbeddingsOutput]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class EmbeddingsCoalescer:
+    """Collects concurrent single-text embed() calls into batch requests.
+
+    Each call waits up to ``max_delay`` seconds for others with the same
+    parameters, then one ``client.embed(list_of_texts)`` request serves them
+    all. A batch is sent early once it reaches ``max_batch_size`` texts.
+    A failed request fails every call in its batch. Per-call usage is left
+    empty, since providers report usage per request rather than per text.
+
+    Usage:
+        embedder = client.coalesce(max_delay=0.01)
+        outputs = await asyncio.gather(*(embedder.embed(text) for text in texts))
+    """
+
+    def __init__(
+        self,
+        client: "EmbeddingsClient",
+        *,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        max_batch_size: int | None = None,
+    ) -> None:
+        """Initialize for a client.
+
+        ``max_batch_size`` defaults to the provider's batch limit.
+
+        Raises:
+            ValueError: If ``max_delay`` is negative or ``max_batch_size`` is less than 1.
+        """
+        if max_batch_size is None:
+            max_batch_size = client._max_batch_size or DEFAULT_MAX_BATCH_SIZE
+        if max_batch_size < 1:
+            msg = "max_batch_size must be at least 1"
+            raise ValueError(msg)
+        if max_delay < 0:
+            msg = "max_delay must not be negative"
+            raise ValueError(msg)
+        self._client = client
+        self._max_delay = max_delay
+        self._max_batch_size = max_batch_size
+        self._pending: dict[_BatchKey, _PendingBatch] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def embed(
+        self,
+        text: str,
+        *,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[EmbeddingsParameters],
+    ) -> EmbeddingsOutput:
+        """Embed one text, sharing a request with concurrent calls."""
+        loop = asyncio.get_running_loop()
+        key = (
+            loop,
+            json.dumps(
+                [extra_body, extra_headers, parameters], sort_keys=True, default=repr
+            ),
+        )
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch(
+                extra_body, extra_headers, parameters
+            )
+            batch.timer = loop.call_later(self._max_delay, self._send, key)
+        future: asyncio.Future[EmbeddingsOutput] = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        if len(batch.texts) >= self._max_batch_size:
+            self._send(key)
+        return await future
+
+    async def flush(self) -> None:
+        """Send every pending batch now and wait for all requests to finish."""
+        for key in list(self._pending):
+            self._send(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+
+    def _send(self, key: _BatchKey) -> None:
+        """Start the request for a pending batch, if it is still pending."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = key[0].create_task(self._request(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _request(self, batch: _PendingBatch) -> None:
+        """Send one batch request and settle every caller's future."""
+        try:
+            output = await self._client.embed(
+                batch.texts,
+                extra_body=batch.extra_body,
+                extra_headers=batch.extra_headers,
+                **batch.parameters,
+            )
+            if len(output.content) != len(batch.texts):
+                msg = (
+                    f"Expected {len(batch.texts)} embeddings, got {len(output.content)}"
+                )
+                raise ValueError(msg)
+        except Exception as exc:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        vectors: list[list[float]] = output.content  # type: ignore[assignment]  # list input
+        metadata = {**output.metadata, "coalesced_batch_size": len(batch.texts)}
+        for future, vector in zip(batch.futures, vectors, strict=True):
+            if not future.done():
+                future.set_result(
+                    EmbeddingsOutput(
+                        content=vector,
+                        finish_reason=output.finish_reason,
+                        metadata=metadata,
+                    )
+                )
+
+
+__all__ = ["DEFAULT_MAX_DELAY", "EmbeddingsCoalescer"]
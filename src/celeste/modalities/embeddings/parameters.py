@@ -12,6 +12,7 @@ class EmbeddingsParameter(StrEnum):
     """Parameter names for embeddings."""
 
     DIMENSIONS = "dimensions"
+    FLOAT32 = "float32"
     IMAGE = "image"
     VIDEO = "video"
     AUDIO = "audio"
@@ -21,6 +22,10 @@ class EmbeddingsParameters(Parameters, total=False):
     """Parameters for embeddings operations."""
 
     dimensions: Annotated[int | None, Field(description="Embedding vector length.")]
+    float32: Annotated[
+        bool | None,
+        Field(description="Return vectors packed in a contiguous float32 buffer."),
+    ]
 
 
 __all__ = [
@@ -1,10 +1,14 @@
 """Embeddings providers."""
 
 from celeste.core import Provider
+from celeste.lazy import LazyMapping
 
 from ..client import EmbeddingsClient
-from .google import GoogleEmbeddingsClient
 
-PROVIDERS: dict[Provider, type[EmbeddingsClient]] = {
-    Provider.GOOGLE: GoogleEmbeddingsClient,
-}
+# Each client is imported on first lookup.
+PROVIDERS: LazyMapping[Provider, type[EmbeddingsClient]] = LazyMapping(
+    {
+        Provider.GOOGLE: ".google.client:GoogleEmbeddingsClient",
+    },
+    package=__name__,
+)
@@ -1,6 +1,17 @@
 """Google provider for embeddings modality."""
 
-from .client import GoogleEmbeddingsClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import GoogleEmbeddingsClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"GoogleEmbeddingsClient": ".client:GoogleEmbeddingsClient"}
+)
+
 __all__ = ["MODELS", "GoogleEmbeddingsClient"]
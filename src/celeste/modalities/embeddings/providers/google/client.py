@@ -1,11 +1,16 @@
 """Google embeddings client."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 from celeste.parameters import ParameterMapper
+from celeste.providers.google.batches.client import (
+    GoogleBatchesClient as GoogleBatchesMixin,
+)
+from celeste.providers.google.batches.config import GoogleBatchesEndpoint
 from celeste.providers.google.embeddings.client import (
     GoogleEmbeddingsClient as GoogleEmbeddingsMixin,
 )
+from celeste.providers.google.embeddings.config import MAX_BATCH_SIZE
 from celeste.providers.google.utils import build_media_part
 from celeste.types import EmbeddingsContent
 
@@ -14,9 +19,14 @@ from ...io import EmbeddingsInput
 from .parameters import GOOGLE_PARAMETER_MAPPERS
 
 
-class GoogleEmbeddingsClient(GoogleEmbeddingsMixin, EmbeddingsClient):
+class GoogleEmbeddingsClient(
+    GoogleBatchesMixin, GoogleEmbeddingsMixin, EmbeddingsClient
+):
     """Google embeddings client."""
 
+    _batch_endpoint: ClassVar[str] = GoogleBatchesEndpoint.ASYNC_BATCH_EMBED_CONTENT
+    _max_batch_size: ClassVar[int | None] = MAX_BATCH_SIZE
+
     @classmethod
     def parameter_mappers(cls) -> list[ParameterMapper[EmbeddingsContent]]:
         """Return parameter mappers for Google embeddings."""
@@ -1,12 +1,14 @@
 """Images modality client."""
 
+from collections.abc import AsyncIterator, Iterable
 from typing import Any, ClassVar, Unpack
 
-from asgiref.sync import async_to_sync
-
 from celeste.artifacts import ImageArtifact
+from celeste.batch import DEFAULT_CONCURRENCY, BatchResult, run_batch
 from celeste.client import ModalityClient
 from celeste.core import Modality
+from celeste.jobs import JobHandle, JobStore
+from celeste.runner import run_sync
 from celeste.types import ImageContent
 
 from .io import ImageChunk, ImageFinishReason, ImageInput, ImageOutput, ImageUsage
@@ -70,6 +72,32 @@ class ImagesClient(
             inputs, endpoint=self._upscale_endpoint, **parameters
         )
 
+    async def collect(
+        self,
+        handle: JobHandle,
+        *,
+        store: JobStore | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[ImageParameters],
+    ) -> ImageOutput:
+        """Wait for a job from `client.submit` and return its output.
+
+        Parameters the job was submitted with are read from the handle;
+        pass any to override them. With ``store``, the handle is removed
+        from it once the output is parsed; a failed collect leaves it there
+        to retry.
+
+        Usage:
+            for handle in await store.pending():
+                output = await client.collect(handle, store=store)
+        """
+        output = await self._collect_job(
+            handle, extra_headers=extra_headers, **parameters
+        )
+        if store is not None:
+            await store.delete(handle.id)
+        return output
+
     @property
     def stream(self) -> "ImagesStreamNamespace":
         """Streaming namespace for images operations."""
@@ -80,6 +108,16 @@ class ImagesClient(
         """Sync namespace for images operations."""
         return ImagesSyncNamespace(self)
 
+    @property
+    def batch(self) -> "ImagesBatchNamespace":
+        """Batch namespace for fan-out over many prompts."""
+        return ImagesBatchNamespace(self)
+
+    @property
+    def submit(self) -> "ImagesSubmitNamespace":
+        """Submit namespace for detached long-running jobs."""
+        return ImagesSubmitNamespace(self)
+
 
 class ImagesStreamNamespace:
     """Streaming namespace for images operations.
@@ -152,8 +190,12 @@ class ImagesSyncNamespace:
             result.content.show()
         """
         inputs = ImageInput(prompt=prompt)
-        return async_to_sync(self._client._predict)(
-            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        return run_sync(
+            self._client._predict,
+            inputs,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
         )
 
     def edit(
@@ -172,8 +214,12 @@ class ImagesSyncNamespace:
             result.content.show()
         """
         inputs = ImageInput(prompt=prompt, image=image)
-        return async_to_sync(self._client._predict)(
-            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        return run_sync(
+            self._client._predict,
+            inputs,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
         )
 
     def upscale(
@@ -191,8 +237,12 @@ class ImagesSyncNamespace:
             result.content.show()
         """
         inputs = ImageInput(image=image)
-        return async_to_sync(self._client._predict)(
-            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        return run_sync(
+            self._client._predict,
+            inputs,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
         )
 
     @property
@@ -258,9 +308,133 @@ class ImagesSyncStreamNamespace:
         )
 
 
+class ImagesBatchNamespace:
+    """Batch namespace for images operations."""
+
+    def __init__(self, client: ImagesClient) -> None:
+        self._client = client
+
+    def generate(
+        self,
+        prompts: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[ImageParameters],
+    ) -> AsyncIterator[BatchResult[ImageOutput]]:
+        """Generate images for many prompts with bounded concurrency."""
+
+        async def generate(prompt: str) -> ImageOutput:
+            return await self._client._predict(
+                ImageInput(prompt=prompt),
+                endpoint=self._client._generate_endpoint,
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                **parameters,
+            )
+
+        return run_batch(prompts, generate, concurrency=concurrency)
+
+
+class ImagesSubmitNamespace:
+    """Submit namespace for images operations on job-based providers.
+
+    Provides `client.submit.generate()`, `client.submit.edit()` and
+    `client.submit.upscale()`, which return a serializable `JobHandle` as soon
+    as the provider accepts the job. `client.collect(handle)` waits for the
+    result, in this process or another.
+    """
+
+    def __init__(self, client: ImagesClient) -> None:
+        self._client = client
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        store: JobStore | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[ImageParameters],
+    ) -> JobHandle:
+        """Submit an image generation job.
+
+        Usage:
+            handle = await client.submit.generate("A red fox", store=store)
+        """
+        return await self._submit(
+            ImageInput(prompt=prompt),
+            self._client._generate_endpoint,
+            store,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
+        )
+
+    async def edit(
+        self,
+        image: ImageArtifact,
+        prompt: str,
+        *,
+        store: JobStore | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[ImageParameters],
+    ) -> JobHandle:
+        """Submit an image edit job."""
+        if self._client._edit_endpoint is None:
+            msg = f"Model {self._client.model.id} does not support image editing"
+            raise NotImplementedError(msg)
+        return await self._submit(
+            ImageInput(prompt=prompt, image=image),
+            self._client._edit_endpoint,
+            store,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
+        )
+
+    async def upscale(
+        self,
+        image: ImageArtifact,
+        *,
+        store: JobStore | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[ImageParameters],
+    ) -> JobHandle:
+        """Submit an image upscale job."""
+        if self._client._upscale_endpoint is None:
+            msg = f"Model {self._client.model.id} does not support image upscaling"
+            raise NotImplementedError(msg)
+        return await self._submit(
+            ImageInput(image=image),
+            self._client._upscale_endpoint,
+            store,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
+        )
+
+    async def _submit(
+        self,
+        inputs: ImageInput,
+        endpoint: str | None,
+        store: JobStore | None,
+        **kwargs: Any,
+    ) -> JobHandle:
+        handle = await self._client._submit_job(inputs, endpoint=endpoint, **kwargs)
+        if store is not None:
+            await store.save(handle)
+        return handle
+
+
 __all__ = [
+    "ImagesBatchNamespace",
     "ImagesClient",
     "ImagesStreamNamespace",
+    "ImagesSubmitNamespace",
     "ImagesSyncNamespace",
     "ImagesSyncStreamNamespace",
 ]
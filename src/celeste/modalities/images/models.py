@@ -1,19 +1,27 @@
 """Aggregated models for images modality."""
 
+from celeste.core import Provider
+from celeste.lazy import import_spec
 from celeste.models import Model
 
-from .providers.bfl.models import MODELS as BFL_MODELS
-from .providers.byteplus.models import MODELS as BYTEPLUS_MODELS
-from .providers.google.models import MODELS as GOOGLE_MODELS
-from .providers.openai.models import MODELS as OPENAI_MODELS
-from .providers.topazlabs.models import MODELS as TOPAZLABS_MODELS
-from .providers.xai.models import MODELS as XAI_MODELS
+# Catalog module per provider, imported on first lookup (see celeste.models).
+MODEL_MODULES: dict[Provider, str] = {
+    Provider.BFL: f"{__package__}.providers.bfl.models",
+    Provider.BYTEPLUS: f"{__package__}.providers.byteplus.models",
+    Provider.GOOGLE: f"{__package__}.providers.google.models",
+    Provider.OPENAI: f"{__package__}.providers.openai.models",
+    Provider.TOPAZLABS: f"{__package__}.providers.topazlabs.models",
+    Provider.XAI: f"{__package__}.providers.xai.models",
+}
 
-MODELS: list[Model] = [
-    *BFL_MODELS,
-    *BYTEPLUS_MODELS,
-    *GOOGLE_MODELS,
-    *OPENAI_MODELS,
-    *TOPAZLABS_MODELS,
-    *XAI_MODELS,
-]
+
+def __getattr__(name: str) -> list[Model]:
+    """Import every provider catalog on first access to ``MODELS``."""
+    if name != "MODELS":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return [
+        model
+        for module in MODEL_MODULES.values()
+        for model in import_spec(f"{module}:MODELS")
+    ]
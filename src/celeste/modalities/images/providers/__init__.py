@@ -1,22 +1,20 @@
 """Images providers."""
 
 from celeste.core import Provider
+from celeste.lazy import LazyMapping
 
 from ..client import ImagesClient
-from .bfl import BFLImagesClient
-from .byteplus import BytePlusImagesClient
-from .google import GoogleImagesClient
-from .ollama import OllamaImagesClient
-from .openai import OpenAIImagesClient
-from .topazlabs import TopazLabsImagesClient
-from .xai import XAIImagesClient
 
-PROVIDERS: dict[Provider, type[ImagesClient]] = {
-    Provider.BFL: BFLImagesClient,
-    Provider.BYTEPLUS: BytePlusImagesClient,
-    Provider.GOOGLE: GoogleImagesClient,
-    Provider.OLLAMA: OllamaImagesClient,
-    Provider.OPENAI: OpenAIImagesClient,
-    Provider.TOPAZLABS: TopazLabsImagesClient,
-    Provider.XAI: XAIImagesClient,
-}
+# Each client is imported on first lookup.
+PROVIDERS: LazyMapping[Provider, type[ImagesClient]] = LazyMapping(
+    {
+        Provider.BFL: ".bfl.client:BFLImagesClient",
+        Provider.BYTEPLUS: ".byteplus.client:BytePlusImagesClient",
+        Provider.GOOGLE: ".google.client:GoogleImagesClient",
+        Provider.OLLAMA: ".ollama.client:OllamaImagesClient",
+        Provider.OPENAI: ".openai.client:OpenAIImagesClient",
+        Provider.TOPAZLABS: ".topazlabs.client:TopazLabsImagesClient",
+        Provider.XAI: ".xai.client:XAIImagesClient",
+    },
+    package=__name__,
+)
@@ -1,6 +1,15 @@
 """BFL (Black Forest Labs) provider for images modality."""
 
-from .client import BFLImagesClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import BFLImagesClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(__name__, {"BFLImagesClient": ".client:BFLImagesClient"})
+
 __all__ = ["MODELS", "BFLImagesClient"]
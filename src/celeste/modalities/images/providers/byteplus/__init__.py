@@ -1,6 +1,17 @@
 """BytePlus provider for images modality."""
 
-from .client import BytePlusImagesClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import BytePlusImagesClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"BytePlusImagesClient": ".client:BytePlusImagesClient"}
+)
+
 __all__ = ["MODELS", "BytePlusImagesClient"]
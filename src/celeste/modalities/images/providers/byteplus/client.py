@@ -43,7 +43,7 @@ class BytePlusImagesStream(_BytePlusImagesStream, ImagesStream):
                 content=ImageArtifact(data=b""),
                 finish_reason=None,
                 usage=None,
-                metadata={"event_data": event_data, "error": error},
+                metadata={**self._chunk_metadata(event_data), "error": error},
             )
 
         # Handle completed event (usage only)
@@ -68,7 +68,7 @@ class BytePlusImagesStream(_BytePlusImagesStream, ImagesStream):
             content=artifact,
             finish_reason=self._get_chunk_finish_reason(event_data),
             usage=None,
-            metadata={"event_data": event_data},
+            metadata=self._chunk_metadata(event_data),
         )
 
     def _aggregate_content(self, chunks: list[ImageChunk]) -> ImageArtifact:
@@ -1,6 +1,17 @@
 """Google provider for images modality."""
 
-from .client import GoogleImagesClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import GoogleImagesClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"GoogleImagesClient": ".client:GoogleImagesClient"}
+)
+
 __all__ = ["MODELS", "GoogleImagesClient"]
@@ -56,6 +56,9 @@ class GoogleImagesClient(ImagesClient):
             provider=self.provider,
             auth=self.auth,
             base_url=self.base_url,
+            http_config=self.http_config,
+            cache=self.cache,
+            retention=self.retention,
         )
         object.__setattr__(self, "_strategy", strategy)
 
@@ -1,6 +1,17 @@
 """Ollama provider for images modality."""
 
-from .client import OllamaImagesClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import OllamaImagesClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"OllamaImagesClient": ".client:OllamaImagesClient"}
+)
+
 __all__ = ["MODELS", "OllamaImagesClient"]
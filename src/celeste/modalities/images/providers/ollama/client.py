@@ -32,14 +32,14 @@ class OllamaImagesStream(_OllamaGenerateStream, ImagesStream):
         if not b64_image:
             return ImageChunk(
                 content=ImageArtifact(data=b""),
-                metadata={"event_data": event_data},
+                metadata=self._chunk_metadata(event_data),
             )
 
         return ImageChunk(
             content=ImageArtifact(data=b64_image),
             finish_reason=self._get_chunk_finish_reason(event_data),
             usage=self._get_chunk_usage(event_data),
-            metadata={"event_data": event_data},
+            metadata=self._chunk_metadata(event_data),
         )
 
     def _aggregate_content(self, chunks: list[ImageChunk]) -> ImageArtifact:
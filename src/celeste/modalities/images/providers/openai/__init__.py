@@ -1,6 +1,17 @@
 """OpenAI provider for images modality."""
 
-from .client import OpenAIImagesClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import OpenAIImagesClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"OpenAIImagesClient": ".client:OpenAIImagesClient"}
+)
+
 __all__ = ["MODELS", "OpenAIImagesClient"]
@@ -1,6 +1,17 @@
 """Topaz Labs provider for images modality."""
 
-from .client import TopazLabsImagesClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import TopazLabsImagesClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"TopazLabsImagesClient": ".client:TopazLabsImagesClient"}
+)
+
 __all__ = ["MODELS", "TopazLabsImagesClient"]
@@ -1,6 +1,15 @@
 """xAI provider for images modality."""
 
-from .client import XAIImagesClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import XAIImagesClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(__name__, {"XAIImagesClient": ".client:XAIImagesClient"})
+
 __all__ = ["MODELS", "XAIImagesClient"]
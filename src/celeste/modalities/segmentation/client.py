@@ -2,11 +2,11 @@
 
 from typing import Any, ClassVar, Unpack
 
-from asgiref.sync import async_to_sync
-
 from celeste.artifacts import ImageArtifact
 from celeste.client import ModalityClient
 from celeste.core import Modality
+from celeste.jobs import JobHandle, JobStore
+from celeste.runner import run_sync
 from celeste.types import SegmentationContent
 
 from .io import (
@@ -60,11 +60,37 @@ class SegmentationClient(
             **parameters,
         )
 
+    async def collect(
+        self,
+        handle: JobHandle,
+        *,
+        store: JobStore | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[SegmentationParameters],
+    ) -> SegmentationOutput:
+        """Wait for a job from `client.submit` and return its output.
+
+        Parameters the job was submitted with are read from the handle;
+        pass any to override them. With ``store``, the handle is removed
+        from it once the output is parsed.
+        """
+        output = await self._collect_job(
+            handle, extra_headers=extra_headers, **parameters
+        )
+        if store is not None:
+            await store.delete(handle.id)
+        return output
+
     @property
     def sync(self) -> "SegmentationSyncNamespace":
         """Sync namespace for segmentation operations."""
         return SegmentationSyncNamespace(self)
 
+    @property
+    def submit(self) -> "SegmentationSubmitNamespace":
+        """Submit namespace for detached long-running jobs."""
+        return SegmentationSubmitNamespace(self)
+
 
 class SegmentationSyncNamespace:
     """Sync namespace for segmentation operations."""
@@ -82,7 +108,8 @@ class SegmentationSyncNamespace:
         **parameters: Unpack[SegmentationParameters],
     ) -> SegmentationOutput:
         """Blocking image segmentation."""
-        return async_to_sync(self._client.segment)(
+        return run_sync(
+            self._client.segment,
             image,
             prompt,
             extra_body=extra_body,
@@ -91,7 +118,41 @@ class SegmentationSyncNamespace:
         )
 
 
+class SegmentationSubmitNamespace:
+    """Submit namespace for segmentation operations.
+
+    Provides `client.submit.segment()`, which returns a serializable
+    `JobHandle`; `client.collect(handle)` waits for the result.
+    """
+
+    def __init__(self, client: SegmentationClient) -> None:
+        self._client = client
+
+    async def segment(
+        self,
+        image: ImageArtifact,
+        prompt: str | None = None,
+        *,
+        store: JobStore | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[SegmentationParameters],
+    ) -> JobHandle:
+        """Submit an image segmentation job."""
+        handle = await self._client._submit_job(
+            SegmentationInput(image=image, prompt=prompt),
+            endpoint=self._client._segment_endpoint,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
+        )
+        if store is not None:
+            await store.save(handle)
+        return handle
+
+
 __all__ = [
     "SegmentationClient",
+    "SegmentationSubmitNamespace",
     "SegmentationSyncNamespace",
 ]
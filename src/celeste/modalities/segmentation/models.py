@@ -1,9 +1,22 @@
 """Aggregated models for segmentation modality."""
 
+from celeste.core import Provider
+from celeste.lazy import import_spec
 from celeste.models import Model
 
-from .providers.fal.models import MODELS as FAL_MODELS
+# Catalog module per provider, imported on first lookup (see celeste.models).
+MODEL_MODULES: dict[Provider, str] = {
+    Provider.FAL: f"{__package__}.providers.fal.models",
+}
 
-MODELS: list[Model] = [
-    *FAL_MODELS,
-]
+
+def __getattr__(name: str) -> list[Model]:
+    """Import every provider catalog on first access to ``MODELS``."""
+    if name != "MODELS":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return [
+        model
+        for module in MODEL_MODULES.values()
+        for model in import_spec(f"{module}:MODELS")
+    ]
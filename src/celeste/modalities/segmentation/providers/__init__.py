@@ -1,10 +1,14 @@
 """Segmentation providers."""
 
 from celeste.core import Provider
+from celeste.lazy import LazyMapping
 
 from ..client import SegmentationClient
-from .fal import FalSegmentationClient
 
-PROVIDERS: dict[Provider, type[SegmentationClient]] = {
-    Provider.FAL: FalSegmentationClient,
-}
+# Each client is imported on first lookup.
+PROVIDERS: LazyMapping[Provider, type[SegmentationClient]] = LazyMapping(
+    {
+        Provider.FAL: ".fal.client:FalSegmentationClient",
+    },
+    package=__name__,
+)
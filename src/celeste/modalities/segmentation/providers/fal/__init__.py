@@ -1,6 +1,17 @@
 """fal segmentation provider."""
 
-from .client import FalSegmentationClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import FalSegmentationClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"FalSegmentationClient": ".client:FalSegmentationClient"}
+)
+
 __all__ = ["MODELS", "FalSegmentationClient"]
@@ -9,9 +9,12 @@ from .io import (
     TextUsage,
 )
 from .parameters import TextParameter, TextParameters
+from .semantic_cache import SemanticCache, SemanticCacheStats
 from .streaming import TextStream
 
 __all__ = [
+    "SemanticCache",
+    "SemanticCacheStats",
     "TextChunk",
     "TextClient",
     "TextFinishReason",
@@ -1,12 +1,20 @@
 """Text modality client."""
 
-from typing import Any, Unpack
-
-from asgiref.sync import async_to_sync
-
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING, Any, Unpack
+
+from celeste.batch import (
+    DEFAULT_BATCH_POLL_INTERVAL,
+    DEFAULT_CONCURRENCY,
+    BatchJob,
+    BatchResult,
+    run_batch,
+    wait_for_batch,
+)
 from celeste.client import ModalityClient
 from celeste.core import Modality
 from celeste.messages import media_types
+from celeste.runner import run_sync
 from celeste.tools import ToolResult, rehydrate_tools
 from celeste.types import (
     AudioContent,
@@ -19,8 +27,12 @@ from celeste.types import (
 
 from .io import TextChunk, TextFinishReason, TextInput, TextOutput, TextUsage
 from .parameters import TextParameters
+from .semantic_cache import DEFAULT_MAX_ENTRIES, DEFAULT_THRESHOLD, SemanticCache
 from .streaming import TextStream
 
+if TYPE_CHECKING:
+    from celeste.modalities.embeddings.client import EmbeddingsClient
+
 
 class TextClient(
     ModalityClient[TextInput, TextOutput, TextParameters, TextContent, TextChunk]
@@ -125,6 +137,23 @@ class TextClient(
                 msg = f"Model {self.model.id} does not support {input_type.value} input"
                 raise NotImplementedError(msg)
 
+    def semantic_cache(
+        self,
+        embedder: "EmbeddingsClient",
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> SemanticCache:
+        """generate() front end that reuses outputs of similar earlier prompts.
+
+        Usage:
+            cached = client.semantic_cache(embeddings_client, threshold=0.92)
+            output = await cached.generate("How do I reset my password?")
+        """
+        return SemanticCache(
+            self, embedder, threshold=threshold, max_entries=max_entries
+        )
+
     @property
     def stream(self) -> "TextStreamNamespace":
         """Streaming namespace for text operations."""
@@ -135,6 +164,11 @@ class TextClient(
         """Sync namespace for text operations."""
         return TextSyncNamespace(self)
 
+    @property
+    def batch(self) -> "TextBatchNamespace":
+        """Batch namespace for fan-out over many prompts."""
+        return TextBatchNamespace(self)
+
 
 class TextStreamNamespace:
     """Streaming namespace for text operations.
@@ -242,7 +276,8 @@ class TextSyncNamespace:
         """
         self._client._check_media_support(messages=messages)
         inputs = TextInput(prompt=prompt, messages=messages)
-        return async_to_sync(self._client._predict)(
+        return run_sync(
+            self._client._predict,
             inputs,
             extra_body=extra_body,
             extra_headers=extra_headers,
@@ -286,7 +321,8 @@ class TextSyncNamespace:
             audio=audio,
             document=document,
         )
-        return async_to_sync(self._client._predict)(
+        return run_sync(
+            self._client._predict,
             inputs,
             extra_body=extra_body,
             extra_headers=extra_headers,
@@ -372,7 +408,96 @@ class TextSyncStreamNamespace:
         )
 
 
+class TextBatchNamespace:
+    """Batch namespace for text operations.
+
+    Provides `client.batch.generate()` for concurrent fan-out, and
+    `client.batch.submit()` / `wait()` / `results()` for provider batch jobs.
+    """
+
+    def __init__(self, client: TextClient) -> None:
+        self._client = client
+
+    def generate(
+        self,
+        prompts: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[TextParameters],
+    ) -> AsyncIterator[BatchResult[TextOutput]]:
+        """Generate text for many prompts with bounded concurrency.
+
+        Usage:
+            async for result in client.batch.generate(prompts, concurrency=32):
+                print(result.index, result.output.content if result.ok else result.error)
+        """
+
+        async def generate(prompt: str) -> TextOutput:
+            return await self._client.generate(
+                prompt,
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                **parameters,
+            )
+
+        return run_batch(prompts, generate, concurrency=concurrency)
+
+    async def submit(
+        self,
+        prompts: Iterable[str],
+        *,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[TextParameters],
+    ) -> BatchJob:
+        """Submit many prompts as one job to the provider's native batch API.
+
+        Batch APIs trade latency (up to 24h) for lower prices and higher limits.
+
+        Usage:
+            job = await client.batch.submit(prompts)
+            job = await client.batch.wait(job)
+            for result in await client.batch.results(job):
+                print(result.index, result.output.content if result.ok else result.error)
+        """
+        inputs = [TextInput(prompt=item) for item in prompts]
+        return await self._client._submit_batch(
+            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        )
+
+    async def refresh(self, job: BatchJob) -> BatchJob:
+        """Fetch the current state of a batch job."""
+        return await self._client._refresh_batch(job)
+
+    async def wait(
+        self,
+        job: BatchJob,
+        *,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        timeout: float | None = None,
+    ) -> BatchJob:
+        """Poll a batch job until it is done."""
+        return await wait_for_batch(
+            job,
+            self._client._refresh_batch,
+            poll_interval=poll_interval,
+            timeout=timeout,
+        )
+
+    async def results(
+        self, job: BatchJob, **parameters: Unpack[TextParameters]
+    ) -> list[BatchResult[TextOutput]]:
+        """Parse a finished job's results in submission order.
+
+        Pass the parameters the job was submitted with.
+        """
+        return await self._client._batch_results(job, **parameters)
+
+
 __all__ = [
+    "TextBatchNamespace",
     "TextClient",
     "TextStreamNamespace",
     "TextSyncNamespace",
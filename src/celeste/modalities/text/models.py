@@ -1,31 +1,33 @@
 """Aggregated models for text modality."""
 
+from celeste.core import Provider
+from celeste.lazy import import_spec
 from celeste.models import Model
 
-from .providers.anthropic.models import MODELS as ANTHROPIC_MODELS
-from .providers.cohere.models import MODELS as COHERE_MODELS
-from .providers.deepseek.models import MODELS as DEEPSEEK_MODELS
-from .providers.google.models import MODELS as GOOGLE_MODELS
-from .providers.groq.models import MODELS as GROQ_MODELS
-from .providers.huggingface.models import MODELS as HUGGINGFACE_MODELS
-from .providers.mistral.models import MODELS as MISTRAL_MODELS
-from .providers.moonshot.models import MODELS as MOONSHOT_MODELS
-from .providers.ollama.models import MODELS as OLLAMA_MODELS
-from .providers.openai.models import MODELS as OPENAI_MODELS
-from .providers.openrouter.models import MODELS as OPENROUTER_MODELS
-from .providers.xai.models import MODELS as XAI_MODELS
+# Catalog module per provider, imported on first lookup (see celeste.models).
+MODEL_MODULES: dict[Provider, str] = {
+    Provider.ANTHROPIC: f"{__package__}.providers.anthropic.models",
+    Provider.COHERE: f"{__package__}.providers.cohere.models",
+    Provider.DEEPSEEK: f"{__package__}.providers.deepseek.models",
+    Provider.GOOGLE: f"{__package__}.providers.google.models",
+    Provider.GROQ: f"{__package__}.providers.groq.models",
+    Provider.HUGGINGFACE: f"{__package__}.providers.huggingface.models",
+    Provider.OLLAMA: f"{__package__}.providers.ollama.models",
+    Provider.MISTRAL: f"{__package__}.providers.mistral.models",
+    Provider.MOONSHOT: f"{__package__}.providers.moonshot.models",
+    Provider.OPENAI: f"{__package__}.providers.openai.models",
+    Provider.OPENROUTER: f"{__package__}.providers.openrouter.models",
+    Provider.XAI: f"{__package__}.providers.xai.models",
+}
 
-MODELS: list[Model] = [
-    *ANTHROPIC_MODELS,
-    *COHERE_MODELS,
-    *DEEPSEEK_MODELS,
-    *GOOGLE_MODELS,
-    *GROQ_MODELS,
-    *HUGGINGFACE_MODELS,
-    *OLLAMA_MODELS,
-    *MISTRAL_MODELS,
-    *MOONSHOT_MODELS,
-    *OPENAI_MODELS,
-    *OPENROUTER_MODELS,
-    *XAI_MODELS,
-]
+
+def __getattr__(name: str) -> list[Model]:
+    """Import every provider catalog on first access to ``MODELS``."""
+    if name != "MODELS":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return [
+        model
+        for module in MODEL_MODULES.values()
+        for model in import_spec(f"{module}:MODELS")
+    ]
@@ -1,32 +1,25 @@
 """Text providers."""
 
 from celeste.core import Provider
+from celeste.lazy import LazyMapping
 
 from ..client import TextClient
-from .anthropic import AnthropicTextClient
-from .cohere import CohereTextClient
-from .deepseek import DeepSeekTextClient
-from .google import GoogleTextClient
-from .groq import GroqTextClient
-from .huggingface import HuggingFaceTextClient
-from .mistral import MistralTextClient
-from .moonshot import MoonshotTextClient
-from .ollama import OllamaTextClient
-from .openai import OpenAITextClient
-from .openrouter import OpenRouterTextClient
-from .xai import XAITextClient
 
-PROVIDERS: dict[Provider, type[TextClient]] = {
-    Provider.ANTHROPIC: AnthropicTextClient,
-    Provider.COHERE: CohereTextClient,
-    Provider.DEEPSEEK: DeepSeekTextClient,
-    Provider.GOOGLE: GoogleTextClient,
-    Provider.GROQ: GroqTextClient,
-    Provider.HUGGINGFACE: HuggingFaceTextClient,
-    Provider.OLLAMA: OllamaTextClient,
-    Provider.MISTRAL: MistralTextClient,
-    Provider.MOONSHOT: MoonshotTextClient,
-    Provider.OPENAI: OpenAITextClient,
-    Provider.OPENROUTER: OpenRouterTextClient,
-    Provider.XAI: XAITextClient,
-}
+# Each client is imported on first lookup.
+PROVIDERS: LazyMapping[Provider, type[TextClient]] = LazyMapping(
+    {
+        Provider.ANTHROPIC: ".anthropic.client:AnthropicTextClient",
+        Provider.COHERE: ".cohere.client:CohereTextClient",
+        Provider.DEEPSEEK: ".deepseek.client:DeepSeekTextClient",
+        Provider.GOOGLE: ".google.client:GoogleTextClient",
+        Provider.GROQ: ".groq.client:GroqTextClient",
+        Provider.HUGGINGFACE: ".huggingface.client:HuggingFaceTextClient",
+        Provider.OLLAMA: ".ollama.client:OllamaTextClient",
+        Provider.MISTRAL: ".mistral.client:MistralTextClient",
+        Provider.MOONSHOT: ".moonshot.client:MoonshotTextClient",
+        Provider.OPENAI: ".openai.client:OpenAITextClient",
+        Provider.OPENROUTER: ".openrouter.client:OpenRouterTextClient",
+        Provider.XAI: ".xai.client:XAITextClient",
+    },
+    package=__name__,
+)
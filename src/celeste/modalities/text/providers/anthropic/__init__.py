@@ -1,6 +1,17 @@
 """Anthropic provider for text modality."""
 
-from .client import AnthropicTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import AnthropicTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"AnthropicTextClient": ".client:AnthropicTextClient"}
+)
+
 __all__ = ["MODELS", "AnthropicTextClient"]
@@ -13,6 +13,9 @@ from celeste.messages import (
 )
 from celeste.mime_types import ImageMimeType
 from celeste.parameters import ParameterMapper
+from celeste.providers.anthropic.batches.client import (
+    AnthropicBatchesClient as AnthropicBatchesMixin,
+)
 from celeste.providers.anthropic.messages.client import (
     AnthropicMessagesClient as AnthropicMessagesMixin,
 )
@@ -84,7 +87,7 @@ class AnthropicTextStream(_AnthropicMessagesStream, TextStream):
         return parse_grounding(self._aggregate_content_blocks())
 
 
-class AnthropicTextClient(AnthropicMessagesMixin, TextClient):
+class AnthropicTextClient(AnthropicBatchesMixin, AnthropicMessagesMixin, TextClient):
     """Anthropic text client."""
 
     @classmethod
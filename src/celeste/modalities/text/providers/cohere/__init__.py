@@ -1,6 +1,17 @@
 """Cohere provider for text modality."""
 
-from .client import CohereTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import CohereTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"CohereTextClient": ".client:CohereTextClient"}
+)
+
 __all__ = ["MODELS", "CohereTextClient"]
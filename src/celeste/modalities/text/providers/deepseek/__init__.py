@@ -1,6 +1,17 @@
 """DeepSeek provider for text modality."""
 
-from .client import DeepSeekTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import DeepSeekTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"DeepSeekTextClient": ".client:DeepSeekTextClient"}
+)
+
 __all__ = ["MODELS", "DeepSeekTextClient"]
@@ -1,6 +1,17 @@
 """Google provider for text modality."""
 
-from .client import GoogleTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import GoogleTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"GoogleTextClient": ".client:GoogleTextClient"}
+)
+
 __all__ = ["MODELS", "GoogleTextClient"]
@@ -3,6 +3,8 @@
 from collections.abc import AsyncIterator
 from typing import Any, Unpack
 
+from celeste.batch import BatchJob, BatchResult
+from celeste.exceptions import BatchItemError
 from celeste.grounding import Grounding
 from celeste.parameters import ParameterMapper
 from celeste.providers.google.auth import GoogleADC
@@ -58,9 +60,26 @@ class GoogleTextClient(TextClient):
             provider=self.provider,
             auth=self.auth,
             base_url=self.base_url,
+            http_config=self.http_config,
+            cache=self.cache,
+            retention=self.retention,
         )
         object.__setattr__(self, "_strategy", strategy)
 
+    def _generate_content_client(self) -> GoogleVertexTextClient:
+        if isinstance(self._strategy, GoogleVertexTextClient):
+            return self._strategy
+        return GoogleVertexTextClient(
+            modality=self.modality,
+            model=self.model,
+            provider=self.provider,
+            auth=self.auth,
+            base_url=self.base_url,
+            http_config=self.http_config,
+            cache=self.cache,
+            retention=self.retention,
+        )
+
     def _generate_content_fallback(
         self, tools: object
     ) -> GoogleVertexTextClient | None:
@@ -69,13 +88,7 @@ class GoogleTextClient(TextClient):
             and self.model.id in _GENERATE_CONTENT_MIXED_TOOL_FALLBACK_MODELS
             and _has_mixed_tools(tools)
         ):
-            return GoogleVertexTextClient(
-                modality=self.modality,
-                model=self.model,
-                provider=self.provider,
-                auth=self.auth,
-                base_url=self.base_url,
-            )
+            return self._generate_content_client()
         return None
 
     async def _predict(
@@ -133,6 +146,43 @@ class GoogleTextClient(TextClient):
             **parameters,
         )
 
+    # Gemini batch mode takes GenerateContent requests, so batch jobs always
+    # build and parse through the GenerateContent backend.
+    async def _submit_batch(
+        self,
+        inputs: list[TextInput],
+        *,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[TextParameters],
+    ) -> BatchJob:
+        return await self._generate_content_client()._submit_batch(
+            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        )
+
+    async def _batch_results(
+        self, job: BatchJob, **parameters: Unpack[TextParameters]
+    ) -> list[BatchResult[TextOutput]]:
+        return await self._generate_content_client()._batch_results(job, **parameters)
+
+    async def _create_batch(
+        self,
+        requests: dict[str, dict[str, Any]],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> BatchJob:
+        return await self._generate_content_client()._create_batch(
+            requests, extra_headers=extra_headers
+        )
+
+    async def _retrieve_batch(self, job: BatchJob) -> BatchJob:
+        return await self._generate_content_client()._retrieve_batch(job)
+
+    async def _fetch_batch_results(
+        self, job: BatchJob
+    ) -> dict[str, dict[str, Any] | BatchItemError]:
+        return await self._generate_content_client()._fetch_batch_results(job)
+
     @classmethod
     def parameter_mappers(cls) -> list[ParameterMapper[TextContent]]:
         return [
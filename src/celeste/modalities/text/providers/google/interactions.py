@@ -41,6 +41,7 @@ class GoogleInteractionsTextStream(_GoogleInteractionsStream, TextStream):
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         super().__init__(*args, **kwargs)
         self._step_events = []
+        self._steps: tuple[int, list[dict[str, Any]]] | None = None
 
     def _parse_chunk(self, event: dict[str, Any]) -> Any:  # noqa: ANN401
         """Retain step lifecycle events that base chunk filtering would drop."""
@@ -53,17 +54,27 @@ class GoogleInteractionsTextStream(_GoogleInteractionsStream, TextStream):
         """Return the retained step events (chunk metadata lacks step.start/stop)."""
         return self._step_events
 
+    def _reconstructed_steps(
+        self, raw_events: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Reconstruct steps once per event count; grounding, tool calls and signatures share them."""
+        if raw_events is not self._step_events:
+            return reconstruct_steps(raw_events)
+        if self._steps is None or self._steps[0] != len(raw_events):
+            self._steps = (len(raw_events), reconstruct_steps(raw_events))
+        return self._steps[1]
+
     def _aggregate_grounding(
         self, chunks: list, raw_events: list[dict[str, Any]]
     ) -> Grounding | None:
         """Aggregate grounding from the reconstructed steps."""
-        return map_grounding_interactions(reconstruct_steps(raw_events))
+        return map_grounding_interactions(self._reconstructed_steps(raw_events))
 
     def _aggregate_tool_calls(
         self, chunks: list, raw_events: list[dict[str, Any]]
     ) -> list[ToolCall]:
         """Extract tool calls from the reconstructed steps."""
-        return tool_calls_from_steps(reconstruct_steps(raw_events))
+        return tool_calls_from_steps(self._reconstructed_steps(raw_events))
 
     def _aggregate_signature(
         self, chunks: list, raw_events: list[dict[str, Any]]
@@ -71,7 +82,7 @@ class GoogleInteractionsTextStream(_GoogleInteractionsStream, TextStream):
         """Extract thought steps (for signature continuity) from reconstructed steps."""
         return [
             step
-            for step in reconstruct_steps(raw_events)
+            for step in self._reconstructed_steps(raw_events)
             if step.get("type") == "thought"
         ]
 
@@ -1,6 +1,6 @@
 """Google text client for the direct and Vertex GenerateContent APIs."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 from celeste.grounding import Grounding
 from celeste.messages import (
@@ -9,6 +9,10 @@ from celeste.messages import (
     tool_result_object,
 )
 from celeste.parameters import ParameterMapper
+from celeste.providers.google.batches.client import (
+    GoogleBatchesClient as GoogleBatchesMixin,
+)
+from celeste.providers.google.batches.config import GoogleBatchesEndpoint
 from celeste.providers.google.generate_content.client import (
     GoogleGenerateContentClient as GoogleGenerateContentMixin,
 )
@@ -76,9 +80,13 @@ class GoogleVertexTextStream(_GoogleGenerateContentStream, TextStream):
         ]
 
 
-class GoogleVertexTextClient(GoogleGenerateContentMixin, TextClient):
+class GoogleVertexTextClient(
+    GoogleBatchesMixin, GoogleGenerateContentMixin, TextClient
+):
     """Google text client for GenerateContent, with auth-based URL routing."""
 
+    _batch_endpoint: ClassVar[str] = GoogleBatchesEndpoint.BATCH_GENERATE_CONTENT
+
     @classmethod
     def parameter_mappers(cls) -> list[ParameterMapper[TextContent]]:
         return GOOGLE_VERTEX_PARAMETER_MAPPERS
@@ -1,6 +1,15 @@
 """Groq provider for text modality."""
 
-from .client import GroqTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import GroqTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(__name__, {"GroqTextClient": ".client:GroqTextClient"})
+
 __all__ = ["MODELS", "GroqTextClient"]
@@ -1,6 +1,17 @@
 """HuggingFace provider for text modality."""
 
-from .client import HuggingFaceTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import HuggingFaceTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"HuggingFaceTextClient": ".client:HuggingFaceTextClient"}
+)
+
 __all__ = ["MODELS", "HuggingFaceTextClient"]
@@ -1,6 +1,17 @@
 """Mistral provider for text modality."""
 
-from .client import MistralTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import MistralTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"MistralTextClient": ".client:MistralTextClient"}
+)
+
 __all__ = ["MODELS", "MistralTextClient"]
@@ -1,6 +1,17 @@
 """Moonshot provider for text modality."""
 
-from .client import MoonshotTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import MoonshotTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"MoonshotTextClient": ".client:MoonshotTextClient"}
+)
+
 __all__ = ["MODELS", "MoonshotTextClient"]
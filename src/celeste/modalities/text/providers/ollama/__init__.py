@@ -1,6 +1,17 @@
 """Ollama provider for text modality."""
 
-from .client import OllamaTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import OllamaTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"OllamaTextClient": ".client:OllamaTextClient"}
+)
+
 __all__ = ["MODELS", "OllamaTextClient"]
@@ -1,6 +1,17 @@
 """OpenAI provider for text modality."""
 
-from .client import OpenAITextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import OpenAITextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"OpenAITextClient": ".client:OpenAITextClient"}
+)
+
 __all__ = ["MODELS", "OpenAITextClient"]
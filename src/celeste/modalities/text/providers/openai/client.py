@@ -1,9 +1,15 @@
 """OpenAI text client."""
 
+from typing import ClassVar
+
 from celeste.parameters import ParameterMapper
+from celeste.providers.openai.batches.client import (
+    OpenAIBatchesClient as OpenAIBatchesMixin,
+)
 from celeste.providers.openai.responses.client import (
     OpenAIResponsesClient as OpenAIResponsesMixin,
 )
+from celeste.providers.openai.responses.config import OpenAIResponsesEndpoint
 from celeste.providers.openai.responses.streaming import (
     OpenAIResponsesStream as _OpenAIResponsesStream,
 )
@@ -23,9 +29,13 @@ class OpenAITextStream(_OpenAIResponsesStream, _OpenResponsesTextStream):
     """OpenAI streaming for text modality."""
 
 
-class OpenAITextClient(OpenAIResponsesMixin, OpenResponsesTextClient):
+class OpenAITextClient(
+    OpenAIBatchesMixin, OpenAIResponsesMixin, OpenResponsesTextClient
+):
     """OpenAI text client using Responses API."""
 
+    _batch_endpoint: ClassVar[str] = OpenAIResponsesEndpoint.CREATE_RESPONSE
+
     @classmethod
     def parameter_mappers(cls) -> list[ParameterMapper[TextContent]]:
         return OPENAI_PARAMETER_MAPPERS
@@ -1,6 +1,17 @@
 """OpenRouter provider for text modality."""
 
-from .client import OpenRouterTextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import OpenRouterTextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"OpenRouterTextClient": ".client:OpenRouterTextClient"}
+)
+
 __all__ = ["MODELS", "OpenRouterTextClient"]
@@ -1,6 +1,15 @@
 """xAI provider for text modality."""
 
-from .client import XAITextClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import XAITextClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(__name__, {"XAITextClient": ".client:XAITextClient"})
+
 __all__ = ["MODELS", "XAITextClient"]
@@ -0,0 +1,261 @@
+"""Semantic caching of generate() outputs by prompt similarity."""
+
+import functools
+import json
+import math
+import time
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Unpack
+
+from pydantic import BaseModel
+
+from celeste.tools import ToolResult
+from celeste.types import Message
+
+from .io import TextOutput
+from .parameters import TextParameters
+
+if TYPE_CHECKING:
+    from celeste.modalities.embeddings.client import EmbeddingsClient
+
+    from .client import TextClient
+
+DEFAULT_THRESHOLD = 0.95
+DEFAULT_MAX_ENTRIES = 1024
+
+
+@functools.cache
+def _numpy() -> Any:  # noqa: ANN401 - numpy is optional
+    """Import numpy on first search, so ``import celeste`` never loads it."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class SemanticCacheStats(BaseModel):
+    """Hit-rate and lookup-latency snapshot for a SemanticCache."""
+
+    lookups: int = 0
+    hits: int = 0
+    entries: int = 0
+    evictions: int = 0
+    total_lookup_time: float = 0.0
+    max_lookup_time: float = 0.0
+
+    @property
+    def misses(self) -> int:
+        """Lookups that fell through to the model."""
+        return self.lookups - self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def mean_lookup_time(self) -> float:
+        """Mean seconds spent embedding the prompt and searching."""
+        return self.total_lookup_time / self.lookups if self.lookups else 0.0
+
+
+class _ScopeIndex:
+    """Unit-normalized prompt vectors for one scope, stored row-major."""
+
+    def __init__(self, dimensions: int) -> None:
+        self.dimensions = dimensions
+        self.ids: list[int] = []
+        self.matrix = array("f")
+
+    def add(self, entry_id: int, vector: array) -> None:
+        self.ids.append(entry_id)
+        self.matrix.extend(vector)
+
+    def remove(self, entry_id: int) -> None:
+        row = self.ids.index(entry_id)
+        del self.ids[row]
+        del self.matrix[row * self.dimensions : (row + 1) * self.dimensions]
+
+    def nearest(self, query: array) -> tuple[int, float] | None:
+        """Return the (entry id, cosine similarity) closest to ``query``."""
+        if not self.ids:
+            return None
+        np = _numpy()
+        if np is None:
+            return self._nearest_python(query)
+        scores = np.frombuffer(self.matrix, dtype=np.float32).reshape(
+            len(self.ids), self.dimensions
+        ) @ np.frombuffer(query, dtype=np.float32)
+        row = int(scores.argmax())
+        return self.ids[row], float(scores[row])
+
+    def _nearest_python(self, query: array) -> tuple[int, float]:
+        dimensions = self.dimensions
+        matrix = self.matrix
+        best_row, best_score = 0, -math.inf
+        for row in range(len(self.ids)):
+            offset = row * dimensions
+            score = math.sumprod(matrix[offset : offset + dimensions], query)
+            if score > best_score:
+                best_row, best_score = row, score
+        return self.ids[best_row], best_score
+
+
+def _normalize(vector: list[float]) -> array:
+    norm = math.hypot(*vector)
+    if norm == 0:
+        msg = "Cannot cache a prompt whose embedding is the zero vector"
+        raise ValueError(msg)
+    return array("f", (value / norm for value in vector))
+
+
+class SemanticCache:
+    """Serves generate() calls whose prompt is close to an earlier one.
+
+    Each prompt is embedded with ``embedder``. If a stored prompt from the same
+    scope has cosine similarity of at least ``threshold``, its TextOutput is
+    returned without calling the model. A scope is the text model plus every
+    request option (parameters, extra body and headers), so a hit never crosses
+    temperatures, tools or output schemas. Entries are evicted least recently
+    used once ``max_entries`` is reached.
+
+    Only ``prompt`` calls are cached; ``messages=`` calls go straight to the
+    model, since earlier turns change the answer. Similarity search is a
+    single matrix-vector product with numpy installed (the ``numpy`` extra)
+    and a pure-Python scan otherwise.
+
+    Usage:
+        cached = client.semantic_cache(embedder, threshold=0.92)
+        output = await cached.generate("How do I reset my password?")
+        print(cached.stats().hit_rate)
+    """
+
+    def __init__(
+        self,
+        client: "TextClient",
+        embedder: "EmbeddingsClient",
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize an empty cache in front of ``client``.
+
+        Raises:
+            ValueError: If ``threshold`` is outside (0, 1] or ``max_entries`` is less than 1.
+        """
+        if not 0 < threshold <= 1:
+            msg = "threshold must be in (0, 1]"
+            raise ValueError(msg)
+        if max_entries < 1:
+            msg = "max_entries must be at least 1"
+            raise ValueError(msg)
+        self._client = client
+        self._embedder = embedder
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._scopes: dict[str, _ScopeIndex] = {}
+        # entry id -> (scope, output), in least- to most-recently-used order
+        self._entries: OrderedDict[int, tuple[str, TextOutput]] = OrderedDict()
+        self._next_id = 0
+        self._stats = SemanticCacheStats()
+
+    async def generate(
+        self,
+        prompt: str | None = None,
+        *,
+        messages: list[Message | ToolResult] | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[TextParameters],
+    ) -> TextOutput:
+        """Generate text, reusing the output of a similar earlier prompt."""
+        if prompt is None or messages is not None:
+            return await self._client.generate(
+                prompt,
+                messages=messages,
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                **parameters,
+            )
+
+        scope = json.dumps(
+            [
+                self._client.provider or self._client.protocol,
+                self._client.model.id,
+                extra_body,
+                extra_headers,
+                parameters,
+            ],
+            sort_keys=True,
+            default=repr,
+        )
+        started = time.perf_counter()
+        embedding = await self._embedder.embed(prompt)
+        vector = _normalize(embedding.content)  # type: ignore[arg-type]  # single text
+        index = self._scopes.get(scope)
+        match = index.nearest(vector) if index is not None else None
+        self._record_lookup(time.perf_counter() - started)
+
+        if match is not None and match[1] >= self._threshold:
+            entry_id, similarity = match
+            self._entries.move_to_end(entry_id)
+            self._stats.hits += 1
+            output = self._entries[entry_id][1]
+            return output.model_copy(
+                update={
+                    "metadata": {
+                        **output.metadata,
+                        "cache_hit": True,
+                        "semantic_similarity": similarity,
+                    }
+                }
+            )
+
+        output = await self._client.generate(
+            prompt, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        )
+        self._store(scope, vector, output)
+        return output
+
+    def stats(self) -> SemanticCacheStats:
+        """Return a snapshot of hit rate, latency and size."""
+        return self._stats.model_copy(update={"entries": len(self._entries)})
+
+    def clear(self) -> None:
+        """Drop every entry; statistics are kept."""
+        self._scopes.clear()
+        self._entries.clear()
+
+    def _record_lookup(self, seconds: float) -> None:
+        self._stats.lookups += 1
+        self._stats.total_lookup_time += seconds
+        self._stats.max_lookup_time = max(self._stats.max_lookup_time, seconds)
+
+    def _store(self, scope: str, vector: array, output: TextOutput) -> None:
+        index = self._scopes.get(scope)
+        if index is None:
+            index = self._scopes[scope] = _ScopeIndex(len(vector))
+        elif index.dimensions != len(vector):
+            msg = f"Expected {index.dimensions}-dim embeddings, got {len(vector)}"
+            raise ValueError(msg)
+        entry_id = self._next_id
+        self._next_id += 1
+        index.add(entry_id, vector)
+        self._entries[entry_id] = (scope, output)
+        while len(self._entries) > self._max_entries:
+            evicted_id, (evicted_scope, _) = self._entries.popitem(last=False)
+            evicted_index = self._scopes[evicted_scope]
+            evicted_index.remove(evicted_id)
+            if not evicted_index.ids:
+                del self._scopes[evicted_scope]
+            self._stats.evictions += 1
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "DEFAULT_THRESHOLD",
+    "SemanticCache",
+    "SemanticCacheStats",
+]
@@ -17,12 +17,11 @@ class TextStream(Stream[TextOutput, TextParameters, TextChunk]):
 
     def _aggregate_content(self, chunks: list[TextChunk]) -> str:
         """Aggregate content from chunks into raw text."""
-        return "".join(chunk.content for chunk in chunks)
+        return self._aggregate_of(chunks).text()
 
     def _aggregate_reasoning(self, chunks: list[TextChunk]) -> str | None:
         """Aggregate reasoning from chunks into text."""
-        parts = [c.reasoning for c in chunks if c.reasoning]
-        return "".join(parts) if parts else None
+        return self._aggregate_of(chunks).reasoning_text()
 
 
 __all__ = ["TextStream"]
@@ -1,12 +1,16 @@
 """Videos modality client."""
 
+import functools
+import io
+from collections.abc import Awaitable, Callable
 from typing import Any, ClassVar, Unpack
 
-from asgiref.sync import async_to_sync
-
 from celeste.artifacts import VideoArtifact
 from celeste.client import ModalityClient
 from celeste.core import Modality
+from celeste.jobs import JobHandle, JobStore
+from celeste.runner import run_sync
+from celeste.sinks import BinarySink, Sink, sink_scope
 from celeste.types import VideoContent
 
 from .io import VideoChunk, VideoFinishReason, VideoInput, VideoOutput, VideoUsage
@@ -24,6 +28,7 @@ class VideosClient(
 
     _generate_endpoint: ClassVar[str | None] = None
     _edit_endpoint: ClassVar[str | None] = None
+    _download_segments: ClassVar[int] = 4
 
     @classmethod
     def _output_class(cls) -> type[VideoOutput]:
@@ -33,18 +38,26 @@ class VideosClient(
     async def generate(
         self,
         prompt: str,
+        *,
+        sink: Sink | None = None,
         **parameters: Unpack[VideoParameters],
     ) -> VideoOutput:
-        """Generate videos from prompt."""
+        """Generate videos from prompt.
+
+        With ``sink`` (a path or binary file), the video is downloaded there in
+        chunks and the returned artifact is backed by that path.
+        """
         inputs = VideoInput(prompt=prompt)
-        return await self._predict(
-            inputs, endpoint=self._generate_endpoint, **parameters
+        return await self._generate(
+            inputs, endpoint=self._generate_endpoint, sink=sink, **parameters
         )
 
     async def edit(
         self,
         video: VideoArtifact,
         prompt: str,
+        *,
+        sink: Sink | None = None,
         **parameters: Unpack[VideoParameters],
     ) -> VideoOutput:
         """Edit a video with text instructions."""
@@ -52,13 +65,145 @@ class VideosClient(
             msg = f"Model {self.model.id} does not support video editing"
             raise NotImplementedError(msg)
         inputs = VideoInput(prompt=prompt, video=video)
-        return await self._predict(inputs, endpoint=self._edit_endpoint, **parameters)
+        return await self._generate(
+            inputs, endpoint=self._edit_endpoint, sink=sink, **parameters
+        )
+
+    async def _generate(
+        self,
+        inputs: VideoInput,
+        *,
+        endpoint: str | None,
+        sink: Sink | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[VideoParameters],
+    ) -> VideoOutput:
+        return await self._into_sink(
+            sink,
+            functools.partial(
+                self._predict,
+                inputs,
+                endpoint=endpoint,
+                extra_body=extra_body,
+                extra_headers=extra_headers,
+                **parameters,
+            ),
+        )
+
+    async def collect(
+        self,
+        handle: JobHandle,
+        *,
+        sink: Sink | None = None,
+        store: JobStore | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[VideoParameters],
+    ) -> VideoOutput:
+        """Wait for a job from `client.submit` and return its output.
+
+        Parameters the job was submitted with are read from the handle;
+        pass any to override them. ``sink`` works as in generate(). With
+        ``store``, the handle is removed from it once the video is written;
+        a failed collect leaves it there to retry.
+
+        Usage:
+            for handle in await store.pending():
+                await client.collect(handle, sink=f"{handle.id}.mp4", store=store)
+        """
+        output = await self._into_sink(
+            sink,
+            functools.partial(
+                self._collect_job, handle, extra_headers=extra_headers, **parameters
+            ),
+        )
+        if store is not None:
+            await store.delete(handle.id)
+        return output
+
+    async def _into_sink(
+        self, sink: Sink | None, produce: Callable[[], Awaitable[VideoOutput]]
+    ) -> VideoOutput:
+        """Run ``produce`` and write its video to ``sink`` when there is one."""
+        if sink is None:
+            return await produce()
+        binary_sink = BinarySink(sink)
+        try:
+            # Providers that fetch the video themselves write it to the sink;
+            # URL and inline results are written here.
+            with sink_scope(binary_sink):
+                output = await produce()
+            if not isinstance(output.content, VideoArtifact):
+                binary_sink.abort()
+                return output
+            if output.content.has_content:
+                await self._write_content(output.content, binary_sink)
+            binary_sink.commit()
+        except BaseException:
+            binary_sink.abort()
+            raise
+        return output.model_copy(
+            update={
+                "content": binary_sink.artifact(
+                    output.content.model_copy(update={"url": None})
+                )
+            }
+        )
+
+    async def download_content(
+        self, artifact: VideoArtifact, *, sink: Sink | None = None
+    ) -> VideoArtifact:
+        """Download the video behind a URL artifact.
+
+        Dropped connections resume where they stopped. With ``sink`` (a path or
+        binary file) the video is written there and the returned artifact is
+        backed by that path; otherwise it is returned in memory.
+        """
+        if sink is None:
+            if artifact.data is not None or artifact.path is not None:
+                return artifact
+            buffer = io.BytesIO()
+            await self._download(artifact, BinarySink(buffer))
+            return VideoArtifact(data=buffer.getvalue(), mime_type=artifact.mime_type)
+        binary_sink = BinarySink(sink)
+        try:
+            await self._write_content(artifact, binary_sink)
+            binary_sink.commit()
+        except BaseException:
+            binary_sink.abort()
+            raise
+        return binary_sink.artifact(artifact.model_copy(update={"url": None}))
+
+    async def _write_content(self, artifact: VideoArtifact, sink: BinarySink) -> None:
+        if artifact.data is not None or artifact.path is not None:
+            sink.write(artifact.get_bytes())
+        else:
+            await self._download(artifact, sink)
+
+    async def _download(self, artifact: VideoArtifact, sink: BinarySink) -> None:
+        """Write the video at ``artifact.url`` to ``sink``.
+
+        Provider video URLs are presigned, so no credentials are sent; providers
+        whose URLs need authentication override this.
+        """
+        if artifact.url is None:
+            msg = "Artifact has no URL or data to download"
+            raise ValueError(msg)
+        response = await self.http_client.download(
+            artifact.url, sink, segments=self._download_segments
+        )
+        self._handle_error_response(response)
 
     @property
     def sync(self) -> "VideosSyncNamespace":
         """Sync namespace for videos operations."""
         return VideosSyncNamespace(self)
 
+    @property
+    def submit(self) -> "VideosSubmitNamespace":
+        """Submit namespace for detached long-running jobs."""
+        return VideosSubmitNamespace(self)
+
 
 class VideosSyncNamespace:
     """Sync namespace for videos operations.
@@ -73,6 +218,7 @@ class VideosSyncNamespace:
         self,
         prompt: str,
         *,
+        sink: Sink | None = None,
         extra_body: dict[str, Any] | None = None,
         extra_headers: dict[str, str] | None = None,
         **parameters: Unpack[VideoParameters],
@@ -84,12 +230,89 @@ class VideosSyncNamespace:
             result.content.save("video.mp4")
         """
         inputs = VideoInput(prompt=prompt)
-        return async_to_sync(self._client._predict)(
-            inputs, extra_body=extra_body, extra_headers=extra_headers, **parameters
+        return run_sync(
+            self._client._generate,
+            inputs,
+            endpoint=self._client._generate_endpoint,
+            sink=sink,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
         )
 
 
+class VideosSubmitNamespace:
+    """Submit namespace for videos operations.
+
+    Provides `client.submit.generate()` and `client.submit.edit()`, which return
+    a serializable `JobHandle` as soon as the provider accepts the job.
+    `client.collect(handle)` waits for the result, in this process or another.
+    """
+
+    def __init__(self, client: VideosClient) -> None:
+        self._client = client
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        store: JobStore | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[VideoParameters],
+    ) -> JobHandle:
+        """Submit a video generation job.
+
+        Usage:
+            handle = await client.submit.generate("A cat on the beach", store=store)
+        """
+        return await self._submit(
+            VideoInput(prompt=prompt),
+            self._client._generate_endpoint,
+            store,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
+        )
+
+    async def edit(
+        self,
+        video: VideoArtifact,
+        prompt: str,
+        *,
+        store: JobStore | None = None,
+        extra_body: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+        **parameters: Unpack[VideoParameters],
+    ) -> JobHandle:
+        """Submit a video edit job."""
+        if self._client._edit_endpoint is None:
+            msg = f"Model {self._client.model.id} does not support video editing"
+            raise NotImplementedError(msg)
+        return await self._submit(
+            VideoInput(prompt=prompt, video=video),
+            self._client._edit_endpoint,
+            store,
+            extra_body=extra_body,
+            extra_headers=extra_headers,
+            **parameters,
+        )
+
+    async def _submit(
+        self,
+        inputs: VideoInput,
+        endpoint: str | None,
+        store: JobStore | None,
+        **kwargs: Any,
+    ) -> JobHandle:
+        handle = await self._client._submit_job(inputs, endpoint=endpoint, **kwargs)
+        if store is not None:
+            await store.save(handle)
+        return handle
+
+
 __all__ = [
     "VideosClient",
+    "VideosSubmitNamespace",
     "VideosSyncNamespace",
 ]
@@ -1,16 +1,17 @@
 """Videos providers."""
 
 from celeste.core import Provider
+from celeste.lazy import LazyMapping
 
 from ..client import VideosClient
-from .byteplus import BytePlusVideosClient
-from .google import GoogleVideosClient
-from .openai import OpenAIVideosClient
-from .xai import XAIVideosClient
 
-PROVIDERS: dict[Provider, type[VideosClient]] = {
-    Provider.BYTEPLUS: BytePlusVideosClient,
-    Provider.GOOGLE: GoogleVideosClient,
-    Provider.OPENAI: OpenAIVideosClient,
-    Provider.XAI: XAIVideosClient,
-}
+# Each client is imported on first lookup.
+PROVIDERS: LazyMapping[Provider, type[VideosClient]] = LazyMapping(
+    {
+        Provider.BYTEPLUS: ".byteplus.client:BytePlusVideosClient",
+        Provider.GOOGLE: ".google.client:GoogleVideosClient",
+        Provider.OPENAI: ".openai.client:OpenAIVideosClient",
+        Provider.XAI: ".xai.client:XAIVideosClient",
+    },
+    package=__name__,
+)
@@ -1,6 +1,17 @@
 """BytePlus provider for videos modality."""
 
-from .client import BytePlusVideosClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import BytePlusVideosClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"BytePlusVideosClient": ".client:BytePlusVideosClient"}
+)
+
 __all__ = ["MODELS", "BytePlusVideosClient"]
@@ -1,6 +1,17 @@
 """Google provider for videos modality."""
 
-from .client import GoogleVideosClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import GoogleVideosClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"GoogleVideosClient": ".client:GoogleVideosClient"}
+)
+
 __all__ = ["MODELS", "GoogleVideosClient"]
@@ -3,7 +3,9 @@
 from typing import Any, Unpack
 
 from celeste.artifacts import VideoArtifact
+from celeste.jobs import JobHandle
 from celeste.parameters import ParameterMapper
+from celeste.sinks import BinarySink, Sink
 from celeste.types import VideoContent
 
 from ...client import VideosClient
@@ -45,6 +47,9 @@ class GoogleVideosClient(VideosClient):
             provider=self.provider,
             auth=self.auth,
             base_url=self.base_url,
+            http_config=self.http_config,
+            cache=self.cache,
+            retention=self.retention,
         )
         object.__setattr__(self, "_strategy", strategy)
 
@@ -107,8 +112,29 @@ class GoogleVideosClient(VideosClient):
             **parameters,
         )
 
-    async def download_content(self, artifact: VideoArtifact) -> VideoArtifact:
-        return await self._strategy.download_content(artifact)  # type: ignore[union-attr]
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        return await self._strategy._start_job(  # type: ignore[union-attr]
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        return await self._strategy._wait_job(handle, extra_headers=extra_headers)  # type: ignore[union-attr]
+
+    async def download_content(
+        self, artifact: VideoArtifact, *, sink: Sink | None = None
+    ) -> VideoArtifact:
+        return await self._strategy.download_content(artifact, sink=sink)  # type: ignore[union-attr]
+
+    async def _download(self, artifact: VideoArtifact, sink: BinarySink) -> None:
+        await self._strategy._download(artifact, sink)  # type: ignore[union-attr]
 
 
 __all__ = ["GoogleVideosClient"]
@@ -10,6 +10,7 @@ from celeste.providers.google.interactions.client import (
     GoogleInteractionsClient as GoogleInteractionsMixin,
 )
 from celeste.providers.google.utils import build_content_part
+from celeste.sinks import BinarySink
 from celeste.types import VideoContent
 
 from ...client import VideosClient
@@ -60,21 +61,19 @@ class GoogleInteractionsVideosClient(GoogleInteractionsMixin, VideosClient):
         msg = "No video content in response"
         raise ValueError(msg)
 
-    async def download_content(self, artifact: VideoArtifact) -> VideoArtifact:
+    async def _download(self, artifact: VideoArtifact, sink: BinarySink) -> None:
         """Download video content from the response URI."""
-        if artifact.data is not None:
-            return artifact
-
         if artifact.url is None:
             msg = "Artifact has no URL or data to download"
             raise ValueError(msg)
 
-        headers = self.auth.get_headers()
-        response = await self.http_client.get(
-            artifact.url, headers=headers, follow_redirects=True
+        response = await self.http_client.download(
+            artifact.url,
+            sink,
+            headers=self.auth.get_headers(),
+            segments=self._download_segments,
         )
         self._handle_error_response(response)
-        return VideoArtifact(data=response.content, mime_type=artifact.mime_type)
 
 
 __all__ = ["GoogleInteractionsVideosClient"]
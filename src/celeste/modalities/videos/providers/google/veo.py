@@ -7,6 +7,7 @@ from celeste.mime_types import VideoMimeType
 from celeste.parameters import ParameterMapper
 from celeste.providers.google.veo import config
 from celeste.providers.google.veo.client import GoogleVeoClient as GoogleVeoMixin
+from celeste.sinks import BinarySink, Sink
 from celeste.types import VideoContent
 
 from ...client import VideosClient
@@ -43,27 +44,26 @@ class GoogleVeoVideosClient(GoogleVeoMixin, VideosClient):
             )
         return VideoArtifact(url=video_data.get("uri"))
 
-    async def download_content(self, artifact: VideoArtifact) -> VideoArtifact:
+    async def download_content(
+        self, artifact: VideoArtifact, *, sink: Sink | None = None
+    ) -> VideoArtifact:
         """Download video content from GCS URL.
 
         Args:
             artifact: VideoArtifact with URL or inline data to download.
+            sink: Optional path or binary file the video is written to.
 
         Returns:
-            VideoArtifact with downloaded bytes data.
+            VideoArtifact with downloaded bytes data, or backed by the sink's path.
         """
-        if artifact.data is not None:
-            return artifact
+        # The mixin's download_content works on raw URLs and bytes.
+        return await VideosClient.download_content(self, artifact, sink=sink)
 
+    async def _download(self, artifact: VideoArtifact, sink: BinarySink) -> None:
         if artifact.url is None:
             msg = "Artifact has no URL or data to download"
             raise ValueError(msg)
-
-        video_bytes = await super().download_content(artifact.url)
-        return VideoArtifact(
-            data=video_bytes,
-            mime_type=artifact.mime_type,
-        )
+        await self.download_to_sink(artifact.url, sink)
 
 
 __all__ = ["GoogleVeoVideosClient"]
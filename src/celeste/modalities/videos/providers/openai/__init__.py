@@ -1,6 +1,17 @@
 """OpenAI provider for videos modality."""
 
-from .client import OpenAIVideosClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import OpenAIVideosClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(
+    __name__, {"OpenAIVideosClient": ".client:OpenAIVideosClient"}
+)
+
 __all__ = ["MODELS", "OpenAIVideosClient"]
@@ -36,6 +36,8 @@ class OpenAIVideosClient(OpenAIVideosMixin, VideosClient):
         response_data: dict[str, Any],
     ) -> VideoArtifact:
         """Parse content from response."""
+        if response_data.get("video_sink"):
+            return VideoArtifact(mime_type=VideoMimeType.MP4)
         video_data_b64 = super()._parse_content(response_data)
         return VideoArtifact(
             data=video_data_b64,
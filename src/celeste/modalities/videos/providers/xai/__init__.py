@@ -1,6 +1,15 @@
 """xAI provider for videos modality."""
 
-from .client import XAIVideosClient
+from typing import TYPE_CHECKING
+
+from celeste.lazy import lazy_attributes
+
 from .models import MODELS
 
+if TYPE_CHECKING:
+    from .client import XAIVideosClient
+
+# The client is imported on first access, so model lookups stay cheap.
+__getattr__ = lazy_attributes(__name__, {"XAIVideosClient": ".client:XAIVideosClient"})
+
 __all__ = ["MODELS", "XAIVideosClient"]
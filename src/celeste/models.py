@@ -1,10 +1,18 @@
 """Models and model registry for Celeste."""
 
+import bisect
+import json
+import threading
+from collections.abc import Hashable, Mapping
+from pathlib import Path
+from typing import Any
+
 from pydantic import BaseModel, Field, SerializeAsAny, computed_field
 
 from celeste.constraints import Constraint
 from celeste.core import InputType, Modality, Operation, Provider
 from celeste.io import get_constraint_input_type
+from celeste.lazy import import_spec
 
 
 class Model(BaseModel):
@@ -42,8 +50,271 @@ class Model(BaseModel):
         return types
 
 
-# Module-level registry mapping (model_id, provider) to model
-_models: dict[tuple[str, Provider], Model] = {}
+SNAPSHOT_VERSION = 1
+
+_Key = tuple[str, Provider]
+_Rank = tuple[int, int]
+
+# Rank catalog index for models registered at runtime: they list after every
+# catalog model, in registration order.
+_RUNTIME_INDEX = 1 << 30
+_ALL = ("all",)
+
+
+class _ModelCatalog:
+    """Registered models with precomputed lookup indexes.
+
+    Each model is indexed by id, provider, modality, (modality, operation) and
+    operation. Index buckets keep keys sorted by rank (catalog order, then
+    registration order) and are updated incrementally on registration. A
+    bucket is materialized into an immutable tuple on first read and reused
+    until it changes, so lookups cost a dict access.
+
+    Built-in catalogs register as pending modules and are imported the first
+    time their provider is looked up (every provider for lookups without one).
+    Snapshot entries stay raw dicts until their model is first read.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entries: dict[_Key, Model | dict[str, Any]] = {}
+        self._ranks: dict[_Key, _Rank] = {}
+        self._indexed: dict[_Key, set[Hashable]] = {}
+        self._buckets: dict[Hashable, list[tuple[_Rank, _Key]]] = {}
+        self._views: dict[Hashable, tuple[Model, ...]] = {}
+        # provider -> [(catalog index, module)] not yet imported
+        self._pending: dict[Provider, list[tuple[int, str]]] = {}
+        self._catalog_count = 0
+        self._runtime_count = 0
+
+    def add_catalog(self, provider: Provider, module: str) -> None:
+        with self._lock:
+            self._pending.setdefault(provider, []).append((self._catalog_count, module))
+            self._catalog_count += 1
+
+    def register(
+        self, model: Model, modality: Modality | None, operation: Operation | None
+    ) -> None:
+        if model.provider is None:
+            msg = "Cannot register a model without a provider"
+            raise ValueError(msg)
+        key = (model.id, model.provider)
+        with self._lock:
+            self._load(model.provider)
+            if key in self._entries:
+                registered = self._materialize(key)
+            else:
+                registered = Model(
+                    id=model.id,
+                    provider=model.provider,
+                    display_name=model.display_name,
+                    parameter_constraints={},
+                    streaming=model.streaming,
+                )
+                self._put(key, registered, (_RUNTIME_INDEX, self._runtime_count))
+                self._runtime_count += 1
+
+            # Validate display name consistency
+            if registered.display_name != model.display_name:
+                raise ValueError(
+                    f"Inconsistent display_name for {model.id}: "
+                    f"'{registered.display_name}' vs '{model.display_name}'"
+                )
+
+            # Update constraints
+            registered.parameter_constraints.update(model.parameter_constraints)
+
+            # Merge model's pre-existing operations
+            for mod, ops in model.operations.items():
+                registered.operations.setdefault(mod, set()).update(ops)
+
+            if modality is not None and operation is not None:
+                registered.operations.setdefault(modality, set()).add(operation)
+
+            self._index(key, registered.operations)
+
+    def get(self, model_id: str, provider: Provider | None) -> tuple[Model, ...]:
+        self._load(provider)
+        if provider is None:
+            return self._view(("id", model_id))
+        with self._lock:
+            if (model_id, provider) not in self._entries:
+                return ()
+            return (self._materialize((model_id, provider)),)
+
+    def select(
+        self,
+        provider: Provider | None,
+        modality: Modality | None,
+        operation: Operation | None,
+    ) -> tuple[Model, ...]:
+        self._load(provider)
+        name: Hashable
+        if modality is not None and operation is not None:
+            name = ("operation", modality, operation)
+        elif modality is not None:
+            name = ("modality", modality)
+        elif operation is not None:
+            name = ("any_operation", operation)
+        elif provider is not None:
+            return self._view(("provider", provider))
+        else:
+            name = _ALL
+        models = self._view(name)
+        if provider is not None:
+            return tuple(m for m in models if m.provider == provider)
+        return models
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._ranks.clear()
+            self._indexed.clear()
+            self._buckets.clear()
+            self._views.clear()
+            self._pending.clear()
+
+    def dump(self) -> dict[str, Any]:
+        self._load()
+        return {
+            "version": SNAPSHOT_VERSION,
+            "models": [_model_to_snapshot(model) for model in self._view(_ALL)],
+        }
+
+    def load(self, snapshot: Mapping[str, Any]) -> None:
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            msg = f"Unsupported model snapshot version: {snapshot.get('version')!r}"
+            raise ValueError(msg)
+        with self._lock:
+            self.clear()
+            for position, raw in enumerate(snapshot["models"]):
+                entry = {
+                    **raw,
+                    "provider": Provider(raw["provider"]),
+                    "operations": {
+                        Modality(modality): {Operation(op) for op in ops}
+                        for modality, ops in raw["operations"].items()
+                    },
+                }
+                self._put((raw["id"], entry["provider"]), entry, (0, position))
+
+    def _load(self, provider: Provider | None = None) -> None:
+        """Import pending catalogs for ``provider``, or for every provider if None."""
+        if not self._pending:
+            return
+        with self._lock:
+            providers = list(self._pending) if provider is None else [provider]
+            for name in providers:
+                for index, module in self._pending.pop(name, []):
+                    models = import_spec(f"{module}:MODELS")
+                    for position, model in enumerate(models):
+                        key = (model.id, model.provider)
+                        self._put(key, model, (index, position))
+
+    def _put(self, key: _Key, entry: Model | dict[str, Any], rank: _Rank) -> None:
+        """Store ``entry`` under ``key``, replacing any previous entry in place."""
+        if key in self._entries:
+            self._unindex(key)
+        self._entries[key] = entry
+        self._ranks.setdefault(key, rank)
+        operations = (
+            entry.operations if isinstance(entry, Model) else entry["operations"]
+        )
+        self._index(key, operations)
+
+    def _index(self, key: _Key, operations: Mapping[Modality, set[Operation]]) -> None:
+        """Add ``key`` to every bucket it belongs to and is not in yet."""
+        model_id, provider = key
+        names: set[Hashable] = {_ALL, ("id", model_id), ("provider", provider)}
+        for modality, ops in operations.items():
+            names.add(("modality", modality))
+            for op in ops:
+                names.add(("operation", modality, op))
+                names.add(("any_operation", op))
+        indexed = self._indexed.setdefault(key, set())
+        item = (self._ranks[key], key)
+        for name in names - indexed:
+            bisect.insort(self._buckets.setdefault(name, []), item)
+            self._views.pop(name, None)
+        indexed |= names
+
+    def _unindex(self, key: _Key) -> None:
+        item = (self._ranks[key], key)
+        for name in self._indexed.pop(key, set()):
+            bucket = self._buckets[name]
+            del bucket[bisect.bisect_left(bucket, item)]
+            self._views.pop(name, None)
+
+    def _view(self, name: Hashable) -> tuple[Model, ...]:
+        view = self._views.get(name)
+        if view is not None:
+            return view
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if not bucket:
+                return ()
+            view = tuple(self._materialize(key) for _, key in bucket)
+            self._views[name] = view
+            return view
+
+    def _materialize(self, key: _Key) -> Model:
+        entry = self._entries[key]
+        if isinstance(entry, dict):
+            entry = self._entries[key] = _model_from_snapshot(entry)
+        return entry
+
+
+def _constraint_path(constraint: Constraint) -> str:
+    """Import spec of a constraint's class (the generic origin for ``Choice[T]``)."""
+    cls = type(constraint).__pydantic_generic_metadata__["origin"] or type(constraint)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _model_to_snapshot(model: Model) -> dict[str, Any]:
+    return {
+        "id": model.id,
+        "provider": model.provider,
+        "display_name": model.display_name,
+        "operations": {
+            modality: sorted(ops) for modality, ops in model.operations.items()
+        },
+        "parameter_constraints": {
+            name: [
+                _constraint_path(constraint),
+                constraint.model_dump(mode="json", exclude={"type"}),
+            ]
+            for name, constraint in model.parameter_constraints.items()
+        },
+        "streaming": model.streaming,
+    }
+
+
+def _model_from_snapshot(entry: dict[str, Any]) -> Model:
+    # Snapshots are written from validated models, so only constraints are
+    # validated; the Model itself is constructed directly.
+    return Model.model_construct(
+        id=entry["id"],
+        provider=entry["provider"],
+        display_name=entry["display_name"],
+        operations=entry["operations"],
+        parameter_constraints={
+            name: import_spec(path).model_validate(fields)
+            for name, (path, fields) in entry["parameter_constraints"].items()
+        },
+        streaming=entry["streaming"],
+    )
+
+
+_catalog = _ModelCatalog()
+
+
+def register_catalog(provider: Provider, module: str) -> None:
+    """Register a module whose ``MODELS`` list loads on first lookup of ``provider``.
+
+    Catalog models are indexed as-is; a later catalog replaces an earlier
+    entry with the same (model_id, provider).
+    """
+    _catalog.add_catalog(provider, module)
 
 
 def register_models(
@@ -67,39 +338,7 @@ def register_models(
         models = [models]
 
     for model in models:
-        if model.provider is None:
-            msg = "Cannot register a model without a provider"
-            raise ValueError(msg)
-        key = (model.id, model.provider)
-
-        # Get existing or create new model with empty constraints
-        registered = _models.setdefault(
-            key,
-            Model(
-                id=model.id,
-                provider=model.provider,
-                display_name=model.display_name,
-                parameter_constraints={},
-                streaming=model.streaming,
-            ),
-        )
-
-        # Validate display name consistency
-        if registered.display_name != model.display_name:
-            raise ValueError(
-                f"Inconsistent display_name for {model.id}: "
-                f"'{registered.display_name}' vs '{model.display_name}'"
-            )
-
-        # Update constraints
-        registered.parameter_constraints.update(model.parameter_constraints)
-
-        # Merge model's pre-existing operations
-        for mod, ops in model.operations.items():
-            registered.operations.setdefault(mod, set()).update(ops)
-
-        if modality is not None and operation is not None:
-            registered.operations.setdefault(modality, set()).add(operation)
+        _catalog.register(model, modality, operation)
 
 
 def get_model(model_id: str, provider: Provider | None = None) -> Model | None:
@@ -113,11 +352,7 @@ def get_model(model_id: str, provider: Provider | None = None) -> Model | None:
     Returns:
         Model instance if found, None otherwise.
     """
-    if provider is not None:
-        return _models.get((model_id, provider))
-
-    # Search across all providers
-    matches = [m for m in _models.values() if m.id == model_id]
+    matches = _catalog.get(model_id, provider)
     if not matches:
         return None
 
@@ -150,27 +385,45 @@ def list_models(
     Returns:
         List of Model instances matching the filters.
     """
-    models = list(_models.values())
+    return list(_catalog.select(provider, modality, operation))
 
-    if provider is not None:
-        models = [m for m in models if m.provider == provider]
 
-    if modality is not None and operation is not None:
-        # Filter by modality AND operation together
-        models = [m for m in models if operation in m.operations.get(modality, set())]
-    elif modality is not None:
-        models = [m for m in models if modality in m.operations]
-    elif operation is not None:
-        models = [
-            m for m in models if any(operation in ops for ops in m.operations.values())
-        ]
+def clear() -> None:
+    """Clear all registered models from the registry."""
+    _catalog.clear()
 
-    return models
 
+def save_snapshot(path: str | Path) -> None:
+    """Write every registered model, built-in catalogs included, to a JSON file.
 
-def clear() -> None:
-    """Clear all registered models from the registry."""
-    _models.clear()
+    Load it with ``load_snapshot()`` at startup to skip importing the provider
+    catalogs and rebuilding their models.
+    Generic constraints such as ``Choice[str]`` are restored as their origin
+    class (``Choice``).
+    """
+    Path(path).write_text(json.dumps(_catalog.dump()), encoding="utf-8")
+
+
+def load_snapshot(path: str | Path) -> None:
+    """Replace the registry with a snapshot written by ``save_snapshot()``.
 
+    Built-in catalogs not yet loaded are dropped; the snapshot is the whole
+    registry. Each model is built on first lookup.
 
-__all__ = ["Model", "clear", "get_model", "list_models", "register_models"]
+    Raises:
+        ValueError: If the snapshot was written by an incompatible version.
+    """
+    _catalog.load(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "Model",
+    "clear",
+    "get_model",
+    "list_models",
+    "load_snapshot",
+    "register_catalog",
+    "register_models",
+    "save_snapshot",
+]
@@ -25,6 +25,7 @@ from celeste.namespaces.domains import (
     ImagesNamespace,
     TextNamespace,
     VideosNamespace,
+    clear_client_cache,
 )
 
 # Module-level singletons
@@ -41,6 +42,7 @@ __all__ = [
     "TextNamespace",
     "VideosNamespace",
     "audio",
+    "clear_client_cache",
     "documents",
     "images",
     "text",
@@ -4,12 +4,16 @@ Each namespace provides methods for operations on a specific domain (resource ty
 The namespace routes to the appropriate modality client based on the operation.
 """
 
+import threading
+from collections import OrderedDict
 from typing import Any, Unpack
 
 from pydantic import SecretStr
 
 from celeste import Authentication, ToolResult, create_client
 from celeste.artifacts import ImageArtifact
+from celeste.auth import AuthHeader
+from celeste.client import ModalityClient
 from celeste.core import Modality, Operation, Protocol, Provider
 from celeste.modalities.audio.io import AudioOutput
 from celeste.modalities.audio.parameters import AudioParameters
@@ -26,6 +30,8 @@ from celeste.modalities.text.parameters import TextParameters
 from celeste.modalities.text.streaming import TextStream
 from celeste.modalities.videos.io import VideoOutput
 from celeste.modalities.videos.parameters import VideoParameters
+from celeste.ratelimit import credential_fingerprint
+from celeste.sinks import Sink
 from celeste.types import (
     AudioContent,
     DocumentContent,
@@ -34,6 +40,92 @@ from celeste.types import (
     VideoContent,
 )
 
+DEFAULT_CLIENT_CACHE_SIZE = 64
+
+type _ClientKey = tuple[
+    Modality,
+    Operation,
+    Provider | None,
+    Protocol | None,
+    str,
+    str | None,
+    str | None,
+]
+
+
+class _ClientCache:
+    """Bounded LRU of clients built by the domain namespaces.
+
+    Keyed on what create_client() resolves from: modality, operation,
+    provider/protocol, model, auth identity and base_url. Reusing a client
+    reuses its auth object, so e.g. a GoogleADC token is fetched once rather
+    than on every call. Environment credentials are read once at import, so
+    calls without ``api_key``/``auth`` share one entry per target.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CLIENT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._clients: OrderedDict[_ClientKey, ModalityClient] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        *,
+        modality: Modality,
+        operation: Operation,
+        model: str,
+        provider: Provider | None = None,
+        protocol: Protocol | None = None,
+        api_key: str | SecretStr | None = None,
+        auth: Authentication | None = None,
+        base_url: str | None = None,
+    ) -> ModalityClient:
+        """Return the cached client for these arguments, creating it on a miss."""
+        if auth is not None:
+            identity: str | None = credential_fingerprint(auth)
+        elif api_key is not None:
+            identity = credential_fingerprint(AuthHeader(secret=api_key))
+        else:
+            identity = None
+        key = (modality, operation, provider, protocol, model, identity, base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+        client = create_client(
+            modality=modality,
+            operation=operation,
+            model=model,
+            provider=provider,
+            protocol=protocol,
+            api_key=api_key,
+            auth=auth,
+            base_url=base_url,
+        )
+        with self._lock:
+            client = self._clients.setdefault(key, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self) -> None:
+        """Drop every cached client."""
+        with self._lock:
+            self._clients.clear()
+
+
+_client_cache = _ClientCache()
+
+
+def clear_client_cache() -> None:
+    """Drop the clients reused by the domain namespaces.
+
+    Call after changing credentials or model registrations at runtime.
+    """
+    _client_cache.clear()
+
 
 class SyncStreamTextNamespace:
     """celeste.text.sync.stream.* namespace."""
@@ -53,7 +145,7 @@ class SyncStreamTextNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Sync streaming text generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.GENERATE,
             model=model,
@@ -89,7 +181,7 @@ class StreamTextNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Async streaming text generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.GENERATE,
             model=model,
@@ -125,7 +217,7 @@ class SyncTextNamespace:
         **params: Unpack[TextParameters],
     ) -> TextOutput:
         """Blocking text generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.GENERATE,
             model=model,
@@ -156,7 +248,7 @@ class SyncTextNamespace:
         **params: Unpack[EmbeddingsParameters],
     ) -> EmbeddingsOutput:
         """Blocking embeddings generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -211,7 +303,7 @@ class TextNamespace:
         Returns:
             TextOutput with generated text.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.GENERATE,
             model=model,
@@ -254,7 +346,7 @@ class TextNamespace:
         Returns:
             EmbeddingsOutput with embedding vectors.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -291,7 +383,7 @@ class SyncStreamImagesNamespace:
         **params: Unpack[ImageParameters],
     ) -> ImagesStream:
         """Sync streaming image generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.GENERATE,
             model=model,
@@ -313,7 +405,7 @@ class SyncStreamImagesNamespace:
         **params: Unpack[ImageParameters],
     ) -> ImagesStream:
         """Sync streaming image editing."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.EDIT,
             model=model,
@@ -336,7 +428,7 @@ class SyncStreamImagesNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Sync streaming image analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -363,7 +455,7 @@ class StreamImagesNamespace:
         **params: Unpack[ImageParameters],
     ) -> ImagesStream:
         """Async streaming image generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.GENERATE,
             model=model,
@@ -385,7 +477,7 @@ class StreamImagesNamespace:
         **params: Unpack[ImageParameters],
     ) -> ImagesStream:
         """Async streaming image editing."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.EDIT,
             model=model,
@@ -408,7 +500,7 @@ class StreamImagesNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Async streaming image analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -433,7 +525,7 @@ class SyncImagesNamespace:
         **params: Unpack[ImageParameters],
     ) -> ImageOutput:
         """Blocking image generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.GENERATE,
             model=model,
@@ -455,7 +547,7 @@ class SyncImagesNamespace:
         **params: Unpack[ImageParameters],
     ) -> ImageOutput:
         """Blocking image editing."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.EDIT,
             model=model,
@@ -476,7 +568,7 @@ class SyncImagesNamespace:
         **params: Unpack[ImageParameters],
     ) -> ImageOutput:
         """Blocking image upscale."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.UPSCALE,
             model=model,
@@ -499,7 +591,7 @@ class SyncImagesNamespace:
         **params: Unpack[TextParameters],
     ) -> TextOutput:
         """Blocking image analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -520,7 +612,7 @@ class SyncImagesNamespace:
         **params: Unpack[EmbeddingsParameters],
     ) -> EmbeddingsOutput:
         """Blocking image embeddings generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -542,7 +634,7 @@ class SyncImagesNamespace:
         **params: Unpack[SegmentationParameters],
     ) -> SegmentationOutput:
         """Blocking image segmentation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.SEGMENTATION,
             operation=Operation.SEGMENT,
             model=model,
@@ -587,7 +679,7 @@ class ImagesNamespace:
         Returns:
             ImageOutput with generated image.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.GENERATE,
             model=model,
@@ -622,7 +714,7 @@ class ImagesNamespace:
         Returns:
             ImageOutput with edited image.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.EDIT,
             model=model,
@@ -655,7 +747,7 @@ class ImagesNamespace:
         Returns:
             ImageOutput with upscaled image.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.IMAGES,
             operation=Operation.UPSCALE,
             model=model,
@@ -692,7 +784,7 @@ class ImagesNamespace:
         Returns:
             TextOutput with analysis result.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -727,7 +819,7 @@ class ImagesNamespace:
         Returns:
             EmbeddingsOutput with embedding vectors.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -762,7 +854,7 @@ class ImagesNamespace:
         Returns:
             SegmentationOutput with RLE masks.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.SEGMENTATION,
             operation=Operation.SEGMENT,
             model=model,
@@ -794,10 +886,11 @@ class SyncStreamAudioNamespace:
         provider: Provider | None = None,
         api_key: str | SecretStr | None = None,
         auth: Authentication | None = None,
+        sink: Sink | None = None,
         **params: Unpack[AudioParameters],
     ) -> AudioStream:
         """Sync streaming text-to-speech."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.SPEAK,
             model=model,
@@ -805,7 +898,7 @@ class SyncStreamAudioNamespace:
             api_key=api_key,
             auth=auth,
         )
-        return client.sync.stream.speak(text, **params)
+        return client.sync.stream.speak(text, sink=sink, **params)
 
     def analyze(
         self,
@@ -820,7 +913,7 @@ class SyncStreamAudioNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Sync streaming audio analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -844,10 +937,11 @@ class StreamAudioNamespace:
         provider: Provider | None = None,
         api_key: str | SecretStr | None = None,
         auth: Authentication | None = None,
+        sink: Sink | None = None,
         **params: Unpack[AudioParameters],
     ) -> AudioStream:
         """Async streaming text-to-speech."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.SPEAK,
             model=model,
@@ -855,7 +949,7 @@ class StreamAudioNamespace:
             api_key=api_key,
             auth=auth,
         )
-        return client.stream.speak(text, **params)
+        return client.stream.speak(text, sink=sink, **params)
 
     def analyze(
         self,
@@ -870,7 +964,7 @@ class StreamAudioNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Async streaming audio analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -892,10 +986,11 @@ class SyncAudioNamespace:
         provider: Provider | None = None,
         api_key: str | SecretStr | None = None,
         auth: Authentication | None = None,
+        sink: Sink | None = None,
         **params: Unpack[AudioParameters],
     ) -> AudioOutput:
         """Blocking text-to-speech."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.SPEAK,
             model=model,
@@ -903,7 +998,7 @@ class SyncAudioNamespace:
             api_key=api_key,
             auth=auth,
         )
-        return client.sync.speak(text, **params)
+        return client.sync.speak(text, sink=sink, **params)
 
     def generate(
         self,
@@ -916,7 +1011,7 @@ class SyncAudioNamespace:
         **params: Unpack[AudioParameters],
     ) -> AudioOutput:
         """Blocking audio generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.GENERATE,
             model=model,
@@ -939,7 +1034,7 @@ class SyncAudioNamespace:
         **params: Unpack[TextParameters],
     ) -> TextOutput:
         """Blocking audio analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -961,7 +1056,7 @@ class SyncAudioNamespace:
         **params: Unpack[AudioParameters],
     ) -> TextOutput:
         """Blocking speech transcription."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.TRANSCRIBE,
             model=model,
@@ -982,7 +1077,7 @@ class SyncAudioNamespace:
         **params: Unpack[EmbeddingsParameters],
     ) -> EmbeddingsOutput:
         """Blocking audio embeddings generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -1012,6 +1107,7 @@ class AudioNamespace:
         provider: Provider | None = None,
         api_key: str | SecretStr | None = None,
         auth: Authentication | None = None,
+        sink: Sink | None = None,
         **parameters: Unpack[AudioParameters],
     ) -> AudioOutput:
         """Convert text to speech.
@@ -1022,12 +1118,14 @@ class AudioNamespace:
             provider: Optional provider override.
             api_key: Optional API key override.
             auth: Optional Authentication object (e.g., GoogleADC for Vertex AI).
+            sink: Optional path or binary file the audio is written to as it
+                  arrives; the returned artifact is then backed by that path.
             **parameters: Additional model parameters (e.g., voice).
 
         Returns:
             AudioOutput with generated audio.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.SPEAK,
             model=model,
@@ -1035,7 +1133,7 @@ class AudioNamespace:
             api_key=api_key,
             auth=auth,
         )
-        return await client.speak(text, **parameters)
+        return await client.speak(text, sink=sink, **parameters)
 
     async def generate(
         self,
@@ -1060,7 +1158,7 @@ class AudioNamespace:
         Returns:
             AudioOutput with generated audio.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.GENERATE,
             model=model,
@@ -1097,7 +1195,7 @@ class AudioNamespace:
         Returns:
             TextOutput with analysis/transcription result.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1134,7 +1232,7 @@ class AudioNamespace:
         Returns:
             TextOutput with the transcript text.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.AUDIO,
             operation=Operation.TRANSCRIBE,
             model=model,
@@ -1167,7 +1265,7 @@ class AudioNamespace:
         Returns:
             EmbeddingsOutput with embedding vectors.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -1204,7 +1302,7 @@ class SyncStreamVideosNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Sync streaming video analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1233,7 +1331,7 @@ class StreamVideosNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Async streaming video analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1255,10 +1353,11 @@ class SyncVideosNamespace:
         provider: Provider | None = None,
         api_key: str | SecretStr | None = None,
         auth: Authentication | None = None,
+        sink: Sink | None = None,
         **params: Unpack[VideoParameters],
     ) -> VideoOutput:
         """Blocking video generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.VIDEOS,
             operation=Operation.GENERATE,
             model=model,
@@ -1266,7 +1365,7 @@ class SyncVideosNamespace:
             api_key=api_key,
             auth=auth,
         )
-        return client.sync.generate(prompt, **params)
+        return client.sync.generate(prompt, sink=sink, **params)
 
     def analyze(
         self,
@@ -1281,7 +1380,7 @@ class SyncVideosNamespace:
         **params: Unpack[TextParameters],
     ) -> TextOutput:
         """Blocking video analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1302,7 +1401,7 @@ class SyncVideosNamespace:
         **params: Unpack[EmbeddingsParameters],
     ) -> EmbeddingsOutput:
         """Blocking video embeddings generation."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -1332,6 +1431,7 @@ class VideosNamespace:
         provider: Provider | None = None,
         api_key: str | SecretStr | None = None,
         auth: Authentication | None = None,
+        sink: Sink | None = None,
         **parameters: Unpack[VideoParameters],
     ) -> VideoOutput:
         """Generate video from a prompt.
@@ -1342,12 +1442,14 @@ class VideosNamespace:
             provider: Optional provider override.
             api_key: Optional API key override.
             auth: Optional Authentication object (e.g., GoogleADC for Vertex AI).
+            sink: Optional path or binary file the video is downloaded to in
+                  chunks; the returned artifact is then backed by that path.
             **parameters: Additional model parameters.
 
         Returns:
             VideoOutput with generated video.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.VIDEOS,
             operation=Operation.GENERATE,
             model=model,
@@ -1355,7 +1457,7 @@ class VideosNamespace:
             api_key=api_key,
             auth=auth,
         )
-        return await client.generate(prompt, **parameters)
+        return await client.generate(prompt, sink=sink, **parameters)
 
     async def analyze(
         self,
@@ -1384,7 +1486,7 @@ class VideosNamespace:
         Returns:
             TextOutput with analysis result.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1419,7 +1521,7 @@ class VideosNamespace:
         Returns:
             EmbeddingsOutput with embedding vectors.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.EMBEDDINGS,
             operation=Operation.EMBED,
             model=model,
@@ -1458,7 +1560,7 @@ class SyncStreamDocumentsNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Sync streaming document analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1491,7 +1593,7 @@ class StreamDocumentsNamespace:
         **params: Unpack[TextParameters],
     ) -> TextStream:
         """Async streaming document analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1524,7 +1626,7 @@ class SyncDocumentsNamespace:
         **params: Unpack[TextParameters],
     ) -> TextOutput:
         """Blocking document analysis."""
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1581,7 +1683,7 @@ class DocumentsNamespace:
         Returns:
             TextOutput with analysis result.
         """
-        client = create_client(
+        client = _client_cache.get(
             modality=Modality.TEXT,
             operation=Operation.ANALYZE,
             model=model,
@@ -1612,4 +1714,5 @@ __all__ = [
     "ImagesNamespace",
     "TextNamespace",
     "VideosNamespace",
+    "clear_client_cache",
 ]
@@ -0,0 +1,346 @@
+"""Shared scheduler for status polls of long-running generation jobs."""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import random
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+BATCH_WINDOW = 0.25  # seconds early a batched job may be polled to join a batch
+
+type StatusFetch = Callable[[], Awaitable[dict[str, Any]]]
+"""Fetch one job's current status payload."""
+
+type StatusCheck = Callable[[dict[str, Any]], bool]
+"""Return True once a status is final; raise for failed jobs."""
+
+
+class PollPolicy(BaseModel):
+    """Polling cadence for one provider's long-running jobs.
+
+    The first poll happens ``initial_delay`` after submission. Every pending
+    status stretches the interval by ``multiplier``, from ``interval`` up to
+    ``max_interval``, and ``jitter`` spreads each delay by that fraction so
+    jobs submitted together stop polling together. ``max_rate`` caps status
+    requests per second across all jobs sharing a rate key; a batch status
+    request counts once.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    initial_delay: float = Field(default=0.0, ge=0)
+    interval: float = Field(default=1.0, gt=0)
+    max_interval: float = Field(default=30.0, gt=0)
+    multiplier: float = Field(default=1.5, ge=1)
+    jitter: float = Field(default=0.1, ge=0, le=1)
+    timeout: float | None = Field(default=None, gt=0)
+    max_rate: float | None = Field(default=10.0, gt=0)
+
+    def delay(self, polls: int) -> float:
+        """Delay before the next poll of a job still pending after ``polls`` polls."""
+        base = min(self.max_interval, self.interval * self.multiplier ** (polls - 1))
+        spread = base * self.jitter
+        return max(0.0, base + random.uniform(-spread, spread))  # nosec B311
+
+
+class StatusBatch:
+    """A batch status endpoint shared by every job with the same ``key``.
+
+    ``fetch(ids)`` is called only when two or more ids are due together and
+    returns the status payload of each id it found. A lone due job, ids it
+    leaves out, and every id of a request that raises use their own status
+    request.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        fetch: Callable[[list[str]], Awaitable[dict[str, dict[str, Any]]]],
+        max_size: int = 50,
+    ) -> None:
+        """Initialize a batch endpoint returning up to ``max_size`` statuses per call."""
+        self.key = key
+        self.fetch = fetch
+        self.max_size = max_size
+
+
+class _Job:
+    """One job waiting on the scheduler."""
+
+    __slots__ = (
+        "batch",
+        "deadline",
+        "done",
+        "fetch",
+        "future",
+        "id",
+        "policy",
+        "polls",
+        "rate_key",
+        "reserved",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        fetch: StatusFetch,
+        done: StatusCheck,
+        rate_key: Hashable,
+        policy: PollPolicy,
+        batch: StatusBatch | None,
+        future: asyncio.Future[dict[str, Any]],
+    ) -> None:
+        self.id = job_id
+        self.fetch = fetch
+        self.done = done
+        self.rate_key = rate_key
+        self.policy = policy
+        self.batch = batch
+        self.future = future
+        self.polls = 0
+        self.reserved = False  # Deferred to a rate slot it already holds
+        self.deadline = (
+            None if policy.timeout is None else time.monotonic() + policy.timeout
+        )
+
+
+class PollScheduler:
+    """Polls every long-running job on one event loop from a single task.
+
+    Jobs wait on futures instead of sleeping in their own loops. Jobs that
+    share a `StatusBatch` and fall due within ``BATCH_WINDOW`` of each other
+    are checked with one request,
+    and each rate key's requests are spaced to its policy's ``max_rate`` by
+    deferring jobs rather than sleeping.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle scheduler; its task starts with the first job."""
+        self._heap: list[tuple[float, int, _Job]] = []
+        self._order = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._next_slot: dict[Hashable, float] = {}
+
+    @property
+    def pending(self) -> int:
+        """Jobs waiting for their next poll or a poll in flight."""
+        return sum(not job.future.done() for _, _, job in self._heap) + len(
+            self._in_flight
+        )
+
+    async def wait(
+        self,
+        fetch: StatusFetch,
+        done: StatusCheck,
+        *,
+        job_id: str,
+        rate_key: Hashable,
+        policy: PollPolicy,
+        batch: StatusBatch | None = None,
+    ) -> dict[str, Any]:
+        """Poll a job until ``done`` accepts its status, and return that status.
+
+        Raises:
+            TimeoutError: If the job is still pending after ``policy.timeout``.
+            Exception: Whatever ``fetch`` or ``done`` raise for a failed job.
+        """
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        job = _Job(job_id, fetch, done, rate_key, policy, batch, future)
+        self._push(job, time.monotonic() + policy.initial_delay)
+        return await future
+
+    def _push(self, job: _Job, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._order), job))
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._heap:
+            now = time.monotonic()
+            due = self._heap[0][0]
+            if due > now:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), due - now)
+                continue
+            jobs: list[_Job] = []
+            early: list[tuple[float, _Job]] = []
+            while self._heap and self._heap[0][0] <= now + BATCH_WINDOW:
+                due, _, job = heapq.heappop(self._heap)
+                if job.future.done():
+                    continue
+                if due > now and (job.batch is None or job.reserved):
+                    early.append((due, job))
+                else:
+                    jobs.append(job)
+            for due, job in early:
+                heapq.heappush(self._heap, (due, next(self._order), job))
+            self._dispatch(jobs, now)
+
+    def _dispatch(self, jobs: list[_Job], now: float) -> None:
+        """Start status requests for due jobs, deferring those over their rate cap."""
+        batches: dict[Hashable, list[_Job]] = {}
+        requests: list[list[_Job]] = []
+        for job in jobs:
+            if job.batch is None:
+                requests.append([job])
+            else:
+                batches.setdefault(job.batch.key, []).append(job)
+        for group in batches.values():
+            size = group[0].batch.max_size  # type: ignore[union-attr]
+            requests.extend(
+                group[start : start + size] for start in range(0, len(group), size)
+            )
+
+        for request in requests:
+            first = request[0]
+            max_rate = first.policy.max_rate
+            if first.reserved:
+                for job in request:
+                    job.reserved = False
+            elif max_rate is not None:
+                slot = max(now, self._next_slot.get(first.rate_key, now))
+                self._next_slot[first.rate_key] = slot + 1 / max_rate
+                if slot > now:
+                    for job in request:
+                        job.reserved = True
+                        self._push(job, slot)
+                    continue
+            # A lone job uses its own status endpoint; listings pay off for two+.
+            coroutine = (
+                self._poll_batch(request) if len(request) > 1 else self._poll_one(first)
+            )
+            task = asyncio.get_running_loop().create_task(coroutine)
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _poll_one(self, job: _Job) -> None:
+        try:
+            status = await job.fetch()
+        except Exception as exc:
+            _fail(job, exc)
+            return
+        self._settle(job, status)
+
+    async def _poll_batch(self, jobs: list[_Job]) -> None:
+        batch = jobs[0].batch
+        assert batch is not None
+        try:
+            statuses = await batch.fetch([job.id for job in jobs])
+        except Exception:
+            # One failed listing must not fail every job in it: each job
+            # falls back to its own status request, which reports its error.
+            for job in jobs:
+                job.batch = None
+                self._push(job, time.monotonic())
+            return
+        for job in jobs:
+            status = statuses.get(job.id)
+            if status is None:
+                job.batch = None  # Not in the listing; poll it on its own
+                self._push(job, time.monotonic())
+            else:
+                self._settle(job, status)
+
+    def _settle(self, job: _Job, status: dict[str, Any]) -> None:
+        """Resolve ``job`` from ``status`` or schedule its next poll."""
+        if job.future.done():
+            return
+        try:
+            finished = job.done(status)
+        except Exception as exc:
+            _fail(job, exc)
+            return
+        if finished:
+            job.future.set_result(status)
+            return
+        now = time.monotonic()
+        if job.deadline is not None and now >= job.deadline:
+            msg = (
+                f"{job.rate_key} job {job.id} polling timed out after "
+                f"{job.policy.timeout} seconds"
+            )
+            _fail(job, TimeoutError(msg))
+            return
+        job.polls += 1
+        due = now + job.policy.delay(job.polls)
+        if job.deadline is not None:
+            due = min(due, job.deadline)
+        self._push(job, due)
+
+
+def _fail(job: _Job, exc: BaseException) -> None:
+    if not job.future.done():
+        job.future.set_exception(exc)
+
+
+_schedulers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PollScheduler] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def poll_scheduler() -> PollScheduler:
+    """Return the running event loop's scheduler."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = PollScheduler()
+    return scheduler
+
+
+async def poll_until_done(
+    fetch: StatusFetch,
+    done: StatusCheck,
+    *,
+    job_id: str,
+    rate_key: Hashable,
+    policy: PollPolicy,
+    batch: StatusBatch | None = None,
+) -> dict[str, Any]:
+    """Wait for a long-running job on the running loop's shared scheduler.
+
+    Args:
+        fetch: Fetches the job's current status payload.
+        done: Returns True once a status is final; raises for failed jobs.
+        job_id: Provider's id for the job, as passed to ``batch.fetch``.
+        rate_key: Jobs sharing this key share ``policy.max_rate``.
+        policy: Polling cadence and timeout.
+        batch: Batch status endpoint the job can be checked through.
+
+    Returns:
+        The final status payload.
+
+    Raises:
+        TimeoutError: If the job is still pending after ``policy.timeout``.
+    """
+    return await poll_scheduler().wait(
+        fetch,
+        done,
+        job_id=job_id,
+        rate_key=rate_key,
+        policy=policy,
+        batch=batch,
+    )
+
+
+__all__ = [
+    "BATCH_WINDOW",
+    "PollPolicy",
+    "PollScheduler",
+    "StatusBatch",
+    "StatusCheck",
+    "StatusFetch",
+    "poll_scheduler",
+    "poll_until_done",
+]
@@ -3,6 +3,7 @@
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.io import FinishReason
@@ -88,7 +89,7 @@ class ChatCompletionsClient(APIMixin):
             json_body=request_body,
         )
         self._handle_error_response(response)
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = codec.loads(response.content)
         return data
 
     def _make_stream_request(
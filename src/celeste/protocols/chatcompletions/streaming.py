@@ -4,6 +4,7 @@ import contextlib
 import json
 from typing import Any
 
+from celeste import codec
 from celeste.io import FinishReason
 from celeste.tools import ToolCall
 
@@ -107,7 +108,7 @@ class ChatCompletionsStream:
                         self._tool_call_deltas[idx] = {
                             "id": tc_delta.get("id", ""),
                             "name": tc_delta.get("function", {}).get("name", ""),
-                            "arguments": "",
+                            "arguments": [],
                         }
                     else:
                         if tc_delta.get("id"):
@@ -115,9 +116,11 @@ class ChatCompletionsStream:
                         fn = tc_delta.get("function", {})
                         if fn.get("name"):
                             self._tool_call_deltas[idx]["name"] = fn["name"]
-                    # Accumulate argument fragments
+                    # Accumulate argument fragments; joined once in _aggregate_tool_calls
                     fn = tc_delta.get("function", {})
-                    self._tool_call_deltas[idx]["arguments"] += fn.get("arguments", "")
+                    self._tool_call_deltas[idx]["arguments"].append(
+                        fn.get("arguments") or ""
+                    )
         return super()._parse_chunk(event_data)  # type: ignore[misc]
 
     def _aggregate_tool_calls(
@@ -127,9 +130,10 @@ class ChatCompletionsStream:
         result: list[ToolCall] = []
         for tc in self._tool_call_deltas.values():
             arguments: dict[str, Any] = {}
-            if tc["arguments"]:
+            raw_arguments = "".join(tc["arguments"])
+            if raw_arguments:
                 with contextlib.suppress(json.JSONDecodeError, ValueError, TypeError):
-                    arguments = json.loads(tc["arguments"])
+                    arguments = codec.loads(raw_arguments)
             result.append(ToolCall(id=tc["id"], name=tc["name"], arguments=arguments))
         return result
 
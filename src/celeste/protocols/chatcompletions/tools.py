@@ -3,6 +3,7 @@
 import json
 from typing import Any
 
+from celeste import codec
 from celeste.tools import ToolCall, ToolMapper
 
 TOOL_MAPPERS: list[ToolMapper] = []
@@ -26,7 +27,7 @@ def parse_tool_calls(
         raw_args = tc.get("function", {}).get("arguments")
         if isinstance(raw_args, str):
             try:
-                arguments = json.loads(raw_args)
+                arguments = codec.loads(raw_args)
             except (json.JSONDecodeError, ValueError):
                 arguments = {}
         else:
@@ -4,6 +4,7 @@ import json
 import warnings
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.exceptions import UnsupportedParameterWarning
 from celeste.tools import (
     CodeExecution,
@@ -73,7 +74,7 @@ def parse_tool_calls(response_data: dict[str, Any]) -> list[ToolCall]:
         raw_args = item.get("arguments")
         if isinstance(raw_args, str):
             try:
-                arguments = json.loads(raw_args)
+                arguments = codec.loads(raw_args)
             except (json.JSONDecodeError, ValueError):
                 arguments = {}
         else:
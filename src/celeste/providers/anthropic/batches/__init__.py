@@ -0,0 +1 @@
+"""Anthropic Message Batches API provider package."""
@@ -0,0 +1,121 @@
+"""Anthropic Message Batches API client mixin."""
+
+from typing import Any
+
+from celeste import codec
+from celeste.auth import AuthHeader
+from celeste.batch import BatchJob
+from celeste.client import APIMixin
+from celeste.exceptions import BatchItemError, BatchNotSupportedError
+
+from ..messages import config as messages_config
+from ..messages.client import beta_header, resolve_max_tokens
+from . import config
+
+
+class AnthropicBatchesClient(APIMixin):
+    """Mixin for Anthropic Message Batches jobs.
+
+    Provides the batch hooks ModalityClient._submit_batch() and friends call:
+    - _create_batch() - POST /v1/messages/batches with one params body per request
+    - _retrieve_batch() - GET /v1/messages/batches/{id}
+    - _fetch_batch_results() - Download the JSONL results file
+
+    Request params get the same max_tokens default and beta headers as
+    Messages API requests. Message Batches need API key auth; Claude on
+    Vertex AI has no Message Batches API.
+
+    Usage:
+        class AnthropicTextClient(AnthropicBatchesMixin, AnthropicMessagesMixin, TextClient):
+            ...
+    """
+
+    def _batch_headers(
+        self,
+        beta_features: list[str] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        """Build batch request headers, rejecting non-API-key auth."""
+        if not isinstance(self.auth, AuthHeader):
+            raise BatchNotSupportedError(model_id=self.model.id)
+        headers = {
+            **self._json_headers(),
+            messages_config.HEADER_ANTHROPIC_VERSION: messages_config.ANTHROPIC_VERSION,
+        }
+        if beta_features:
+            headers[messages_config.HEADER_ANTHROPIC_BETA] = beta_header(beta_features)
+        return self._merge_headers(headers, extra_headers)
+
+    def _batch_job(self, batch: dict[str, Any], size: int) -> BatchJob:
+        """Wrap a message batch object in a BatchJob."""
+        return BatchJob(
+            id=batch["id"],
+            status=config.STATUS_MAP[batch["processing_status"]],
+            size=size,
+            data=batch,
+        )
+
+    async def _create_batch(
+        self,
+        requests: dict[str, dict[str, Any]],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> BatchJob:
+        """Create a message batch from request bodies."""
+        beta_features: dict[str, None] = {}
+        batch_requests: list[dict[str, Any]] = []
+        for custom_id, params in requests.items():
+            params.setdefault("max_tokens", resolve_max_tokens(self.model))
+            beta_features.update(dict.fromkeys(params.pop("_beta_features", [])))
+            batch_requests.append({"custom_id": custom_id, "params": params})
+
+        headers = self._batch_headers(
+            beta_features=list(beta_features), extra_headers=extra_headers
+        )
+        response = await self.http_client.post(
+            url=f"{messages_config.BASE_URL}{config.AnthropicBatchesEndpoint.CREATE_BATCH}",
+            headers=headers,
+            json_body={"requests": batch_requests},
+        )
+        self._handle_error_response(response)
+        return self._batch_job(codec.loads(response.content), size=len(requests))
+
+    async def _retrieve_batch(self, job: BatchJob) -> BatchJob:
+        """Fetch the message batch object."""
+        endpoint = config.AnthropicBatchesEndpoint.GET_BATCH.format(batch_id=job.id)
+        response = await self.http_client.get(
+            f"{messages_config.BASE_URL}{endpoint}",
+            headers=self._batch_headers(),
+        )
+        self._handle_error_response(response)
+        return self._batch_job(codec.loads(response.content), size=job.size)
+
+    async def _fetch_batch_results(
+        self, job: BatchJob
+    ) -> dict[str, dict[str, Any] | BatchItemError]:
+        """Read per-request messages and errors from the results file."""
+        url = job.data.get("results_url") or (
+            f"{messages_config.BASE_URL}"
+            f"{config.AnthropicBatchesEndpoint.GET_RESULTS.format(batch_id=job.id)}"
+        )
+        response = await self.http_client.get(url, headers=self._batch_headers())
+        self._handle_error_response(response)
+
+        results: dict[str, dict[str, Any] | BatchItemError] = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            record = codec.loads(line)
+            custom_id = record["custom_id"]
+            result = record["result"]
+            if result["type"] == config.RESULT_SUCCEEDED:
+                results[custom_id] = result["message"]
+                continue
+            error = (result.get("error") or {}).get("error") or {}
+            results[custom_id] = BatchItemError(
+                custom_id, error.get("message") or result["type"]
+            )
+        return results
+
+
+__all__ = ["AnthropicBatchesClient"]
@@ -0,0 +1,23 @@
+"""Configuration for Anthropic Message Batches API."""
+
+from enum import StrEnum
+
+from celeste.batch import BatchJobStatus
+
+
+class AnthropicBatchesEndpoint(StrEnum):
+    """Endpoints for Anthropic Message Batches API."""
+
+    CREATE_BATCH = "/v1/messages/batches"
+    GET_BATCH = "/v1/messages/batches/{batch_id}"
+    GET_RESULTS = "/v1/messages/batches/{batch_id}/results"
+
+
+# Processing status -> unified status; per-request outcomes live in the results
+STATUS_MAP: dict[str, BatchJobStatus] = {
+    "in_progress": BatchJobStatus.RUNNING,
+    "canceling": BatchJobStatus.RUNNING,
+    "ended": BatchJobStatus.COMPLETED,
+}
+
+RESULT_SUCCEEDED = "succeeded"
@@ -3,10 +3,12 @@
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.constraints import Range
 from celeste.core import Parameter, UsageField
 from celeste.io import FinishReason
+from celeste.models import Model
 from celeste.providers.google.auth import GoogleADC
 
 from . import config
@@ -28,6 +30,21 @@ def needs_native_replay(blocks: list[dict[str, Any]]) -> bool:
     )
 
 
+def resolve_max_tokens(model: Model) -> int:
+    """Default max_tokens to the model's output ceiling, not an arbitrary cap."""
+    constraint = model.parameter_constraints.get(Parameter.MAX_TOKENS)
+    if isinstance(constraint, Range):
+        return int(constraint.max)
+    return config.DEFAULT_MAX_TOKENS
+
+
+def beta_header(beta_features: list[str]) -> str:
+    """Join beta feature names into an anthropic-beta header value."""
+    return ",".join(
+        getattr(config, f"BETA_{f.upper().replace('-', '_')}") for f in beta_features
+    )
+
+
 class AnthropicMessagesClient(APIMixin):
     """Mixin for Anthropic Messages API capabilities.
 
@@ -83,11 +100,7 @@ class AnthropicMessagesClient(APIMixin):
             config.HEADER_ANTHROPIC_VERSION: config.ANTHROPIC_VERSION,
         }
         if beta_features:
-            beta_values = [
-                getattr(config, f"BETA_{f.upper().replace('-', '_')}")
-                for f in beta_features
-            ]
-            headers[config.HEADER_ANTHROPIC_BETA] = ",".join(beta_values)
+            headers[config.HEADER_ANTHROPIC_BETA] = beta_header(beta_features)
         if extra_headers:
             headers.update(extra_headers)
         return headers
@@ -110,10 +123,7 @@ class AnthropicMessagesClient(APIMixin):
 
     def _resolve_max_tokens(self) -> int:
         """Default max_tokens to the model's output ceiling, not an arbitrary cap."""
-        constraint = self.model.parameter_constraints.get(Parameter.MAX_TOKENS)
-        if isinstance(constraint, Range):
-            return int(constraint.max)
-        return config.DEFAULT_MAX_TOKENS
+        return resolve_max_tokens(self.model)
 
     async def _make_request(
         self,
@@ -142,7 +152,7 @@ class AnthropicMessagesClient(APIMixin):
             json_body=request_body,
         )
         self._handle_error_response(response)
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = codec.loads(response.content)
         return data
 
     def _make_stream_request(
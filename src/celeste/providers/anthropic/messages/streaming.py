@@ -1,9 +1,9 @@
 """Anthropic Messages SSE parsing for streaming."""
 
 import contextlib
-import json
 from typing import Any
 
+from celeste import codec
 from celeste.io import FinishReason
 from celeste.types import ToolActivity, ToolActivityStatus
 
@@ -23,7 +23,9 @@ class AnthropicMessagesStream:
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         super().__init__(*args, **kwargs)
+        # String fields accumulate as lists of deltas, joined once on read.
         self._content_blocks: dict[int, dict[str, Any]] = {}
+        self._blocks_cache: list[dict[str, Any]] | None = None
         self._message_start: dict[str, Any] | None = None
 
     def _parse_chunk(self, event_data: dict[str, Any]) -> Any:  # noqa: ANN401
@@ -34,6 +36,8 @@ class AnthropicMessagesStream:
             if isinstance(message, dict):
                 self._message_start = message
             return None
+        if event_type in {"content_block_start", "content_block_delta"}:
+            self._blocks_cache = None
         if event_type == "content_block_start":
             block = event_data.get("content_block", {})
             block_type = block.get("type")
@@ -45,7 +49,7 @@ class AnthropicMessagesStream:
                 captured["input"] = (
                     input_value if isinstance(input_value, dict) else None
                 )
-                captured["input_json"] = ""
+                captured["input_json"] = []
                 self._content_blocks[idx] = captured
             elif block_type == "redacted_thinking" or (
                 isinstance(block_type, str) and block_type.endswith("_tool_result")
@@ -54,13 +58,13 @@ class AnthropicMessagesStream:
             elif block_type == "thinking":
                 self._content_blocks[idx] = {
                     "type": "thinking",
-                    "thinking": block.get("thinking", ""),
-                    "signature": block.get("signature", ""),
+                    "thinking": [block.get("thinking", "")],
+                    "signature": [block.get("signature", "")],
                 }
             elif block_type == "text":
                 self._content_blocks[idx] = {
                     "type": "text",
-                    "text": block.get("text", ""),
+                    "text": [block.get("text", "")],
                     "citations": [],
                 }
         elif event_type == "content_block_delta":
@@ -70,17 +74,17 @@ class AnthropicMessagesStream:
             block = self._content_blocks.get(idx)
             if delta_type == "input_json_delta":
                 if block and block.get("type") in {"server_tool_use", "tool_use"}:
-                    block["input_json"] += delta.get("partial_json", "")
+                    block["input_json"].append(delta.get("partial_json", ""))
             elif delta_type in {"thinking_delta", "signature_delta"}:
                 key = delta_type.removesuffix("_delta")
                 if block and block.get("type") == "thinking":
-                    block[key] += delta.get(key, "")
+                    block[key].append(delta.get(key, ""))
             elif delta_type in {"text_delta", "citations_delta"}:
                 block = self._content_blocks.setdefault(
-                    idx, {"type": "text", "text": "", "citations": []}
+                    idx, {"type": "text", "text": [], "citations": []}
                 )
                 if delta_type == "text_delta":
-                    block["text"] += delta.get("text", "")
+                    block["text"].append(delta.get("text", ""))
                 else:
                     citation = delta.get("citation")
                     if isinstance(citation, dict):
@@ -113,23 +117,46 @@ class AnthropicMessagesStream:
         return response
 
     def _aggregate_content_blocks(self) -> list[dict[str, Any]]:
-        """Return reconstructed native Anthropic content blocks."""
+        """Return reconstructed native Anthropic content blocks.
+
+        Cached until the next content block event, so the tool call, signature
+        and grounding aggregations share one reconstruction.
+        """
+        if self._blocks_cache is not None:
+            return self._blocks_cache
         blocks: list[dict[str, Any]] = []
         for idx in sorted(self._content_blocks):
             block = self._content_blocks[idx]
-            if block.get("type") in {"server_tool_use", "tool_use"}:
+            block_type = block.get("type")
+            if block_type in {"server_tool_use", "tool_use"}:
                 input_data = block.get("input") or {}
-                if block.get("input_json"):
+                input_json = "".join(block["input_json"])
+                if input_json:
                     with contextlib.suppress(ValueError, TypeError):
-                        input_data = json.loads(block["input_json"])
+                        input_data = codec.loads(input_json)
                 # Keep all captured fields (incl. caller); drop input_json accumulator.
                 emitted = {k: v for k, v in block.items() if k != "input_json"}
                 emitted["input"] = input_data
                 blocks.append(emitted)
-            elif block.get("type") == "text" and not block.get("citations"):
-                blocks.append({"type": "text", "text": block.get("text", "")})
+            elif block_type == "thinking":
+                blocks.append(
+                    {
+                        "type": "thinking",
+                        "thinking": "".join(block["thinking"]),
+                        "signature": "".join(block["signature"]),
+                    }
+                )
+            elif block_type == "text":
+                text = "".join(block["text"])
+                if block["citations"]:
+                    blocks.append(
+                        {"type": "text", "text": text, "citations": block["citations"]}
+                    )
+                else:
+                    blocks.append({"type": "text", "text": text})
             else:
                 blocks.append(block)
+        self._blocks_cache = blocks
         return blocks
 
     def _parse_chunk_content(self, event_data: dict[str, Any]) -> str | None:
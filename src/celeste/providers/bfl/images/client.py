@@ -1,15 +1,16 @@
 """BFL Images API client mixin."""
 
-import asyncio
-import time
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
+from celeste.jobs import JobHandle
 from celeste.mime_types import ApplicationMimeType
+from celeste.polling import poll_until_done
 
 from . import config
 
@@ -19,6 +20,7 @@ class BFLImagesClient(APIMixin):
 
     Provides shared implementation:
     - _make_request() - HTTP POST with async polling pattern
+    - _start_job() / _wait_job() / _finish_job() - the same steps, for detached jobs
     - _parse_finish_reason() - Map BFL status to FinishReason
 
     The BFL API uses async polling:
@@ -50,6 +52,18 @@ class BFLImagesClient(APIMixin):
         2. Poll polling_url until Ready/Failed
         3. Return response with _submit_metadata for usage parsing
         """
+        return await self._run_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        """Submit a job to /v1/{model_id} and return a handle on its polling_url."""
         headers = {
             **self._json_headers(extra_headers),
             "Accept": ApplicationMimeType.JSON,
@@ -59,7 +73,6 @@ class BFLImagesClient(APIMixin):
             endpoint = config.BFLImagesEndpoint.CREATE_IMAGE
         endpoint = endpoint.format(model_id=self.model.id)
 
-        # Phase 1: Submit job
         submit_response = await self.http_client.post(
             f"{config.BASE_URL}{endpoint}",
             headers=headers,
@@ -67,47 +80,66 @@ class BFLImagesClient(APIMixin):
         )
 
         self._handle_error_response(submit_response)
-        submit_data = submit_response.json()
+        submit_data = codec.loads(submit_response.content)
         polling_url = submit_data.get("polling_url")
 
         if not polling_url:
             msg = f"No polling_url in {self.provider} response"
             raise ValueError(msg)
 
-        # Phase 2: Poll for completion
-        start_time = time.monotonic()
+        return self._job_handle(
+            submit_data.get("id", polling_url),
+            polling_url,
+            submit_metadata=submit_data,
+        )
+
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll the job's polling_url on the shared scheduler until Ready."""
         poll_headers = self._merge_headers(
             {**self.auth.get_headers(), "Accept": ApplicationMimeType.JSON},
             extra_headers,
         )
 
-        while True:
-            elapsed = time.monotonic() - start_time
-            if elapsed >= config.POLLING_TIMEOUT:
-                msg = f"{self.provider} polling timed out after {config.POLLING_TIMEOUT} seconds"
-                raise TimeoutError(msg)
-
+        async def fetch_status() -> dict[str, Any]:
             poll_response = await self.http_client.get(
-                polling_url,
+                handle.poll_url,
                 headers=poll_headers,
             )
-
             self._handle_error_response(poll_response)
-            poll_data = poll_response.json()
-            status = poll_data.get("status")
-
-            if status == "Ready":
-                # Merge submit metadata into final response for usage parsing
-                return {
-                    **poll_data,
-                    "_submit_metadata": submit_data,
-                }
-            elif status in ("Error", "Failed"):
-                error_msg = poll_data.get("error", "Unknown error")
-                msg = f"{self.provider} image generation failed: {error_msg}"
-                raise ValueError(msg)
-
-            await asyncio.sleep(config.POLLING_INTERVAL)
+            poll_data: dict[str, Any] = codec.loads(poll_response.content)
+            return poll_data
+
+        return await poll_until_done(
+            fetch_status,
+            self._poll_done,
+            job_id=handle.id,
+            rate_key=self.provider,
+            policy=config.POLL_POLICY,
+        )
+
+    async def _finish_job(
+        self,
+        handle: JobHandle,
+        status: dict[str, Any],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Merge submit metadata into the final response for usage parsing."""
+        return {
+            **status,
+            "_submit_metadata": handle.data.get("submit_metadata", {}),
+        }
+
+    def _poll_done(self, poll_data: dict[str, Any]) -> bool:
+        """Whether a polled job is Ready; raises for failed jobs."""
+        status = poll_data.get("status")
+        if status in ("Error", "Failed"):
+            error_msg = poll_data.get("error", "Unknown error")
+            msg = f"{self.provider} image generation failed: {error_msg}"
+            raise ValueError(msg)
+        return status == "Ready"
 
     def _make_stream_request(
         self,
@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from celeste.polling import PollPolicy
+
 
 class BFLImagesEndpoint(StrEnum):
     """Endpoints for BFL Images API."""
@@ -12,5 +14,11 @@ class BFLImagesEndpoint(StrEnum):
 BASE_URL = "https://api.bfl.ai"
 
 # Polling Configuration
-POLLING_INTERVAL = 0.5  # seconds between polling attempts
+POLLING_INTERVAL = 0.5  # seconds between the first polling attempts
 POLLING_TIMEOUT = 120.0  # 2 minutes timeout
+POLL_POLICY = PollPolicy(
+    interval=POLLING_INTERVAL,
+    max_interval=4.0,
+    timeout=POLLING_TIMEOUT,
+    max_rate=20.0,
+)
@@ -1,15 +1,19 @@
 """BytePlus Videos API client mixin."""
 
-import asyncio
+import functools
 import logging
-import time
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
+from urllib.parse import urlencode
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
+from celeste.jobs import JobHandle
+from celeste.polling import StatusBatch, poll_until_done
+from celeste.ratelimit import credential_fingerprint
 
 from . import config
 
@@ -21,10 +25,12 @@ class BytePlusVideosClient(APIMixin):
 
     Provides shared implementation:
     - _make_request() - HTTP POST with async polling pattern
+    - _start_job() / _wait_job() - the same steps, for detached jobs
 
     The BytePlus Videos API uses async polling:
     1. POST to /api/v3/contents/generations/tasks to submit job
-    2. Poll GET /api/v3/contents/generations/tasks/{task_id} until succeeded/failed
+    2. Poll GET /api/v3/contents/generations/tasks/{task_id} until succeeded/failed,
+       or the task list filtered by id when several tasks are pending
     3. Return final response
 
     Usage:
@@ -67,64 +73,100 @@ class BytePlusVideosClient(APIMixin):
         2. Poll CONTENT_STATUS endpoint until succeeded/failed/canceled
         3. Return response with final status data
         """
-        headers = self._json_headers(extra_headers)
+        return await self._run_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
 
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        """Submit a task and return a handle on its status endpoint."""
         if endpoint is None:
             endpoint = config.BytePlusVideosEndpoint.CREATE_VIDEO
 
-        # Phase 1: Submit job
         logger.debug("Submitting video generation task to BytePlus")
         submit_response = await self.http_client.post(
             f"{config.BASE_URL}{endpoint}",
-            headers=headers,
+            headers=self._json_headers(extra_headers),
             json_body=request_body,
         )
 
         self._handle_error_response(submit_response)
-        submit_data = submit_response.json()
-        task_id = submit_data["id"]
+        task_id = codec.loads(submit_response.content)["id"]
         logger.info(f"BytePlus task submitted: {task_id}")
+        status_url = f"{config.BASE_URL}{config.BytePlusVideosEndpoint.GET_VIDEO_STATUS.format(task_id=task_id)}"
+        return self._job_handle(task_id, status_url)
 
-        # Phase 2: Poll for completion
-        start_time = time.monotonic()
-
-        # Wait before first poll
-        await asyncio.sleep(config.POLLING_INTERVAL)
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll a task on the shared scheduler until succeeded.
 
-        while True:
-            elapsed = time.monotonic() - start_time
-            if elapsed >= config.POLLING_TIMEOUT:
-                msg = f"BytePlus task {task_id} timed out after {config.POLLING_TIMEOUT} seconds"
-                raise TimeoutError(msg)
+        Tasks of the same credential are batched through the task list endpoint.
+        """
+        headers = self._json_headers(extra_headers)
+        task_id = handle.id
 
-            status_url = f"{config.BASE_URL}{config.BytePlusVideosEndpoint.GET_VIDEO_STATUS.format(task_id=task_id)}"
+        async def fetch_status() -> dict[str, Any]:
             logger.debug(f"Polling BytePlus task status: {task_id}")
-
             status_response = await self.http_client.get(
-                status_url,
+                handle.poll_url,
                 headers=headers,
             )
-
             self._handle_error_response(status_response)
-            status_data: dict[str, Any] = status_response.json()
-            status = status_data.get("status")
-            logger.debug(f"BytePlus task {task_id} status: {status}")
-
-            if status == config.STATUS_SUCCEEDED:
-                logger.info(f"BytePlus task {task_id} completed in {elapsed:.0f}s")
-                return status_data
-
-            if status in (config.STATUS_FAILED, config.STATUS_CANCELED):
-                error = status_data.get("error", {})
-                error_msg = (
-                    error.get("message", "Unknown error")
-                    if isinstance(error, dict)
-                    else "Unknown error"
-                )
-                msg = f"BytePlus task {task_id} failed: {error_msg}"
-                raise ValueError(msg)
-
-            await asyncio.sleep(config.POLLING_INTERVAL)
+            status_data: dict[str, Any] = codec.loads(status_response.content)
+            return status_data
+
+        async def fetch_statuses(task_ids: list[str]) -> dict[str, dict[str, Any]]:
+            query = urlencode(
+                [("page_size", len(task_ids))]
+                + [("filter.task_ids", task_id) for task_id in task_ids]
+            )
+            list_url = f"{config.BASE_URL}{config.BytePlusVideosEndpoint.LIST_VIDEO_TASKS.format(query=query)}"
+            list_response = await self.http_client.get(list_url, headers=headers)
+            self._handle_error_response(list_response)
+            return {
+                item["id"]: item
+                for item in codec.loads(list_response.content).get("items", [])
+            }
+
+        status_data = await poll_until_done(
+            fetch_status,
+            functools.partial(self._poll_done, task_id),
+            job_id=task_id,
+            rate_key=self.provider,
+            policy=config.POLL_POLICY,
+            batch=StatusBatch(
+                (
+                    self.provider,
+                    credential_fingerprint(self.auth),
+                    *sorted((extra_headers or {}).items()),
+                ),
+                fetch_statuses,
+                max_size=config.STATUS_BATCH_SIZE,
+            ),
+        )
+        logger.info(f"BytePlus task {task_id} completed")
+        return status_data
+
+    def _poll_done(self, task_id: str, status_data: dict[str, Any]) -> bool:
+        """Whether a task has succeeded; raises for failed or canceled tasks."""
+        status = status_data.get("status")
+        logger.debug(f"BytePlus task {task_id} status: {status}")
+        if status in (config.STATUS_FAILED, config.STATUS_CANCELED):
+            error = status_data.get("error", {})
+            error_msg = (
+                error.get("message", "Unknown error")
+                if isinstance(error, dict)
+                else "Unknown error"
+            )
+            msg = f"BytePlus task {task_id} failed: {error_msg}"
+            raise ValueError(msg)
+        return status == config.STATUS_SUCCEEDED
 
     def _make_stream_request(
         self,
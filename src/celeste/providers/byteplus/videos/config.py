@@ -2,12 +2,15 @@
 
 from enum import StrEnum
 
+from celeste.polling import PollPolicy
+
 
 class BytePlusVideosEndpoint(StrEnum):
     """Endpoints for BytePlus Videos API."""
 
     CREATE_VIDEO = "/api/v3/contents/generations/tasks"
     GET_VIDEO_STATUS = "/api/v3/contents/generations/tasks/{task_id}"
+    LIST_VIDEO_TASKS = "/api/v3/contents/generations/tasks?{query}"
 
 
 BASE_URL = "https://ark.ap-southeast.bytepluses.com"
@@ -15,6 +18,14 @@ BASE_URL = "https://ark.ap-southeast.bytepluses.com"
 # Polling Configuration
 POLLING_INTERVAL = 5  # seconds
 POLLING_TIMEOUT = 300  # 5 minutes
+POLL_POLICY = PollPolicy(
+    initial_delay=POLLING_INTERVAL,
+    interval=POLLING_INTERVAL,
+    max_interval=15.0,
+    timeout=POLLING_TIMEOUT,
+    max_rate=5.0,
+)
+STATUS_BATCH_SIZE = 100  # task ids per list request
 
 # Status Constants
 STATUS_SUCCEEDED = "succeeded"
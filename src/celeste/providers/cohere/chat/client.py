@@ -3,6 +3,7 @@
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.io import FinishReason
@@ -67,7 +68,7 @@ class CohereChatClient(APIMixin):
             json_body=request_body,
         )
         self._handle_error_response(response)
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = codec.loads(response.content)
         return data
 
     def _make_stream_request(
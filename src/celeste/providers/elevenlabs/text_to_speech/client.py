@@ -1,5 +1,6 @@
 """ElevenLabs TextToSpeech API client mixin."""
 
+import contextlib
 from collections.abc import AsyncIterator
 from typing import Any
 
@@ -8,6 +9,7 @@ import httpx
 from celeste.client import APIMixin
 from celeste.io import FinishReason
 from celeste.mime_types import AudioMimeType
+from celeste.sinks import active_sink
 
 from . import config
 
@@ -40,7 +42,8 @@ class ElevenLabsTextToSpeechClient(APIMixin):
     ) -> dict[str, Any]:
         """Make HTTP request to ElevenLabs TTS endpoint.
 
-        Returns dict with binary audio content.
+        Returns dict with binary audio content, or writes it to the active
+        sink (see celeste.sinks) when there is one.
         Voice ID is extracted from request_body["_voice_id"] and used in URL path.
         """
         # Extract voice_id from request_body (set by VoiceMapper)
@@ -65,6 +68,14 @@ class ElevenLabsTextToSpeechClient(APIMixin):
         if output_format:
             url = f"{url}?output_format={output_format}"
 
+        sink = active_sink()
+        if sink is not None:
+            response = await self.http_client.stream_to_sink(
+                url, sink, headers=headers, json_body=request_body
+            )
+            self._handle_error_response(response)
+            return {"audio_sink": True, "headers": dict(response.headers)}
+
         response = await self.http_client.post(
             url,
             headers=headers,
@@ -125,28 +136,20 @@ class ElevenLabsTextToSpeechClient(APIMixin):
     ) -> AsyncIterator[dict[str, Any]]:
         """Stream binary audio data and yield as dict events.
 
-        Wraps httpx streaming to yield dicts compatible with Stream interface.
+        Wraps HTTPClient.stream_bytes to yield dicts compatible with Stream interface.
         """
-        client = await self.http_client._get_client()
-
-        async with client.stream(
-            "POST",
-            url,
-            json=json_body,
-            headers=headers,
-        ) as response:
-            if not response.is_success:
-                error_text = await response.aread()
-                msg = f"HTTP {response.status_code}: {error_text.decode('utf-8', errors='ignore')}"
-                raise httpx.HTTPStatusError(
-                    msg,
-                    request=response.request,
-                    response=response,
-                )
-
-            async for chunk in response.aiter_bytes():
-                if chunk:
+        try:
+            async with contextlib.aclosing(
+                self.http_client.stream_bytes(url, headers, json_body)
+            ) as chunks:
+                async for chunk in chunks:
                     yield {"data": chunk}
+        except httpx.HTTPStatusError as e:
+            response = e.response
+            msg = f"HTTP {response.status_code}: {response.content.decode('utf-8', errors='ignore')}"
+            raise httpx.HTTPStatusError(
+                msg, request=e.request, response=response
+            ) from None
 
     @staticmethod
     def map_usage_fields(usage_data: dict[str, Any]) -> dict[str, int | float | None]:
@@ -1,14 +1,15 @@
 """fal.ai queue API client mixin."""
 
-import asyncio
-import time
 from collections.abc import AsyncIterator
 from typing import Any
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
+from celeste.jobs import JobHandle
 from celeste.mime_types import ApplicationMimeType
+from celeste.polling import poll_until_done
 
 from . import config
 
@@ -18,6 +19,7 @@ class FalQueueClient(APIMixin):
 
     Provides shared implementation:
     - _make_request() - POST to queue, poll status_url, fetch response_url
+    - _start_job() / _wait_job() / _finish_job() - the same steps, for detached jobs
     - _make_stream_request() - raises StreamingNotSupportedError
     - _parse_usage() - empty (fal queue results carry no usage)
     - _parse_finish_reason() - COMPLETE on success
@@ -38,6 +40,18 @@ class FalQueueClient(APIMixin):
         **parameters: Any,
     ) -> dict[str, Any]:
         """Submit to fal queue, poll until COMPLETED, return result payload."""
+        return await self._run_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        """Submit to fal queue and return a handle on the request's status_url."""
         headers = {
             **self._json_headers(extra_headers),
             "Accept": ApplicationMimeType.JSON,
@@ -53,7 +67,7 @@ class FalQueueClient(APIMixin):
             json_body=request_body,
         )
         self._handle_error_response(submit_response)
-        submit_data = submit_response.json()
+        submit_data = codec.loads(submit_response.content)
 
         status_url = submit_data.get("status_url")
         response_url = submit_data.get("response_url")
@@ -61,43 +75,67 @@ class FalQueueClient(APIMixin):
             msg = f"No status_url/response_url in {self.provider} response"
             raise ValueError(msg)
 
-        poll_headers = self._merge_headers(
+        return self._job_handle(
+            submit_data.get("request_id", status_url),
+            status_url,
+            response_url=response_url,
+        )
+
+    def _poll_headers(self, extra_headers: dict[str, str] | None) -> dict[str, str]:
+        return self._merge_headers(
             {**self.auth.get_headers(), "Accept": ApplicationMimeType.JSON},
             extra_headers,
         )
-        start_time = time.monotonic()
 
-        while True:
-            elapsed = time.monotonic() - start_time
-            if elapsed >= config.POLLING_TIMEOUT:
-                msg = (
-                    f"{self.provider} polling timed out after"
-                    f" {config.POLLING_TIMEOUT} seconds"
-                )
-                raise TimeoutError(msg)
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll the request's status_url on the shared scheduler until COMPLETED."""
+        poll_headers = self._poll_headers(extra_headers)
 
+        async def fetch_status() -> dict[str, Any]:
             poll_response = await self.http_client.get(
-                status_url,
+                handle.poll_url,
                 headers=poll_headers,
             )
             self._handle_error_response(poll_response)
-            poll_data = poll_response.json()
-            status = poll_data.get("status")
-
-            if status == "COMPLETED":
-                result_response = await self.http_client.get(
-                    response_url,
-                    headers=poll_headers,
-                )
-                self._handle_error_response(result_response)
-                return result_response.json()
-
-            if status not in ("IN_QUEUE", "IN_PROGRESS"):
-                error_msg = poll_data.get("error", poll_data)
-                msg = f"{self.provider} request failed: {error_msg}"
-                raise ValueError(msg)
-
-            await asyncio.sleep(config.POLLING_INTERVAL)
+            poll_data: dict[str, Any] = codec.loads(poll_response.content)
+            return poll_data
+
+        return await poll_until_done(
+            fetch_status,
+            self._poll_done,
+            job_id=handle.id,
+            rate_key=self.provider,
+            policy=config.POLL_POLICY,
+        )
+
+    async def _finish_job(
+        self,
+        handle: JobHandle,
+        status: dict[str, Any],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """GET the completed request's response_url for the result body."""
+        result_response = await self.http_client.get(
+            handle.data["response_url"],
+            headers=self._poll_headers(extra_headers),
+        )
+        self._handle_error_response(result_response)
+        result: dict[str, Any] = codec.loads(result_response.content)
+        return result
+
+    def _poll_done(self, poll_data: dict[str, Any]) -> bool:
+        """Whether a queued request is COMPLETED; raises for failed requests."""
+        status = poll_data.get("status")
+        if status == "COMPLETED":
+            return True
+        if status not in ("IN_QUEUE", "IN_PROGRESS"):
+            error_msg = poll_data.get("error", poll_data)
+            msg = f"{self.provider} request failed: {error_msg}"
+            raise ValueError(msg)
+        return False
 
     def _make_stream_request(
         self,
@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from celeste.polling import PollPolicy
+
 
 class FalQueueEndpoint(StrEnum):
     """Endpoints for fal.ai queue API."""
@@ -13,3 +15,9 @@ BASE_URL = "https://queue.fal.run"
 
 POLLING_INTERVAL = 0.5
 POLLING_TIMEOUT = 120.0
+POLL_POLICY = PollPolicy(
+    interval=POLLING_INTERVAL,
+    max_interval=4.0,
+    timeout=POLLING_TIMEOUT,
+    max_rate=20.0,
+)
@@ -1,5 +1,11 @@
 """Google Cloud authentication using ADC."""
 
+import asyncio
+import contextlib
+import os
+import threading
+import weakref
+from datetime import UTC, datetime, timedelta
 from typing import Any, ClassVar
 
 from pydantic import ConfigDict
@@ -10,6 +16,108 @@ from celeste.exceptions import MissingDependencyError
 VERTEX_BASE_URL = "https://{location}-aiplatform.googleapis.com"
 VERTEX_GLOBAL_BASE_URL = "https://aiplatform.googleapis.com"
 
+# Tokens this close to expiry are refreshed in the background while still in use.
+REFRESH_MARGIN = timedelta(minutes=5)
+
+
+def _google_auth() -> tuple[Any, Any]:
+    """Import google-auth lazily; return (google.auth, its requests transport)."""
+    try:
+        import google.auth
+        import google.auth.transport.requests
+    except ImportError as e:
+        raise MissingDependencyError(library="google-auth", extra="gcp") from e
+    return google.auth, google.auth.transport.requests
+
+
+class _TokenSource:
+    """ADC credentials shared by every GoogleADC with the same scopes and key file.
+
+    Loading and refreshing are single-flight: one thread performs the HTTP
+    round trip while other threads wait on the lock and reuse its token, and
+    coroutines on one event loop await a single worker-thread refresh.
+    """
+
+    def __init__(self, scopes: tuple[str, ...]) -> None:
+        self.scopes = scopes
+        self.credentials: Any = None
+        self.project: str | None = None
+        self._request: Any = None
+        self._lock = threading.Lock()
+        self._background_lock = threading.Lock()
+        self._background: threading.Thread | None = None
+        self._tasks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Task[None]
+        ] = weakref.WeakKeyDictionary()
+
+    def needs_refresh(self, margin: timedelta = timedelta(0)) -> bool:
+        """Whether the token is missing, invalid, or expires within ``margin``."""
+        credentials = self.credentials
+        if credentials is None or not credentials.valid:
+            return True
+        expiry = credentials.expiry  # naive UTC, or None if it never expires
+        now = datetime.now(UTC).replace(tzinfo=None)
+        return expiry is not None and expiry - margin <= now
+
+    def ensure(self) -> None:
+        """Load credentials and refresh a token near expiry, blocking this thread."""
+        if not self.needs_refresh(REFRESH_MARGIN):
+            return
+        with self._lock:
+            if not self.needs_refresh(REFRESH_MARGIN):
+                return
+            google_auth, transport = _google_auth()
+            if self.credentials is None:
+                self.credentials, self.project = google_auth.default(
+                    scopes=list(self.scopes)
+                )
+                self._request = transport.Request()
+            if self.needs_refresh(REFRESH_MARGIN):
+                self.credentials.refresh(self._request)
+
+    async def ensure_async(self) -> None:
+        """Like ensure(), but waits on a worker thread shared by this loop."""
+        if not self.needs_refresh():
+            if self.needs_refresh(REFRESH_MARGIN):
+                self.refresh_in_background()
+            return
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(loop)
+        if task is None:
+            task = loop.create_task(asyncio.to_thread(self.ensure))
+            self._tasks[loop] = task
+            task.add_done_callback(lambda _: self._tasks.pop(loop, None))
+        await asyncio.shield(task)
+
+    def refresh_in_background(self) -> None:
+        """Start a refresh on a daemon thread unless one is already running."""
+        with self._background_lock:
+            if self._background is not None and self._background.is_alive():
+                return
+            self._background = threading.Thread(
+                target=self._refresh_quietly, name="celeste-adc-refresh", daemon=True
+            )
+            self._background.start()
+
+    def _refresh_quietly(self) -> None:
+        # The token is still valid; if this fails, the next blocking ensure() raises.
+        with contextlib.suppress(Exception):
+            self.ensure()
+
+
+_token_sources: dict[tuple[tuple[str, ...], str | None], _TokenSource] = {}
+_token_sources_lock = threading.Lock()
+
+
+def _token_source(scopes: list[str]) -> _TokenSource:
+    """Return the shared token source for ``scopes`` and the ADC key file."""
+    key = (tuple(scopes), os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"))
+    with _token_sources_lock:
+        source = _token_sources.get(key)
+        if source is None:
+            source = _token_sources[key] = _TokenSource(key[0])
+        return source
+
 
 class GoogleADC(Authentication):
     """Google Application Default Credentials authentication.
@@ -38,19 +146,34 @@ class GoogleADC(Authentication):
             headers["x-goog-user-project"] = project
         return headers
 
+    async def ensure_valid(self) -> None:
+        """Load or refresh the shared token in a worker thread, single-flight."""
+        source = _token_source(self.scopes)
+        if self._credentials is None or self._credentials is source.credentials:
+            await source.ensure_async()
+            self._credentials, self._project = source.credentials, source.project
+
     def _get_access_token(self) -> tuple[str, str | None]:
-        """Get OAuth access token using Application Default Credentials."""
-        try:
-            import google.auth
-            import google.auth.transport.requests
-        except ImportError as e:
-            raise MissingDependencyError(library="google-auth", extra="gcp") from e
+        """Get OAuth access token using Application Default Credentials.
 
+        Credentials and tokens are shared by every instance with the same
+        scopes and key file. A token near expiry is still returned while a
+        background thread refreshes it; only a missing or expired token blocks.
+        """
+        source = _token_source(self.scopes)
         if self._credentials is None:
-            self._credentials, self._project = google.auth.default(scopes=self.scopes)
-            self._auth_request = google.auth.transport.requests.Request()
-
-        if not self._credentials.valid:
+            source.ensure()
+            self._credentials, self._project = source.credentials, source.project
+
+        if self._credentials is source.credentials:
+            if source.needs_refresh():
+                source.ensure()
+            elif source.needs_refresh(REFRESH_MARGIN):
+                source.refresh_in_background()
+        elif not self._credentials.valid:
+            _, transport = _google_auth()
+            if self._auth_request is None:
+                self._auth_request = transport.Request()
             self._credentials.refresh(self._auth_request)
 
         return self._credentials.token, self.project_id or self._project
@@ -0,0 +1 @@
+"""Google Gemini Batch API provider package."""
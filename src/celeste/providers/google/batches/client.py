@@ -0,0 +1,155 @@
+"""Google Gemini Batch API client mixin."""
+
+from typing import Any, ClassVar
+
+from celeste import codec
+from celeste.batch import BatchJob, BatchJobStatus, batch_custom_id
+from celeste.client import APIMixin
+from celeste.exceptions import BatchItemError, BatchNotSupportedError
+
+from ..auth import GoogleADC
+from . import config
+
+
+class GoogleBatchesClient(APIMixin):
+    """Mixin for Gemini API batch mode.
+
+    Provides the batch hooks ModalityClient._submit_batch() and friends call:
+    - _create_batch() - POST the inline requests to _batch_endpoint
+    - _retrieve_batch() - GET /v1beta/batches/{id}
+    - _fetch_batch_results() - Read inline responses or download the responses file
+
+    Each inline request carries a body built by the modality client's normal
+    _build_request(), so results parse like synchronous responses. Vertex AI
+    batch prediction (GoogleADC auth) reads from Cloud Storage and is not supported.
+
+    Usage:
+        class GoogleVertexTextClient(GoogleBatchesMixin, GoogleGenerateContentMixin, TextClient):
+            _batch_endpoint: ClassVar[str] = config.GoogleBatchesEndpoint.BATCH_GENERATE_CONTENT
+    """
+
+    _batch_endpoint: ClassVar[str]
+
+    def _batch_headers(
+        self, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, str]:
+        """Build batch request headers, rejecting Vertex AI auth."""
+        if isinstance(self.auth, GoogleADC):
+            raise BatchNotSupportedError(model_id=self.model.id)
+        return self._json_headers(extra_headers)
+
+    @staticmethod
+    def _batch_status(operation: dict[str, Any]) -> BatchJobStatus:
+        """Map a batch operation's state to the unified status."""
+        if operation.get("error"):
+            return BatchJobStatus.FAILED
+        metadata = operation.get("metadata") or {}
+        state = metadata.get("state") or operation.get("state") or "UNSPECIFIED"
+        status = config.STATUS_MAP[state.rsplit("_STATE_", 1)[-1]]
+        if operation.get("done") and not status.done:
+            return BatchJobStatus.COMPLETED
+        return status
+
+    def _batch_job(self, operation: dict[str, Any], size: int) -> BatchJob:
+        """Wrap a batch operation in a BatchJob."""
+        return BatchJob(
+            id=operation["name"],
+            status=self._batch_status(operation),
+            size=size,
+            data=operation,
+        )
+
+    async def _create_batch(
+        self,
+        requests: dict[str, dict[str, Any]],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> BatchJob:
+        """Create a batch with the requests inlined."""
+        body = {
+            "batch": {
+                "display_name": config.BATCH_DISPLAY_NAME,
+                "input_config": {
+                    "requests": {
+                        "requests": [
+                            {"request": request, "metadata": {"key": custom_id}}
+                            for custom_id, request in requests.items()
+                        ]
+                    }
+                },
+            }
+        }
+        headers = self._batch_headers(extra_headers)
+        endpoint = self._batch_endpoint.format(model_id=self.model.id)
+        response = await self.http_client.post(
+            url=f"{config.BASE_URL}{endpoint}",
+            headers=headers,
+            json_body=body,
+        )
+        self._handle_error_response(response)
+        return self._batch_job(codec.loads(response.content), size=len(requests))
+
+    async def _retrieve_batch(self, job: BatchJob) -> BatchJob:
+        """Fetch the batch operation."""
+        headers = self._batch_headers()
+        endpoint = config.GoogleBatchesEndpoint.GET_BATCH.format(name=job.id)
+        response = await self.http_client.get(
+            f"{config.BASE_URL}{endpoint}", headers=headers
+        )
+        self._handle_error_response(response)
+        return self._batch_job(codec.loads(response.content), size=job.size)
+
+    async def _fetch_batch_results(
+        self, job: BatchJob
+    ) -> dict[str, dict[str, Any] | BatchItemError]:
+        """Read per-request responses and errors from the batch output."""
+        headers = self._batch_headers()
+        records: list[dict[str, Any]] = []
+        for source in (job.data.get("response"), job.data.get("metadata")):
+            output = (source or {}).get("output", source) or {}
+            if responses_file := output.get("responsesFile"):
+                endpoint = config.GoogleBatchesEndpoint.DOWNLOAD_FILE.format(
+                    name=responses_file
+                )
+                response = await self.http_client.get(
+                    f"{config.BASE_URL}{endpoint}", headers=headers
+                )
+                self._handle_error_response(response)
+                records = [
+                    codec.loads(line) for line in response.text.splitlines() if line
+                ]
+                break
+            inlined = next(
+                (
+                    output[field]
+                    for field in config.INLINED_OUTPUT_FIELDS
+                    if field in output
+                ),
+                None,
+            )
+            if inlined is not None:
+                records = (
+                    inlined.get("inlinedResponses", [])
+                    if isinstance(inlined, dict)
+                    else inlined
+                )
+                break
+
+        results: dict[str, dict[str, Any] | BatchItemError] = {}
+        for index, record in enumerate(records):
+            custom_id = (
+                (record.get("metadata") or {}).get("key")
+                or record.get("key")
+                or batch_custom_id(index)
+            )
+            if "error" in record:
+                error = record["error"]
+                results[custom_id] = BatchItemError(
+                    custom_id, error.get("message", str(error))
+                )
+            else:
+                results[custom_id] = record.get("response") or {}
+        return results
+
+
+__all__ = ["GoogleBatchesClient"]
@@ -0,0 +1,33 @@
+"""Configuration for Google Gemini Batch API."""
+
+from enum import StrEnum
+
+from celeste.batch import BatchJobStatus
+
+
+class GoogleBatchesEndpoint(StrEnum):
+    """Endpoints for Google Gemini Batch API."""
+
+    BATCH_GENERATE_CONTENT = "/v1beta/models/{model_id}:batchGenerateContent"
+    ASYNC_BATCH_EMBED_CONTENT = "/v1beta/models/{model_id}:asyncBatchEmbedContent"
+    GET_BATCH = "/v1beta/{name}"
+    DOWNLOAD_FILE = "/download/v1beta/{name}:download?alt=media"
+
+
+BASE_URL = "https://generativelanguage.googleapis.com"
+
+BATCH_DISPLAY_NAME = "celeste-batch"
+
+# Batch state (BATCH_STATE_* / JOB_STATE_*, prefix stripped) -> unified status
+STATUS_MAP: dict[str, BatchJobStatus] = {
+    "UNSPECIFIED": BatchJobStatus.PENDING,
+    "PENDING": BatchJobStatus.PENDING,
+    "RUNNING": BatchJobStatus.RUNNING,
+    "SUCCEEDED": BatchJobStatus.COMPLETED,
+    "FAILED": BatchJobStatus.FAILED,
+    "CANCELLED": BatchJobStatus.CANCELLED,
+    "EXPIRED": BatchJobStatus.EXPIRED,
+}
+
+# Output fields holding inline results, by batch kind
+INLINED_OUTPUT_FIELDS = ("inlinedResponses", "inlinedEmbedContentResponses")
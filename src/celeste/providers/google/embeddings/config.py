@@ -17,3 +17,6 @@ class VertexEmbeddingsEndpoint(StrEnum):
 
 
 BASE_URL = "https://generativelanguage.googleapis.com"
+
+# batchEmbedContents accepts at most this many requests
+MAX_BATCH_SIZE = 100
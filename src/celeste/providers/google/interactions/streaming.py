@@ -1,8 +1,8 @@
 """Google Interactions SSE parsing for streaming."""
 
-import json
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.io import FinishReason
 
 from .client import GoogleInteractionsClient
@@ -11,6 +11,8 @@ from .client import GoogleInteractionsClient
 def reconstruct_steps(raw_events: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Rebuild completed steps from step.start/step.delta/step.stop events."""
     pending: dict[int, dict[str, Any]] = {}
+    # Streamed string fields of each pending step, as delta lists joined on step.stop
+    parts: dict[int, dict[str, list[str]]] = {}
     steps: list[dict[str, Any]] = []
 
     for event in raw_events:
@@ -21,43 +23,51 @@ def reconstruct_steps(raw_events: list[dict[str, Any]]) -> list[dict[str, Any]]:
         event_type = event.get("event_type")
         if event_type == "step.start":
             pending[index] = dict(event.get("step") or {})
+            parts[index] = {}
         elif event_type == "step.delta":
             step = pending.setdefault(index, {})
+            fields = parts.setdefault(index, {})
             delta = event.get("delta") or {}
             delta_type = delta.get("type")
             if delta_type == "text":
-                content = step.setdefault("content", [{"type": "text", "text": ""}])
-                content[0]["text"] += delta.get("text") or ""
+                step.setdefault("content", [{"type": "text", "text": ""}])
+                fields.setdefault("text", []).append(delta.get("text") or "")
             elif delta_type == "text_annotation_delta":
                 content = step.setdefault("content", [{"type": "text", "text": ""}])
                 annotations = content[0].setdefault("annotations", [])
                 annotations.extend(delta.get("annotations") or [])
             elif delta_type == "arguments_delta":
-                step["_arguments_json"] = step.get("_arguments_json", "") + (
-                    delta.get("arguments") or ""
-                )
+                fields.setdefault("arguments", []).append(delta.get("arguments") or "")
             elif delta_type == "thought_summary":
-                summary = step.setdefault("summary", [{"type": "text", "text": ""}])
-                summary[0]["text"] += (delta.get("content") or {}).get("text") or ""
-            elif delta_type == "thought_signature":
-                step["signature"] = step.get("signature", "") + (
-                    delta.get("signature") or ""
+                step.setdefault("summary", [{"type": "text", "text": ""}])
+                fields.setdefault("summary", []).append(
+                    (delta.get("content") or {}).get("text") or ""
                 )
+            elif delta_type == "thought_signature":
+                fields.setdefault("signature", []).append(delta.get("signature") or "")
             else:
                 # google_search_call / google_search_result deltas carry complete
                 # step fields (arguments dict, result list, is_error) verbatim.
                 if delta.get("signature"):
-                    step["signature"] = step.get("signature", "") + delta["signature"]
+                    fields.setdefault("signature", []).append(delta["signature"])
                 step.update(
                     {k: v for k, v in delta.items() if k not in ("type", "signature")}
                 )
         elif event_type == "step.stop":
             step = pending.pop(index, None)
+            fields = parts.pop(index, {})
             if step is None:
                 continue
-            raw_arguments = step.pop("_arguments_json", None)
-            if raw_arguments is not None:
-                step["arguments"] = json.loads(raw_arguments)
+            if "text" in fields:
+                step["content"][0]["text"] += "".join(fields["text"])
+            if "summary" in fields:
+                step["summary"][0]["text"] += "".join(fields["summary"])
+            if "signature" in fields:
+                step["signature"] = step.get("signature", "") + "".join(
+                    fields["signature"]
+                )
+            if "arguments" in fields:
+                step["arguments"] = codec.loads("".join(fields["arguments"]))
             steps.append(step)
 
     return steps
@@ -1,13 +1,18 @@
 """Google Veo API client mixin."""
 
-import asyncio
+import functools
+import io
 import logging
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
+from celeste.jobs import JobHandle
+from celeste.polling import poll_until_done
+from celeste.sinks import BinarySink
 
 from ..auth import GoogleADC
 from . import config
@@ -20,8 +25,10 @@ class GoogleVeoClient(APIMixin):
 
     Provides shared implementation for video generation using the Veo API:
     - _make_request() - HTTP POST with async polling for long-running operations
+    - _start_job() / _wait_job() - the same steps, for detached jobs
     - _parse_content() - Extract raw video dict from response (generic)
     - download_content() - Download from GCS URL, returns raw bytes (generic)
+    - download_to_sink() - Download from GCS URL into a BinarySink, resumably
 
     Modality clients extend via super() to wrap results in artifacts:
         class GoogleVideosClient(GoogleVeoMixin, VideosClient):
@@ -91,7 +98,7 @@ class GoogleVeoClient(APIMixin):
             )
 
         self._handle_error_response(response)
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = codec.loads(response.content)
         return data
 
     def _make_stream_request(
@@ -114,6 +121,18 @@ class GoogleVeoClient(APIMixin):
         **parameters: Any,
     ) -> dict[str, Any]:
         """Make HTTP request with async polling for Veo video generation."""
+        return await self._run_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        """Start a long-running operation and return a handle on it."""
         if endpoint is None:
             endpoint = config.GoogleVeoEndpoint.CREATE_VIDEO
 
@@ -128,32 +147,40 @@ class GoogleVeoClient(APIMixin):
         )
 
         self._handle_error_response(response)
-        operation_data: dict[str, Any] = response.json()
+        operation_data: dict[str, Any] = codec.loads(response.content)
 
         operation_name = operation_data["name"]
         logger.info(f"Video generation started: {operation_name}")
+        return self._job_handle(operation_name, self._build_poll_url(operation_name))
 
-        while True:
-            await asyncio.sleep(config.POLL_INTERVAL)
-            logger.debug(f"Polling operation status: {operation_name}")
-
-            operation_data = await self._make_poll_request(
-                operation_name, extra_headers=extra_headers
-            )
-
-            if operation_data.get("done"):
-                if "error" in operation_data:
-                    error = operation_data["error"]
-                    error_msg = error.get("message", "Unknown error")
-                    error_code = error.get("code", "UNKNOWN")
-                    msg = f"Video generation failed: {error_code} - {error_msg}"
-                    raise ValueError(msg)
-
-                logger.info(f"Video generation completed: {operation_name}")
-                break
-
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll the operation on the shared scheduler until it is done."""
+        operation_data = await poll_until_done(
+            functools.partial(
+                self._make_poll_request, handle.id, extra_headers=extra_headers
+            ),
+            self._poll_done,
+            job_id=handle.id,
+            rate_key=self.provider,
+            policy=config.POLL_POLICY,
+        )
+        logger.info(f"Video generation completed: {handle.id}")
         return operation_data
 
+    def _poll_done(self, operation_data: dict[str, Any]) -> bool:
+        """Whether an operation is done; raises for failed operations."""
+        if not operation_data.get("done"):
+            return False
+        if "error" in operation_data:
+            error = operation_data["error"]
+            error_msg = error.get("message", "Unknown error")
+            error_code = error.get("code", "UNKNOWN")
+            msg = f"Video generation failed: {error_code} - {error_msg}"
+            raise ValueError(msg)
+        return True
+
     def _parse_content(self, response_data: dict[str, Any]) -> Any:
         """Extract raw video dict from response.
 
@@ -213,6 +240,26 @@ class GoogleVeoClient(APIMixin):
         Returns:
             Raw video bytes.
         """
+        buffer = io.BytesIO()
+        await self.download_to_sink(url, BinarySink(buffer), extra_headers)
+        return buffer.getvalue()
+
+    async def download_to_sink(
+        self,
+        url: str,
+        sink: BinarySink,
+        extra_headers: dict[str, str] | None = None,
+    ) -> None:
+        """Download video content from GCS URL into ``sink`` in chunks.
+
+        Dropped connections resume with HTTP Range requests, and large videos
+        are fetched as parallel ranged segments.
+
+        Args:
+            url: GCS URL (gs://) or HTTPS URL to download from.
+            sink: Destination for the video bytes.
+            extra_headers: Optional extra HTTP headers to include.
+        """
         download_url = url
         if download_url.startswith("gs://"):
             download_url = download_url.replace("gs://", config.STORAGE_BASE_URL, 1)
@@ -221,15 +268,15 @@ class GoogleVeoClient(APIMixin):
 
         headers = self._merge_headers(self.auth.get_headers(), extra_headers)
 
-        response = await self.http_client.get(
+        response = await self.http_client.download(
             download_url,
+            sink,
             headers=headers,
             timeout=config.DEFAULT_TIMEOUT,
-            follow_redirects=True,
+            segments=config.DOWNLOAD_SEGMENTS,
         )
 
         self._handle_error_response(response)
-        return response.content
 
 
 __all__ = ["GoogleVeoClient"]
@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from celeste.polling import PollPolicy
+
 
 class GoogleVeoEndpoint(StrEnum):
     """Endpoints for Google Veo API."""
@@ -21,7 +23,14 @@ BASE_URL = "https://generativelanguage.googleapis.com"
 
 # Polling Configuration
 POLL_INTERVAL = 10  # seconds
+POLL_POLICY = PollPolicy(
+    initial_delay=POLL_INTERVAL,
+    interval=POLL_INTERVAL,
+    max_interval=30.0,
+    max_rate=5.0,
+)
 DEFAULT_TIMEOUT = 300.0  # 5 minutes for long-running operations
 
 # Storage Configuration
 STORAGE_BASE_URL = "https://storage.googleapis.com/"
+DOWNLOAD_SEGMENTS = 4  # parallel ranged requests for large videos
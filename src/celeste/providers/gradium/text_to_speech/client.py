@@ -1,12 +1,12 @@
 """Gradium TextToSpeech API client mixin."""
 
 import base64
-import json
 from collections.abc import AsyncIterator
 from typing import Any
 
 from websockets.asyncio.client import connect as ws_connect
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.io import FinishReason
 from celeste.mime_types import AudioMimeType
@@ -77,27 +77,24 @@ class GradiumTextToSpeechClient(APIMixin):
             if json_config is not None:
                 setup_msg["json_config"] = json_config
 
-            await ws.send(json.dumps(setup_msg))
+            await ws.send(codec.dumps_str(setup_msg))
 
             # 2. Wait for ready
             ready_msg = await ws.recv()
-            ready = json.loads(ready_msg)
+            ready = codec.loads(ready_msg)
             if ready.get("type") != "ready":
                 msg = f"Expected ready message, got: {ready}"
                 raise ValueError(msg)
 
             # 3. Send text
-            await ws.send(json.dumps({"type": "text", "text": text}))
+            await ws.send(codec.dumps_str({"type": "text", "text": text}))
 
             # 4. Signal end of input
-            await ws.send(json.dumps({"type": "end_of_stream"}))
+            await ws.send(codec.dumps_str({"type": "end_of_stream"}))
 
             # 5. Yield audio chunks
             async for message in ws:
-                if isinstance(message, bytes):
-                    data = json.loads(message.decode("utf-8"))
-                else:
-                    data = json.loads(message)
+                data = codec.loads(message)
 
                 if data["type"] == "audio":
                     yield {"data": base64.b64decode(data["audio"])}
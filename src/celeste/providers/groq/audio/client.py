@@ -2,6 +2,7 @@
 
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.artifacts import AudioArtifact
 from celeste.client import APIMixin
 from celeste.io import FinishReason
@@ -77,7 +78,7 @@ class GroqAudioClient(APIMixin):
             data=data,
         )
         self._handle_error_response(response)
-        result: dict[str, Any] = response.json()
+        result: dict[str, Any] = codec.loads(response.content)
         return result
 
     def _parse_usage(
@@ -1,9 +1,9 @@
 """Ollama Generate API client mixin."""
 
-import json
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.io import FinishReason
@@ -68,7 +68,7 @@ class OllamaGenerateClient(APIMixin):
         )
         self._handle_error_response(response)
         # NDJSON: Ollama returns progress lines, final line has done=true + image
-        return json.loads(response.text.strip().splitlines()[-1])
+        return codec.loads(response.content.strip().splitlines()[-1])
 
     def _make_stream_request(
         self,
@@ -3,11 +3,13 @@
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.artifacts import AudioArtifact
 from celeste.client import APIMixin
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
 from celeste.mime_types import AudioMimeType
+from celeste.sinks import active_sink
 from celeste.utils import detect_mime_type
 
 from . import config
@@ -43,7 +45,7 @@ class OpenAIAudioClient(APIMixin):
                 return super()._parse_content(response_data)
     """
 
-    _content_fields: ClassVar[set[str]] = {"text", "audio_bytes"}
+    _content_fields: ClassVar[set[str]] = {"text", "audio_bytes", "audio_sink"}
 
     def _build_request(
         self,
@@ -93,6 +95,17 @@ class OpenAIAudioClient(APIMixin):
             )
 
         headers = self._json_headers(extra_headers)
+        sink = active_sink()
+        if sink is not None:
+            response = await self.http_client.stream_to_sink(
+                f"{config.BASE_URL}{endpoint}",
+                sink,
+                headers=headers,
+                json_body=request_body,
+            )
+            self._handle_error_response(response)
+            return {"audio_sink": True, "headers": dict(response.headers)}
+
         response = await self.http_client.post(
             f"{config.BASE_URL}{endpoint}",
             headers=headers,
@@ -135,7 +148,7 @@ class OpenAIAudioClient(APIMixin):
             data=data,
         )
         self._handle_error_response(response)
-        result: dict[str, Any] = response.json()
+        result: dict[str, Any] = codec.loads(response.content)
         return result
 
     @staticmethod
@@ -0,0 +1 @@
+"""OpenAI Batch API provider package."""
@@ -0,0 +1,143 @@
+"""OpenAI Batch API client mixin."""
+
+from typing import Any, ClassVar
+
+from celeste import codec
+from celeste.batch import BatchJob
+from celeste.client import APIMixin
+from celeste.exceptions import BatchItemError
+from celeste.mime_types import ApplicationMimeType
+
+from . import config
+
+
+class OpenAIBatchesClient(APIMixin):
+    """Mixin for OpenAI Batch API jobs.
+
+    Provides the batch hooks ModalityClient._submit_batch() and friends call:
+    - _create_batch() - Upload a JSONL input file, then POST /v1/batches
+    - _retrieve_batch() - GET /v1/batches/{id}
+    - _fetch_batch_results() - Download the output and error files
+
+    Each JSONL line targets _batch_endpoint with a body built by the modality
+    client's normal _build_request(), so results parse like synchronous responses.
+
+    Usage:
+        class OpenAITextClient(OpenAIBatchesMixin, OpenAIResponsesMixin, TextClient):
+            _batch_endpoint: ClassVar[str] = "/v1/responses"
+    """
+
+    _batch_endpoint: ClassVar[str]
+
+    def _batch_url(self, endpoint: str) -> str:
+        """Build full URL, honoring a custom base URL."""
+        base = self.base_url if self.base_url is not None else config.BASE_URL
+        return f"{base}{endpoint}"
+
+    def _batch_job(self, batch: dict[str, Any], size: int) -> BatchJob:
+        """Wrap a batch object in a BatchJob."""
+        return BatchJob(
+            id=batch["id"],
+            status=config.STATUS_MAP[batch["status"]],
+            size=size,
+            data=batch,
+        )
+
+    async def _create_batch(
+        self,
+        requests: dict[str, dict[str, Any]],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> BatchJob:
+        """Upload requests as a JSONL file and create a batch over it."""
+        lines = [
+            codec.dumps_str(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": self._batch_endpoint,
+                    "body": body,
+                }
+            )
+            for custom_id, body in requests.items()
+        ]
+        upload = await self.http_client.post_multipart(
+            self._batch_url(config.OpenAIBatchesEndpoint.UPLOAD_FILE),
+            headers=self._merge_headers(self.auth.get_headers(), extra_headers),
+            files={
+                "file": (
+                    config.INPUT_FILENAME,
+                    "\n".join(lines).encode("utf-8"),
+                    ApplicationMimeType.JSONL,
+                )
+            },
+            data={"purpose": config.FILE_PURPOSE},
+        )
+        self._handle_error_response(upload)
+
+        response = await self.http_client.post(
+            self._batch_url(config.OpenAIBatchesEndpoint.CREATE_BATCH),
+            headers=self._json_headers(extra_headers),
+            json_body={
+                "input_file_id": codec.loads(upload.content)["id"],
+                "endpoint": self._batch_endpoint,
+                "completion_window": config.COMPLETION_WINDOW,
+            },
+        )
+        self._handle_error_response(response)
+        return self._batch_job(codec.loads(response.content), size=len(requests))
+
+    async def _retrieve_batch(self, job: BatchJob) -> BatchJob:
+        """Fetch the batch object."""
+        response = await self.http_client.get(
+            self._batch_url(
+                config.OpenAIBatchesEndpoint.GET_BATCH.format(batch_id=job.id)
+            ),
+            headers=self._json_headers(),
+        )
+        self._handle_error_response(response)
+        return self._batch_job(codec.loads(response.content), size=job.size)
+
+    async def _fetch_batch_results(
+        self, job: BatchJob
+    ) -> dict[str, dict[str, Any] | BatchItemError]:
+        """Read response bodies from the output file and failures from the error file."""
+        results: dict[str, dict[str, Any] | BatchItemError] = {}
+        for file_field in ("output_file_id", "error_file_id"):
+            file_id = job.data.get(file_field)
+            if not file_id:
+                continue
+            response = await self.http_client.get(
+                self._batch_url(
+                    config.OpenAIBatchesEndpoint.FILE_CONTENT.format(file_id=file_id)
+                ),
+                headers=self.auth.get_headers(),
+            )
+            self._handle_error_response(response)
+            for line in response.text.splitlines():
+                if not line.strip():
+                    continue
+                record = codec.loads(line)
+                custom_id = record["custom_id"]
+                results[custom_id] = self._parse_batch_record(custom_id, record)
+        return results
+
+    @staticmethod
+    def _parse_batch_record(
+        custom_id: str, record: dict[str, Any]
+    ) -> dict[str, Any] | BatchItemError:
+        """Return the response body of one JSONL record, or its error."""
+        error = record.get("error")
+        if error:
+            return BatchItemError(custom_id, error.get("message", str(error)))
+        response = record.get("response") or {}
+        body: dict[str, Any] = response.get("body") or {}
+        if response.get("status_code", 200) >= 400:
+            message = (body.get("error") or {}).get("message") or (
+                f"HTTP {response.get('status_code')}"
+            )
+            return BatchItemError(custom_id, message)
+        return body
+
+
+__all__ = ["OpenAIBatchesClient"]
@@ -0,0 +1,33 @@
+"""Configuration for OpenAI Batch API."""
+
+from enum import StrEnum
+
+from celeste.batch import BatchJobStatus
+
+
+class OpenAIBatchesEndpoint(StrEnum):
+    """Endpoints for OpenAI Batch API."""
+
+    UPLOAD_FILE = "/v1/files"
+    FILE_CONTENT = "/v1/files/{file_id}/content"
+    CREATE_BATCH = "/v1/batches"
+    GET_BATCH = "/v1/batches/{batch_id}"
+
+
+BASE_URL = "https://api.openai.com"
+
+FILE_PURPOSE = "batch"
+INPUT_FILENAME = "batch.jsonl"
+COMPLETION_WINDOW = "24h"
+
+# Batch status -> unified status
+STATUS_MAP: dict[str, BatchJobStatus] = {
+    "validating": BatchJobStatus.PENDING,
+    "in_progress": BatchJobStatus.RUNNING,
+    "finalizing": BatchJobStatus.RUNNING,
+    "cancelling": BatchJobStatus.RUNNING,
+    "completed": BatchJobStatus.COMPLETED,
+    "failed": BatchJobStatus.FAILED,
+    "expired": BatchJobStatus.EXPIRED,
+    "cancelled": BatchJobStatus.CANCELLED,
+}
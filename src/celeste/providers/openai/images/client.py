@@ -8,6 +8,7 @@ Provides shared implementation for capabilities using the OpenAI Images API:
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.io import FinishReason
@@ -85,7 +86,7 @@ class OpenAIImagesClient(APIMixin):
             json_body=request_body,
         )
         self._handle_error_response(response)
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = codec.loads(response.content)
         return data
 
     async def _make_multipart_request(
@@ -122,7 +123,7 @@ class OpenAIImagesClient(APIMixin):
             data=data,
         )
         self._handle_error_response(response)
-        response_data: dict[str, Any] = response.json()
+        response_data: dict[str, Any] = codec.loads(response.content)
         return response_data
 
     def _make_stream_request(
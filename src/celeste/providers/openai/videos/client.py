@@ -4,16 +4,20 @@ Provides shared implementation for capabilities using the OpenAI Videos API:
 - video-generation (async polling pattern)
 """
 
-import asyncio
 import base64
+import io
 import logging
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
+from celeste.jobs import JobHandle
+from celeste.polling import poll_until_done
+from celeste.sinks import BinarySink, active_sink
 
 from . import config
 
@@ -25,6 +29,7 @@ class OpenAIVideosClient(APIMixin):
 
     Provides shared implementation for video generation:
     - _make_request() - HTTP POST with async polling pattern
+    - _start_job() / _wait_job() / _finish_job() - the same steps, for detached jobs
     - _parse_usage() - Returns billing units from response
     - _parse_finish_reason() - Returns None (Videos API doesn't provide finish reasons)
     - _content_fields: ClassVar - Content field names to exclude from metadata
@@ -40,7 +45,7 @@ class OpenAIVideosClient(APIMixin):
                 # Handle input_reference image uploads...
     """
 
-    _content_fields: ClassVar[set[str]] = {"video_data"}
+    _content_fields: ClassVar[set[str]] = {"video_data", "video_sink"}
 
     def _build_request(
         self,
@@ -84,6 +89,18 @@ class OpenAIVideosClient(APIMixin):
         2. Poll for completion
         3. Fetch video content
         """
+        return await self._run_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        """Create a video job and return a handle on its status URL."""
         if endpoint is None:
             endpoint = config.OpenAIVideosEndpoint.CREATE_VIDEO
 
@@ -106,60 +123,80 @@ class OpenAIVideosClient(APIMixin):
             )
 
         self._handle_error_response(response)
-        video_obj = response.json()
-
-        video_id = video_obj["id"]
+        video_id = codec.loads(response.content)["id"]
         logger.info(f"Created video job: {video_id}")
+        return self._job_handle(video_id, f"{config.BASE_URL}{endpoint}/{video_id}")
 
-        # Poll for completion
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll the video job on the shared scheduler until completed."""
         poll_headers = self._json_headers(extra_headers)
-        for _ in range(config.MAX_POLLS):
+
+        async def fetch_status() -> dict[str, Any]:
             status_response = await self.http_client.get(
-                f"{config.BASE_URL}{endpoint}/{video_id}",
+                handle.poll_url,
                 headers=poll_headers,
             )
             self._handle_error_response(status_response)
-            video_obj = status_response.json()
-
-            status = video_obj["status"]
-            progress = video_obj.get("progress", 0)
-
-            logger.info(f"Video {video_id}: {status} ({progress}%)")
-
-            if status == config.STATUS_COMPLETED:
-                break
-            elif status == config.STATUS_FAILED:
-                error = video_obj.get("error", {})
-                msg = (
-                    f"Video generation failed: {error.get('message', 'Unknown error')}"
-                )
-                raise RuntimeError(msg)
-
-            await asyncio.sleep(config.POLL_INTERVAL)
-        else:
-            msg = f"Video generation timeout after {config.MAX_POLLS * config.POLL_INTERVAL} seconds"
-            raise TimeoutError(msg)
+            status_obj: dict[str, Any] = codec.loads(status_response.content)
+            return status_obj
+
+        return await poll_until_done(
+            fetch_status,
+            self._poll_done,
+            job_id=handle.id,
+            rate_key=self.provider,
+            policy=config.POLL_POLICY,
+        )
 
-        # Fetch video content
-        content_response = await self.http_client.get(
-            f"{config.BASE_URL}{endpoint}/{video_id}{config.CONTENT_ENDPOINT_SUFFIX}",
-            headers=poll_headers,
+    async def _finish_job(
+        self,
+        handle: JobHandle,
+        status: dict[str, Any],
+        *,
+        extra_headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch the video content, into the caller's sink when there is one."""
+        sink = active_sink()
+        buffer = io.BytesIO()
+        content_response = await self.http_client.download(
+            f"{handle.poll_url}{config.CONTENT_ENDPOINT_SUFFIX}",
+            sink if sink is not None else BinarySink(buffer),
+            headers=self._json_headers(extra_headers),
+            segments=config.DOWNLOAD_SEGMENTS,
         )
         self._handle_error_response(content_response)
-        video_data = content_response.content
+        content: dict[str, Any] = (
+            {"video_sink": True}
+            if sink is not None
+            else {"video_data": base64.b64encode(buffer.getvalue()).decode("utf-8")}
+        )
 
         # Return normalized response data
         return {
-            "video_data": base64.b64encode(video_data).decode("utf-8"),
-            "model": video_obj.get("model", self.model.id),
-            "video_id": video_id,
-            "seconds": video_obj.get("seconds"),
-            "size": video_obj.get("size"),
-            "created_at": video_obj.get("created_at"),
-            "completed_at": video_obj.get("completed_at"),
-            "expires_at": video_obj.get("expires_at"),
+            **content,
+            "model": status.get("model", self.model.id),
+            "video_id": handle.id,
+            "seconds": status.get("seconds"),
+            "size": status.get("size"),
+            "created_at": status.get("created_at"),
+            "completed_at": status.get("completed_at"),
+            "expires_at": status.get("expires_at"),
         }
 
+    def _poll_done(self, video_obj: dict[str, Any]) -> bool:
+        """Whether a video job has completed; raises for failed jobs."""
+        status = video_obj["status"]
+        logger.info(
+            f"Video {video_obj.get('id')}: {status} ({video_obj.get('progress', 0)}%)"
+        )
+        if status == config.STATUS_FAILED:
+            error = video_obj.get("error", {})
+            msg = f"Video generation failed: {error.get('message', 'Unknown error')}"
+            raise RuntimeError(msg)
+        return status == config.STATUS_COMPLETED
+
     async def _prepare_multipart_request(
         self,
         request_body: dict[str, Any],
@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from celeste.polling import PollPolicy
+
 
 class OpenAIVideosEndpoint(StrEnum):
     """Endpoints for OpenAI Videos API."""
@@ -11,10 +13,17 @@ class OpenAIVideosEndpoint(StrEnum):
 
 BASE_URL = "https://api.openai.com"
 CONTENT_ENDPOINT_SUFFIX = "/content"
+DOWNLOAD_SEGMENTS = 4  # parallel ranged requests for large videos
 
 # Polling Configuration
-MAX_POLLS = 60
 POLL_INTERVAL = 5  # seconds
+POLLING_TIMEOUT = 300.0  # 5 minutes
+POLL_POLICY = PollPolicy(
+    interval=POLL_INTERVAL,
+    max_interval=20.0,
+    timeout=POLLING_TIMEOUT,
+    max_rate=5.0,
+)
 
 # Status Constants
 STATUS_COMPLETED = "completed"
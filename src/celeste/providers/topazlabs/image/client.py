@@ -1,14 +1,15 @@
 """Topaz Labs Image API client mixin."""
 
-import asyncio
-import time
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
+from celeste.jobs import JobHandle
 from celeste.mime_types import ApplicationMimeType
+from celeste.polling import poll_until_done
 from celeste.utils import detect_mime_type
 
 from . import config
@@ -58,33 +59,19 @@ class TopazLabsImageClient(APIMixin):
         **parameters: Any,
     ) -> dict[str, Any]:
         """Submit image job, poll status, then fetch download URL."""
-        submit_endpoint = config.submit_endpoint_for_model(self.model.id)
-        submit_data = await self._submit_job(
-            request_body, submit_endpoint, extra_headers=extra_headers
+        return await self._run_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
         )
-        process_id = submit_data.get("process_id")
-        if not process_id:
-            msg = f"No process_id in {self.provider} response"
-            raise ValueError(msg)
 
-        status_data = await self._poll_status(process_id, extra_headers=extra_headers)
-        download_data = await self._fetch_download(
-            process_id, extra_headers=extra_headers
-        )
-        return {
-            **download_data,
-            "_status": status_data,
-            "_submit_metadata": submit_data,
-        }
-
-    async def _submit_job(
+    async def _start_job(
         self,
         request_body: dict[str, Any],
-        endpoint: str,
         *,
+        endpoint: str | None = None,
         extra_headers: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
-        """POST multipart image job and return submit JSON."""
+    ) -> JobHandle:
+        """POST multipart image job and return a handle on its status URL."""
+        submit_endpoint = config.submit_endpoint_for_model(self.model.id)
         image_artifact = request_body.pop("image")
         image_bytes = image_artifact.get_bytes()
         mime = image_artifact.mime_type or detect_mime_type(image_bytes)
@@ -98,74 +85,81 @@ class TopazLabsImageClient(APIMixin):
                 data[key] = form_field_value(value)
 
         response = await self.http_client.post_multipart(
-            f"{config.BASE_URL}{endpoint}",
+            f"{config.BASE_URL}{submit_endpoint}",
             headers=self._merge_headers(self.auth.get_headers(), extra_headers),
             files=files,
             data=data,
         )
         self._handle_error_response(response)
-        submit_data: dict[str, Any] = response.json()
-        return submit_data
+        submit_data: dict[str, Any] = codec.loads(response.content)
+        process_id = submit_data.get("process_id")
+        if not process_id:
+            msg = f"No process_id in {self.provider} response"
+            raise ValueError(msg)
 
-    async def _poll_status(
-        self,
-        process_id: str,
-        *,
-        extra_headers: dict[str, str] | None = None,
-    ) -> dict[str, Any]:
-        """Poll status until Completed or terminal failure."""
-        headers = self._merge_headers(
-            {**self.auth.get_headers(), "Accept": ApplicationMimeType.JSON},
-            extra_headers,
-        )
         status_url = (
             f"{config.BASE_URL}"
             f"{config.TopazLabsImageEndpoint.STATUS.format(process_id=process_id)}"
         )
-        start_time = time.monotonic()
-
-        while True:
-            elapsed = time.monotonic() - start_time
-            if elapsed >= config.POLLING_TIMEOUT:
-                msg = (
-                    f"{self.provider} polling timed out after "
-                    f"{config.POLLING_TIMEOUT} seconds"
-                )
-                raise TimeoutError(msg)
-
-            poll_response = await self.http_client.get(status_url, headers=headers)
-            self._handle_error_response(poll_response)
-            poll_data: dict[str, Any] = poll_response.json()
-            status = poll_data.get("status")
+        return self._job_handle(process_id, status_url, submit_metadata=submit_data)
 
-            if status == "Completed":
-                return poll_data
-            if status in ("Failed", "Cancelled"):
-                error_msg = poll_data.get("error") or poll_data.get("message") or status
-                msg = f"{self.provider} image upscale failed: {error_msg}"
-                raise ValueError(msg)
+    def _poll_headers(self, extra_headers: dict[str, str] | None) -> dict[str, str]:
+        return self._merge_headers(
+            {**self.auth.get_headers(), "Accept": ApplicationMimeType.JSON},
+            extra_headers,
+        )
 
-            await asyncio.sleep(config.POLLING_INTERVAL)
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll status until Completed or terminal failure."""
+        headers = self._poll_headers(extra_headers)
 
-    async def _fetch_download(
+        async def fetch_status() -> dict[str, Any]:
+            poll_response = await self.http_client.get(handle.poll_url, headers=headers)
+            self._handle_error_response(poll_response)
+            poll_data: dict[str, Any] = codec.loads(poll_response.content)
+            return poll_data
+
+        return await poll_until_done(
+            fetch_status,
+            self._poll_done,
+            job_id=handle.id,
+            rate_key=self.provider,
+            policy=config.POLL_POLICY,
+        )
+
+    def _poll_done(self, poll_data: dict[str, Any]) -> bool:
+        """Whether a process is Completed; raises for failed or cancelled ones."""
+        status = poll_data.get("status")
+        if status in ("Failed", "Cancelled"):
+            error_msg = poll_data.get("error") or poll_data.get("message") or status
+            msg = f"{self.provider} image upscale failed: {error_msg}"
+            raise ValueError(msg)
+        return status == "Completed"
+
+    async def _finish_job(
         self,
-        process_id: str,
+        handle: JobHandle,
+        status: dict[str, Any],
         *,
         extra_headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Fetch presigned download URL for a completed process."""
-        headers = self._merge_headers(
-            {**self.auth.get_headers(), "Accept": ApplicationMimeType.JSON},
-            extra_headers,
-        )
         download_url = (
             f"{config.BASE_URL}"
-            f"{config.TopazLabsImageEndpoint.DOWNLOAD.format(process_id=process_id)}"
+            f"{config.TopazLabsImageEndpoint.DOWNLOAD.format(process_id=handle.id)}"
+        )
+        response = await self.http_client.get(
+            download_url, headers=self._poll_headers(extra_headers)
         )
-        response = await self.http_client.get(download_url, headers=headers)
         self._handle_error_response(response)
-        download_data: dict[str, Any] = response.json()
-        return download_data
+        download_data: dict[str, Any] = codec.loads(response.content)
+        return {
+            **download_data,
+            "_status": status,
+            "_submit_metadata": handle.data.get("submit_metadata", {}),
+        }
 
     def _make_stream_request(
         self,
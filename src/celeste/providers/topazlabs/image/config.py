@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from celeste.polling import PollPolicy
+
 
 class TopazLabsImageEndpoint(StrEnum):
     """Endpoints for Topaz Labs Image API."""
@@ -42,3 +44,9 @@ BASE_URL = "https://api.topazlabs.com/image/v1"
 
 POLLING_INTERVAL = 2.0
 POLLING_TIMEOUT = 300.0
+POLL_POLICY = PollPolicy(
+    interval=POLLING_INTERVAL,
+    max_interval=10.0,
+    timeout=POLLING_TIMEOUT,
+    max_rate=5.0,
+)
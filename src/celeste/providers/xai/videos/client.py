@@ -1,13 +1,15 @@
 """xAI Videos API client mixin."""
 
-import asyncio
 from collections.abc import AsyncIterator
 from typing import Any, ClassVar
 
+from celeste import codec
 from celeste.client import APIMixin
 from celeste.core import UsageField
 from celeste.exceptions import StreamingNotSupportedError
 from celeste.io import FinishReason
+from celeste.jobs import JobHandle
+from celeste.polling import poll_until_done
 
 from . import config
 
@@ -17,6 +19,7 @@ class XAIVideosClient(APIMixin):
 
     Provides shared implementation for video generation:
     - _make_request() - HTTP POST with async polling pattern
+    - _start_job() / _wait_job() - the same steps, for detached jobs
     - _parse_usage() - Extract usage dict from response
     - _parse_content() - Extract video URL from response
     - _parse_finish_reason() - Returns None (Videos API doesn't provide finish reasons)
@@ -64,56 +67,77 @@ class XAIVideosClient(APIMixin):
         **parameters: Any,
     ) -> dict[str, Any]:
         """Make HTTP request with async polling for xAI video generation."""
+        return await self._run_job(
+            request_body, endpoint=endpoint, extra_headers=extra_headers
+        )
+
+    async def _start_job(
+        self,
+        request_body: dict[str, Any],
+        *,
+        endpoint: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> JobHandle:
+        """Submit a video request and return a handle on its status URL."""
         if endpoint is None:
             endpoint = config.XAIVideosEndpoint.CREATE_VIDEO
 
-        headers = self._json_headers(extra_headers)
-
-        # Submit video generation request
         response = await self.http_client.post(
             f"{config.BASE_URL}{endpoint}",
-            headers=headers,
+            headers=self._json_headers(extra_headers),
             json_body=request_body,
         )
         self._handle_error_response(response)
-        video_obj: dict[str, Any] = response.json()
+        video_obj: dict[str, Any] = codec.loads(response.content)
 
         request_id = video_obj.get("request_id")
         if not request_id:
-            # Response already has URL (e.g., cached result)
+            # Response already has URL (e.g., cached result); nothing to poll
             if "url" in video_obj:
-                return video_obj
+                return self._job_handle(
+                    video_obj.get("id", video_obj["url"]), "", response=video_obj
+                )
             msg = "No request_id in video generation response"
             raise ValueError(msg)
 
-        # Poll for completion
-        poll_endpoint = f"/v1/videos/{request_id}"
-        for _ in range(config.MAX_POLLS):
-            await asyncio.sleep(config.POLL_INTERVAL)
+        return self._job_handle(request_id, f"{config.BASE_URL}/v1/videos/{request_id}")
 
+    async def _wait_job(
+        self, handle: JobHandle, *, extra_headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Poll the request on the shared scheduler until it is ready."""
+        if "response" in handle.data:
+            response: dict[str, Any] = handle.data["response"]
+            return response
+
+        headers = self._json_headers(extra_headers)
+
+        async def fetch_status() -> dict[str, Any]:
             status_response = await self.http_client.get(
-                f"{config.BASE_URL}{poll_endpoint}",
-                headers=headers,
+                handle.poll_url, headers=headers
             )
             self._handle_error_response(status_response)
-
             # xAI uses HTTP status codes: 200 = ready, 202 = still processing
-            if status_response.status_code == 200:
-                return status_response.json()
-
-            # 202 Accepted means still processing, continue polling
             if status_response.status_code == 202:
-                continue
-
-            # Parse response for error handling
-            video_obj = status_response.json()
-            status = video_obj.get("status", "")
-            if status == config.STATUS_FAILED:
-                error = video_obj.get("error", "Video generation failed")
-                raise RuntimeError(error)
+                return {"status": config.STATUS_PENDING}
+            status_obj: dict[str, Any] = codec.loads(status_response.content)
+            return status_obj
+
+        return await poll_until_done(
+            fetch_status,
+            self._poll_done,
+            job_id=handle.id,
+            rate_key=self.provider,
+            policy=config.POLL_POLICY,
+        )
 
-        msg = f"Video generation timeout after {config.MAX_POLLS * config.POLL_INTERVAL} seconds"
-        raise TimeoutError(msg)
+    def _poll_done(self, video_obj: dict[str, Any]) -> bool:
+        """Whether a video request is ready; raises for failed requests."""
+        status = video_obj.get("status")
+        if status == config.STATUS_FAILED:
+            error = video_obj.get("error", "Video generation failed")
+            raise RuntimeError(error)
+        return status != config.STATUS_PENDING
 
     @staticmethod
     def map_usage_fields(usage_data: dict[str, Any]) -> dict[str, int | float | None]:
@@ -2,6 +2,8 @@
 
 from enum import StrEnum
 
+from celeste.polling import PollPolicy
+
 
 class XAIVideosEndpoint(StrEnum):
     """Endpoints for xAI Videos API."""
@@ -13,8 +15,16 @@ class XAIVideosEndpoint(StrEnum):
 BASE_URL = "https://api.x.ai"
 
 # Polling Configuration
-MAX_POLLS = 60
 POLL_INTERVAL = 5  # seconds
+POLLING_TIMEOUT = 300.0  # 5 minutes
+POLL_POLICY = PollPolicy(
+    initial_delay=POLL_INTERVAL,
+    interval=POLL_INTERVAL,
+    max_interval=20.0,
+    timeout=POLLING_TIMEOUT,
+    max_rate=5.0,
+)
 
 # Status Constants
+STATUS_PENDING = "pending"
 STATUS_FAILED = "failed"
@@ -0,0 +1,393 @@
+"""Client-side rate limiting for provider requests."""
+
+import asyncio
+import contextvars
+import hashlib
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from celeste import telemetry
+from celeste.auth import Authentication, AuthHeader
+from celeste.core import Protocol, Provider
+from celeste.retry import parse_reset_time
+
+# Rough characters-per-token ratio used to estimate prompt size before sending.
+CHARS_PER_TOKEN = 4
+
+# Strings at least this long made only of base64 characters are taken to be
+# inline image/audio/file payloads, which providers do not bill as text tokens.
+_MIN_BASE64_CHARS = 1024
+_BASE64 = re.compile(r"[A-Za-z0-9+/_-]+={0,2}")
+
+# (limit, remaining, reset) headers per dimension, checked in order.
+# OpenAI and Groq use x-ratelimit-*; Anthropic uses anthropic-ratelimit-*.
+_HEADER_FAMILIES: dict[str, tuple[tuple[str, str, str], ...]] = {
+    "requests": (
+        (
+            "x-ratelimit-limit-requests",
+            "x-ratelimit-remaining-requests",
+            "x-ratelimit-reset-requests",
+        ),
+        (
+            "anthropic-ratelimit-requests-limit",
+            "anthropic-ratelimit-requests-remaining",
+            "anthropic-ratelimit-requests-reset",
+        ),
+    ),
+    "tokens": (
+        (
+            "x-ratelimit-limit-tokens",
+            "x-ratelimit-remaining-tokens",
+            "x-ratelimit-reset-tokens",
+        ),
+        (
+            "anthropic-ratelimit-tokens-limit",
+            "anthropic-ratelimit-tokens-remaining",
+            "anthropic-ratelimit-tokens-reset",
+        ),
+        (
+            "anthropic-ratelimit-input-tokens-limit",
+            "anthropic-ratelimit-input-tokens-remaining",
+            "anthropic-ratelimit-input-tokens-reset",
+        ),
+    ),
+}
+
+RateLimitKey = tuple[Provider | Protocol | None, str, str]
+"""(provider or protocol, model id, credential fingerprint)."""
+
+
+class RateLimit(BaseModel):
+    """Requests and estimated tokens allowed per minute."""
+
+    model_config = ConfigDict(frozen=True)
+
+    requests_per_minute: float | None = Field(default=None, gt=0)
+    tokens_per_minute: float | None = Field(default=None, gt=0)
+
+
+class RateLimitStats(BaseModel):
+    """Back-pressure snapshot for one rate-limit key."""
+
+    queue_depth: int = 0
+    acquired: int = 0
+    waited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+
+class _TokenBucket:
+    """Reservation-based token bucket; negative levels are queued debt."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Reserve ``amount`` and return seconds until it is available."""
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def sync(self, remaining: float | None, reset: float | None, now: float) -> None:
+        """Align the bucket with the provider's view of the window."""
+        self._refill(now)
+        if remaining is not None:
+            self.level = min(self.level, remaining)
+        if remaining is not None and remaining <= 0 and reset is not None:
+            self.level = min(self.level, -reset * self.rate)
+
+    def resize(self, per_minute: float) -> None:
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = min(self.level, per_minute)
+
+
+class _KeyState:
+    """Buckets and counters for one rate-limit key."""
+
+    def __init__(self, limit: RateLimit | None) -> None:
+        self.configured = limit is not None
+        self.buckets: dict[str, _TokenBucket] = {}
+        if limit is not None:
+            if limit.requests_per_minute is not None:
+                self.buckets["requests"] = _TokenBucket(limit.requests_per_minute)
+            if limit.tokens_per_minute is not None:
+                self.buckets["tokens"] = _TokenBucket(limit.tokens_per_minute)
+        self.stats = RateLimitStats()
+
+
+class RateLimiter:
+    """Async token-bucket limiter keyed by (provider, model, credential).
+
+    Calls queue in arrival order before they reach the wire. Limits come from
+    `configure()` or, when ``learn_from_headers`` is set, from the
+    ``x-ratelimit-*`` / ``anthropic-ratelimit-*`` response headers. Keys with
+    no limits pass straight through.
+    """
+
+    def __init__(self, learn_from_headers: bool = False) -> None:
+        """Initialize an empty limiter.
+
+        Args:
+            learn_from_headers: Derive limits and remaining budget from provider
+                rate-limit response headers (off by default: learned token
+                limits are enforced against a client-side size estimate).
+        """
+        self.learn_from_headers = learn_from_headers
+        self._limits: dict[tuple[Provider | Protocol, str | None], RateLimit] = {}
+        self._states: dict[RateLimitKey, _KeyState] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        provider: Provider | Protocol,
+        limit: RateLimit,
+        *,
+        model: str | None = None,
+    ) -> None:
+        """Set explicit limits for a provider, or for one of its models.
+
+        Explicit limits take precedence over learned ones and apply per
+        credential. Model-specific limits win over provider-wide limits.
+        """
+        with self._lock:
+            self._limits[(provider, model)] = limit
+            for key in [k for k in self._states if k[0] == provider]:
+                if model is None or key[1] == model:
+                    del self._states[key]
+
+    def _state(self, key: RateLimitKey) -> _KeyState:
+        state = self._states.get(key)
+        if state is None:
+            provider, model, _ = key
+            limit = None
+            if provider is not None:
+                limit = self._limits.get((provider, model)) or self._limits.get(
+                    (provider, None)
+                )
+            state = self._states[key] = _KeyState(limit)
+        return state
+
+    def _reserve(
+        self,
+        key: RateLimitKey,
+        request_body: dict[str, Any] | None,
+        max_tokens: int | None,
+    ) -> tuple[_KeyState, float]:
+        with self._lock:
+            state = self._state(key)
+            if not state.buckets:
+                return state, 0.0
+            now = time.monotonic()
+            wait = 0.0
+            if (requests := state.buckets.get("requests")) is not None:
+                wait = max(wait, requests.reserve(1, now))
+            if (tokens := state.buckets.get("tokens")) is not None:
+                estimate = estimate_tokens(request_body, max_tokens)
+                wait = max(wait, tokens.reserve(estimate, now))
+            return state, wait
+
+    async def acquire(
+        self,
+        key: RateLimitKey,
+        request_body: dict[str, Any] | None = None,
+        max_tokens: int | None = None,
+    ) -> float:
+        """Wait until ``key`` may send one request of the estimated size.
+
+        Returns:
+            Seconds spent queued.
+        """
+        state, wait = self._reserve(key, request_body, max_tokens)
+        stats = state.stats
+        stats.acquired += 1
+        if wait <= 0:
+            return 0.0
+        attributes = _metric_attributes(key)
+        stats.queue_depth += 1
+        telemetry.record_rate_limit_queue(1, attributes)
+        try:
+            await asyncio.sleep(wait)
+        finally:
+            stats.queue_depth -= 1
+            telemetry.record_rate_limit_queue(-1, attributes)
+        stats.waited += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        telemetry.record_rate_limit_wait(wait, attributes)
+        return wait
+
+    def observe(self, key: RateLimitKey, headers: Mapping[str, str]) -> None:
+        """Update ``key`` from provider rate-limit response headers."""
+        if not self.learn_from_headers:
+            return
+        with self._lock:
+            state = self._state(key)
+            now = time.monotonic()
+            for dimension, families in _HEADER_FAMILIES.items():
+                for limit_header, remaining_header, reset_header in families:
+                    limit = _header_float(headers, limit_header)
+                    remaining = _header_float(headers, remaining_header)
+                    if limit is None and remaining is None:
+                        continue
+                    bucket = state.buckets.get(dimension)
+                    if bucket is None:
+                        if limit is None or state.configured:
+                            break
+                        bucket = state.buckets[dimension] = _TokenBucket(limit)
+                    elif limit is not None and not state.configured:
+                        bucket.resize(limit)
+                    raw_reset = headers.get(reset_header)
+                    reset = parse_reset_time(raw_reset) if raw_reset else None
+                    bucket.sync(remaining, reset, now)
+                    break
+
+    def stats(self, key: RateLimitKey) -> RateLimitStats:
+        """Return a copy of the back-pressure counters for ``key``."""
+        with self._lock:
+            state = self._state(key)
+            requests = state.buckets.get("requests")
+            tokens = state.buckets.get("tokens")
+            return state.stats.model_copy(
+                update={
+                    "requests_per_minute": requests.capacity if requests else None,
+                    "tokens_per_minute": tokens.capacity if tokens else None,
+                }
+            )
+
+    def reset(self) -> None:
+        """Forget configured limits, learned limits, and counters."""
+        with self._lock:
+            self._limits.clear()
+            self._states.clear()
+
+
+def credential_fingerprint(auth: Authentication) -> str:
+    """Stable, non-reversible identifier for an authentication object."""
+    if isinstance(auth, AuthHeader):
+        material = auth.secret.get_secret_value()
+    else:
+        material = f"{type(auth).__name__}:{auth.model_dump_json()}"
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+
+def estimate_tokens(
+    request_body: dict[str, Any] | None, max_tokens: int | None = None
+) -> int:
+    """Estimate the tokens a request will consume (prompt size + output cap).
+
+    The prompt size counts the text in ``request_body``; inline binary parts
+    (bytes, base64 data URLs and long base64 strings) are left out.
+    """
+    if not isinstance(max_tokens, int):
+        max_tokens = None
+    prompt = _text_chars(request_body) // CHARS_PER_TOKEN if request_body else 0
+    return prompt + (max_tokens or 0)
+
+
+def _text_chars(value: Any) -> int:  # noqa: ANN401
+    """Characters of text in a JSON-like request body, skipping binary payloads."""
+    if isinstance(value, str):
+        if value.startswith("data:") and ";base64," in value[:256]:
+            return 0
+        if len(value) >= _MIN_BASE64_CHARS and _BASE64.fullmatch(value):
+            return 0
+        return len(value)
+    if isinstance(value, dict):
+        return sum(len(str(k)) + _text_chars(v) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return sum(_text_chars(item) for item in value)
+    if isinstance(value, bytes | bytearray | memoryview):
+        return 0
+    return len(str(value))
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _metric_attributes(key: RateLimitKey) -> dict[str, Any]:
+    provider, model, _ = key
+    attributes: dict[str, Any] = {"gen_ai.request.model": model}
+    if provider is not None:
+        attributes["celeste.provider"] = str(provider)
+    return attributes
+
+
+_current_key: contextvars.ContextVar[RateLimitKey | None] = contextvars.ContextVar(
+    "celeste_rate_limit_key", default=None
+)
+
+
+@contextmanager
+def rate_limit_scope(key: RateLimitKey) -> Iterator[None]:
+    """Attribute HTTP responses observed inside this block to ``key``."""
+    token = _current_key.set(key)
+    try:
+        yield
+    finally:
+        _current_key.reset(token)
+
+
+def observe_response_headers(headers: Mapping[str, str]) -> None:
+    """Feed response headers to the process limiter for the current scope."""
+    key = _current_key.get()
+    if key is not None:
+        rate_limiter.observe(key, headers)
+
+
+async def throttle_stream(
+    iterator: AsyncIterator[dict[str, Any]],
+    key: RateLimitKey,
+    request_body: dict[str, Any] | None = None,
+    max_tokens: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Acquire the limiter before the stream opens and scope its first pull."""
+    await rate_limiter.acquire(key, request_body, max_tokens)
+    with rate_limit_scope(key):
+        try:
+            first = await iterator.__anext__()
+        except StopAsyncIteration:
+            return
+    yield first
+    async for event in iterator:
+        yield event
+
+
+# Process-wide limiter used by every client.
+rate_limiter = RateLimiter()
+
+
+__all__ = [
+    "RateLimit",
+    "RateLimitKey",
+    "RateLimitStats",
+    "RateLimiter",
+    "credential_fingerprint",
+    "estimate_tokens",
+    "observe_response_headers",
+    "rate_limit_scope",
+    "rate_limiter",
+    "throttle_stream",
+]
@@ -0,0 +1,52 @@
+"""How much raw provider payload streams and outputs keep in memory."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+
+
+class Retention(StrEnum):
+    """Retention policy for raw provider events and responses.
+
+    - ``full``: every chunk keeps its event in ``metadata["event_data"]``;
+      outputs carry ``raw_events`` (streams) and ``raw_response``.
+    - ``last_event``: only the newest chunk keeps its event. Stream outputs
+      carry the final event (and the last one that reported usage) as
+      ``raw_events``, plus ``raw_response``.
+    - ``none``: chunks carry no event and outputs no ``raw_events`` or
+      ``raw_response``.
+
+    Parsed fields (content, usage, tool calls, grounding, signatures) are the
+    same under every policy.
+    """
+
+    FULL = "full"
+    LAST_EVENT = "last_event"
+    NONE = "none"
+
+
+_active_retention: ContextVar[Retention | None] = ContextVar(
+    "celeste_active_retention", default=None
+)
+
+
+@contextmanager
+def retention_scope(retention: Retention | str) -> Iterator[Retention]:
+    """Override the client's retention policy for requests made in this context.
+
+    Streams take the policy in effect when they are created.
+    """
+    token = _active_retention.set(Retention(retention))
+    try:
+        yield Retention(retention)
+    finally:
+        _active_retention.reset(token)
+
+
+def active_retention(default: Retention = Retention.FULL) -> Retention:
+    """Return the retention policy of the current context, else ``default``."""
+    return _active_retention.get() or default
+
+
+__all__ = ["Retention", "active_retention", "retention_scope"]
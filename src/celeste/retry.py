@@ -0,0 +1,228 @@
+"""Retry policies for transient HTTP failures."""
+
+import random
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+MAX_RETRIES = 2
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+MAX_RETRY_AFTER = 60.0
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# (reset header, remaining header) per rate-limit window. OpenAI/Groq send reset
+# durations ("1s", "6m0s", "20ms"); Anthropic sends RFC 3339 timestamps.
+RATE_LIMIT_RESET_HEADERS: tuple[tuple[str, str], ...] = (
+    ("x-ratelimit-reset-requests", "x-ratelimit-remaining-requests"),
+    ("x-ratelimit-reset-tokens", "x-ratelimit-remaining-tokens"),
+    ("anthropic-ratelimit-requests-reset", "anthropic-ratelimit-requests-remaining"),
+    ("anthropic-ratelimit-tokens-reset", "anthropic-ratelimit-tokens-remaining"),
+    (
+        "anthropic-ratelimit-input-tokens-reset",
+        "anthropic-ratelimit-input-tokens-remaining",
+    ),
+    (
+        "anthropic-ratelimit-output-tokens-reset",
+        "anthropic-ratelimit-output-tokens-remaining",
+    ),
+)
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class RetryJitter(StrEnum):
+    """Jitter strategies applied to exponential backoff."""
+
+    NONE = "none"
+    FULL = "full"
+    DECORRELATED = "decorrelated"
+
+
+class RetryBudget:
+    """Token bucket capping retries relative to successful requests.
+
+    Every retryable failure withdraws one token and every success deposits
+    ``token_ratio`` tokens. Retries are allowed only while the bucket holds more
+    than half of ``max_tokens``, so a provider outage degrades into fast
+    failures instead of multiplying traffic. Share one instance across policies
+    to budget retries process-wide; the budget is thread-safe.
+    """
+
+    def __init__(self, max_tokens: float = 100.0, token_ratio: float = 0.1) -> None:
+        """Initialize a full budget.
+
+        Args:
+            max_tokens: Bucket capacity.
+            token_ratio: Tokens restored per successful request.
+        """
+        if max_tokens <= 0:
+            msg = "max_tokens must be positive"
+            raise ValueError(msg)
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        return self._tokens
+
+    def record_success(self) -> None:
+        """Deposit tokens for a request that did not need a retry."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> None:
+        """Withdraw one token for a retryable failure."""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def allows_retry(self) -> bool:
+        """Return True while the budget is above its throttling threshold."""
+        return self._tokens > self.max_tokens / 2
+
+
+class RetryPolicy(BaseModel):
+    """Retry behaviour for transient HTTP failures.
+
+    Retries network errors and ``retryable_status`` responses with capped
+    exponential backoff. Server-supplied ``Retry-After`` / ``retry-after-ms`` and
+    rate-limit reset headers take precedence over the computed delay when
+    ``respect_retry_after`` is set; a server wait longer than
+    ``max_retry_after`` returns the response instead of sleeping.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    max_retries: int = Field(default=MAX_RETRIES, ge=0)
+    base_delay: float = Field(default=RETRY_BASE_DELAY, ge=0)
+    max_delay: float = Field(default=RETRY_MAX_DELAY, ge=0)
+    jitter: RetryJitter = RetryJitter.FULL
+    retryable_status: frozenset[int] = RETRYABLE_STATUS
+    respect_retry_after: bool = True
+    max_retry_after: float = Field(default=MAX_RETRY_AFTER, ge=0)
+    budget: RetryBudget | None = Field(default=None, exclude=True)
+
+    def is_retryable(self, response: httpx.Response) -> bool:
+        """Return True if the response status should be retried."""
+        return response.status_code in self.retryable_status
+
+    def backoff(self, attempt: int, previous_delay: float) -> float:
+        """Compute the backoff delay before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * 2.0**attempt)
+        if self.jitter == RetryJitter.FULL:
+            return random.uniform(0, ceiling)  # nosec B311 - jitter, not crypto
+        if self.jitter == RetryJitter.DECORRELATED:
+            upper = max(self.base_delay, previous_delay * 3)
+            return min(self.max_delay, random.uniform(self.base_delay, upper))  # nosec B311
+        return ceiling
+
+    def next_delay(
+        self,
+        attempt: int,
+        previous_delay: float,
+        response: httpx.Response | None = None,
+    ) -> float | None:
+        """Return the delay before the next retry, or None to stop retrying."""
+        if attempt >= self.max_retries:
+            return None
+        if response is not None and self.respect_retry_after:
+            server_delay = server_retry_delay(response)
+            if server_delay is not None:
+                return server_delay if server_delay <= self.max_retry_after else None
+        return self.backoff(attempt, previous_delay)
+
+
+def parse_duration(value: str) -> float | None:
+    """Parse a reset duration such as ``"1.5"``, ``"20ms"`` or ``"6m0s"`` into seconds."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    total = 0.0
+    number = ""
+    index = 0
+    while index < len(value):
+        char = value[index]
+        if char.isdigit() or char == ".":
+            number += char
+            index += 1
+            continue
+        unit = "ms" if value.startswith("ms", index) else char
+        if unit not in _DURATION_UNITS or not number:
+            return None
+        total += float(number) * _DURATION_UNITS[unit]
+        number = ""
+        index += len(unit)
+    if number:
+        return None
+    return total
+
+
+def parse_reset_time(value: str) -> float | None:
+    """Parse a reset header holding a duration, HTTP date, or RFC 3339 timestamp."""
+    duration = parse_duration(value)
+    if duration is not None:
+        return duration
+    try:
+        reset_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            reset_at = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return max(0.0, reset_at.timestamp() - time.time())
+
+
+def server_retry_delay(response: httpx.Response) -> float | None:
+    """Delay requested by the server via retry or rate-limit reset headers."""
+    headers = response.headers
+    if (retry_after_ms := headers.get("retry-after-ms")) is not None:
+        delay = parse_duration(retry_after_ms)
+        if delay is not None:
+            return delay / 1000
+    if (retry_after := headers.get("retry-after")) is not None:
+        delay = parse_reset_time(retry_after)
+        if delay is not None:
+            return delay
+    if response.status_code != 429:
+        return None
+    delays: list[float] = []
+    for reset_header, remaining_header in RATE_LIMIT_RESET_HEADERS:
+        raw = headers.get(reset_header)
+        if raw is None or headers.get(remaining_header, "0").strip() not in ("0", ""):
+            continue  # Only exhausted windows explain the 429
+        delay = parse_reset_time(raw)
+        if delay is not None:
+            delays.append(delay)
+    return max(delays) if delays else None
+
+
+# Budget shared by every client using the default policy.
+default_retry_budget = RetryBudget()
+DEFAULT_RETRY_POLICY = RetryPolicy(budget=default_retry_budget)
+
+
+__all__ = [
+    "DEFAULT_RETRY_POLICY",
+    "MAX_RETRIES",
+    "RATE_LIMIT_RESET_HEADERS",
+    "RETRYABLE_STATUS",
+    "RetryBudget",
+    "RetryJitter",
+    "RetryPolicy",
+    "default_retry_budget",
+    "parse_duration",
+    "parse_reset_time",
+    "server_retry_delay",
+]
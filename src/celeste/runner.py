@@ -0,0 +1,150 @@
+"""Persistent background event loop backing the sync API."""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+
+class _LoopRunner:
+    """One daemon thread running one asyncio loop for the whole process.
+
+    Every sync entry point submits its coroutine here, so sync callers share a
+    single event loop and therefore a single warm connection pool instead of
+    creating a loop and thread per call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The background loop, started on first use."""
+        with self._lock:
+            if (
+                self._loop is None
+                or self._thread is None
+                or not self._thread.is_alive()
+            ):
+                ready = threading.Event()
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run,
+                    args=(loop, ready),
+                    name="celeste-sync-runner",
+                    daemon=True,
+                )
+                thread.start()
+                ready.wait()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+    def run[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the background loop and block until it finishes."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            msg = "Cannot block on the sync runner from inside its own event loop"
+            raise RuntimeError(msg)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            msg = (
+                "Sync API called from a running event loop - "
+                "await the async API directly instead"
+            )
+            raise RuntimeError(msg)
+
+        loop = self.loop
+        context = contextvars.copy_context()
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        task: asyncio.Task[T] | None = None
+
+        def start() -> None:
+            nonlocal task
+            if not future.set_running_or_notify_cancel():
+                coro.close()
+                return
+            task = loop.create_task(coro, context=context)
+            task.add_done_callback(finish)
+
+        def finish(done: asyncio.Task[T]) -> None:
+            if done.cancelled():
+                future.set_exception(concurrent.futures.CancelledError())
+            elif (exc := done.exception()) is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(done.result())
+
+        loop.call_soon_threadsafe(start)
+        try:
+            return future.result()
+        except BaseException:
+            # Caller interrupted (e.g. KeyboardInterrupt): don't leave work running
+            if not future.done():
+                loop.call_soon_threadsafe(lambda: task.cancel() if task else None)
+            raise
+
+    def shutdown(self, timeout: float | None = 5.0) -> None:
+        """Stop the background loop and join its thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+    def _forget(self) -> None:
+        """Drop the parent's loop in a forked child; it has no running thread."""
+        self._lock = threading.Lock()
+        self._loop = self._thread = None
+
+
+_runner = _LoopRunner()
+atexit.register(_runner.shutdown)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_runner._forget)
+
+
+def run_sync[**P, T](
+    func: Callable[P, Coroutine[Any, Any, T]], *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """Call an async function from sync code on the shared background loop.
+
+    Context variables of the caller (tracing context, rate-limit scope) are
+    visible to the coroutine.
+
+    Raises:
+        RuntimeError: If called from a thread that is already running an event
+            loop; await the async API there instead.
+    """
+    return _runner.run(func(*args, **kwargs))
+
+
+def shutdown_sync_runner() -> None:
+    """Stop the background loop; the next sync call starts a fresh one."""
+    _runner.shutdown()
+
+
+__all__ = ["run_sync", "shutdown_sync_runner"]
@@ -0,0 +1,125 @@
+"""Incremental writers for large binary outputs (speech, video)."""
+
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import BinaryIO
+
+from celeste.artifacts import Artifact
+
+type Sink = str | os.PathLike[str] | BinaryIO
+"""Destination for binary output: a file path or a binary file opened for writing."""
+
+
+class BinarySink:
+    """Writes binary output as it arrives, so it is never held in memory whole.
+
+    A path target is written to a temporary file in the same directory and
+    moved into place by ``commit()``, so a failed or abandoned output never
+    leaves a partial file at the target. An open file is written as-is and
+    left open for the caller.
+    """
+
+    def __init__(self, target: Sink) -> None:
+        """Initialize for ``target``; nothing is created until the first write."""
+        self._file: BinaryIO | None = None
+        self._temp_path: str | None = None
+        self._done = False
+        self._position = 0
+        self.bytes_written = 0
+        if isinstance(target, str | os.PathLike):
+            self.path: str | None = os.fspath(target)
+            self._owned = True
+        else:
+            name = getattr(target, "name", None)
+            self.path = name if isinstance(name, str) else None
+            self._file = target
+            self._owned = False
+
+    def write(self, data: bytes) -> None:
+        """Append ``data`` to the output."""
+        self.write_at(self._position, data)
+
+    def write_at(self, offset: int, data: bytes) -> None:
+        """Write ``data`` at ``offset`` bytes from the start of the output.
+
+        Used by ranged downloads; any offset other than the current end needs a
+        seekable target (always the case for a path).
+        """
+        if self._file is None:
+            directory = os.path.dirname(os.path.abspath(self.path or "."))
+            fd, self._temp_path = tempfile.mkstemp(
+                dir=directory, prefix=".celeste-", suffix=".part"
+            )
+            self._file = os.fdopen(fd, "wb")
+        if offset != self._position:
+            self._file.seek(offset - self._position, os.SEEK_CUR)
+        self._file.write(data)
+        self._position = offset + len(data)
+        self.bytes_written = max(self.bytes_written, self._position)
+
+    def seekable(self) -> bool:
+        """Whether ``write_at`` can write at arbitrary offsets."""
+        return self._owned or (self._file is not None and self._file.seekable())
+
+    def commit(self) -> None:
+        """Finish the output, moving a path target into place."""
+        if self._done:
+            return
+        self._done = True
+        if not self._owned:
+            return
+        if self._file is None:
+            self.write(b"")
+        assert self._file is not None and self._temp_path is not None
+        self._file.close()
+        os.replace(self._temp_path, self.path)  # type: ignore[arg-type]
+
+    def abort(self) -> None:
+        """Discard an unfinished output; a no-op once committed."""
+        if self._done:
+            return
+        self._done = True
+        if self._owned and self._file is not None:
+            self._file.close()
+            with suppress(OSError):
+                os.unlink(self._temp_path)  # type: ignore[arg-type]
+
+    def artifact[A: Artifact](self, artifact: A) -> A:
+        """Return ``artifact`` backed by this sink's path instead of in-memory data."""
+        return artifact.model_copy(
+            update={
+                "data": None,
+                "path": self.path,
+                "metadata": {**artifact.metadata, "size": self.bytes_written},
+            }
+        )
+
+
+_active_sink: ContextVar[BinarySink | None] = ContextVar(
+    "celeste_active_sink", default=None
+)
+
+
+@contextmanager
+def sink_scope(sink: BinarySink) -> Iterator[BinarySink]:
+    """Route binary response bodies of requests in this context to ``sink``.
+
+    Providers that can stream a unary response body check ``active_sink()``
+    and write to it instead of returning the bytes.
+    """
+    token = _active_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _active_sink.reset(token)
+
+
+def active_sink() -> BinarySink | None:
+    """Return the sink the current request's binary body should go to, if any."""
+    return _active_sink.get()
+
+
+__all__ = ["BinarySink", "Sink", "active_sink", "sink_scope"]
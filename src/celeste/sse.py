@@ -0,0 +1,211 @@
+"""Incremental Server-Sent Events and NDJSON framing over raw response bytes."""
+
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import Any
+
+from celeste import codec
+
+_BOM = b"\xef\xbb\xbf"
+
+type JSONDecoder = Callable[[bytes], Any]
+"""Decode one JSON document from bytes (``json.loads``, ``orjson.loads``, ...)."""
+
+
+def decode_json(data: bytes) -> Any:  # noqa: ANN401
+    """Default JSON decoder: the active `celeste.codec` backend."""
+    return codec.loads(data)
+
+
+class SSEEvent:
+    """One dispatched Server-Sent Event.
+
+    ``data`` is the raw payload (multi-line data joined with ``\\n``), left as
+    bytes so it can go straight to a JSON decoder. ``id`` is the stream's last
+    event id at dispatch time, which persists across events as the SSE spec
+    requires; send it back as ``Last-Event-ID`` to resume a stream.
+    """
+
+    __slots__ = ("data", "event", "id", "retry")
+
+    def __init__(
+        self,
+        data: bytes,
+        event: str = "message",
+        id: str | None = None,  # noqa: A002
+        retry: int | None = None,
+    ) -> None:
+        """Initialize an event."""
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return f"SSEEvent(event={self.event!r}, id={self.id!r}, data={self.data!r})"
+
+
+class SSEDecoder:
+    """Incremental SSE parser fed with arbitrary byte chunks.
+
+    Events are framed on blank lines with ``bytes.find``/``bytes.split`` over
+    the raw chunks, so a chunk carrying many small events costs a few C-level
+    scans rather than a Python step per line, and an event spread over many
+    chunks is joined once.
+    CRLF, LF and bare CR line endings are accepted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a decoder at the start of a stream."""
+        self._parts: list[bytes] = []
+        self._head: bytes | None = b""  # None once past a possible leading BOM
+        self._pending_cr = False
+        self.last_event_id: str | None = None
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        """Add ``chunk`` and return the events it completes."""
+        if self._head is not None:
+            head = self._head + chunk
+            if len(head) < len(_BOM) and _BOM.startswith(head):
+                self._head = head
+                return []
+            self._head = None
+            chunk = head.removeprefix(_BOM)
+        if self._pending_cr:
+            self._pending_cr = False
+            chunk = b"\r" + chunk
+        if b"\r" in chunk:
+            if chunk.endswith(b"\r"):
+                # May be the first half of a CRLF split across chunks.
+                self._pending_cr = True
+                chunk = chunk[:-1]
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        buffer = _extend(self._parts, chunk, b"\n\n")
+        if buffer is None:
+            return []
+        *blocks, rest = buffer.split(b"\n\n")
+        if rest:
+            self._parts.append(rest)
+        events: list[SSEEvent] = []
+        for block in blocks:
+            event = self._dispatch(block)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> list[SSEEvent]:
+        """Return the final event if the stream ended without a blank line."""
+        buffer = b"".join(self._parts)
+        self._parts.clear()
+        self._head = None
+        self._pending_cr = False
+        event = self._dispatch(buffer.rstrip(b"\n")) if buffer.strip() else None
+        return [event] if event is not None else []
+
+    def _dispatch(self, block: bytes) -> SSEEvent | None:
+        # Fast path: the common single-line `data:` event.
+        if block.startswith(b"data:") and block.find(b"\n") == -1:
+            value = block[5:]
+            return SSEEvent(
+                value[1:] if value[:1] == b" " else value, id=self.last_event_id
+            )
+        data: list[bytes] = []
+        event_type = "message"
+        retry: int | None = None
+        for line in block.split(b"\n"):
+            if not line or line[:1] == b":":
+                continue
+            field, colon, value = line.partition(b":")
+            if colon and value[:1] == b" ":
+                value = value[1:]
+            if field == b"data":
+                data.append(value)
+            elif field == b"event":
+                event_type = value.decode(errors="replace") or "message"
+            elif field == b"id":
+                if b"\x00" not in value:
+                    self.last_event_id = value.decode(errors="replace")
+            elif field == b"retry" and value.isdigit():
+                retry = int(value)
+        if not data:
+            return None
+        return SSEEvent(
+            b"\n".join(data), event=event_type, id=self.last_event_id, retry=retry
+        )
+
+
+class NDJSONDecoder:
+    """Incremental newline-delimited JSON framing; yields one raw line per document."""
+
+    def __init__(self) -> None:
+        """Initialize a decoder at the start of a stream."""
+        self._parts: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add ``chunk`` and return the non-empty lines it completes."""
+        buffer = _extend(self._parts, chunk, b"\n")
+        if buffer is None:
+            return []
+        *lines, rest = buffer.split(b"\n")
+        if rest:
+            self._parts.append(rest)
+        return [stripped for line in lines if (stripped := line.strip())]
+
+    def flush(self) -> list[bytes]:
+        """Return a final line left without a trailing newline."""
+        line = b"".join(self._parts).strip()
+        self._parts.clear()
+        return [line] if line else []
+
+
+def _extend(parts: list[bytes], chunk: bytes, separator: bytes) -> bytes | None:
+    """Join pending ``parts`` with ``chunk`` once a ``separator`` may be complete.
+
+    Returns None (keeping ``chunk`` pending) while no separator can end in it,
+    so a long frame arriving in many chunks is copied once, not once per chunk.
+    """
+    if not chunk:
+        return None
+    if not parts:
+        return chunk
+    if chunk.find(separator) == -1 and not (
+        len(separator) == 2 and parts[-1][-1:] == b"\n" and chunk[:1] == b"\n"
+    ):
+        parts.append(chunk)
+        return None
+    parts.append(chunk)
+    buffer = b"".join(parts)
+    parts.clear()
+    return buffer
+
+
+async def aiter_sse(chunks: AsyncIterable[bytes]) -> AsyncIterator[SSEEvent]:
+    """Parse SSE events from a stream of byte chunks (e.g. ``response.aiter_bytes()``)."""
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
+
+
+async def aiter_ndjson(
+    chunks: AsyncIterable[bytes], decode: JSONDecoder = decode_json
+) -> AsyncIterator[Any]:
+    """Decode NDJSON documents from a stream of byte chunks."""
+    decoder = NDJSONDecoder()
+    async for chunk in chunks:
+        for line in decoder.feed(chunk):
+            yield decode(line)
+    for line in decoder.flush():
+        yield decode(line)
+
+
+__all__ = [
+    "JSONDecoder",
+    "NDJSONDecoder",
+    "SSEDecoder",
+    "SSEEvent",
+    "aiter_ndjson",
+    "aiter_sse",
+    "decode_json",
+]
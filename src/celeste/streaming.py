@@ -7,13 +7,16 @@ from types import TracebackType
 from typing import Any, ClassVar, Self, Unpack
 
 import httpx
-from anyio.from_thread import start_blocking_portal
 
+from celeste.artifacts import Artifact
 from celeste.exceptions import StreamEventError, StreamNotExhaustedError
 from celeste.grounding import Grounding
 from celeste.io import Chunk as ChunkBase
-from celeste.io import FinishReason, Output, Usage
+from celeste.io import FinishReason, Output, Usage, trusted_constructor
 from celeste.parameters import Parameters
+from celeste.retention import Retention
+from celeste.runner import run_sync
+from celeste.sinks import BinarySink
 from celeste.tools import ToolCall, validate_tool_calls
 from celeste.types import RawUsage, ToolActivity
 
@@ -31,15 +34,95 @@ async def enrich_stream_errors(
         raise  # Unreachable — error_handler always raises for error responses
 
 
+class StreamAggregate:
+    """Running totals of a stream, folded in once per chunk as it arrives.
+
+    Content and reasoning are kept as lists of parts and joined on demand,
+    so neither the final Output nor a mid-stream snapshot re-walks the chunks
+    or copies the text once per token. Unless ``keep_events`` is set, only the
+    last event and the last event that reported usage are kept.
+    """
+
+    __slots__ = (
+        "content",
+        "events",
+        "finish_reason",
+        "keep_events",
+        "last_event",
+        "reasoning",
+        "usage",
+        "usage_event",
+    )
+
+    def __init__(self, keep_events: bool = True) -> None:
+        """Initialize an empty aggregate."""
+        self.keep_events = keep_events
+        self.content: list[Any] = []
+        self.reasoning: list[str] = []
+        self.events: list[dict[str, Any]] = []
+        self.last_event: dict[str, Any] | None = None
+        self.usage_event: dict[str, Any] | None = None
+        self.usage: Usage | None = None
+        self.finish_reason: FinishReason | None = None
+
+    @classmethod
+    def of(cls, chunks: list[Any]) -> "StreamAggregate":
+        """Fold ``chunks`` into a new aggregate in one pass."""
+        aggregate = cls()
+        for chunk in chunks:
+            aggregate.add(chunk, chunk.metadata.get("event_data"))
+        return aggregate
+
+    def add(self, chunk: ChunkBase, event_data: dict[str, Any] | None) -> None:
+        """Fold one chunk and the event it was parsed from in (last usage and finish reason win)."""
+        if chunk.content:
+            self.content.append(chunk.content)
+        reasoning = getattr(chunk, "reasoning", None)
+        if reasoning:
+            self.reasoning.append(reasoning)
+        if isinstance(event_data, dict):
+            if self.keep_events:
+                self.events.append(event_data)
+            else:
+                self.last_event = event_data
+                if chunk.usage:
+                    self.usage_event = event_data
+        if chunk.usage:
+            self.usage = chunk.usage
+        if chunk.finish_reason:
+            self.finish_reason = chunk.finish_reason
+
+    def retained_events(self) -> list[dict[str, Any]]:
+        """Events kept so far, oldest first."""
+        if self.keep_events:
+            return list(self.events)
+        events = [self.usage_event] if self.usage_event is not None else []
+        if self.last_event is not None and self.last_event is not self.usage_event:
+            events.append(self.last_event)
+        return events
+
+    def text(self) -> str:
+        """Content parts joined as text."""
+        return _join(self.content)
+
+    def reasoning_text(self) -> str | None:
+        """Reasoning parts joined as text, or None if there were none."""
+        return _join(self.reasoning) if self.reasoning else None
+
+
+def _join(parts: list[str]) -> str:
+    """Join ``parts`` in place, so a later join only copies what arrived since."""
+    if len(parts) > 1:
+        parts[:] = ["".join(parts)]
+    return parts[0] if parts else ""
+
+
 class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
     """Async iterator wrapper providing final Output access after stream exhaustion.
 
     Supports both async iteration (`async for chunk in stream`) and sync iteration
-    (`for chunk in stream`). Sync iteration uses anyio's blocking portal to maintain
-    a persistent event loop in a dedicated thread.
-
-    Note: For high-volume scenarios, async iteration is recommended. Sync iteration
-    creates a background thread per stream.
+    (`for chunk in stream`). Sync iteration drives the stream on the process-wide
+    background loop shared by every sync entry point (see `celeste.runner`).
     """
 
     _usage_class: ClassVar[type[Usage]] = Usage
@@ -54,17 +137,28 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
         sse_iterator: AsyncIterator[dict[str, Any]],
         transform_output: Callable[..., Any] | None = None,
         stream_metadata: dict[str, Any] | None = None,
+        sink: BinarySink | None = None,
+        retention: Retention = Retention.FULL,
         **parameters: Unpack[Params],  # type: ignore[misc]
     ) -> None:
-        """Initialize stream with SSE iterator."""
+        """Initialize stream with SSE iterator.
+
+        With a ``sink``, binary chunk content is written to it as chunks
+        arrive and dropped from the retained chunks; the final Output's
+        artifact points at the sink's path. ``retention`` bounds the raw
+        events kept on chunks and the final Output (see `Retention`).
+        """
         self._sse_iterator = sse_iterator
+        self._sink = sink
+        self._retention = retention
         self._chunks: list[Chunk] = []
+        self._aggregate = StreamAggregate(keep_events=retention is Retention.FULL)
         self._closed = False
         self._output: Out | None = None
         self._parameters = parameters
         self._transform_output = transform_output
         self._stream_metadata = stream_metadata or {}
-        # Sync iteration state (portal lifecycle managed by __iter__ generator)
+        # Sync iteration state (lifecycle managed by __iter__ generator)
         self._sync_generator: Iterator[Chunk] | None = None
 
     def _build_error_from_value(self, error: Any) -> dict[str, Any]:  # noqa: ANN401
@@ -124,6 +218,12 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
         """Wrap raw content into chunk content type. Override for type transformation."""
         return raw_content
 
+    def _chunk_metadata(self, event: dict[str, Any]) -> dict[str, Any]:
+        """Chunk metadata for ``event`` under the stream's retention policy."""
+        if self._retention is Retention.NONE:
+            return {}
+        return {"event_data": event}
+
     def _parse_chunk(self, event: dict[str, Any]) -> Chunk | None:
         """Parse SSE event into Chunk (returns None to filter lifecycle events)."""
         error = self._parse_stream_error(event)
@@ -152,18 +252,28 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
             if content is not None
             else self._empty_content
         )
-        kwargs: dict[str, Any] = {}
+        fields: dict[str, Any] = {
+            "content": content,
+            "finish_reason": finish_reason,
+            "usage": usage,
+            "metadata": self._chunk_metadata(event),
+        }
         if reasoning is not None:
-            kwargs["reasoning"] = reasoning
+            fields["reasoning"] = reasoning
         if tool_activity is not None:
-            kwargs["tool_activity"] = tool_activity
-        return self._chunk_class(  # type: ignore[return-value]
-            content=content,
-            finish_reason=finish_reason,
-            usage=usage,
-            metadata={"event_data": event},
-            **kwargs,
-        )
+            fields["tool_activity"] = tool_activity
+        return self._build_chunk(fields)
+
+    def _build_chunk(self, fields: dict[str, Any]) -> Chunk:
+        """Build a chunk from fields this stream already parsed and typed.
+
+        Chunks are built once per event, so validation is skipped (see
+        `trusted_constructor`): content comes from the provider parsers, and
+        usage and finish reason are validated by `_get_chunk_usage` /
+        `_get_chunk_finish_reason`. The result is the same model class with
+        the same fields and defaults as a validated chunk.
+        """
+        return trusted_constructor(self._chunk_class)(fields)  # type: ignore[return-value]
 
     @abstractmethod
     def _aggregate_content(self, chunks: list[Chunk]) -> Any:  # noqa: ANN401
@@ -178,6 +288,8 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
             if self._transform_output
             else raw_content
         )
+        if self._sink is not None and isinstance(content, Artifact):
+            content = self._sink.artifact(content)
         raw_events = self._aggregate_event_data(chunks)
         reasoning = self._aggregate_reasoning(chunks)
         signature = self._aggregate_signature(chunks, raw_events)
@@ -197,10 +309,13 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
             parameters.get("tools"),
         )
         metadata = self._build_stream_metadata(raw_events)
+        if self._retention is Retention.NONE:
+            metadata.pop("raw_events", None)
         raw_response = self._aggregate_raw_response(chunks, raw_events)
         usage: Usage | None = None
         if raw_response is not None:
-            metadata["raw_response"] = raw_response
+            if self._retention is not Retention.NONE:
+                metadata["raw_response"] = raw_response
             if (
                 isinstance(response_model := raw_response.get("model"), str)
                 and response_model
@@ -292,28 +407,23 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
         """Build metadata for streaming. Providers override to filter content."""
         return {**self._stream_metadata, "raw_events": raw_events}
 
+    def _aggregate_of(self, chunks: list[Chunk]) -> StreamAggregate:
+        """Running aggregate for this stream's chunks; a one-pass fold for any other list."""
+        if chunks is self._chunks:
+            return self._aggregate
+        return StreamAggregate.of(chunks)
+
     def _aggregate_usage(self, chunks: list[Chunk]) -> Usage:
         """Aggregate usage across chunks (last chunk with usage wins)."""
-        for chunk in reversed(chunks):
-            if chunk.usage:
-                return chunk.usage
-        return self._usage_class()
+        return self._aggregate_of(chunks).usage or self._usage_class()
 
     def _aggregate_finish_reason(self, chunks: list[Chunk]) -> FinishReason | None:
         """Aggregate finish reason across chunks (last chunk with finish_reason wins)."""
-        for chunk in reversed(chunks):
-            if chunk.finish_reason:
-                return chunk.finish_reason
-        return None
+        return self._aggregate_of(chunks).finish_reason
 
     def _aggregate_event_data(self, chunks: list[Chunk]) -> list[dict[str, Any]]:
-        """Collect raw event_data from chunk metadata."""
-        events: list[dict[str, Any]] = []
-        for chunk in chunks:
-            event_data = chunk.metadata.get("event_data")
-            if isinstance(event_data, dict):
-                events.append(event_data)
-        return events
+        """Collect the raw events retained under the stream's retention policy."""
+        return self._aggregate_of(chunks).retained_events()
 
     def __repr__(self) -> str:
         """Developer-friendly representation showing stream state."""
@@ -343,11 +453,17 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
             async for event in self._sse_iterator:
                 chunk = self._parse_chunk(event)
                 if chunk is not None:
-                    self._chunks.append(chunk)
+                    kept = chunk if self._sink is None else self._spill(chunk)
+                    if self._retention is Retention.LAST_EVENT and self._chunks:
+                        self._chunks[-1].metadata.pop("event_data", None)
+                    self._chunks.append(kept)
+                    self._aggregate.add(kept, kept.metadata.get("event_data", event))
                     return chunk
 
             # Stream exhausted naturally
             if self._chunks:
+                if self._sink is not None:
+                    self._sink.commit()
                 self._output = self._parse_output(self._chunks, **self._parameters)
             self._closed = True
         except Exception:
@@ -356,27 +472,40 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
 
         raise StopAsyncIteration
 
+    def _spill(self, chunk: Chunk) -> Chunk:
+        """Write binary chunk content to the sink; return the chunk without it."""
+        assert self._sink is not None
+        if not isinstance(chunk.content, bytes) or not chunk.content:
+            return chunk
+        self._sink.write(chunk.content)
+        metadata = dict(chunk.metadata)
+        event_data = metadata.get("event_data")
+        if isinstance(event_data, dict):
+            metadata["event_data"] = {
+                k: v for k, v in event_data.items() if not isinstance(v, bytes)
+            }
+        return chunk.model_copy(
+            update={"content": self._empty_content, "metadata": metadata}
+        )
+
     # Iterator protocol (sync)
     def __iter__(self) -> Iterator[Chunk]:
         """Sync iterator using a generator with try/finally for guaranteed cleanup.
 
-        Creates a blocking portal in a dedicated thread. The generator's finally
-        block ensures the portal is cleaned up on exhaustion, break, exception,
-        or garbage collection — unlike __next__ which only cleans up on exhaustion.
+        Each chunk is pulled on the shared background loop. The generator's finally
+        block closes the stream on exhaustion, break, exception, or garbage
+        collection — unlike __next__ which only cleans up on exhaustion.
         """
-        portal_cm = start_blocking_portal()
-        portal = portal_cm.__enter__()
         try:
             while True:
                 try:
-                    yield portal.call(self.__anext__)
+                    yield run_sync(self.__anext__)
                 except StopAsyncIteration:
                     return
         finally:
             if not self._closed:
                 with suppress(RuntimeError):
-                    portal.call(self.aclose)
-            portal_cm.__exit__(None, None, None)
+                    run_sync(self.aclose)
 
     # AsyncContextManager protocol
     async def __aenter__(self) -> Self:
@@ -404,7 +533,7 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit sync context. Portal cleanup is handled by __iter__ generator's finally."""
+        """Exit sync context. Stream cleanup is handled by __iter__ generator's finally."""
         return
 
     @property
@@ -414,22 +543,50 @@ class Stream[Out: Output, Params: Parameters, Chunk: ChunkBase](ABC):
             raise StreamNotExhaustedError()
         return self._output
 
+    def snapshot(self) -> Out | None:
+        """Partial Output for the chunks received so far, or None before the first.
+
+        Built from the running aggregate, so it is cheap to call after every
+        chunk. Content is not passed through the client's output transform,
+        tool calls are left out until the stream ends (their arguments are
+        incomplete JSON until then), and ``metadata["partial"]`` is True.
+        Once the stream is exhausted this is the final ``output``.
+        """
+        if self._output is not None:
+            return self._output
+        if not self._chunks:
+            return None
+        kwargs: dict[str, Any] = {}
+        reasoning = self._aggregate_reasoning(self._chunks)
+        if reasoning is not None:
+            kwargs["reasoning"] = reasoning
+        output = self._output_class(
+            content=self._aggregate_content(self._chunks),
+            usage=self._aggregate_usage(self._chunks),
+            finish_reason=self._aggregate_finish_reason(self._chunks),
+            metadata={**self._stream_metadata, "partial": True},
+            **kwargs,
+        )
+        return output  # type: ignore[return-value]
+
     async def aclose(self) -> None:
         """Explicitly close stream and cleanup resources."""
         if self._closed:
             return
 
         self._closed = True
+        if self._sink is not None:
+            self._sink.abort()
 
         # Fast path: skip if iterator is currently running
         if getattr(self._sse_iterator, "ag_running", False):
             return
 
-        # Close SSE iterator (httpx-sse connection)
+        # Close SSE iterator (and its HTTP connection)
         # Use suppress to handle TOCTOU race between ag_running check and aclose
         if hasattr(self._sse_iterator, "aclose"):
             with suppress(RuntimeError):
                 await self._sse_iterator.aclose()
 
 
-__all__ = ["Stream", "enrich_stream_errors"]
+__all__ = ["Stream", "StreamAggregate", "enrich_stream_errors"]
@@ -2,7 +2,6 @@
 
 import asyncio
 import contextvars
-import json
 import os
 import time
 from collections.abc import AsyncIterator, Iterator
@@ -10,14 +9,16 @@ from contextlib import contextmanager, suppress
 from types import TracebackType
 from typing import Any
 
-from anyio.from_thread import start_blocking_portal
+import httpx
 
+from celeste import codec
 from celeste.artifacts import Artifact
 from celeste.core import Modality, Protocol, Provider, UsageField
 from celeste.exceptions import StreamNotExhaustedError
 from celeste.io import Input, Output, Usage
 from celeste.messages import request_messages
 from celeste.models import Model
+from celeste.runner import run_sync
 from celeste.streaming import Stream
 from celeste.tools import ToolCall, ToolResult
 from celeste.types import (
@@ -112,6 +113,26 @@ _operation_duration_histogram: Any = meter.create_histogram(
     unit="s",
     description="Wall-clock duration of GenAI calls.",
 )
+_http_retry_counter: Any = meter.create_counter(
+    name="celeste.http.client.retries",
+    unit="{retry}",
+    description="HTTP retry decisions, sliced by reason and outcome.",
+)
+_rate_limit_wait_histogram: Any = meter.create_histogram(
+    name="celeste.rate_limit.wait",
+    unit="s",
+    description="Time requests spent queued by the client-side rate limiter.",
+)
+_rate_limit_queue_counter: Any = meter.create_up_down_counter(
+    name="celeste.rate_limit.queue_depth",
+    unit="{request}",
+    description="Requests currently queued by the client-side rate limiter.",
+)
+_cache_lookup_counter: Any = meter.create_counter(
+    name="celeste.cache.lookups",
+    unit="{lookup}",
+    description="Response cache lookups, sliced by hit or miss.",
+)
 
 
 def request_attributes(
@@ -227,6 +248,46 @@ def record_operation_duration(
     _operation_duration_histogram.record(duration_seconds, attributes=attrs)
 
 
+def record_retry(
+    url: str,
+    reason: str,
+    throttled: bool = False,
+) -> None:
+    """Record one ``celeste.http.client.retries`` observation.
+
+    Args:
+        url: Request URL; only the host is recorded.
+        reason: Status code or exception type that triggered the retry.
+        throttled: True when the retry budget suppressed the retry.
+    """
+    _http_retry_counter.add(
+        1,
+        attributes={
+            "server.address": httpx.URL(url).host,
+            "celeste.retry.reason": reason,
+            "celeste.retry.outcome": "throttled" if throttled else "retried",
+        },
+    )
+
+
+def record_rate_limit_wait(seconds: float, attributes: dict[str, Any]) -> None:
+    """Record one ``celeste.rate_limit.wait`` observation for a queued request."""
+    _rate_limit_wait_histogram.record(seconds, attributes=attributes)
+
+
+def record_rate_limit_queue(delta: int, attributes: dict[str, Any]) -> None:
+    """Adjust the ``celeste.rate_limit.queue_depth`` gauge by ``delta``."""
+    _rate_limit_queue_counter.add(delta, attributes=attributes)
+
+
+def record_cache_lookup(span: Any, hit: bool, attributes: dict[str, Any]) -> None:
+    """Mark ``span`` as a cache hit or miss and count the lookup."""
+    span.set_attribute("celeste.cache.hit", hit)
+    _cache_lookup_counter.add(
+        1, attributes={**attributes, "celeste.cache.outcome": "hit" if hit else "miss"}
+    )
+
+
 # Opt-in flag, read once at import (semconv-standard env name).
 _CAPTURE_CONTENT: bool = (
     os.environ.get("OTEL_INSTRUMENTATION_GENAI_CAPTURE_MESSAGE_CONTENT", "")
@@ -279,7 +340,7 @@ def _content_to_parts(content: Any) -> list[dict[str, Any]]:
         return [_artifact_part(content)]
     if isinstance(content, str):
         return [{"type": "text", "content": content}]
-    return [{"type": "text", "content": json.dumps(content, default=str)}]
+    return [{"type": "text", "content": codec.dumps_str(content, default=str)}]
 
 
 def _tool_call_part(tool_call: ToolCall) -> dict[str, Any]:
@@ -288,7 +349,7 @@ def _tool_call_part(tool_call: ToolCall) -> dict[str, Any]:
         "type": "tool_call",
         "id": tool_call.id,
         "name": tool_call.name,
-        "arguments": json.dumps(tool_call.arguments, default=str),
+        "arguments": codec.dumps_str(tool_call.arguments, default=str),
     }
 
 
@@ -336,7 +397,7 @@ def _input_messages_event(inputs: Input) -> dict[str, Any] | None:
             messages.append(_tool_result_to_dict(message))
     if not messages:
         return None
-    return {"messages": json.dumps(messages, default=str)}
+    return {"messages": codec.dumps_str(messages, default=str)}
 
 
 def _output_messages_event(output: Output[Any]) -> dict[str, Any] | None:
@@ -352,7 +413,9 @@ def _output_messages_event(output: Output[Any]) -> dict[str, Any] | None:
     if not parts:
         return None
     return {
-        "messages": json.dumps([{"role": "assistant", "parts": parts}], default=str)
+        "messages": codec.dumps_str(
+            [{"role": "assistant", "parts": parts}], default=str
+        )
     }
 
 
@@ -470,20 +533,17 @@ class _TracedStream:
         return False
 
     def __iter__(self) -> Iterator[Any]:
-        """Sync iterator using a blocking portal — drives this wrapper's __anext__."""
-        portal_cm = start_blocking_portal()
-        portal = portal_cm.__enter__()
+        """Sync iterator on the shared background loop — drives this wrapper's __anext__."""
         try:
             while True:
                 try:
-                    yield portal.call(self.__anext__)
+                    yield run_sync(self.__anext__)
                 except StopAsyncIteration:
                     return
         finally:
             if not self._ended:
                 with suppress(RuntimeError):
-                    portal.call(self.aclose)
-            portal_cm.__exit__(None, None, None)
+                    run_sync(self.aclose)
 
     def __enter__(self) -> "_TracedStream":
         """Enter sync context — delegate to inner Stream."""
@@ -573,8 +633,12 @@ __all__ = [
     "gen_ai_span",
     "meter",
     "output_attributes",
+    "record_cache_lookup",
     "record_operation_duration",
     "record_output",
+    "record_rate_limit_queue",
+    "record_rate_limit_wait",
+    "record_retry",
     "record_token_usage",
     "request_attributes",
     "span_name",
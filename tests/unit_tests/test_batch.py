@@ -0,0 +1,434 @@
+import asyncio
+import json
+from collections.abc import Callable, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from celeste import Model, create_client
+from celeste.auth import AuthHeader
+from celeste.batch import (
+    BatchJob,
+    BatchJobStatus,
+    BatchResult,
+    run_batch,
+    wait_for_batch,
+)
+from celeste.core import Modality, Operation, Provider
+from celeste.exceptions import BatchItemError, BatchNotSupportedError
+from celeste.modalities.text.providers.openai.client import OpenAITextClient
+from tests.unit_tests.conftest import anthropic_test_client
+
+
+async def test_bounded_concurrency_completion_order_and_errors() -> None:
+    in_flight = 0
+    peak = 0
+    pulled: list[int] = []
+
+    def items() -> Iterator[int]:
+        for item in range(10):
+            pulled.append(item)
+            yield item
+
+    async def call(item: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (10 - item))
+        in_flight -= 1
+        if item == 3:
+            raise ValueError("bad item")
+        return item * 2
+
+    results = [result async for result in run_batch(items(), call, concurrency=3)]
+
+    assert peak == 3
+    assert sorted(result.index for result in results) == list(range(10))
+    assert [result.index for result in results[:2]] != [0, 1]  # completion order
+    failed = next(result for result in results if not result.ok)
+    assert failed.index == 3
+    with pytest.raises(ValueError, match="bad item"):
+        failed.unwrap()
+    assert {r.index: r.unwrap() for r in results if r.ok}[9] == 18
+    assert len(pulled) == 10
+
+
+async def test_closing_early_cancels_in_flight_calls() -> None:
+    cancelled = 0
+
+    async def call(item: int) -> int:
+        nonlocal cancelled
+        if item == 0:
+            return item
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return item
+
+    batch = run_batch(range(100), call, concurrency=4)
+    first = await anext(batch)
+    await batch.aclose()
+
+    assert first == BatchResult(index=0, output=0)
+    assert cancelled == 3  # items 1-3 were running; item 4 never started
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_rejects_non_positive_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        await anext(run_batch([1], AsyncMock(), concurrency=0))
+
+
+async def test_text_batch_generate_goes_through_predict() -> None:
+    client = anthropic_test_client()
+
+    def respond(url: str, **kwargs: object) -> httpx.Response:
+        body = json.loads(kwargs["content"])  # type: ignore[arg-type]
+        prompt = body["messages"][0]["content"][0]["text"]
+        request = httpx.Request("POST", url)
+        if prompt == "fail":
+            return httpx.Response(
+                400, json={"error": {"message": "bad request"}}, request=request
+            )
+        return httpx.Response(
+            200,
+            json={
+                "content": [{"type": "text", "text": f"echo {prompt}"}],
+                "usage": {"input_tokens": 1, "output_tokens": 1},
+            },
+            request=request,
+        )
+
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(side_effect=respond)
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        results = [
+            result
+            async for result in client.batch.generate(
+                ["a", "fail", "b"], concurrency=2, max_tokens=5
+            )
+        ]
+
+    by_index = {result.index: result for result in results}
+    assert by_index[0].unwrap().content == "echo a"
+    assert by_index[2].unwrap().content == "echo b"
+    assert "bad request" in str(by_index[1].error)
+    assert json.loads(transport.post.call_args.kwargs["content"])["max_tokens"] == 5
+
+
+def _fake_server(
+    routes: dict[tuple[str, str], Callable[[httpx.Request], httpx.Response]],
+) -> httpx.AsyncClient:
+    """AsyncClient whose transport answers (method, path) routes in-process."""
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        return routes[request.method, request.url.path](request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handle))
+
+
+def _model(model_id: str, provider: Provider, modality: Modality) -> Model:
+    operation = (
+        Operation.EMBED if modality is Modality.EMBEDDINGS else Operation.GENERATE
+    )
+    return Model(
+        id=model_id,
+        provider=provider,
+        display_name=model_id,
+        operations={modality: {operation}},
+    )
+
+
+async def test_openai_batch_job_uploads_jsonl_and_parses_outputs() -> None:
+    client = OpenAITextClient(
+        model=_model("gpt-test", Provider.OPENAI, Modality.TEXT),
+        provider=Provider.OPENAI,
+        auth=AuthHeader(secret=SecretStr("test")),
+    )
+    uploaded: list[dict[str, Any]] = []
+
+    def upload(request: httpx.Request) -> httpx.Response:
+        body = request.content.split(b"\r\n\r\n", 2)[2].rsplit(b"\r\n--", 2)[0]
+        uploaded.extend(json.loads(line) for line in body.decode().splitlines())
+        return httpx.Response(200, json={"id": "file-in"})
+
+    def create(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content) == {
+            "input_file_id": "file-in",
+            "endpoint": "/v1/responses",
+            "completion_window": "24h",
+        }
+        return httpx.Response(200, json={"id": "batch_1", "status": "validating"})
+
+    def output(request: httpx.Request) -> httpx.Response:
+        lines = [
+            {
+                "custom_id": line["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "output": [
+                            {
+                                "type": "message",
+                                "content": [
+                                    {
+                                        "type": "output_text",
+                                        "text": f"echo {line['body']['input'][0]['content']}",
+                                    }
+                                ],
+                            }
+                        ],
+                        "usage": {"input_tokens": 2, "output_tokens": 3},
+                    },
+                },
+                "error": None,
+            }
+            for line in uploaded[::2]
+        ]
+        return httpx.Response(200, text="\n".join(json.dumps(x) for x in lines))
+
+    def errors(request: httpx.Request) -> httpx.Response:
+        record = {
+            "custom_id": uploaded[1]["custom_id"],
+            "response": {
+                "status_code": 400,
+                "body": {"error": {"message": "bad prompt"}},
+            },
+            "error": None,
+        }
+        return httpx.Response(200, text=json.dumps(record))
+
+    server = _fake_server(
+        {
+            ("POST", "/v1/files"): upload,
+            ("POST", "/v1/batches"): create,
+            ("GET", "/v1/batches/batch_1"): lambda _: httpx.Response(
+                200,
+                json={
+                    "id": "batch_1",
+                    "status": "completed",
+                    "output_file_id": "file-out",
+                    "error_file_id": "file-err",
+                },
+            ),
+            ("GET", "/v1/files/file-out/content"): output,
+            ("GET", "/v1/files/file-err/content"): errors,
+        }
+    )
+    with patch("celeste.http.httpx.AsyncClient", return_value=server):
+        job = await client.batch.submit(["a", "b", "c"], max_tokens=7)
+        assert job.status is BatchJobStatus.PENDING
+        job = await client.batch.wait(job, poll_interval=0)
+        results = await client.batch.results(
+            BatchJob.model_validate_json(job.model_dump_json())
+        )
+
+    assert [line["url"] for line in uploaded] == ["/v1/responses"] * 3
+    assert uploaded[0]["body"]["max_output_tokens"] == 7
+    assert uploaded[0]["body"]["model"] == "gpt-test"
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].unwrap().content == "echo a"
+    assert results[0].unwrap().usage.output_tokens == 3
+    assert results[2].unwrap().content == "echo c"
+    assert isinstance(results[1].error, BatchItemError)
+    assert "bad prompt" in str(results[1].error)
+
+
+async def test_anthropic_batch_job_round_trip() -> None:
+    client = anthropic_test_client()
+    submitted: list[dict[str, Any]] = []
+
+    def create(request: httpx.Request) -> httpx.Response:
+        submitted.extend(json.loads(request.content)["requests"])
+        return httpx.Response(
+            200, json={"id": "msgbatch_1", "processing_status": "in_progress"}
+        )
+
+    def results(request: httpx.Request) -> httpx.Response:
+        first, second = submitted
+        lines = [
+            {
+                "custom_id": second["custom_id"],
+                "result": {
+                    "type": "errored",
+                    "error": {"type": "error", "error": {"message": "overloaded"}},
+                },
+            },
+            {
+                "custom_id": first["custom_id"],
+                "result": {
+                    "type": "succeeded",
+                    "message": {
+                        "content": [{"type": "text", "text": "hello"}],
+                        "usage": {"input_tokens": 1, "output_tokens": 1},
+                        "stop_reason": "end_turn",
+                    },
+                },
+            },
+        ]
+        return httpx.Response(200, text="\n".join(json.dumps(x) for x in lines))
+
+    server = _fake_server(
+        {
+            ("POST", "/v1/messages/batches"): create,
+            ("GET", "/v1/messages/batches/msgbatch_1"): lambda _: httpx.Response(
+                200,
+                json={
+                    "id": "msgbatch_1",
+                    "processing_status": "ended",
+                    "results_url": "https://api.anthropic.com/v1/messages/batches/msgbatch_1/results",
+                },
+            ),
+            ("GET", "/v1/messages/batches/msgbatch_1/results"): results,
+        }
+    )
+    with patch("celeste.http.httpx.AsyncClient", return_value=server):
+        job = await client.batch.submit(["hi", "there"])
+        with pytest.raises(ValueError, match="still running"):
+            await client.batch.results(job)
+        job = await client.batch.refresh(job)
+        outputs = await client.batch.results(job)
+
+    assert [r["custom_id"] for r in submitted] == ["item-0", "item-1"]
+    assert submitted[0]["params"]["model"] == "claude-opus-4-8"
+    assert "max_tokens" in submitted[0]["params"]
+    assert outputs[0].unwrap().content == "hello"
+    assert "overloaded" in str(outputs[1].error)
+
+
+async def test_gemini_batch_job_uses_generate_content_requests() -> None:
+    client = create_client(
+        modality=Modality.TEXT,
+        provider=Provider.GOOGLE,
+        model=_model("gemini-test", Provider.GOOGLE, Modality.TEXT),
+        api_key="test",
+    )
+    submitted: list[dict[str, Any]] = []
+
+    def create(request: httpx.Request) -> httpx.Response:
+        batch = json.loads(request.content)["batch"]
+        submitted.extend(batch["input_config"]["requests"]["requests"])
+        return httpx.Response(
+            200,
+            json={"name": "batches/1", "metadata": {"state": "BATCH_STATE_PENDING"}},
+        )
+
+    def get(request: httpx.Request) -> httpx.Response:
+        responses = [
+            {
+                "metadata": item["metadata"],
+                "response": {
+                    "candidates": [
+                        {
+                            "content": {"parts": [{"text": "ok"}]},
+                            "finishReason": "STOP",
+                        }
+                    ],
+                    "usageMetadata": {"promptTokenCount": 4},
+                },
+            }
+            for item in submitted
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "name": "batches/1",
+                "done": True,
+                "metadata": {"state": "BATCH_STATE_SUCCEEDED"},
+                "response": {
+                    "inlinedResponses": {"inlinedResponses": responses},
+                },
+            },
+        )
+
+    server = _fake_server(
+        {
+            ("POST", "/v1beta/models/gemini-test:batchGenerateContent"): create,
+            ("GET", "/v1beta/batches/1"): get,
+        }
+    )
+    with patch("celeste.http.httpx.AsyncClient", return_value=server):
+        job = await client.batch.submit(["x", "y"])
+        job = await client.batch.wait(job, poll_interval=0)
+        results = await client.batch.results(job)
+
+    assert submitted[1]["request"]["contents"][0]["parts"] == [{"text": "y"}]
+    assert job.status is BatchJobStatus.COMPLETED
+    assert [r.unwrap().content for r in results] == ["ok", "ok"]
+    assert results[0].unwrap().usage.input_tokens == 4
+
+
+async def test_embeddings_batch_results_match_embed_shape() -> None:
+    client = create_client(
+        modality=Modality.EMBEDDINGS,
+        provider=Provider.GOOGLE,
+        model=_model("embed-test", Provider.GOOGLE, Modality.EMBEDDINGS),
+        api_key="test",
+    )
+    submitted: list[dict[str, Any]] = []
+
+    def create(request: httpx.Request) -> httpx.Response:
+        batch = json.loads(request.content)["batch"]
+        submitted.extend(batch["input_config"]["requests"]["requests"])
+        return httpx.Response(
+            200,
+            json={"name": "batches/2", "metadata": {"state": "BATCH_STATE_PENDING"}},
+        )
+
+    def get(request: httpx.Request) -> httpx.Response:
+        responses = [
+            {
+                "metadata": item["metadata"],
+                "response": {"embedding": {"values": [1.0, 2.0]}},
+            }
+            for item in submitted
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "name": "batches/2",
+                "done": True,
+                "metadata": {"state": "BATCH_STATE_SUCCEEDED"},
+                "response": {
+                    "inlinedEmbedContentResponses": {"inlinedResponses": responses},
+                },
+            },
+        )
+
+    server = _fake_server(
+        {
+            ("POST", "/v1beta/models/embed-test:asyncBatchEmbedContent"): create,
+            ("GET", "/v1beta/batches/2"): get,
+        }
+    )
+    with patch("celeste.http.httpx.AsyncClient", return_value=server):
+        job = await client.batch.submit(["a", "b"])
+        job = await client.batch.wait(job, poll_interval=0)
+        results = await client.batch.results(job)
+        packed = await client.batch.results(job, float32=True)
+
+    assert [r.unwrap().content for r in results] == [[1.0, 2.0], [1.0, 2.0]]
+    assert packed[0].unwrap().content.shape == (2,)
+    assert packed[0].unwrap().content.tolist() == [1.0, 2.0]
+
+
+async def test_batch_jobs_unsupported_and_timeouts() -> None:
+    client = create_client(
+        modality=Modality.TEXT,
+        provider=Provider.MISTRAL,
+        model=_model("mistral-test", Provider.MISTRAL, Modality.TEXT),
+        api_key="test",
+    )
+    with pytest.raises(BatchNotSupportedError):
+        await client.batch.submit(["a"])
+
+    running = BatchJob(id="j", status=BatchJobStatus.RUNNING, size=1)
+    refresh = AsyncMock(return_value=running)
+    with pytest.raises(TimeoutError):
+        await wait_for_batch(running, refresh, poll_interval=0.01, timeout=0.05)
+    assert refresh.await_count >= 1
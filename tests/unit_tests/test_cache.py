@@ -0,0 +1,127 @@
+"""Unit tests for the exact-match response cache (no network)."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader, NumberDataPoint
+
+from celeste import telemetry
+from celeste.cache import DiskCache, MemoryCache, SQLiteCache, response_cache_key
+from celeste.core import Provider
+from tests.unit_tests.conftest import anthropic_test_client
+
+
+def _message_response(text: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "content": [{"type": "text", "text": text}],
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        },
+        request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"),
+    )
+
+
+def test_key_is_canonical() -> None:
+    key = response_cache_key(
+        target=Provider.OPENAI, model_id="m", request_body={"a": 1, "b": [b"x"]}
+    )
+
+    assert key == response_cache_key(
+        target=Provider.OPENAI, model_id="m", request_body={"b": [b"x"], "a": 1}
+    )
+    assert key != response_cache_key(
+        target=Provider.OPENAI, model_id="other", request_body={"a": 1, "b": [b"x"]}
+    )
+    assert key != response_cache_key(
+        target=Provider.OPENAI,
+        model_id="m",
+        request_body={"a": 1, "b": [b"x"]},
+        endpoint="/v1/other",
+    )
+
+
+async def test_identical_requests_are_served_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("celeste-test")
+    monkeypatch.setattr(
+        telemetry,
+        "_cache_lookup_counter",
+        meter.create_counter(name="celeste.cache.lookups", unit="{lookup}"),
+    )
+    client = anthropic_test_client()
+    client.cache = MemoryCache()
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(
+        side_effect=[_message_response("first"), _message_response("second")]
+    )
+
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        miss = await client.generate("hello", temperature=0.0)
+        hit = await client.generate("hello", temperature=0.0)
+        other = await client.generate("hello", temperature=0.5)
+
+    assert transport.post.await_count == 2
+    assert (miss.content, hit.content, other.content) == ("first", "first", "second")
+    assert hit.usage.input_tokens == 1
+    assert (miss.metadata["cache_hit"], hit.metadata["cache_hit"]) == (False, True)
+    metrics = reader.get_metrics_data()
+    assert metrics is not None
+    points = metrics.resource_metrics[0].scope_metrics[0].metrics[0].data.data_points
+    outcomes = {}
+    for point in points:
+        assert isinstance(point, NumberDataPoint)
+        assert point.attributes is not None
+        outcomes[point.attributes["celeste.cache.outcome"]] = point.value
+    assert outcomes == {"hit": 1, "miss": 2}
+
+
+async def test_memory_cache_evicts_lru_and_expires() -> None:
+    cache = MemoryCache(max_entries=2, ttl=10)
+    await cache.set("a", {"v": 1})
+    await cache.set("b", {"v": 2})
+    assert await cache.get("a") == {"v": 1}
+    await cache.set("c", {"v": 3})
+
+    assert await cache.get("b") is None
+    assert len(cache) == 2
+    with patch("celeste.cache.time.time", return_value=1e12):
+        assert await cache.get("a") is None
+
+
+async def test_sqlite_cache_is_shared_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "responses.db"
+    await SQLiteCache(path).set("k", {"audio": b"\x00\xff", "n": [1, 2]})
+
+    cache = SQLiteCache(path, ttl=60)
+    assert await cache.get("k") == {"audio": b"\x00\xff", "n": [1, 2]}
+    await cache.set("expiring", {"v": 1})
+    with patch("celeste.cache.time.time", return_value=1e12):
+        assert await cache.get("expiring") is None
+    await cache.clear()
+    assert await cache.get("k") is None
+
+
+async def test_disk_cache_stores_artifacts_by_content(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    video = b"\x00" * 4096
+    await cache.set("first", {"video_bytes": video, "id": "1"})
+    await cache.set("second", {"video_bytes": video, "id": "2"})
+
+    assert await cache.get("second") == {"video_bytes": video, "id": "2"}
+    assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 1
+    assert await cache.get("missing") is None
+    await cache.clear()
+    assert await cache.get("first") is None
+
+
+def test_rejects_invalid_settings(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        MemoryCache(max_entries=0)
+    with pytest.raises(ValueError, match="ttl"):
+        DiskCache(tmp_path, ttl=0)
@@ -0,0 +1,98 @@
+"""Unit tests for the pluggable JSON codec."""
+
+import importlib.util
+import json
+import sys
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from celeste import codec
+from celeste.exceptions import MissingDependencyError
+from celeste.http import HTTPClient
+from celeste.sse import decode_json
+
+_DOCUMENT: dict[str, Any] = {"text": "héllo ✓", "n": [1, 2.5, None, True], "k": {}}
+_BACKENDS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            name != "json" and importlib.util.find_spec(name) is None,
+            reason=f"{name} not installed",
+        ),
+    )
+    for name in ["json", "msgspec", "orjson"]
+]
+
+
+@pytest.fixture(autouse=True)
+def _restore_codec() -> Iterator[None]:
+    previous = codec.get_codec()
+    yield
+    codec.set_codec(previous)
+
+
+@pytest.mark.parametrize("name", _BACKENDS)
+def test_backends_round_trip_compact_utf8(name: str) -> None:
+    codec.set_codec(name)
+    encoded = codec.dumps(_DOCUMENT)
+
+    assert codec.get_codec().name == name
+    assert json.loads(encoded) == _DOCUMENT
+    assert codec.loads(encoded) == codec.loads(encoded.decode()) == _DOCUMENT
+    assert b": " not in encoded and "✓".encode() in encoded
+    assert json.loads(codec.dumps({1: object()}, default=lambda _: "x")) == {"1": "x"}
+    with pytest.raises(ValueError):
+        codec.loads(b'{"truncated": ')
+
+
+def test_set_codec_rejects_unknown_and_missing_backends(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        codec.set_codec("ujson")
+    with pytest.raises(MissingDependencyError, match=r"celeste-ai\[orjson\]"):
+        codec.set_codec("orjson")
+
+
+class _RecordingCodec(codec.JSONCodec):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def dumps(self, obj: Any, default: codec.Default | None = None) -> bytes:  # noqa: ANN401
+        self.calls.append("dumps")
+        return super().dumps(obj, default)
+
+    def loads(self, data: bytes | str) -> Any:  # noqa: ANN401
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+async def test_requests_are_encoded_once_by_the_active_codec() -> None:
+    recording = _RecordingCodec()
+    codec.set_codec(recording)
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(
+        side_effect=[
+            httpx.Response(503, request=httpx.Request("POST", "https://x.test")),
+            httpx.Response(200, request=httpx.Request("POST", "https://x.test")),
+        ]
+    )
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        await HTTPClient().post(
+            "https://x.test", {"content-type": "application/json+x"}, {"a": 1}
+        )
+
+    assert recording.calls == ["dumps"]
+    sent = [c.kwargs for c in transport.post.call_args_list]
+    assert [c["content"] for c in sent] == [b'{"a":1}', b'{"a":1}']
+    assert sent[0]["headers"] == {"content-type": "application/json+x"}
+    assert decode_json(b"[1]") == [1]
+    assert recording.calls == ["dumps", "loads"]
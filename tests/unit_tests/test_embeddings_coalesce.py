@@ -0,0 +1,94 @@
+"""Unit tests for coalescing concurrent embed() calls (no network)."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from celeste import Model
+from celeste.auth import AuthHeader
+from celeste.core import Modality, Operation, Provider
+from celeste.modalities.embeddings.providers.google.client import GoogleEmbeddingsClient
+
+
+def _make_client() -> GoogleEmbeddingsClient:
+    return GoogleEmbeddingsClient(
+        model=Model(
+            id="embedding-test",
+            provider=Provider.GOOGLE,
+            display_name="Embedding test",
+            operations={Modality.EMBEDDINGS: {Operation.EMBED}},
+        ),
+        provider=Provider.GOOGLE,
+        auth=AuthHeader(secret=SecretStr("test"), header="x-goog-api-key", prefix=""),
+    )
+
+
+def _embed_responses(url: str, *, content: bytes, **_: object) -> httpx.Response:
+    body = json.loads(content)
+    requests = body.get("requests", [body])
+    return httpx.Response(
+        200,
+        json={
+            "embeddings": [
+                {"values": [float(request["content"]["parts"][0]["text"])]}
+                for request in requests
+            ]
+        },
+        request=httpx.Request("POST", url),
+    )
+
+
+async def test_concurrent_calls_share_batch_requests() -> None:
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(side_effect=_embed_responses)
+    embedder = _make_client().coalesce(max_delay=0.01, max_batch_size=100)
+
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        outputs = await asyncio.gather(
+            *(embedder.embed(str(i)) for i in range(250)),
+            embedder.embed("7", dimensions=8),
+        )
+
+    assert [output.content for output in outputs[:250]] == [
+        [float(i)] for i in range(250)
+    ]
+    assert outputs[250].content == [7.0]
+    sizes = sorted(
+        len(json.loads(c.kwargs["content"]).get("requests", [None]))
+        for c in transport.post.call_args_list
+    )
+    assert sizes == [1, 50, 100, 100]  # the dimensions=8 call is batched apart
+    assert "batchEmbedContents" in transport.post.call_args_list[0].args[0]
+    assert outputs[0].metadata["coalesced_batch_size"] == 100
+
+
+async def test_failed_request_fails_every_caller_in_batch() -> None:
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(
+        return_value=httpx.Response(
+            400,
+            json={"error": {"message": "bad input"}},
+            request=httpx.Request("POST", "https://example.test"),
+        )
+    )
+    embedder = _make_client().coalesce(max_delay=60)
+
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        calls = [asyncio.create_task(embedder.embed(text)) for text in "abc"]
+        await asyncio.sleep(0)
+        await embedder.flush()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert transport.post.await_count == 1
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+def test_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="max_batch_size"):
+        _make_client().coalesce(max_batch_size=0)
+    with pytest.raises(ValueError, match="max_delay"):
+        _make_client().coalesce(max_delay=-1)
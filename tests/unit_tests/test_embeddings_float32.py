@@ -0,0 +1,86 @@
+"""Unit tests for packed float32 embeddings output (no network)."""
+
+import json
+import warnings
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from celeste import Model
+from celeste.auth import AuthHeader
+from celeste.core import Modality, Operation, Provider
+from celeste.modalities.embeddings.io import EmbeddingsOutput
+from celeste.modalities.embeddings.providers.google.client import GoogleEmbeddingsClient
+from celeste.types import Float32Embeddings
+
+
+def _make_client() -> GoogleEmbeddingsClient:
+    return GoogleEmbeddingsClient(
+        model=Model(
+            id="embedding-test",
+            provider=Provider.GOOGLE,
+            display_name="Embedding test",
+            operations={Modality.EMBEDDINGS: {Operation.EMBED}},
+        ),
+        provider=Provider.GOOGLE,
+        auth=AuthHeader(secret=SecretStr("test"), header="x-goog-api-key", prefix=""),
+    )
+
+
+def _respond(url: str, *, content: bytes, **_: object) -> httpx.Response:
+    body: dict[str, Any]
+    if "requests" in json.loads(content):
+        body = {"embeddings": [{"values": [0.5, 1.5]}, {"values": [2.5, 3.5]}]}
+    else:
+        body = {"embedding": {"values": [0.25, 0.75]}}
+    return httpx.Response(200, json=body, request=httpx.Request("POST", url))
+
+
+def test_packs_vectors_contiguously() -> None:
+    packed = Float32Embeddings.from_vectors([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+
+    assert packed.shape == (3, 2)
+    assert packed.nbytes == 24
+    assert len(packed) == 3
+    assert packed.tolist() == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    assert packed[-1].tolist() == [5.0, 6.0]  # type: ignore[union-attr]
+    assert memoryview(packed).tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert Float32Embeddings.from_vectors([1.0, 2.0])[1] == 2.0
+    with pytest.raises(ValueError, match="same length"):
+        Float32Embeddings.from_vectors([[1.0], [1.0, 2.0]])
+
+
+def test_output_serializes_as_lists() -> None:
+    output = EmbeddingsOutput(content=Float32Embeddings.from_vectors([0.5, 0.25]))
+
+    assert json.loads(output.model_dump_json())["content"] == [0.5, 0.25]
+
+
+async def test_embed_float32_is_client_side_only() -> None:
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(side_effect=_respond)
+    client = _make_client()
+
+    with (
+        patch("celeste.http.httpx.AsyncClient", return_value=transport),
+        warnings.catch_warnings(),
+    ):
+        warnings.simplefilter("error")
+        single = await client.embed("a", float32=True)
+        batch = await client.embed(["a", "b"], float32=True)
+        plain = await client.embed("a")
+
+    assert isinstance(single.content, Float32Embeddings)
+    assert single.content.shape == (2,)
+    assert single.content.tolist() == [0.25, 0.75]
+    assert isinstance(batch.content, Float32Embeddings)
+    assert batch.content.shape == (2, 2)
+    assert batch.content.tolist() == [[0.5, 1.5], [2.5, 3.5]]
+    assert plain.content == [0.25, 0.75]
+    assert all(
+        "float32" not in json.loads(c.kwargs["content"])
+        for c in transport.post.call_args_list
+    )
@@ -0,0 +1,87 @@
+"""Unit tests for shared, non-blocking GoogleADC token refresh (no network)."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from celeste.providers.google import auth as adc
+from celeste.providers.google.auth import GoogleADC
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class _FakeCredentials:
+    """google-auth credentials whose refresh takes one slow round trip."""
+
+    def __init__(self) -> None:
+        self.token: str | None = None
+        self.expiry: datetime | None = None
+        self.refreshes = 0
+
+    @property
+    def valid(self) -> bool:
+        return self.token is not None and (self.expiry is None or self.expiry > _now())
+
+    def refresh(self, request: Any) -> None:  # noqa: ANN401
+        time.sleep(0.05)
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = _now() + timedelta(hours=1)
+
+
+@pytest.fixture
+def credentials(monkeypatch: pytest.MonkeyPatch) -> _FakeCredentials:
+    fake = _FakeCredentials()
+    google_auth = SimpleNamespace(default=MagicMock(return_value=(fake, "project")))
+    monkeypatch.setattr(
+        adc, "_google_auth", lambda: (google_auth, SimpleNamespace(Request=object))
+    )
+    monkeypatch.setattr(adc, "_token_sources", {})
+    return fake
+
+
+async def test_concurrent_refresh_is_single_flight_and_off_loop(
+    credentials: _FakeCredentials,
+) -> None:
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    first, second = GoogleADC(), GoogleADC(project_id="other")
+    ticking = asyncio.create_task(ticker())
+    await asyncio.gather(*(auth.ensure_valid() for auth in [first, second] * 5))
+    ticking.cancel()
+
+    assert credentials.refreshes == 1
+    assert ticks > 1  # the loop kept running during the refresh
+    assert first.get_headers()["Authorization"] == "Bearer token-1"
+    assert second.get_headers() == {
+        "Authorization": "Bearer token-1",
+        "x-goog-user-project": "other",
+    }
+
+
+def test_token_near_expiry_is_refreshed_in_background(
+    credentials: _FakeCredentials,
+) -> None:
+    auth = GoogleADC()
+    auth.get_headers()
+    credentials.expiry = _now() + timedelta(minutes=1)
+
+    assert auth.get_headers()["Authorization"] == "Bearer token-1"  # no wait
+    background = adc._token_source(auth.scopes)._background
+    assert background is not None
+    background.join()
+    assert credentials.refreshes == 2
+    assert auth.get_headers()["Authorization"] == "Bearer token-2"
@@ -1,5 +1,7 @@
+import asyncio
+import gc
+import json
 from collections.abc import AsyncIterator, Generator
-from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
@@ -8,14 +10,20 @@ import pytest
 
 import celeste.http as http_module
 from celeste.core import Modality, Provider
+from celeste.exceptions import MissingDependencyError
 from celeste.http import (
     DEFAULT_TIMEOUT,
     MAX_RETRIES,
+    ConnectionPools,
     HTTPClient,
+    HTTPConfig,
     clear_http_clients,
     close_all_http_clients,
+    configure_origin,
     get_http_client,
+    request_origin,
 )
+from celeste.retry import RetryPolicy
 
 
 @pytest.fixture
@@ -30,27 +38,30 @@ def transport() -> AsyncMock:
 @pytest.fixture(autouse=True)
 def isolated_registry() -> Generator[None]:
     previous = http_module._http_clients.copy()
+    previous_pools = http_module._shared_pools
     http_module._http_clients.clear()
+    http_module._shared_pools = ConnectionPools()
     yield
     http_module._http_clients.clear()
     http_module._http_clients.update(previous)
+    http_module._shared_pools = previous_pools
 
 
 async def test_client_is_lazy_reused_and_closed(transport: AsyncMock) -> None:
     client = HTTPClient(max_connections=7, max_keepalive_connections=3)
-    assert client._client is None
+    assert client._pools.open_pools() == 0
 
     with patch("celeste.http.httpx.AsyncClient", return_value=transport) as constructor:
         await client.post("https://example.com/one", {}, {})
         await client.post("https://example.com/two", {}, {})
-        created = client._client
+        created = await client._get_client("https://example.com/three")
         await client.aclose()
 
     assert constructor.call_count == 1
     limits = constructor.call_args.kwargs["limits"]
     assert (limits.max_connections, limits.max_keepalive_connections) == (7, 3)
     assert created is transport
-    assert client._client is None
+    assert client._pools.open_pools() == 0
     transport.aclose.assert_awaited_once()
 
 
@@ -69,8 +80,8 @@ async def test_request_methods_forward_arguments(
             )
             assert transport.post.call_args == call(
                 "https://example.com",
-                headers={"Authorization": "key"},
-                json={"prompt": "hello"},
+                headers={"Authorization": "key", "Content-Type": "application/json"},
+                content=b'{"prompt":"hello"}',
                 timeout=10,
             )
         elif operation == "post_multipart":
@@ -159,14 +170,101 @@ def test_registry_is_keyed_by_provider_and_modality() -> None:
     assert get_http_client(Provider.ANTHROPIC, Modality.TEXT) is not openai_text
 
 
+def test_get_http_client_installs_retry_policy() -> None:
+    policy = RetryPolicy(max_retries=5)
+    client = get_http_client(Provider.OPENAI, Modality.TEXT, retry_policy=policy)
+    assert client.retry_policy is policy
+    assert get_http_client(Provider.OPENAI, Modality.TEXT).retry_policy is policy
+
+
+def test_registry_gives_each_http_config_its_own_pool() -> None:
+    config = HTTPConfig(max_connections=100, keepalive_expiry=30)
+    default = get_http_client(Provider.OPENAI, Modality.TEXT)
+    tuned = get_http_client(Provider.OPENAI, Modality.TEXT, config=config)
+    assert tuned is not default
+    assert tuned.config is config
+    assert get_http_client(Provider.OPENAI, Modality.TEXT, config=config) is tuned
+
+
+async def test_http_config_sets_limits_and_phase_timeouts(
+    transport: AsyncMock,
+) -> None:
+    config = HTTPConfig(max_connections=50, keepalive_expiry=30, connect_timeout=2)
+    client = HTTPClient(config=config)
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport) as constructor:
+        await client.post("https://example.com", {}, {}, timeout=60)
+
+    limits = constructor.call_args.kwargs["limits"]
+    assert (limits.max_connections, limits.keepalive_expiry) == (50, 30)
+    assert "http2" not in constructor.call_args.kwargs
+    timeout = transport.post.call_args.kwargs["timeout"]
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (
+        2,
+        60,
+        60,
+        60,
+    )
+
+
+async def test_http2_requires_optional_dependency() -> None:
+    client = HTTPClient(config=HTTPConfig(http2=True))
+    with (
+        patch.dict("sys.modules", {"h2": None}),
+        pytest.raises(MissingDependencyError, match=r"celeste-ai\[http2\]"),
+    ):
+        await client.get("https://example.com")
+
+
+def test_request_origin_fills_default_ports() -> None:
+    assert request_origin("https://api.openai.com/v1/responses") == (
+        "https",
+        "api.openai.com",
+        443,
+    )
+    assert request_origin("http://localhost:11434/api/chat") == (
+        "http",
+        "localhost",
+        11434,
+    )
+
+
+async def test_shared_pools_are_keyed_by_origin() -> None:
+    text = get_http_client(Provider.OPENAI, Modality.TEXT)
+    images = get_http_client(Provider.OPENAI, Modality.IMAGES)
+    transports = [AsyncMock(spec=httpx.AsyncClient) for _ in range(3)]
+    with patch("celeste.http.httpx.AsyncClient", side_effect=transports) as constructor:
+        openai = await text._get_client("https://api.openai.com/v1/responses")
+        assert await images._get_client("https://api.openai.com/v1/images") is openai
+        local = await text._get_client("http://localhost:8000/v1/responses")
+        other = await text._get_client("http://localhost:9000/v1/responses")
+
+    assert [openai, local, other] == transports
+    assert constructor.call_count == 3
+
+
+async def test_configure_origin_overrides_client_config(transport: AsyncMock) -> None:
+    configure_origin(
+        "https://api.openai.com", HTTPConfig(max_connections=200, read_timeout=5)
+    )
+    client = get_http_client(Provider.OPENAI, Modality.TEXT)
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport) as constructor:
+        await client.post("https://api.openai.com/v1/responses", {}, {}, timeout=30)
+
+    assert constructor.call_args.kwargs["limits"].max_connections == 200
+    assert transport.post.call_args.kwargs["timeout"].read == 5
+
+
 async def test_close_all_continues_after_a_client_failure() -> None:
-    failing = get_http_client(Provider.OPENAI, Modality.TEXT)
-    healthy = get_http_client(Provider.ANTHROPIC, Modality.TEXT)
+    get_http_client(Provider.OPENAI, Modality.TEXT)
     failing_transport = AsyncMock(spec=httpx.AsyncClient)
     healthy_transport = AsyncMock(spec=httpx.AsyncClient)
     failing_transport.aclose.side_effect = RuntimeError("close failed")
-    failing._client = failing_transport
-    healthy._client = healthy_transport
+    with patch(
+        "celeste.http.httpx.AsyncClient",
+        side_effect=[failing_transport, healthy_transport],
+    ):
+        await http_module._shared_pools.get("https://one.example", HTTPConfig())
+        await http_module._shared_pools.get("https://two.example", HTTPConfig())
 
     await close_all_http_clients()
 
@@ -175,12 +273,48 @@ async def test_close_all_continues_after_a_client_failure() -> None:
     assert not http_module._http_clients
 
 
-def test_clear_registry_does_not_close_clients() -> None:
+async def test_registry_client_aclose_leaves_shared_pools_open(
+    transport: AsyncMock,
+) -> None:
     client = get_http_client(Provider.OPENAI, Modality.TEXT)
-    client._client = AsyncMock(spec=httpx.AsyncClient)
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        await client.get("https://example.com")
+    await client.aclose()
+    transport.aclose.assert_not_called()
+
+
+async def test_clear_registry_does_not_close_clients(transport: AsyncMock) -> None:
+    pools = http_module._shared_pools
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        await get_http_client(Provider.OPENAI, Modality.TEXT).get("https://a.example")
     clear_http_clients()
-    client._client.aclose.assert_not_called()
+    transport.aclose.assert_not_called()
     assert not http_module._http_clients
+    assert http_module._shared_pools is not pools
+
+
+def test_each_event_loop_keeps_its_pools_until_shutdown() -> None:
+    pools = ConnectionPools()
+    transports = [AsyncMock(spec=httpx.AsyncClient) for _ in range(2)]
+
+    async def use() -> httpx.AsyncClient:
+        first = await pools.get("https://example.com", HTTPConfig())
+        assert await pools.get("https://example.com/next", HTTPConfig()) is first
+        return first
+
+    with patch("celeste.http.httpx.AsyncClient", side_effect=transports):
+        with asyncio.Runner() as runner:
+            first = runner.run(use())
+            first.aclose.assert_not_called()
+            assert runner.run(use()) is first
+        first.aclose.assert_awaited_once()
+
+        second = asyncio.run(use())
+
+    assert second is transports[1]
+    second.aclose.assert_awaited_once()
+    gc.collect()
+    assert not pools._loops
 
 
 async def test_context_manager_closes_on_exception(transport: AsyncMock) -> None:
@@ -193,36 +327,31 @@ async def test_context_manager_closes_on_exception(transport: AsyncMock) -> None
             assert entered is client
             await client.post("https://example.com", {}, {})
             raise RuntimeError("boom")
-    assert client._client is None
+    assert client._pools.open_pools() == 0
     transport.aclose.assert_awaited_once()
 
 
-async def _iterate(items: list[Any]) -> AsyncIterator[Any]:
-    for item in items:
-        yield item
+class AsyncResponseContext:
+    def __init__(self, response: httpx.Response) -> None:
+        self.response = response
 
+    async def __aenter__(self) -> httpx.Response:
+        return self.response
 
-def _event_source(data: list[str], response: httpx.Response | None = None) -> MagicMock:
-    source = MagicMock()
-    source.response = response or httpx.Response(
-        200, request=httpx.Request("POST", "https://example.com")
-    )
-    source.aiter_sse.return_value = _iterate(
-        [SimpleNamespace(data=item) for item in data]
-    )
-    source.__aenter__ = AsyncMock(return_value=source)
-    source.__aexit__ = AsyncMock(return_value=False)
-    return source
+    async def __aexit__(self, *_args: object) -> None:
+        return None
 
 
 async def test_sse_stream_forwards_arguments_and_skips_control_messages(
     transport: AsyncMock,
 ) -> None:
-    source = _event_source(['{"delta": "hello"}', "[DONE]", '{"delta": "!"}'])
-    with (
-        patch("celeste.http.httpx.AsyncClient", return_value=transport),
-        patch("celeste.http.aconnect_sse", return_value=source) as connect,
-    ):
+    response = httpx.Response(
+        200,
+        content=b'data: {"delta": "hello"}\n\ndata: [DONE]\n\ndata: {"delta": "!"}\n\n',
+        request=httpx.Request("POST", "https://example.com"),
+    )
+    transport.stream = MagicMock(return_value=AsyncResponseContext(response))
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
         events = [
             event
             async for event in HTTPClient().stream_post(
@@ -234,25 +363,73 @@ async def test_sse_stream_forwards_arguments_and_skips_control_messages(
         ]
 
     assert events == [{"delta": "hello"}, {"delta": "!"}]
-    connect.assert_called_once_with(
-        transport,
+    transport.stream.assert_called_once_with(
         "POST",
         "https://example.com",
-        json={"stream": True},
-        headers={"Authorization": "key"},
+        content=b'{"stream":true}',
+        headers={
+            "Accept": "text/event-stream",
+            "Cache-Control": "no-store",
+            "Authorization": "key",
+            "Content-Type": "application/json",
+        },
         timeout=10,
     )
 
 
+class TrackedBody(httpx.AsyncByteStream):
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b'data: {"delta": "hello"}\n\n'
+        yield b'data: {"delta": "!"}\n\n'
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def test_sse_stream_closes_response_with_generator() -> None:
+    body = TrackedBody()
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, stream=body))
+    )
+    with patch("celeste.http.httpx.AsyncClient", return_value=client):
+        events = HTTPClient().stream_post("https://example.com", {}, {})
+        assert await anext(events) == {"delta": "hello"}
+        await events.aclose()
+
+    assert body.closed
+
+
+async def test_sse_events_keep_names_and_ids(transport: AsyncMock) -> None:
+    response = httpx.Response(
+        200,
+        content=b"event: delta\nid: 7\ndata: {}\n\n",
+        request=httpx.Request("POST", "https://example.com"),
+    )
+    transport.stream = MagicMock(return_value=AsyncResponseContext(response))
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        (event,) = [
+            event
+            async for event in HTTPClient().stream_events(
+                "https://example.com", {}, {}, last_event_id="6"
+            )
+        ]
+
+    assert (event.event, event.id, event.data) == ("delta", "7", b"{}")
+    assert transport.stream.call_args.kwargs["headers"]["Last-Event-ID"] == "6"
+
+
 async def test_sse_error_body_remains_readable(transport: AsyncMock) -> None:
     response = httpx.Response(
         401,
         content=b'{"error": {"message": "invalid key"}}',
         request=httpx.Request("POST", "https://example.com"),
     )
+    transport.stream = MagicMock(return_value=AsyncResponseContext(response))
     with (
         patch("celeste.http.httpx.AsyncClient", return_value=transport),
-        patch("celeste.http.aconnect_sse", return_value=_event_source([], response)),
         pytest.raises(httpx.HTTPStatusError) as error,
     ):
         async for _ in HTTPClient().stream_post("https://example.com", {}, {}):
@@ -260,17 +437,6 @@ async def test_sse_error_body_remains_readable(transport: AsyncMock) -> None:
     assert error.value.response.json()["error"]["message"] == "invalid key"
 
 
-class AsyncResponseContext:
-    def __init__(self, response: httpx.Response) -> None:
-        self.response = response
-
-    async def __aenter__(self) -> httpx.Response:
-        return self.response
-
-    async def __aexit__(self, *_args: object) -> None:
-        return None
-
-
 async def test_ndjson_stream_parses_nonempty_lines(transport: AsyncMock) -> None:
     response = httpx.Response(
         200,
@@ -288,6 +454,26 @@ async def test_ndjson_stream_parses_nonempty_lines(transport: AsyncMock) -> None
     assert events == [{"value": 1}, {"value": 2}]
 
 
+async def test_byte_stream_sends_encoded_body(transport: AsyncMock) -> None:
+    response = httpx.Response(
+        200,
+        content=b"audio-bytes",
+        request=httpx.Request("POST", "https://example.com"),
+    )
+    transport.stream = MagicMock(return_value=AsyncResponseContext(response))
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        chunks = [
+            chunk
+            async for chunk in HTTPClient().stream_bytes(
+                "https://example.com", {}, {"text": "hi"}
+            )
+        ]
+    assert b"".join(chunks) == b"audio-bytes"
+    kwargs = transport.stream.call_args.kwargs
+    assert "json" not in kwargs
+    assert json.loads(kwargs["content"]) == {"text": "hi"}
+
+
 async def test_ndjson_error_body_remains_readable(transport: AsyncMock) -> None:
     response = httpx.Response(
         403,
@@ -5,7 +5,15 @@ from unittest.mock import Mock, patch
 import pytest
 
 import celeste
-from celeste import Modality, Model, Operation, Protocol, Provider, create_client
+from celeste import (
+    Modality,
+    Model,
+    Operation,
+    Protocol,
+    Provider,
+    Retention,
+    create_client,
+)
 from celeste.auth import NoAuth
 from celeste.exceptions import ClientNotFoundError, ModelNotFoundError
 
@@ -132,6 +140,9 @@ def test_create_client_resolves_provider_client(text_model: Model) -> None:
         protocol=None,
         auth=auth,
         base_url=None,
+        http_config=None,
+        cache=None,
+        retention=Retention.FULL,
     )
 
 
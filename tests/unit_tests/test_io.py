@@ -1,6 +1,7 @@
-from typing import cast
+from typing import Any, cast
 
 import pytest
+from pydantic import BaseModel, PrivateAttr
 
 from celeste.artifacts import (
     AudioArtifact,
@@ -17,7 +18,12 @@ from celeste.constraints import (
     VideosConstraint,
 )
 from celeste.core import InputType
-from celeste.io import _extract_input_type, get_constraint_input_type
+from celeste.io import (
+    Chunk,
+    _extract_input_type,
+    get_constraint_input_type,
+    trusted_constructor,
+)
 
 
 @pytest.mark.parametrize(
@@ -48,3 +54,32 @@ def test_extract_input_type(annotation: type, expected: InputType | None) -> Non
 )
 def test_constraint_input_type(constraint: object, expected: InputType | None) -> None:
     assert get_constraint_input_type(constraint) == expected  # type: ignore[arg-type]
+
+
+class _Tagged(BaseModel):
+    value: int
+    tags: list[str] = []
+    _cache: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+
+@pytest.mark.parametrize(
+    ("model_class", "fields"),
+    [
+        (Chunk[str], {"content": "a", "metadata": {}}),
+        (Chunk[str], {"content": "a", "usage": None, "unknown": 1}),
+        (Chunk[str], {"finish_reason": None}),
+        (_Tagged, {"value": 1}),
+    ],
+)
+def test_trusted_constructor_matches_model_construct(
+    model_class: type[BaseModel], fields: dict[str, Any]
+) -> None:
+    model = trusted_constructor(model_class)(fields)
+    expected = model_class.model_construct(**fields)
+
+    assert type(model) is model_class
+    assert model.__dict__ == expected.__dict__
+    assert list(model.__dict__) == list(expected.__dict__)
+    assert model.model_fields_set == expected.model_fields_set
+    assert model.__pydantic_private__ == expected.__pydantic_private__
+    assert trusted_constructor(model_class) is trusted_constructor(model_class)
@@ -0,0 +1,230 @@
+"""Unit tests for detached job handles and job stores (no network)."""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from celeste import Modality, Operation, Provider, create_client
+from celeste.artifacts import ImageArtifact, VideoArtifact
+from celeste.exceptions import JobNotSupportedError
+from celeste.jobs import DirectoryJobStore, JobHandle, MemoryJobStore
+from celeste.modalities.images.client import ImagesClient
+from celeste.modalities.videos.client import VideosClient
+from celeste.polling import PollPolicy
+from celeste.providers.bfl.images import config as bfl_config
+from celeste.providers.xai.videos import config as xai_config
+
+_FAST = PollPolicy(interval=0.001, max_interval=0.004, jitter=0, max_rate=None)
+_POLLING_URL = "https://api.bfl.ai/v1/get_result?id=job-1"
+
+type Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def serve(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Callable[[Handler], list[httpx.Request]]]:
+    monkeypatch.setattr(bfl_config, "POLL_POLICY", _FAST)
+    monkeypatch.setattr(xai_config, "POLL_POLICY", _FAST)
+    requests: list[httpx.Request] = []
+    patcher = None
+
+    def install(handler: Handler) -> list[httpx.Request]:
+        nonlocal patcher
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        patcher = patch("celeste.http.httpx.AsyncClient", return_value=transport)
+        patcher.start()
+        return requests
+
+    yield install
+    if patcher is not None:
+        patcher.stop()
+
+
+def _bfl_client() -> ImagesClient:
+    return create_client(  # type: ignore[return-value]
+        Modality.IMAGES,
+        Operation.GENERATE,
+        provider=Provider.BFL,
+        model="flux-2-pro",
+        api_key="sk-secret",
+    )
+
+
+def _bfl(request: httpx.Request) -> httpx.Response:
+    if request.method == "POST":
+        return httpx.Response(
+            200, json={"id": "job-1", "polling_url": _POLLING_URL, "cost": 3}
+        )
+    return httpx.Response(
+        200,
+        json={"status": "Ready", "result": {"sample": "https://cdn.bfl.ai/1.png"}},
+    )
+
+
+async def test_submit_returns_handle_without_polling(
+    serve: Callable[[Handler], list[httpx.Request]],
+) -> None:
+    requests = serve(_bfl)
+
+    handle = await _bfl_client().submit.generate("A red fox")
+
+    assert [r.method for r in requests] == ["POST"]
+    assert handle.id == "job-1"
+    assert handle.poll_url == _POLLING_URL
+    assert (handle.provider, handle.model) == (Provider.BFL, "flux-2-pro")
+    assert handle.modality == Modality.IMAGES
+    assert "sk-secret" not in handle.model_dump_json()
+
+
+async def test_collect_in_another_client_parses_output(
+    serve: Callable[[Handler], list[httpx.Request]],
+    tmp_path: Path,
+) -> None:
+    serve(_bfl)
+    store = DirectoryJobStore(tmp_path)
+    handle = await _bfl_client().submit.generate("A red fox", store=store)
+
+    (pending,) = await DirectoryJobStore(tmp_path).pending()
+    output = await _bfl_client().collect(pending, store=store)
+
+    assert pending == handle
+    assert isinstance(output.content, ImageArtifact)
+    assert output.content.url == "https://cdn.bfl.ai/1.png"
+    assert output.usage.billed_units == 3
+    assert await store.pending() == []
+
+
+async def test_collect_reuses_submit_parameters_from_store(
+    serve: Callable[[Handler], list[httpx.Request]],
+    tmp_path: Path,
+) -> None:
+    serve(_bfl)
+    store = DirectoryJobStore(tmp_path)
+    await _bfl_client().submit.generate(
+        "A red fox",
+        store=store,
+        seed=7,
+        reference_images=[ImageArtifact(url="https://cdn.bfl.ai/ref.png")],
+    )
+    (pending,) = await DirectoryJobStore(tmp_path).pending()
+    client = _bfl_client()
+
+    with patch.object(
+        ImagesClient, "_transform_output", side_effect=lambda c, **p: c
+    ) as transform:
+        await client.collect(pending)
+        await client.collect(pending, seed=8)
+
+    assert pending.parameters == {"seed": 7}
+    assert transform.call_args_list[0].kwargs == {"seed": 7}
+    assert transform.call_args_list[1].kwargs == {"seed": 8}
+
+
+async def test_failed_collect_keeps_handle_in_store(
+    serve: Callable[[Handler], list[httpx.Request]],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return _bfl(request)
+        return httpx.Response(200, json={"status": "Failed", "error": "nsfw"})
+
+    serve(handler)
+    store = MemoryJobStore()
+    handle = await _bfl_client().submit.generate("A red fox", store=store)
+
+    with pytest.raises(ValueError, match="nsfw"):
+        await _bfl_client().collect(handle, store=store)
+
+    assert await store.get(handle.id) == handle
+
+
+async def test_collect_rejects_handle_from_another_model(
+    serve: Callable[[Handler], list[httpx.Request]],
+) -> None:
+    serve(_bfl)
+    handle = await _bfl_client().submit.generate("A red fox")
+    other = handle.model_copy(update={"model": "flux-2-flex"})
+
+    with pytest.raises(ValueError, match="flux-2-flex"):
+        await _bfl_client().collect(other)
+
+
+async def test_video_job_collects_to_sink(
+    serve: Callable[[Handler], list[httpx.Request]],
+    tmp_path: Path,
+) -> None:
+    video = b"\x00\x00\x00\x18ftypmp42" * 64
+    polls = iter([202, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/videos/generations":
+            return httpx.Response(200, json={"request_id": "req-1"})
+        if request.url.path == "/v1/videos/req-1":
+            if next(polls) == 202:
+                return httpx.Response(202, json={})
+            return httpx.Response(
+                200, json={"video": {"url": "https://cdn.x.ai/req-1.mp4"}}
+            )
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, content=video)
+
+    serve(handler)
+    client: VideosClient = create_client(  # type: ignore[assignment]
+        Modality.VIDEOS,
+        Operation.GENERATE,
+        provider=Provider.XAI,
+        model="grok-imagine-video",
+        api_key="k",
+    )
+    handle = JobHandle.model_validate_json(
+        (await client.submit.generate("A cat")).model_dump_json()
+    )
+
+    output = await client.collect(handle, sink=tmp_path / "cat.mp4")
+
+    assert isinstance(output.content, VideoArtifact)
+    assert output.content.path == str(tmp_path / "cat.mp4")
+    assert (tmp_path / "cat.mp4").read_bytes() == video
+
+
+async def test_inline_providers_reject_submit() -> None:
+    client: ImagesClient = create_client(  # type: ignore[assignment]
+        Modality.IMAGES,
+        Operation.GENERATE,
+        provider=Provider.OPENAI,
+        model="gpt-image-1",
+        api_key="k",
+    )
+
+    with pytest.raises(JobNotSupportedError):
+        await client.submit.generate("A red fox")
+
+
+async def test_directory_store_round_trips_handles(tmp_path: Path) -> None:
+    handle = JobHandle(
+        id="models/veo/operations/abc",
+        provider=Provider.GOOGLE,
+        model="veo-3.0-generate-001",
+        modality=Modality.VIDEOS,
+        poll_url="https://example.com/op",
+        data={"nested": {"a": [1, 2]}},
+    )
+
+    store = DirectoryJobStore(tmp_path)
+
+    await store.save(handle)
+
+    assert await store.get(handle.id) == handle
+    assert [path.parent for path in tmp_path.iterdir()] == [tmp_path]
+    await store.delete(handle.id)
+    assert await store.get(handle.id) is None
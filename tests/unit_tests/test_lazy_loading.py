@@ -0,0 +1,77 @@
+"""Unit tests for lazy provider client and model catalog loading."""
+
+import subprocess
+import sys
+
+from celeste.lazy import LazyMapping
+
+
+def _loaded_after(code: str) -> set[str]:
+    """Celeste provider modules imported after running ``code`` in a fresh interpreter."""
+    script = f"""
+import sys
+{code}
+print("\\n".join(m for m in sys.modules if m.startswith("celeste.modalities.")))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return {
+        module
+        for module in result.stdout.split()
+        if ".providers." in module and module.endswith((".client", ".models"))
+    }
+
+
+def test_import_loads_no_provider_clients_or_catalogs() -> None:
+    assert _loaded_after("import celeste") == set()
+
+
+def test_import_does_not_load_numpy() -> None:
+    script = "import sys\nimport celeste\nprint('numpy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_first_use_loads_only_that_provider() -> None:
+    loaded = _loaded_after(
+        "import celeste\n"
+        "celeste.create_client(celeste.Modality.TEXT, model='claude-opus-4-8',"
+        " provider=celeste.Provider.ANTHROPIC, api_key='key')"
+    )
+    assert loaded == {
+        "celeste.modalities.text.providers.anthropic.client",
+        "celeste.modalities.text.providers.anthropic.models",
+    }
+
+
+def test_lazy_mapping_imports_on_lookup() -> None:
+    mapping: LazyMapping[str, object] = LazyMapping(
+        {"dumps": "json:dumps", "loads": "json:loads"}
+    )
+
+    assert list(mapping) == ["dumps", "loads"]
+    assert not mapping.is_loaded("dumps")
+    assert mapping["dumps"].__name__ == "dumps"  # type: ignore[attr-defined]
+    assert mapping.is_loaded("dumps")
+    assert not mapping.copy().is_loaded("loads")
+
+
+def test_catalog_order_is_independent_of_load_order() -> None:
+    script = """
+import celeste
+{first}
+print(" ".join(f"{{m.provider}}/{{m.id}}" for m in celeste.list_models()))
+"""
+
+    def listed(first: str) -> str:
+        return subprocess.run(
+            [sys.executable, "-c", script.format(first=first)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    assert listed("celeste.list_models(provider=celeste.Provider.XAI)") == listed("")
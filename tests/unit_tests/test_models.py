@@ -1,13 +1,15 @@
 """Tests for model registration, lookup, and filtering."""
 
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 import celeste.models as models_module
 from celeste import Modality, Model, Operation, Provider
-from celeste.constraints import Str
+from celeste.constraints import Choice, Str, ToolSupport
 from celeste.models import get_model, list_models, register_models
+from celeste.tools import WebSearch
 
 
 def model(
@@ -28,7 +30,7 @@ def model(
 
 @pytest.fixture(autouse=True)
 def isolated_registry(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(models_module, "_models", {})
+    monkeypatch.setattr(models_module, "_catalog", models_module._ModelCatalog())
 
 
 @pytest.mark.parametrize(
@@ -119,3 +121,46 @@ def test_get_model_distinguishes_providers_and_warns_when_ambiguous() -> None:
     assert get_model("missing", Provider.OPENAI) is None
     with pytest.warns(UserWarning, match="found in multiple providers"):
         assert get_model("shared").provider is Provider.OPENAI  # type: ignore[union-attr]
+
+
+def test_indexes_follow_incremental_registration(populated_registry: None) -> None:
+    before = list_models(modality=Modality.EMBEDDINGS)
+    register_models(
+        model("text-openai"), modality=Modality.EMBEDDINGS, operation=Operation.EMBED
+    )
+
+    assert before == []
+    assert [m.id for m in list_models(operation=Operation.EMBED)] == ["text-openai"]
+    assert [m.id for m in list_models(provider=Provider.OPENAI)] == [
+        "text-openai",
+        "image-openai",
+    ]
+
+
+def test_snapshot_round_trip_preserves_models_and_order(
+    populated_registry: None, tmp_path: Path
+) -> None:
+    tools = model("tools-openai", modality=Modality.TEXT)
+    tools.parameter_constraints = {
+        "tools": ToolSupport(tools=[WebSearch]),
+        "effort": Choice(options=["low", "high"]),
+    }
+    register_models(tools)
+    expected = [m.model_dump(mode="json") for m in list_models()]
+
+    models_module.save_snapshot(tmp_path / "models.json")
+    models_module.clear()
+    models_module.load_snapshot(tmp_path / "models.json")
+
+    assert [m.model_dump(mode="json") for m in list_models()] == expected
+    restored = get_model("tools-openai", Provider.OPENAI)
+    assert restored is not None
+    assert restored.parameter_constraints["tools"].tools == [WebSearch]  # type: ignore[attr-defined]
+    assert restored.parameter_constraints["effort"]("high") == "high"
+
+
+def test_snapshot_rejects_unknown_version(tmp_path: Path) -> None:
+    (tmp_path / "models.json").write_text('{"version": 0, "models": []}')
+
+    with pytest.raises(ValueError, match="snapshot version"):
+        models_module.load_snapshot(tmp_path / "models.json")
@@ -0,0 +1,61 @@
+"""Unit tests for client reuse in the domain namespaces (no network)."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+import celeste
+from celeste import create_client
+from celeste.namespaces import domains
+
+
+@pytest.fixture(autouse=True)
+def empty_client_cache() -> Generator[None]:
+    celeste.namespaces.clear_client_cache()
+    yield
+    celeste.namespaces.clear_client_cache()
+
+
+@pytest.fixture
+def transport() -> Generator[AsyncMock]:
+    mock = AsyncMock(spec=httpx.AsyncClient)
+    mock.post = AsyncMock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "content": [{"type": "text", "text": "hi"}],
+                "usage": {"input_tokens": 1, "output_tokens": 1},
+            },
+            request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"),
+        )
+    )
+    with patch("celeste.http.httpx.AsyncClient", return_value=mock):
+        yield mock
+
+
+async def test_repeated_calls_reuse_one_client(transport: AsyncMock) -> None:
+    with patch.object(domains, "create_client", wraps=create_client) as factory:
+        for _ in range(3):
+            await celeste.text.generate(
+                "hello", model="claude-opus-4-8", api_key="key-a"
+            )
+        await celeste.text.generate("hello", model="claude-opus-4-8", api_key="key-b")
+
+    assert factory.call_count == 2  # one client per credential
+    assert transport.post.await_count == 4
+
+
+def test_cache_is_bounded() -> None:
+    cache = domains._ClientCache(max_size=2)
+    with patch.object(domains, "create_client", wraps=create_client) as factory:
+        for key in ("a", "b", "a", "c", "b"):
+            cache.get(
+                modality=celeste.Modality.TEXT,
+                operation=celeste.Operation.GENERATE,
+                model="claude-opus-4-8",
+                api_key=key,
+            )
+
+    assert factory.call_count == 4  # "b" was evicted by "c"
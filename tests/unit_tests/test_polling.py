@@ -0,0 +1,239 @@
+"""Unit tests for the shared long-running job poll scheduler (no network)."""
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from celeste import Modality, Operation, Provider, create_client
+from celeste.polling import PollPolicy, StatusBatch, poll_scheduler, poll_until_done
+from celeste.providers.byteplus.videos import config as byteplus_config
+
+_FAST = PollPolicy(interval=0.001, max_interval=0.004, jitter=0, max_rate=None)
+
+
+def _job(polls_needed: int, calls: Counter[str], job_id: str) -> Any:  # noqa: ANN401
+    async def fetch() -> dict[str, Any]:
+        calls[job_id] += 1
+        return {"id": job_id, "ready": calls[job_id] >= polls_needed}
+
+    return fetch
+
+
+def _ready(status: dict[str, Any]) -> bool:
+    if status.get("failed"):
+        raise ValueError("job failed")
+    return bool(status["ready"])
+
+
+async def test_jobs_resolve_through_the_scheduler() -> None:
+    calls: Counter[str] = Counter()
+    jobs = [
+        poll_until_done(
+            _job(3, calls, f"job-{index}"),
+            _ready,
+            job_id=f"job-{index}",
+            rate_key="provider",
+            policy=_FAST,
+        )
+        for index in range(200)
+    ]
+    results = await asyncio.gather(*jobs)
+
+    assert [r["id"] for r in results] == [f"job-{index}" for index in range(200)]
+    assert set(calls.values()) == {3}
+    assert poll_scheduler().pending == 0
+
+
+def test_backoff_grows_to_the_cap() -> None:
+    policy = PollPolicy(interval=1.0, max_interval=5.0, multiplier=2.0, jitter=0)
+
+    assert [policy.delay(polls) for polls in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+async def test_rate_cap_spaces_status_requests() -> None:
+    stamps: list[float] = []
+
+    async def fetch() -> dict[str, Any]:
+        stamps.append(time.monotonic())
+        return {"ready": True}
+
+    policy = PollPolicy(interval=0.001, max_rate=100.0)
+    await asyncio.gather(
+        *(
+            poll_until_done(
+                fetch, _ready, job_id=str(i), rate_key="capped", policy=policy
+            )
+            for i in range(10)
+        )
+    )
+
+    assert stamps[-1] - stamps[0] >= 9 / 100 * 0.9
+
+
+async def test_due_jobs_share_batch_requests() -> None:
+    batches: list[list[str]] = []
+    singles: list[str] = []
+
+    async def fetch_many(ids: list[str]) -> dict[str, dict[str, Any]]:
+        batches.append(ids)
+        return {job_id: {"ready": True} for job_id in ids if job_id != "missing"}
+
+    def single(job_id: str) -> Any:  # noqa: ANN401
+        async def fetch() -> dict[str, Any]:
+            singles.append(job_id)
+            return {"ready": True}
+
+        return fetch
+
+    ids = ["a", "b", "c", "missing"]
+    await asyncio.gather(
+        *(
+            poll_until_done(
+                single(job_id),
+                _ready,
+                job_id=job_id,
+                rate_key="batched",
+                policy=_FAST,
+                batch=StatusBatch("credential", fetch_many, max_size=2),
+            )
+            for job_id in ids
+        )
+    )
+
+    assert sorted(map(sorted, batches)) == [["a", "b"], ["c", "missing"]]
+    assert singles == ["missing"]
+
+
+async def test_lone_batched_job_uses_its_own_fetch() -> None:
+    batches: list[list[str]] = []
+    singles: list[str] = []
+
+    async def fetch_many(ids: list[str]) -> dict[str, dict[str, Any]]:
+        batches.append(ids)
+        return {job_id: {"ready": True} for job_id in ids}
+
+    async def fetch() -> dict[str, Any]:
+        singles.append("only")
+        return {"ready": True}
+
+    await poll_until_done(
+        fetch,
+        _ready,
+        job_id="only",
+        rate_key="batched",
+        policy=_FAST,
+        batch=StatusBatch("credential", fetch_many),
+    )
+
+    assert batches == []
+    assert singles == ["only"]
+
+
+async def test_failed_batch_request_falls_back_to_single_polls() -> None:
+    async def fetch_many(ids: list[str]) -> dict[str, dict[str, Any]]:
+        raise httpx.ConnectError("listing unavailable")
+
+    def single(job_id: str) -> Any:  # noqa: ANN401
+        async def fetch() -> dict[str, Any]:
+            if job_id == "broken":
+                raise httpx.ConnectError("status unavailable")
+            return {"id": job_id, "ready": True}
+
+        return fetch
+
+    batch = StatusBatch("credential", fetch_many)
+    results = await asyncio.gather(
+        *(
+            poll_until_done(
+                single(job_id),
+                _ready,
+                job_id=job_id,
+                rate_key="batched",
+                policy=_FAST,
+                batch=batch,
+            )
+            for job_id in ["a", "b", "broken"]
+        ),
+        return_exceptions=True,
+    )
+
+    assert [r["id"] for r in results[:2]] == ["a", "b"]  # type: ignore[index]
+    assert isinstance(results[2], httpx.ConnectError)
+
+
+async def test_failures_and_timeouts_reach_the_caller() -> None:
+    async def failed() -> dict[str, Any]:
+        return {"failed": True}
+
+    async def pending() -> dict[str, Any]:
+        return {"ready": False}
+
+    with pytest.raises(ValueError, match="job failed"):
+        await poll_until_done(failed, _ready, job_id="f", rate_key="p", policy=_FAST)
+    with pytest.raises(TimeoutError, match="p job slow polling timed out"):
+        await poll_until_done(
+            pending,
+            _ready,
+            job_id="slow",
+            rate_key="p",
+            policy=_FAST.model_copy(update={"timeout": 0.02}),
+        )
+
+
+@pytest.fixture
+def byteplus_tasks(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[httpx.Request]]:
+    policy = _FAST.model_copy(update={"initial_delay": 0.02})
+    monkeypatch.setattr(byteplus_config, "POLL_POLICY", policy)
+    requests: list[httpx.Request] = []
+    submitted = iter(range(100))
+
+    def task(task_id: str) -> dict[str, Any]:
+        return {
+            "id": task_id,
+            "status": "succeeded",
+            "content": {"video_url": f"https://cdn.example.com/{task_id}.mp4"},
+        }
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": f"task-{next(submitted)}"})
+        query = parse_qs(urlsplit(str(request.url)).query)
+        if "filter.task_ids" in query:
+            items = [task(task_id) for task_id in query["filter.task_ids"]]
+            return httpx.Response(200, json={"items": items, "total": len(items)})
+        return httpx.Response(200, json=task(request.url.path.rsplit("/", 1)[-1]))
+
+    transport = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        yield requests
+
+
+async def test_byteplus_jobs_poll_through_the_task_list(
+    byteplus_tasks: list[httpx.Request],
+) -> None:
+    client = create_client(
+        Modality.VIDEOS,
+        Operation.GENERATE,
+        provider=Provider.BYTEPLUS,
+        model="seedance-1-0-pro-250528",
+        api_key="k",
+    )
+
+    outputs = await asyncio.gather(*(client.generate(f"clip {i}") for i in range(5)))
+
+    assert sorted(o.content.url for o in outputs) == [  # type: ignore[union-attr]
+        f"https://cdn.example.com/task-{i}.mp4" for i in range(5)
+    ]
+    polls = [r for r in byteplus_tasks if r.method == "GET"]
+    assert len(polls) == 1
+    assert parse_qs(urlsplit(str(polls[0].url)).query)["filter.task_ids"] == [
+        f"task-{i}" for i in range(5)
+    ]
@@ -0,0 +1,160 @@
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from celeste.auth import AuthHeader
+from celeste.core import Provider
+from celeste.ratelimit import (
+    RateLimit,
+    RateLimiter,
+    RateLimitKey,
+    credential_fingerprint,
+    estimate_tokens,
+    rate_limiter,
+)
+from tests.unit_tests.conftest import anthropic_test_client
+
+KEY: RateLimitKey = (Provider.OPENAI, "gpt-test", "credential")
+
+
+@pytest.fixture(autouse=True)
+def reset_process_limiter() -> Generator[None]:
+    rate_limiter.reset()
+    yield
+    rate_limiter.reset()
+
+
+@pytest.fixture
+def sleep() -> Generator[AsyncMock]:
+    with patch("celeste.ratelimit.asyncio.sleep", new=AsyncMock()) as mock:
+        yield mock
+
+
+async def test_unlimited_keys_pass_through(sleep: AsyncMock) -> None:
+    limiter = RateLimiter()
+    for _ in range(100):
+        assert await limiter.acquire(KEY) == 0
+    sleep.assert_not_awaited()
+
+
+async def test_configured_request_limit_queues_excess_calls(sleep: AsyncMock) -> None:
+    limiter = RateLimiter()
+    limiter.configure(Provider.OPENAI, RateLimit(requests_per_minute=2))
+
+    assert await limiter.acquire(KEY) == 0
+    assert await limiter.acquire(KEY) == 0
+    waited = await limiter.acquire(KEY)
+
+    assert waited == pytest.approx(30, abs=0.5)
+    sleep.assert_awaited_once()
+    stats = limiter.stats(KEY)
+    assert (stats.acquired, stats.waited, stats.queue_depth) == (3, 1, 0)
+    assert stats.requests_per_minute == 2
+
+
+async def test_model_limits_override_provider_limits(sleep: AsyncMock) -> None:
+    limiter = RateLimiter()
+    limiter.configure(Provider.OPENAI, RateLimit(requests_per_minute=1))
+    limiter.configure(
+        Provider.OPENAI, RateLimit(requests_per_minute=600), model="gpt-test"
+    )
+    for _ in range(10):
+        assert await limiter.acquire(KEY) == 0
+
+
+async def test_token_limit_uses_request_size_estimate(sleep: AsyncMock) -> None:
+    limiter = RateLimiter()
+    limiter.configure(Provider.OPENAI, RateLimit(tokens_per_minute=600))
+    body = {"input": "x" * 400}
+
+    assert await limiter.acquire(KEY, body, max_tokens=400) == 0
+    assert await limiter.acquire(KEY, body, max_tokens=400) > 0
+
+
+async def test_exhausted_headers_block_until_reset(sleep: AsyncMock) -> None:
+    limiter = RateLimiter(learn_from_headers=True)
+    limiter.observe(
+        KEY,
+        httpx.Headers(
+            {
+                "x-ratelimit-limit-requests": "500",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "2s",
+            }
+        ),
+    )
+
+    assert await limiter.acquire(KEY) == pytest.approx(2.12, abs=0.1)
+    assert limiter.stats(KEY).requests_per_minute == 500
+
+
+def test_learning_is_opt_in() -> None:
+    limiter = RateLimiter()
+    limiter.observe(KEY, {"x-ratelimit-limit-requests": "10"})
+    assert limiter.stats(KEY).requests_per_minute is None
+
+
+def test_configured_limits_are_not_overwritten_by_headers() -> None:
+    limiter = RateLimiter(learn_from_headers=True)
+    limiter.configure(Provider.OPENAI, RateLimit(tokens_per_minute=1000))
+    limiter.observe(
+        KEY,
+        {"x-ratelimit-limit-tokens": "90000", "x-ratelimit-limit-requests": "10"},
+    )
+    stats = limiter.stats(KEY)
+    assert (stats.tokens_per_minute, stats.requests_per_minute) == (1000, None)
+
+
+def test_estimate_and_fingerprint() -> None:
+    assert estimate_tokens({"a": "b" * 40}, 10) == 10 + len("a" + "b" * 40) // 4
+    assert estimate_tokens(None, None) == 0
+    first = credential_fingerprint(AuthHeader(secret="one"))
+    assert first == credential_fingerprint(AuthHeader(secret="one"))
+    assert first != credential_fingerprint(AuthHeader(secret="two"))
+    assert "one" not in first
+
+
+def test_estimate_skips_inline_binary_payloads() -> None:
+    text = {"type": "text", "text": "describe " * 10}
+    base64 = "iVBORw0KGgo" * 10_000
+    parts = [
+        {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{base64}"}},
+        {"type": "image", "source": {"type": "base64", "data": base64}},
+        {"type": "input_audio", "input_audio": {"data": base64.encode()}},
+    ]
+
+    with_binary = estimate_tokens({"messages": [{"content": [text, *parts]}]})
+    assert with_binary < 100
+    assert with_binary > estimate_tokens({"messages": [{"content": [text]}]})
+
+
+async def test_predict_learns_limits_from_provider_response(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(rate_limiter, "learn_from_headers", True)
+    client = anthropic_test_client()
+    response = httpx.Response(
+        200,
+        json={
+            "content": [{"type": "text", "text": "hi"}],
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        },
+        headers={
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "49",
+            "anthropic-ratelimit-tokens-limit": "40000",
+            "anthropic-ratelimit-tokens-remaining": "39990",
+        },
+        request=httpx.Request("POST", "https://api.anthropic.com/v1/messages"),
+    )
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(return_value=response)
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        output = await client.generate("hello")
+
+    assert output.content == "hi"
+    stats = rate_limiter.stats(client._rate_limit_key())
+    assert (stats.requests_per_minute, stats.tokens_per_minute) == (50, 40000)
+    assert stats.acquired == 1
@@ -0,0 +1,139 @@
+"""Retention policies bound the raw events kept by chunks and outputs."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from celeste.modalities.text.protocols.chatcompletions import ChatCompletionsTextStream
+from celeste.modalities.text.providers.anthropic.client import AnthropicTextStream
+from celeste.retention import Retention, active_retention, retention_scope
+from tests.unit_tests.conftest import anthropic_test_client
+
+_EVENTS: list[dict[str, Any]] = [
+    {
+        "type": "message_start",
+        "message": {"id": "msg_01", "model": "claude", "usage": {"input_tokens": 9}},
+    },
+    {
+        "type": "content_block_start",
+        "index": 0,
+        "content_block": {"type": "tool_use", "id": "tu_1", "name": "weather"},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 0,
+        "delta": {"type": "input_json_delta", "partial_json": '{"city": "Oslo"}'},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "text_delta", "text": "Checking "},
+    },
+    {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "text_delta", "text": "now."},
+    },
+    {
+        "type": "message_delta",
+        "delta": {"stop_reason": "tool_use"},
+        "usage": {"output_tokens": 21},
+    },
+    {"type": "message_stop"},
+]
+
+_RESPONSE: dict[str, Any] = {
+    "id": "msg_02",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-opus-4-8",
+    "content": [{"type": "text", "text": "hi"}],
+    "stop_reason": "end_turn",
+    "usage": {"input_tokens": 3, "output_tokens": 1},
+}
+
+
+async def _async_iter(items: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for item in items:
+        yield item
+
+
+async def _drain(retention: Retention) -> AnthropicTextStream:
+    stream = AnthropicTextStream(_async_iter(_EVENTS), retention=retention)
+    async for _ in stream:
+        pass
+    return stream
+
+
+@pytest.mark.parametrize("retention", list(Retention))
+async def test_parsed_fields_do_not_depend_on_retention(retention: Retention) -> None:
+    output = (await _drain(retention)).output
+
+    assert output.content == "Checking now."
+    assert [(c.name, c.arguments) for c in output.tool_calls] == [
+        ("weather", {"city": "Oslo"})
+    ]
+    assert (output.usage.input_tokens, output.usage.output_tokens) == (9, 21)
+    assert output.finish_reason is not None
+    assert output.finish_reason.reason == "tool_use"
+
+
+async def test_last_event_keeps_only_the_newest_event() -> None:
+    stream = await _drain(Retention.LAST_EVENT)
+
+    assert [bool(chunk.metadata) for chunk in stream._chunks] == [False, False, True]
+    assert stream.output.metadata["raw_events"] == [
+        {"type": "message_start", "message": _EVENTS[0]["message"]},
+        _EVENTS[5],
+    ]
+    assert stream.output.metadata["raw_response"]["usage"] == {
+        "input_tokens": 9,
+        "output_tokens": 21,
+    }
+
+
+async def test_none_keeps_no_raw_payloads() -> None:
+    stream = await _drain(Retention.NONE)
+
+    assert all(chunk.metadata == {} for chunk in stream._chunks)
+    assert "raw_events" not in stream.output.metadata
+    assert "raw_response" not in stream.output.metadata
+
+
+async def test_full_keeps_every_event() -> None:
+    stream = ChatCompletionsTextStream(
+        _async_iter(
+            [
+                {
+                    "object": "chat.completion.chunk",
+                    "choices": [{"index": 0, "delta": {"content": part}}],
+                }
+                for part in ["a", "b", "c"]
+            ]
+        )
+    )
+    async for _ in stream:
+        pass
+
+    assert [
+        c.metadata["event_data"]["choices"][0]["delta"] for c in stream._chunks
+    ] == [
+        {"content": "a"},
+        {"content": "b"},
+        {"content": "c"},
+    ]
+
+
+def test_unary_metadata_follows_client_and_scope() -> None:
+    client = anthropic_test_client()
+    lean = client.model_copy(update={"retention": Retention.NONE})
+
+    assert "raw_response" in client._build_output(_RESPONSE).metadata
+    assert "raw_response" not in lean._build_output(_RESPONSE).metadata
+    with retention_scope("none"):
+        assert active_retention() is Retention.NONE
+        assert "raw_response" not in client._build_output(_RESPONSE).metadata
+    assert lean._build_output(_RESPONSE).metadata["response_model"] == (
+        "claude-opus-4-8"
+    )
@@ -0,0 +1,122 @@
+import time
+from email.utils import formatdate
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from celeste.http import HTTPClient
+from celeste.retry import (
+    RetryBudget,
+    RetryJitter,
+    RetryPolicy,
+    parse_duration,
+    server_retry_delay,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "seconds"),
+    [("1.5", 1.5), ("20ms", 0.02), ("6m0s", 360.0), ("1h2m", 3720.0), ("soon", None)],
+)
+def test_parse_duration(value: str, seconds: float | None) -> None:
+    assert parse_duration(value) == seconds
+
+
+@pytest.mark.parametrize(
+    ("status", "headers", "expected"),
+    [
+        (503, {"retry-after": "3"}, 3.0),
+        (429, {"retry-after-ms": "250"}, 0.25),
+        (
+            429,
+            {
+                "x-ratelimit-remaining-requests": "10",
+                "x-ratelimit-reset-requests": "1h",
+                "x-ratelimit-remaining-tokens": "0",
+                "x-ratelimit-reset-tokens": "2s",
+            },
+            2.0,
+        ),
+        (503, {"x-ratelimit-reset-tokens": "2s"}, None),
+        (500, {}, None),
+    ],
+)
+def test_server_retry_delay(
+    status: int, headers: dict[str, str], expected: float | None
+) -> None:
+    assert server_retry_delay(httpx.Response(status, headers=headers)) == expected
+
+
+def test_server_retry_delay_accepts_http_dates() -> None:
+    headers = {"retry-after": formatdate(time.time() + 30, usegmt=True)}
+    delay = server_retry_delay(httpx.Response(429, headers=headers))
+    assert delay is not None
+    assert 25 <= delay <= 30
+
+
+@pytest.mark.parametrize("jitter", list(RetryJitter))
+def test_backoff_stays_within_bounds(jitter: RetryJitter) -> None:
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=jitter)
+    previous = policy.base_delay
+    for attempt in range(10):
+        delay = policy.backoff(attempt, previous)
+        assert 0 <= delay <= 5.0
+        previous = delay
+    if jitter == RetryJitter.NONE:
+        assert policy.backoff(1, 1.0) == 2.0
+
+
+def test_next_delay_prefers_server_delay_and_gives_up_past_cap() -> None:
+    policy = RetryPolicy(max_retry_after=10)
+    assert (
+        policy.next_delay(0, 0.5, httpx.Response(429, headers={"retry-after": "4"}))
+        == 4
+    )
+    assert (
+        policy.next_delay(0, 0.5, httpx.Response(429, headers={"retry-after": "60"}))
+        is None
+    )
+    assert policy.next_delay(policy.max_retries, 0.5) is None
+
+
+def test_budget_throttles_below_half_and_refills_on_success() -> None:
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    budget.record_failure()
+    assert budget.allows_retry()
+    budget.record_failure()
+    assert not budget.allows_retry()
+    budget.record_success()
+    assert budget.allows_retry()
+
+
+async def test_client_sleeps_for_retry_after_header() -> None:
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(
+        side_effect=[
+            httpx.Response(429, headers={"retry-after": "7"}),
+            httpx.Response(200),
+        ]
+    )
+    sleep = AsyncMock()
+    with (
+        patch("celeste.http.httpx.AsyncClient", return_value=transport),
+        patch("celeste.http.asyncio.sleep", new=sleep),
+    ):
+        response = await HTTPClient().post("https://example.com", {}, {})
+    assert response.status_code == 200
+    sleep.assert_awaited_once_with(7.0)
+
+
+async def test_exhausted_budget_returns_response_without_retrying() -> None:
+    budget = RetryBudget(max_tokens=2)
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(return_value=httpx.Response(503))
+    client = HTTPClient(retry_policy=RetryPolicy(budget=budget))
+    with (
+        patch("celeste.http.httpx.AsyncClient", return_value=transport),
+        patch("celeste.http.asyncio.sleep", new=AsyncMock()),
+    ):
+        response = await client.post("https://example.com", {}, {})
+    assert response.status_code == 503
+    assert transport.post.call_count == 1
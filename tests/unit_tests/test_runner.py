@@ -0,0 +1,69 @@
+import asyncio
+import contextvars
+import threading
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from celeste.http import ConnectionPools, HTTPConfig
+from celeste.runner import run_sync, shutdown_sync_runner
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+async def _loop_identity() -> tuple[int, str]:
+    return id(asyncio.get_running_loop()), threading.current_thread().name
+
+
+def test_sync_calls_share_one_background_loop() -> None:
+    first = run_sync(_loop_identity)
+    second = run_sync(_loop_identity)
+    assert first == second
+    assert first[1] == "celeste-sync-runner"
+
+
+def test_sync_calls_reuse_the_connection_pool() -> None:
+    pools = ConnectionPools()
+
+    async def pool() -> httpx.AsyncClient:
+        return await pools.get("https://api.example.com/v1", HTTPConfig())
+
+    with patch(
+        "celeste.http.httpx.AsyncClient", side_effect=lambda **_: AsyncMock()
+    ) as constructor:
+        assert run_sync(pool) is run_sync(pool)
+    assert constructor.call_count == 1
+
+
+def test_caller_context_and_errors_propagate() -> None:
+    async def read() -> str:
+        return request_id.get()
+
+    async def fail(message: str) -> None:
+        raise ValueError(message)
+
+    token = request_id.set("abc")
+    try:
+        assert run_sync(read) == "abc"
+    finally:
+        request_id.reset(token)
+    with pytest.raises(ValueError, match="boom"):
+        run_sync(fail, "boom")
+
+
+async def test_rejects_calls_from_a_running_loop() -> None:
+    with pytest.raises(RuntimeError, match="await the async API"):
+        run_sync(_loop_identity)
+
+
+def test_shutdown_restarts_on_next_call() -> None:
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    before = run_sync(current_loop)
+    shutdown_sync_runner()
+    assert before.is_closed()
+    after = run_sync(current_loop)
+    assert after is not before
+    assert after.is_running()
@@ -0,0 +1,126 @@
+"""Unit tests for writing binary outputs to sinks (no network)."""
+
+import io
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from celeste import Modality, Operation, Provider, create_client
+from celeste.modalities.audio.client import AudioClient
+from celeste.providers.elevenlabs.text_to_speech.client import (
+    ElevenLabsTextToSpeechClient,
+)
+
+_AUDIO = [b"RIFF", b"-chunk-1", b"-chunk-2"]
+
+
+def _client(provider: Provider, model: str) -> AudioClient:
+    return create_client(  # type: ignore[return-value]
+        Modality.AUDIO, Operation.SPEAK, provider=provider, model=model, api_key="k"
+    )
+
+
+def _streamed(*, fail: bool = False) -> Any:  # noqa: ANN401
+    async def stream(
+        self: object, url: str, headers: object, json_body: object
+    ) -> AsyncIterator[dict[str, Any]]:
+        for index, data in enumerate(_AUDIO):
+            if fail and index == 2:
+                raise httpx.ReadError("connection lost")
+            yield {"data": data}
+
+    return patch.object(ElevenLabsTextToSpeechClient, "_stream_binary_audio", stream)
+
+
+@pytest.fixture
+def http_body() -> Iterator[list[httpx.Request]]:
+    requests: list[httpx.Request] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if b"fail" in request.content:
+            return httpx.Response(400, json={"error": {"message": "bad input"}})
+        if b"busy" in request.content and len(requests) == 1:
+            return httpx.Response(503, headers={"Retry-After": "2"})
+        return httpx.Response(200, content=b"".join(_AUDIO))
+
+    transport = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        yield requests
+
+
+async def test_streaming_model_writes_chunks_to_path(tmp_path: Path) -> None:
+    target = tmp_path / "speech.mp3"
+    client = _client(Provider.ELEVENLABS, "eleven_turbo_v2_5")
+
+    with _streamed():
+        output = await client.speak("Hello", sink=target)
+
+    assert target.read_bytes() == b"".join(_AUDIO)
+    assert output.content.data is None  # type: ignore[union-attr]
+    assert output.content.path == str(target)  # type: ignore[union-attr]
+    assert output.content.metadata["size"] == 20  # type: ignore[union-attr]
+
+
+async def test_stream_yields_chunks_but_retains_no_audio() -> None:
+    buffer = io.BytesIO()
+    client = _client(Provider.ELEVENLABS, "eleven_turbo_v2_5")
+
+    with _streamed():
+        stream = client.stream.speak("Hello", sink=buffer)
+        chunks = [chunk.content async for chunk in stream]
+
+    assert chunks == _AUDIO
+    assert buffer.getvalue() == b"".join(_AUDIO)
+    assert all(chunk.content == b"" for chunk in stream._inner._chunks)  # type: ignore[attr-defined]
+    assert stream.output.content.metadata["size"] == 20  # type: ignore[union-attr]
+    assert not buffer.closed
+
+
+async def test_failed_stream_leaves_no_partial_file(tmp_path: Path) -> None:
+    target = tmp_path / "speech.mp3"
+    client = _client(Provider.ELEVENLABS, "eleven_turbo_v2_5")
+
+    with _streamed(fail=True), pytest.raises(httpx.ReadError):
+        await client.speak("Hello", sink=target)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_unary_model_streams_response_body_to_sink(
+    tmp_path: Path, http_body: list[httpx.Request]
+) -> None:
+    target = tmp_path / "speech.mp3"
+    output = await _client(Provider.OPENAI, "tts-1").speak("Hello", sink=target)
+
+    assert target.read_bytes() == b"".join(_AUDIO)
+    assert output.content.path == str(target)  # type: ignore[union-attr]
+    assert "audio_sink" not in output.metadata
+    assert len(http_body) == 1
+
+
+async def test_unary_error_response_writes_nothing(
+    tmp_path: Path, http_body: list[httpx.Request]
+) -> None:
+    with pytest.raises(httpx.HTTPStatusError):
+        await _client(Provider.OPENAI, "tts-1").speak(
+            "fail", sink=tmp_path / "speech.mp3"
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_unary_sink_request_retries_transient_errors(
+    tmp_path: Path, http_body: list[httpx.Request]
+) -> None:
+    target = tmp_path / "speech.mp3"
+    with patch("celeste.http.asyncio.sleep", new=AsyncMock()) as sleep:
+        await _client(Provider.OPENAI, "tts-1").speak("busy", sink=target)
+
+    assert len(http_body) == 2
+    sleep.assert_awaited_once_with(2.0)
+    assert target.read_bytes() == b"".join(_AUDIO)
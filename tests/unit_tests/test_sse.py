@@ -0,0 +1,83 @@
+"""Unit tests for incremental SSE and NDJSON framing."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from celeste.sse import NDJSONDecoder, SSEDecoder, SSEEvent, aiter_ndjson, aiter_sse
+
+_STREAM = (
+    b"\xef\xbb\xbf: keep-alive\r\n\r\n"
+    b'event: message_start\r\nid: 1\r\ndata: {"a": 1}\r\n\r\n'
+    b"data: line one\ndata: line two\n\n"
+    b"retry: 3000\nid: 2\n\n"
+    b"event: ping\rdata:no-space\r\r"
+    b'data: {"done": true}'
+)
+
+
+def _fields(events: list[SSEEvent]) -> list[tuple[str, str | None, bytes]]:
+    return [(e.event, e.id, e.data) for e in events]
+
+
+def _decode(chunks: list[bytes]) -> list[SSEEvent]:
+    decoder = SSEDecoder()
+    events = [event for chunk in chunks for event in decoder.feed(chunk)]
+    return events + decoder.flush()
+
+
+_EXPECTED = [
+    ("message_start", "1", b'{"a": 1}'),
+    ("message", "1", b"line one\nline two"),
+    ("ping", "2", b"no-space"),
+    ("message", "2", b'{"done": true}'),
+]
+
+
+def test_sse_fields_and_line_endings() -> None:
+    assert _fields(_decode([_STREAM])) == _EXPECTED
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_sse_framing_is_independent_of_chunk_boundaries(size: int) -> None:
+    chunks = [_STREAM[i : i + size] for i in range(0, len(_STREAM), size)]
+
+    assert _fields(_decode(chunks)) == _EXPECTED
+
+
+def test_sse_strips_leading_bom_split_across_chunks() -> None:
+    body = b"\xef\xbb\xbfdata: first\n\n"
+
+    assert [e.data for e in _decode([body[:1], body[1:2], body[2:]])] == [b"first"]
+
+
+def test_sse_large_event_across_many_chunks() -> None:
+    payload = b"x" * 100_000
+    body = b"data: " + payload + b"\n\n"
+    chunks = [body[i : i + 1000] for i in range(0, len(body), 1000)]
+
+    (event,) = _decode(chunks)
+
+    assert event.data == payload
+
+
+def test_ndjson_lines_across_chunks() -> None:
+    body = b'{"a": 1}\n\n  {"b": 2}\r\n{"c": 3}'
+    decoder = NDJSONDecoder()
+
+    lines = [line for i in range(len(body)) for line in decoder.feed(body[i : i + 1])]
+
+    assert lines + decoder.flush() == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def test_async_helpers() -> None:
+    events = [e async for e in aiter_sse(_chunks(b"data: 1\n", b"\ndata: 2"))]
+    documents = [d async for d in aiter_ndjson(_chunks(b'{"a":', b" 1}\n[2]"))]
+
+    assert [e.data for e in events] == [b"1", b"2"]
+    assert documents == [{"a": 1}, [2]]
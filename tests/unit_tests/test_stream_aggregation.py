@@ -0,0 +1,164 @@
+"""Incremental stream aggregation, mid-stream snapshots and chunk construction."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from celeste.modalities.text.io import TextChunk, TextFinishReason, TextUsage
+from celeste.modalities.text.protocols.chatcompletions import ChatCompletionsTextStream
+from celeste.modalities.text.providers.anthropic.client import AnthropicTextStream
+
+
+async def _async_iter(items: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for item in items:
+        yield item
+
+
+def _completion_chunk(delta: dict[str, Any], **extra: Any) -> dict[str, Any]:  # noqa: ANN401
+    return {
+        "object": "chat.completion.chunk",
+        "choices": [{"index": 0, "delta": delta, **extra}],
+    }
+
+
+async def test_snapshot_tracks_content_as_chunks_arrive() -> None:
+    words = ["The ", "quick ", "brown ", "fox"]
+    events = [_completion_chunk({"content": word}) for word in words]
+    events.append(_completion_chunk({}, finish_reason="stop"))
+    stream = ChatCompletionsTextStream(_async_iter(events))
+
+    assert stream.snapshot() is None
+    seen: list[str] = []
+    async for _ in stream:
+        snapshot = stream.snapshot()
+        assert snapshot is not None
+        seen.append(snapshot.content)
+        if snapshot is not stream._output:
+            assert snapshot.metadata["partial"] is True
+
+    assert seen[:4] == ["The ", "The quick ", "The quick brown ", "The quick brown fox"]
+    assert stream.snapshot() is stream.output
+    assert stream.output.content == "The quick brown fox"
+    assert stream.output.finish_reason is not None
+    assert stream.output.finish_reason.reason == "stop"
+
+
+async def test_chatcompletions_tool_call_arguments_join_from_fragments() -> None:
+    fragments = ['{"ci', 'ty": "Pa', 'ris"}']
+    events = [
+        _completion_chunk(
+            {
+                "tool_calls": [
+                    {"index": 0, "id": "call_1", "function": {"name": "weather"}}
+                ]
+            }
+        ),
+        *(
+            _completion_chunk(
+                {"tool_calls": [{"index": 0, "function": {"arguments": part}}]}
+            )
+            for part in fragments
+        ),
+        _completion_chunk({}, finish_reason="tool_calls"),
+    ]
+    stream = ChatCompletionsTextStream(_async_iter(events))
+
+    async for _ in stream:
+        pass
+
+    (call,) = stream.output.tool_calls
+    assert (call.id, call.name, call.arguments) == (
+        "call_1",
+        "weather",
+        {"city": "Paris"},
+    )
+
+
+async def test_anthropic_blocks_join_from_deltas() -> None:
+    events: list[dict[str, Any]] = [
+        {"type": "message_start", "message": {"id": "msg_01", "usage": {}}},
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "thinking", "thinking": "", "signature": ""},
+        },
+        *(
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "thinking_delta", "thinking": part},
+            }
+            for part in ["Look ", "it ", "up."]
+        ),
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "signature_delta", "signature": "sig"},
+        },
+        {
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {"type": "tool_use", "id": "tu_1", "name": "weather"},
+        },
+        *(
+            {
+                "type": "content_block_delta",
+                "index": 1,
+                "delta": {"type": "input_json_delta", "partial_json": part},
+            }
+            for part in ['{"city"', ': "Par', 'is"}']
+        ),
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "tool_use"},
+            "usage": {"output_tokens": 12},
+        },
+    ]
+    stream = AnthropicTextStream(_async_iter(events))
+
+    async for _ in stream:
+        partial = stream.snapshot()
+        assert partial is not None and partial.tool_calls == []
+
+    output = stream.output
+    assert output.reasoning == "Look it up."
+    assert output.signature is not None
+    assert output.signature[0] == {
+        "type": "thinking",
+        "thinking": "Look it up.",
+        "signature": "sig",
+    }
+    (call,) = output.tool_calls
+    assert (call.id, call.arguments) == ("tu_1", {"city": "Paris"})
+    assert output.usage.output_tokens == 12
+
+
+async def test_constructed_chunks_match_validated_chunks() -> None:
+    events = [
+        _completion_chunk({"content": "Hi"}),
+        {
+            **_completion_chunk({}, finish_reason="stop"),
+            # Provider-raw values: usage is still validated and coerced.
+            "usage": {
+                "prompt_tokens": 3.0,
+                "completion_tokens": "1",
+                "total_tokens": 4,
+            },
+        },
+    ]
+    stream = ChatCompletionsTextStream(_async_iter(events))
+    chunks = [chunk async for chunk in stream]
+
+    for chunk in chunks:
+        validated = TextChunk.model_validate(
+            chunk.model_dump(include=chunk.model_fields_set)
+        )
+        assert type(chunk) is TextChunk
+        assert chunk == validated
+        assert chunk.model_fields_set == validated.model_fields_set
+        assert chunk.model_dump_json() == validated.model_dump_json()
+    usage = chunks[-1].usage
+    assert usage == TextUsage(input_tokens=3, output_tokens=1, total_tokens=4)
+    assert all(type(key) is str for key in usage.model_fields_set)
+    assert stream.output.usage == usage
+    assert isinstance(chunks[-1].finish_reason, TextFinishReason)
+    assert chunks[0].reasoning is None and chunks[0].tool_activity is None
@@ -0,0 +1,118 @@
+"""Unit tests for the semantic generate() cache (no network)."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from celeste import Model
+from celeste.auth import AuthHeader
+from celeste.core import Modality, Operation, Provider
+from celeste.modalities.embeddings.providers.google.client import GoogleEmbeddingsClient
+from celeste.types import Message, Role
+from tests.unit_tests.conftest import anthropic_test_client
+
+# Prompt -> embedding; the first two are near-duplicates (cosine ~0.995).
+_VECTORS = {
+    "How do I reset my password?": [1.0, 0.0, 0.0],
+    "how can I reset my password": [0.99, 0.1, 0.0],
+    "What are your opening hours?": [0.0, 1.0, 0.0],
+    "Where is my order?": [0.0, 0.0, 1.0],
+}
+
+
+def _embedder() -> GoogleEmbeddingsClient:
+    return GoogleEmbeddingsClient(
+        model=Model(
+            id="embedding-test",
+            provider=Provider.GOOGLE,
+            display_name="Embedding test",
+            operations={Modality.EMBEDDINGS: {Operation.EMBED}},
+        ),
+        provider=Provider.GOOGLE,
+        auth=AuthHeader(secret=SecretStr("test"), header="x-goog-api-key", prefix=""),
+    )
+
+
+def _transport() -> AsyncMock:
+    answers = iter(f"answer {i}" for i in range(100))
+
+    def respond(url: str, *, content: bytes, **_: object) -> httpx.Response:
+        if "embedContent" in url:
+            text = json.loads(content)["content"]["parts"][0]["text"]
+            body: dict[str, Any] = {"embedding": {"values": _VECTORS[text]}}
+        else:
+            body = {
+                "content": [{"type": "text", "text": next(answers)}],
+                "usage": {"input_tokens": 1, "output_tokens": 1},
+            }
+        return httpx.Response(200, json=body, request=httpx.Request("POST", url))
+
+    transport = AsyncMock(spec=httpx.AsyncClient)
+    transport.post = AsyncMock(side_effect=respond)
+    return transport
+
+
+def _generate_calls(transport: AsyncMock) -> int:
+    return sum("/v1/messages" in c.args[0] for c in transport.post.call_args_list)
+
+
+async def test_similar_prompt_reuses_output_within_scope() -> None:
+    transport = _transport()
+    cached = anthropic_test_client().semantic_cache(_embedder(), threshold=0.95)
+
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        first = await cached.generate("How do I reset my password?")
+        similar = await cached.generate("how can I reset my password")
+        other = await cached.generate("What are your opening hours?")
+        rescoped = await cached.generate("how can I reset my password", temperature=1)
+
+    assert first.content == similar.content == "answer 0"
+    assert similar.metadata["cache_hit"] is True
+    assert similar.metadata["semantic_similarity"] > 0.99
+    assert "cache_hit" not in first.metadata
+    assert (other.content, rescoped.content) == ("answer 1", "answer 2")
+    assert _generate_calls(transport) == 3
+    stats = cached.stats()
+    assert (stats.lookups, stats.hits, stats.misses, stats.entries) == (4, 1, 3, 3)
+    assert stats.hit_rate == 0.25
+    assert stats.mean_lookup_time > 0
+
+
+async def test_evicts_least_recently_used_entry() -> None:
+    transport = _transport()
+    cached = anthropic_test_client().semantic_cache(_embedder(), max_entries=2)
+
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        await cached.generate("How do I reset my password?")
+        await cached.generate("What are your opening hours?")
+        await cached.generate("How do I reset my password?")  # hit, now most recent
+        await cached.generate("Where is my order?")  # evicts opening hours
+        reset = await cached.generate("How do I reset my password?")
+        hours = await cached.generate("What are your opening hours?")
+
+    assert reset.metadata["cache_hit"] is True
+    assert "cache_hit" not in hours.metadata
+    assert cached.stats().evictions == 2
+    assert cached.stats().entries == 2
+
+
+async def test_messages_bypass_the_cache() -> None:
+    transport = _transport()
+    cached = anthropic_test_client().semantic_cache(_embedder())
+
+    with patch("celeste.http.httpx.AsyncClient", return_value=transport):
+        await cached.generate(messages=[Message(role=Role.USER, content="hi")])
+
+    assert transport.post.await_count == 1
+    assert cached.stats().lookups == 0
+
+
+def test_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="threshold"):
+        anthropic_test_client().semantic_cache(_embedder(), threshold=0)
+    with pytest.raises(ValueError, match="max_entries"):
+        anthropic_test_client().semantic_cache(_embedder(), max_entries=0)
@@ -0,0 +1,221 @@
+"""Unit tests for chunked, resumable video downloads (no network)."""
+
+import io
+from collections.abc import AsyncIterator, Callable, Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from celeste import Modality, Operation, Provider, create_client, http
+from celeste.artifacts import VideoArtifact
+from celeste.http import HTTPClient
+from celeste.modalities.videos.client import VideosClient
+from celeste.retry import RetryJitter, RetryPolicy
+from celeste.sinks import BinarySink
+
+_VIDEO = bytes(range(256)) * 64
+_URL = "https://cdn.example.com/video.mp4"
+
+type Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class _DroppedBody(httpx.AsyncByteStream):
+    """Response body whose connection drops after ``data``."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._data
+        raise httpx.RemoteProtocolError("peer closed connection")
+
+
+def _range(request: httpx.Request) -> tuple[int, int]:
+    """Inclusive byte range requested, defaulting to the whole body."""
+    value = request.headers.get("range", "bytes=0-")
+    start, _, end = value.removeprefix("bytes=").partition("-")
+    return int(start), int(end) if end else len(_VIDEO) - 1
+
+
+def _partial(request: httpx.Request) -> httpx.Response:
+    start, end = _range(request)
+    return httpx.Response(
+        206,
+        content=_VIDEO[start : end + 1],
+        headers={"content-range": f"bytes {start}-{end}/{len(_VIDEO)}"},
+    )
+
+
+@pytest.fixture
+def serve() -> Iterator[Callable[[Handler], list[httpx.Request]]]:
+    requests: list[httpx.Request] = []
+    patcher = None
+
+    def install(handler: Handler) -> list[httpx.Request]:
+        nonlocal patcher
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        transport = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        patcher = patch("celeste.http.httpx.AsyncClient", return_value=transport)
+        patcher.start()
+        return requests
+
+    yield install
+    if patcher is not None:
+        patcher.stop()
+
+
+def _http_client() -> HTTPClient:
+    return HTTPClient(
+        retry_policy=RetryPolicy(max_retries=1, base_delay=0, jitter=RetryJitter.NONE)
+    )
+
+
+async def test_dropped_connection_resumes_with_range(
+    serve: Callable[[Handler], list[httpx.Request]],
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "range" in request.headers:
+            return _partial(request)
+        return httpx.Response(200, stream=_DroppedBody(_VIDEO[:1000]))
+
+    requests = serve(handler)
+    buffer = io.BytesIO()
+
+    response = await _http_client().download(_URL, BinarySink(buffer))
+
+    assert response.status_code == 206
+    assert buffer.getvalue() == _VIDEO
+    assert [r.headers.get("range") for r in requests] == [None, "bytes=1000-"]
+
+
+async def test_server_ignoring_range_restarts_from_start(
+    serve: Callable[[Handler], list[httpx.Request]],
+) -> None:
+    attempts = iter([httpx.Response(200, stream=_DroppedBody(_VIDEO[:1000]))])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(attempts, httpx.Response(200, content=_VIDEO))
+
+    requests = serve(handler)
+    buffer = io.BytesIO()
+
+    await _http_client().download(_URL, BinarySink(buffer))
+
+    assert len(requests) == 2
+    assert buffer.getvalue() == _VIDEO
+
+
+async def test_server_ignoring_range_spends_retries(
+    serve: Callable[[Handler], list[httpx.Request]],
+) -> None:
+    requests = serve(lambda _: httpx.Response(200, stream=_DroppedBody(_VIDEO[:100])))
+    buffer = io.BytesIO()
+
+    with pytest.raises(httpx.RemoteProtocolError):
+        await _http_client().download(_URL, BinarySink(buffer))
+
+    # The first response made progress and is resumed for free; the restarts
+    # that follow only resend the start, so each one spends a retry.
+    assert len(requests) == 3
+    assert buffer.getvalue() == _VIDEO[:100]
+
+
+class _Pipe(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+async def test_server_ignoring_range_rejects_non_seekable_sink(
+    serve: Callable[[Handler], list[httpx.Request]],
+) -> None:
+    attempts = iter([httpx.Response(200, stream=_DroppedBody(_VIDEO[:1000]))])
+    serve(lambda _: next(attempts, httpx.Response(200, content=_VIDEO)))
+    pipe = _Pipe()
+
+    with pytest.raises(io.UnsupportedOperation, match="non-seekable"):
+        await _http_client().download(_URL, BinarySink(pipe))
+
+    assert pipe.getvalue() == _VIDEO[:1000]
+
+
+async def test_parallel_segments_write_at_their_offsets(
+    serve: Callable[[Handler], list[httpx.Request]],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(http, "MIN_DOWNLOAD_SEGMENT_BYTES", 4096)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(
+                200,
+                headers={"accept-ranges": "bytes", "content-length": str(len(_VIDEO))},
+            )
+        return _partial(request)
+
+    requests = serve(handler)
+    sink = BinarySink(tmp_path / "video.mp4")
+
+    await _http_client().download(_URL, sink, segments=3)
+    sink.commit()
+
+    ranges = sorted(r.headers["range"] for r in requests if r.method == "GET")
+    assert ranges == ["bytes=0-5460", "bytes=10922-16383", "bytes=5461-10921"]
+    assert (tmp_path / "video.mp4").read_bytes() == _VIDEO
+
+
+async def test_generate_downloads_url_result_to_path(
+    serve: Callable[[Handler], list[httpx.Request]],
+    tmp_path: Path,
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.x.ai":
+            return httpx.Response(200, json={"url": _URL, "video": {"url": _URL}})
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200, content=_VIDEO)
+
+    requests = serve(handler)
+    client: VideosClient = create_client(  # type: ignore[assignment]
+        Modality.VIDEOS,
+        Operation.GENERATE,
+        provider=Provider.XAI,
+        model="grok-imagine-video",
+        api_key="k",
+    )
+    target = tmp_path / "video.mp4"
+
+    output = await client.generate("A cat", sink=target)
+
+    assert target.read_bytes() == _VIDEO
+    assert output.content.path == str(target)
+    assert output.content.data is None and output.content.url is None
+    download = next(r for r in requests if r.url == _URL and r.method == "GET")
+    assert "authorization" not in download.headers  # presigned URL
+
+
+async def test_failed_download_leaves_no_file(
+    serve: Callable[[Handler], list[httpx.Request]],
+    tmp_path: Path,
+) -> None:
+    serve(lambda request: httpx.Response(403, json={"error": "expired"}))
+    client: VideosClient = create_client(  # type: ignore[assignment]
+        Modality.VIDEOS,
+        Operation.GENERATE,
+        provider=Provider.XAI,
+        model="grok-imagine-video",
+        api_key="k",
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.download_content(
+            VideoArtifact(url=_URL), sink=tmp_path / "video.mp4"
+        )
+
+    assert list(tmp_path.iterdir()) == []